@@ -0,0 +1,56 @@
+"""poetry run python -m scripts.benchmarks.dashboard_twr
+
+Micro-benchmark for the Time-Weighted Return calculation used by the Dashboard.
+
+Runs `Dashboard._calculate_twr` and `Dashboard._derive_period_returns` over synthetic daily portfolio values.
+"""
+
+import argparse
+import random
+import timeit
+
+from scripts.common import setup_django_environment
+
+setup_django_environment()
+
+from stonks_overwatch.views.dashboard import Dashboard  # noqa: E402
+
+
+def generate_daily_values(years: int) -> tuple[list[str], dict[str, float], dict[str, float]]:
+    """Generates business days with a random-walk portfolio value and a monthly deposit."""
+    random.seed(42)
+    end_year = 2025
+    dates = Dashboard._get_business_date_range(f"{end_year - years}-01-01", f"{end_year - 1}-12-31")
+
+    market_value_per_day = {}
+    cash_flows = {}
+    value = 1000.0
+    for day in dates:
+        deposit = 500.0 if day.endswith("-01") else 0.0
+        value = value * (1 + random.gauss(0.0003, 0.01)) + deposit
+        market_value_per_day[day] = value
+        if deposit:
+            cash_flows[day] = deposit
+
+    return dates, market_value_per_day, cash_flows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=20, help="Number of years of daily values")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs")
+    args = parser.parse_args()
+
+    dates, market_value_per_day, cash_flows = generate_daily_values(args.years)
+    print(f"Calculating TWR over {len(dates)} business days ({args.years} years, {args.repeat} runs)")
+
+    def run():
+        metrics = Dashboard._calculate_twr(dates, market_value_per_day, cash_flows)
+        Dashboard._derive_period_returns(metrics.cumulative_returns)
+
+    best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+    print(f"TWR + period returns: {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""poetry run python -m scripts.benchmarks.degiro_cash_movements
+
+Micro-benchmark for the DeGiro cash movements transformation used by the UpdateService.
+
+Compares the native polars implementation against the previous `map_elements` based one over
+synthetic DeGiro cash movements.
+"""
+
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+
+import polars as pl
+
+from scripts.common import setup_django_environment
+
+setup_django_environment()
+
+from stonks_overwatch.services.brokers.degiro.services.update_service import UpdateService  # noqa: E402
+
+
+def generate_cash_movements(rows: int) -> list[dict]:
+    """Generates synthetic cash movements with the same shape as the DeGiro `get_account_overview` response."""
+    random.seed(42)
+    start = datetime(2015, 1, 1)
+    movements = []
+    for i in range(rows):
+        movement = {
+            "id": i,
+            "date": (start + timedelta(minutes=i)).isoformat(),
+            "valueDate": (start + timedelta(minutes=i)).isoformat(),
+            "description": random.choice(["Koop", "Verkoop", "Dividend", "DEGIRO Transactiekosten"]),
+            "currency": random.choice(["EUR", "USD"]),
+            "type": random.choice(["CASH_TRANSACTION", "TRANSACTION", "FLATEX_CASH_SWEEP"]),
+            "change": round(random.uniform(-1000, 1000), 2),
+            "balance": {
+                "unsettledCash": 0.0,
+                "flatexCash": round(random.uniform(0, 10000), 2),
+                "total": round(random.uniform(0, 10000), 2),
+            },
+        }
+        if i % 3:
+            movement["productId"] = random.randint(100000, 99999999)
+            movement["orderId"] = f"order-{i}"
+            movement["exchangeRate"] = round(random.uniform(0.5, 1.5), 4)
+        movements.append(movement)
+    return movements
+
+
+def legacy_transform(cash_movements: list[dict]) -> pl.DataFrame:
+    """Previous implementation, flattening in Python and fixing columns with `map_elements`."""
+    flattened = []
+    for item in cash_movements:
+        flat_item = {}
+        for key, value in item.items():
+            if isinstance(value, dict):
+                for nested_key, nested_value in value.items():
+                    flat_item[f"{key}_{nested_key}"] = nested_value
+            else:
+                flat_item[key] = value
+        flattened.append(flat_item)
+    df = pl.DataFrame(flattened, infer_schema_length=None)
+
+    def fix_columns(dataframe: pl.DataFrame, columns: list[str], func) -> pl.DataFrame:
+        for col in columns:
+            if col in dataframe.columns:
+                dataframe = dataframe.with_columns(pl.col(col).map_elements(func, return_dtype=pl.String).alias(col))
+        return dataframe
+
+    df = fix_columns(
+        df,
+        ["productId", "id", "exchangeRate", "orderId"],
+        lambda x: None if (x is None) else str(x).replace(".0", ""),
+    )
+    df = fix_columns(df, ["change"], lambda x: None if (x is None) else str(x))
+    return df.sort("date")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of synthetic cash movements")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per implementation")
+    args = parser.parse_args()
+
+    cash_movements = generate_cash_movements(args.rows)
+    print(f"Transforming {args.rows} cash movements ({args.repeat} runs each)")
+
+    for name, func in [
+        ("map_elements", legacy_transform),
+        ("native", UpdateService._transform_cash_movements),
+    ]:
+        best = min(timeit.repeat(lambda func=func: func(cash_movements), number=1, repeat=args.repeat))
+        print(f"{name:>14}: {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
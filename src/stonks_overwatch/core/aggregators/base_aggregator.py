@@ -6,13 +6,15 @@ offering common patterns for broker service management and data aggregation.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional
 
 from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.core.exceptions import DataAggregationException
 from stonks_overwatch.core.factories.broker_factory import BrokerFactory
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.models import PortfolioId
+from stonks_overwatch.services.utilities.pagination import Page, PageQuery, decode_cursor, encode_cursor
 from stonks_overwatch.settings import DEBUG_MODE
 from stonks_overwatch.utils.core.logger import StonksLogger
 
@@ -378,3 +380,69 @@ class BaseAggregator(ABC):
             return sorted(combined_data, key=sort_key, reverse=reverse)
         else:
             return sorted(combined_data, reverse=reverse)
+
+    def _collect_page(
+        self, selected_portfolio: PortfolioId, method_name: str, query: PageQuery, sort_key: Callable[[Any], Any]
+    ) -> Page:
+        """
+        Collect a page of entries from every enabled broker and merge them into a single page.
+
+        Each broker only returns up to query.limit entries after its own position, so the cost of a page
+        does not depend on the size of the history. The returned cursor encodes the position of every
+        broker right after the last entry it contributed to the page.
+
+        Args:
+            selected_portfolio: Selected portfolio configuration
+            method_name: Name of the page method to call on each broker service, with the PageQuery
+            query: Position, filters and sorting of the page
+            sort_key: Function used to merge the broker pages. Each broker page must already be sorted by it
+
+        Returns:
+            Merged page, with the cursor of the next page or None if there are no more entries
+        """
+        positions = decode_cursor(query.cursor)
+        # Without a cursor, the entries before the offset must be read from every broker to merge them
+        skip = 0 if query.cursor else query.offset
+
+        entries = []
+        broker_pages = {}
+        broker_keys = set()
+        for broker_name in self._get_enabled_brokers(selected_portfolio):
+            key = BrokerName(broker_name).value
+            broker_keys.add(key)
+            if key in positions and positions[key] is None:
+                # This broker has no more entries
+                continue
+            try:
+                service = self._broker_services[broker_name]
+                broker_query = replace(query, cursor=positions.get(key), offset=0, limit=skip + query.limit)
+                page = getattr(service, method_name)(broker_query)
+            except Exception as e:
+                self._logger.error(f"Failed to collect page from {broker_name}: {e}", exc_info=DEBUG_MODE)
+                continue
+            broker_pages[key] = page
+            entries.extend((item, key, index) for index, item in enumerate(page.items))
+
+        # The sort is stable, so the entries of each broker keep their order
+        entries.sort(key=lambda entry: sort_key(entry[0]), reverse=not query.ascending)
+        selected = entries[: skip + query.limit]
+
+        consumed = {}
+        for _, key, index in selected:
+            consumed[key] = max(consumed.get(key, 0), index + 1)
+
+        next_positions = {key: position for key, position in positions.items() if key in broker_keys}
+        has_more = False
+        for key, page in broker_pages.items():
+            count = consumed.get(key, 0)
+            if count == len(page.items) and page.next_cursor is None:
+                next_positions[key] = None
+                continue
+            has_more = True
+            if count > 0:
+                next_positions[key] = page.item_cursors[count - 1]
+
+        return Page(
+            items=[item for item, _, _ in selected[skip:]],
+            next_cursor=encode_cursor(next_positions) if has_more else None,
+        )
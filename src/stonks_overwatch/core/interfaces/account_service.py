@@ -10,6 +10,7 @@ from abc import ABC, abstractmethod
 from typing import List
 
 from stonks_overwatch.services.models import AccountOverview
+from stonks_overwatch.services.utilities.pagination import Page, PageQuery, paginate
 
 
 class AccountServiceInterface(ABC):
@@ -55,3 +56,26 @@ class AccountServiceInterface(ABC):
             List[AccountOverview]: List of account overview entries sorted by date (newest first)
         """
         pass
+
+    def get_account_overview_page(self, query: PageQuery) -> Page[AccountOverview]:
+        """
+        Retrieves a page of the account overview.
+
+        The type filter matches the movement type. The default implementation filters and pages
+        get_account_overview() in memory. Brokers that can filter and page in the database should
+        override it.
+
+        Args:
+            query: Position, filters and sorting of the page
+
+        Returns:
+            Page[AccountOverview]: Account overview entries of the page, sorted by date
+        """
+        return paginate(
+            self.get_account_overview(),
+            query,
+            entry_date=lambda k: k.datetime.date(),
+            entry_symbol=lambda k: k.stock_symbol,
+            entry_type=lambda k: k.type,
+            sort_key=lambda k: k.datetime,
+        )
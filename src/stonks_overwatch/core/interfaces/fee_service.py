@@ -7,9 +7,9 @@ need to implement this interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional
 
-from stonks_overwatch.services.models import Fee
+from stonks_overwatch.services.models import Fee, FeeType
 
 
 class FeeServiceInterface(ABC):
@@ -55,3 +55,22 @@ class FeeServiceInterface(ABC):
             List[Fee]: List of fees sorted by date and time (newest first)
         """
         pass
+
+    def get_fee_totals(self, fees: Optional[List[Fee]] = None) -> Dict[FeeType, float]:
+        """
+        Retrieves the total fee value of each fee type.
+
+        The default implementation sums the fees. Brokers that can aggregate them in the
+        database should override it.
+
+        Args:
+            fees: The fees returned by get_fees(), to avoid retrieving them again
+
+        Returns:
+            Dict[FeeType, float]: Total fee value per fee type
+        """
+        totals = dict.fromkeys(FeeType, 0.0)
+        for fee in fees if fees is not None else self.get_fees():
+            totals[fee.type] += fee.fee_value
+
+        return totals
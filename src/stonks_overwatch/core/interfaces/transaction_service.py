@@ -6,9 +6,11 @@ All broker transaction services should implement this interface.
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List
 
 from stonks_overwatch.services.models import Transaction
+from stonks_overwatch.services.utilities.pagination import Page, PageQuery, paginate
 
 
 class TransactionServiceInterface(ABC):
@@ -54,3 +56,26 @@ class TransactionServiceInterface(ABC):
             List[Transaction]: List of transactions sorted by date (newest first)
         """
         pass
+
+    def get_transactions_page(self, query: PageQuery) -> Page[Transaction]:
+        """
+        Retrieves a page of the transaction history.
+
+        The type filter matches the action (Buy or Sell). The default implementation filters and
+        pages get_transactions() in memory. Brokers that can filter and page in the database should
+        override it.
+
+        Args:
+            query: Position, filters and sorting of the page
+
+        Returns:
+            Page[Transaction]: Transactions of the page, sorted by date
+        """
+        return paginate(
+            self.get_transactions(),
+            query,
+            entry_date=lambda k: date.fromisoformat(k.date),
+            entry_symbol=lambda k: k.symbol,
+            entry_type=lambda k: k.buy_sell,
+            sort_key=lambda k: (k.date, k.time),
+        )
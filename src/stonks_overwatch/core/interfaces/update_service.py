@@ -1,8 +1,8 @@
 import os
 import time as core_time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
 
 from django.db.utils import OperationalError
 from django.utils import timezone
@@ -12,6 +12,9 @@ from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.settings import STONKS_OVERWATCH_DATA_DIR
 from stonks_overwatch.utils.core.logger import StonksLogger
 
+# Days before the last stored snapshot that are always rewritten, to pick up close prices imported late
+SNAPSHOT_LOOKBACK_DAYS = 7
+
 
 class AbstractUpdateService(ABC):
     """
@@ -34,6 +37,9 @@ class AbstractUpdateService(ABC):
        configuration injection from the unified factory.
     """
 
+    # Oldest day of the data imported by this run, see _mark_history_changed
+    _history_changed_since: Optional[date] = None
+
     def __init__(
         self,
         broker_name: BrokerName,
@@ -155,6 +161,165 @@ class AbstractUpdateService(ABC):
         except Exception as e:
             self.logger.error("Failed to record sync log for %s: %s", self.broker_name, str(e))
 
+    def update_ticker_info(self) -> None:
+        """
+        Fetch the Yahoo Finance ticker info missing for the stocks and ETFs of this broker portfolio.
+
+        The portfolio views only read the stored ticker info, so the network lookups happen here,
+        at the end of update_all(), instead of while serving a request.
+        """
+        from stonks_overwatch.core.factories.broker_factory import BrokerFactory
+        from stonks_overwatch.core.service_types import ServiceType
+        from stonks_overwatch.services.brokers.yfinance.services.market_data_service import YFinance
+        from stonks_overwatch.utils.domain.constants import ProductType
+
+        self._log_message("Updating Ticker Info....")
+        try:
+            portfolio_service = BrokerFactory().create_service(self.broker_name, ServiceType.PORTFOLIO)
+            if portfolio_service is None:
+                return
+
+            # Some portfolio services expose the portfolio as a property
+            portfolio = portfolio_service.get_portfolio
+            if callable(portfolio):
+                portfolio = portfolio()
+
+            product_types = (ProductType.STOCK, ProductType.ETF)
+            symbols = {entry.symbol for entry in portfolio if entry.product_type in product_types}
+            fetched = YFinance().update_ticker_infos(symbols)
+            self._log_message(f"Fetched ticker info for {fetched} symbols")
+        except Exception as e:
+            self.logger.error("Failed to update ticker info for %s: %s", self.broker_name, str(e))
+
+    def _mark_history_changed(self, days: Iterable[Optional[date | datetime]]) -> None:
+        """
+        Record the days of the imported transactions or movements. Missing days (None) are ignored.
+
+        update_portfolio_snapshot rewrites the snapshots from the oldest recorded day, so the ones changed by
+        a backdated transaction are recalculated.
+        """
+        for day in days:
+            if day is None:
+                continue
+            day = day.date() if isinstance(day, datetime) else day
+            if self._history_changed_since is None or day < self._history_changed_since:
+                self._history_changed_since = day
+
+    def _get_snapshot_start_date(self, currency: str) -> Optional[date]:
+        """
+        Return the first day whose snapshot must be rewritten, None if every snapshot must be written.
+
+        Every snapshot is rewritten after the base currency changed.
+        """
+        from stonks_overwatch.core.models import PortfolioDailyValueRepository
+
+        last_date = PortfolioDailyValueRepository.get_last_date(self.broker_name)
+        if last_date is None or PortfolioDailyValueRepository.has_other_currency(self.broker_name, currency):
+            return None
+
+        start = last_date - timedelta(days=SNAPSHOT_LOOKBACK_DAYS)
+        if self._history_changed_since is not None:
+            start = min(start, self._history_changed_since)
+        return start
+
+    def update_portfolio_snapshot(self) -> None:
+        """
+        Store the daily value of this broker portfolio in the PortfolioDailyValue table.
+
+        Should be called at the end of update_all(), once the broker data has been imported. Only the
+        snapshots from a week before the last stored one, or from the oldest day of the imported data
+        (see _mark_history_changed), are rewritten.
+        """
+        from stonks_overwatch.core.factories.broker_factory import BrokerFactory
+        from stonks_overwatch.core.models import PortfolioDailyValueRepository
+        from stonks_overwatch.core.service_types import ServiceType
+        from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
+        from stonks_overwatch.utils.core.localization import LocalizationUtility
+
+        self._log_message("Updating Portfolio Snapshots....")
+        try:
+            factory = BrokerFactory()
+            portfolio_service = factory.create_service(self.broker_name, ServiceType.PORTFOLIO)
+            if portfolio_service is None:
+                return
+
+            historical_value = sorted(portfolio_service.calculate_historical_value(), key=lambda item: item["x"])
+            if not historical_value:
+                return
+
+            deposits_service = factory.create_service(self.broker_name, ServiceType.DEPOSIT)
+            deposits = deposits_service.get_cash_deposits() if deposits_service else []
+            deposits = sorted(deposits, key=lambda k: k.datetime)
+            portfolio_total = portfolio_service.get_portfolio_total()
+            currency = portfolio_total.base_currency
+            start_date = self._get_snapshot_start_date(currency)
+
+            daily_values = []
+            deposit_index = 0
+            total_deposits = 0.0
+            for item in historical_value:
+                day = date.fromisoformat(item["x"])
+                while deposit_index < len(deposits) and deposits[deposit_index].datetime.date() <= day:
+                    total_deposits += deposits[deposit_index].change
+                    deposit_index += 1
+                if start_date and day < start_date:
+                    continue
+                daily_values.append(
+                    {
+                        "date": day,
+                        "value": float(item["y"]),
+                        "cash": None,
+                        "deposits": LocalizationUtility.round_value(total_deposits),
+                    }
+                )
+            if not daily_values:
+                return
+            # Cash balances are only known for the current day
+            daily_values[-1]["cash"] = portfolio_total.total_cash
+
+            written = self._retry_database_operation(
+                PortfolioDailyValueRepository.save_daily_values, self.broker_name, daily_values, currency
+            )
+            self._history_changed_since = None
+            # The dashboard series are built from the snapshots
+            PortfolioAggregatorService.series_snapshots.invalidate()
+            self._log_message(f"Stored {written} portfolio snapshots")
+        except Exception as e:
+            self.logger.error("Failed to update portfolio snapshots for %s: %s", self.broker_name, str(e))
+
+    def update_dividend_aggregates(self) -> None:
+        """
+        Store the paid dividends of this broker aggregated per month and currency.
+
+        Should be called at the end of update_all(), once the broker data has been imported, so the
+        dividends views only read the DividendMonthlyAggregate table.
+        """
+        from stonks_overwatch.core.factories.broker_factory import BrokerFactory
+        from stonks_overwatch.core.models import DividendMonthlyAggregateRepository
+        from stonks_overwatch.core.service_types import ServiceType
+        from stonks_overwatch.services.aggregators.dividends_aggregator import DividendsAggregatorService
+
+        factory = BrokerFactory()
+        if not factory.broker_supports_service(self.broker_name, ServiceType.DIVIDEND):
+            return
+
+        self._log_message("Updating Dividend Aggregates....")
+        try:
+            dividends_service = factory.create_service(self.broker_name, ServiceType.DIVIDEND)
+            if dividends_service is None:
+                return
+
+            aggregates = DividendsAggregatorService.aggregate_monthly_dividends(dividends_service.get_dividends())
+            written = self._retry_database_operation(
+                DividendMonthlyAggregateRepository.save_monthly_dividends,
+                self.broker_name,
+                aggregates,
+                dividends_service.base_currency,
+            )
+            self._log_message(f"Stored {written} monthly dividend aggregates")
+        except Exception as e:
+            self.logger.error("Failed to update dividend aggregates for %s: %s", self.broker_name, str(e))
+
     def get_last_sync(self) -> Optional[datetime]:
         """
         Return the last time this broker was successfully synced with the external API.
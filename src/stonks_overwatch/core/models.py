@@ -1,4 +1,7 @@
-from django.db import models
+import math
+from datetime import date
+
+from django.db import models, transaction
 from django.utils import timezone
 
 from stonks_overwatch.utils.core.logger import StonksLogger
@@ -71,3 +74,254 @@ class GlobalConfiguration(models.Model):
         except Exception as e:
             cls.logger.error(f"Error setting '{key}': {e}")
             raise
+
+
+class PortfolioDailyValue(models.Model):
+    """
+    Daily snapshot of a broker portfolio, written at the end of each broker update job.
+
+    The dashboard reads date-ranged slices of this table instead of recomputing the whole
+    historical value series on every request.
+    """
+
+    class Meta:
+        db_table = "portfolio_daily_value"
+        verbose_name = "Portfolio Daily Value"
+        verbose_name_plural = "Portfolio Daily Values"
+        constraints = [
+            models.UniqueConstraint(fields=["portfolio_id", "date"], name="unique_portfolio_daily_value"),
+        ]
+
+    portfolio_id = models.CharField(max_length=50, db_index=True)
+    date = models.DateField()
+    value = models.FloatField()
+    cash = models.FloatField(null=True, blank=True)
+    deposits = models.FloatField(null=True, blank=True)
+    # Base currency of the values, snapshots in another currency are rebuilt by the next update
+    currency = models.CharField(max_length=10, null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.portfolio_id}: {self.date} ({self.value})"
+
+
+class PortfolioDailyValueRepository:
+    """
+    Repository for managing PortfolioDailyValue model instances.
+    """
+
+    logger = StonksLogger.get_logger("stonks_overwatch.core.models", "[PORTFOLIO_DAILY_VALUE|REPOSITORY]")
+
+    @staticmethod
+    def get_last_date(portfolio_id: str) -> date | None:
+        return (
+            PortfolioDailyValue.objects.filter(portfolio_id=portfolio_id)
+            .order_by("-date")
+            .values_list("date", flat=True)
+            .first()
+        )
+
+    @staticmethod
+    def has_other_currency(portfolio_id: str, currency: str) -> bool:
+        """Return True if any stored snapshot of the portfolio is not in the given currency."""
+        return PortfolioDailyValue.objects.filter(portfolio_id=portfolio_id).exclude(currency=currency).exists()
+
+    @staticmethod
+    def get_daily_values(
+        portfolio_ids: list[str],
+        start_date: date | None = None,
+        end_date: date | None = None,
+        currency: str | None = None,
+    ) -> dict[str, list[dict]]:
+        """
+        Return the stored snapshots of each portfolio, sorted by date.
+
+        When `start_date` is given, the last snapshot before it is included as well, so callers
+        can carry the value forward to the start of the range. When `currency` is given, the
+        snapshots in another currency are left out.
+        """
+        queryset = PortfolioDailyValue.objects.filter(portfolio_id__in=portfolio_ids)
+        if currency:
+            queryset = queryset.filter(currency=currency)
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+
+        carry_in = {}
+        if start_date:
+            for portfolio_id in portfolio_ids:
+                previous = (
+                    queryset.filter(portfolio_id=portfolio_id, date__lt=start_date)
+                    .order_by("-date")
+                    .values("portfolio_id", "date", "value", "cash", "deposits")
+                    .first()
+                )
+                if previous:
+                    carry_in[portfolio_id] = previous
+            queryset = queryset.filter(date__gte=start_date)
+
+        result = {
+            portfolio_id: [carry_in[portfolio_id]] if portfolio_id in carry_in else [] for portfolio_id in portfolio_ids
+        }
+        for row in queryset.order_by("date").values("portfolio_id", "date", "value", "cash", "deposits"):
+            result[row["portfolio_id"]].append(row)
+
+        return result
+
+    @staticmethod
+    def _is_same_snapshot(stored: tuple | None, row: dict, currency: str) -> bool:
+        if stored is None or stored[3] != currency:
+            return False
+        for stored_value, value in zip(stored[:3], (row["value"], row.get("cash"), row.get("deposits")), strict=True):
+            if stored_value is None or value is None:
+                if stored_value is not value:
+                    return False
+            elif not math.isclose(stored_value, value, rel_tol=1e-9, abs_tol=1e-6):
+                return False
+        return True
+
+    @staticmethod
+    def save_daily_values(portfolio_id: str, daily_values: list[dict], currency: str) -> int:
+        """
+        Upsert the given snapshots, rewriting only the dates after the last stored snapshot and
+        the older dates whose values or currency changed (e.g. after a backdated transaction was
+        imported). Only the stored snapshots of the given dates are compared.
+
+        Returns:
+            Number of rows written
+        """
+        if not daily_values:
+            return 0
+
+        first_date = min(row["date"] for row in daily_values)
+        stored = {
+            row["date"]: (row["value"], row["cash"], row["deposits"], row["currency"])
+            for row in PortfolioDailyValue.objects.filter(portfolio_id=portfolio_id, date__gte=first_date).values(
+                "date", "value", "cash", "deposits", "currency"
+            )
+        }
+        last_date = PortfolioDailyValueRepository.get_last_date(portfolio_id)
+
+        changed = [
+            PortfolioDailyValue(portfolio_id=portfolio_id, currency=currency, **row)
+            for row in daily_values
+            if last_date is None
+            or row["date"] >= last_date
+            or not PortfolioDailyValueRepository._is_same_snapshot(stored.get(row["date"]), row, currency)
+        ]
+        if not changed:
+            return 0
+
+        PortfolioDailyValue.objects.bulk_create(
+            changed,
+            update_conflicts=True,
+            unique_fields=["portfolio_id", "date"],
+            update_fields=["value", "cash", "deposits", "currency"],
+        )
+        PortfolioDailyValueRepository.logger.debug(f"Stored {len(changed)} daily values for {portfolio_id}")
+
+        return len(changed)
+
+
+class DividendMonthlyAggregate(models.Model):
+    """
+    Paid dividends of a broker portfolio aggregated per month and currency.
+
+    Written by the broker update jobs once the dividends are imported, so the dividends calendar
+    and growth chart do not need to re-aggregate every dividend on each request.
+    """
+
+    class Meta:
+        db_table = "dividend_monthly_aggregate"
+        verbose_name = "Dividend Monthly Aggregate"
+        verbose_name_plural = "Dividend Monthly Aggregates"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["portfolio_id", "year", "month", "currency"], name="unique_dividend_monthly_aggregate"
+            ),
+        ]
+
+    portfolio_id = models.CharField(max_length=50, db_index=True)
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    currency = models.CharField(max_length=10)
+    net_amount = models.FloatField(default=0.0)
+    gross_amount = models.FloatField(default=0.0)
+    payouts = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.portfolio_id}: {self.year}-{self.month:02d} ({self.net_amount} {self.currency})"
+
+
+class DividendAggregateStatus(models.Model):
+    """
+    Marks the portfolios whose monthly dividend aggregates have been computed by the update jobs.
+
+    A portfolio without dividends has no DividendMonthlyAggregate rows, so this marker tells it apart
+    from a portfolio whose aggregates were never computed. The aggregates computed in another base
+    currency are treated as never computed.
+    """
+
+    class Meta:
+        db_table = "dividend_aggregate_status"
+        verbose_name = "Dividend Aggregate Status"
+        verbose_name_plural = "Dividend Aggregate Statuses"
+
+    portfolio_id = models.CharField(max_length=50, primary_key=True)
+    computed_at = models.DateTimeField(default=timezone.now)
+    base_currency = models.CharField(max_length=10, null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.portfolio_id}: {self.computed_at}"
+
+
+class DividendMonthlyAggregateRepository:
+    """
+    Repository for managing DividendMonthlyAggregate model instances.
+    """
+
+    logger = StonksLogger.get_logger("stonks_overwatch.core.models", "[DIVIDEND_MONTHLY_AGGREGATE|REPOSITORY]")
+
+    @staticmethod
+    def get_monthly_dividends(portfolio_ids: list[str], base_currency: str | None = None) -> dict[str, list[dict]]:
+        """
+        Return the stored monthly aggregates of each portfolio, sorted by year and month.
+
+        Portfolios whose aggregates were never computed, or computed in another base currency than
+        `base_currency` when given, are not included, while the computed ones without dividends are
+        returned with an empty list.
+        """
+        statuses = DividendAggregateStatus.objects.filter(portfolio_id__in=portfolio_ids)
+        if base_currency:
+            statuses = statuses.filter(base_currency=base_currency)
+        computed = statuses.values_list("portfolio_id", flat=True)
+        result = {portfolio_id: [] for portfolio_id in computed}
+        for row in (
+            DividendMonthlyAggregate.objects.filter(portfolio_id__in=result.keys())
+            .order_by("year", "month", "currency")
+            .values("portfolio_id", "year", "month", "currency", "net_amount", "gross_amount", "payouts")
+        ):
+            result[row["portfolio_id"]].append(row)
+
+        return result
+
+    @staticmethod
+    def save_monthly_dividends(portfolio_id: str, aggregates: list[dict], base_currency: str) -> int:
+        """
+        Replace the stored monthly aggregates of the portfolio, and mark them as computed in the given
+        base currency.
+
+        Returns:
+            Number of rows written
+        """
+        with transaction.atomic():
+            DividendMonthlyAggregate.objects.filter(portfolio_id=portfolio_id).delete()
+            DividendMonthlyAggregate.objects.bulk_create(
+                [DividendMonthlyAggregate(portfolio_id=portfolio_id, **row) for row in aggregates]
+            )
+            DividendAggregateStatus.objects.update_or_create(
+                portfolio_id=portfolio_id, defaults={"computed_at": timezone.now(), "base_currency": base_currency}
+            )
+        DividendMonthlyAggregateRepository.logger.debug(
+            f"Stored {len(aggregates)} monthly dividend aggregates for {portfolio_id}"
+        )
+
+        return len(aggregates)
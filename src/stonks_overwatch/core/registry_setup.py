@@ -91,6 +91,9 @@ from stonks_overwatch.services.brokers.alpaca.services.transaction_service impor
     TransactionService as AlpacaTransactionService,
 )
 from stonks_overwatch.services.brokers.alpaca.services.update_service import UpdateService as AlpacaUpdateService
+from stonks_overwatch.services.brokers.ibkr.services.deposits import (
+    DepositsService as IbkrDepositsService,
+)
 from stonks_overwatch.services.brokers.ibkr.services.dividends import (
     DividendsService as IbkrDividendsService,
 )
@@ -142,6 +145,7 @@ BROKER_CONFIGS: Dict[BrokerName, Dict[str, Any]] = {
         "services": {
             ServiceType.PORTFOLIO: IbkrPortfolioService,
             ServiceType.TRANSACTION: IbkrTransactionService,
+            ServiceType.DEPOSIT: IbkrDepositsService,
             ServiceType.DIVIDEND: IbkrDividendsService,
             ServiceType.ACCOUNT: IbkrAccountOverviewService,
             ServiceType.AUTHENTICATION: IbkrAuthenticationService,
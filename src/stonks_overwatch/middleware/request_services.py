@@ -0,0 +1,17 @@
+"""
+Request-scoped services middleware.
+
+Attaches a RequestServices container to every request, so the view and the template tags
+rendering it share the same aggregator services and computed portfolio.
+"""
+
+from stonks_overwatch.services.utilities.request_services import RequestServices
+
+
+class RequestServicesMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        setattr(request, RequestServices.REQUEST_ATTRIBUTE, RequestServices())
+        return self.get_response(request)
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0011_alpaca"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PortfolioDailyValue",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("portfolio_id", models.CharField(db_index=True, max_length=50)),
+                ("date", models.DateField()),
+                ("value", models.FloatField()),
+                ("cash", models.FloatField(blank=True, null=True)),
+                ("deposits", models.FloatField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Portfolio Daily Value",
+                "verbose_name_plural": "Portfolio Daily Values",
+                "db_table": "portfolio_daily_value",
+                "constraints": [
+                    models.UniqueConstraint(fields=("portfolio_id", "date"), name="unique_portfolio_daily_value")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0012_portfoliodailyvalue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DividendMonthlyAggregate",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("portfolio_id", models.CharField(db_index=True, max_length=50)),
+                ("year", models.PositiveSmallIntegerField()),
+                ("month", models.PositiveSmallIntegerField()),
+                ("currency", models.CharField(max_length=10)),
+                ("net_amount", models.FloatField(default=0.0)),
+                ("gross_amount", models.FloatField(default=0.0)),
+                ("payouts", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Dividend Monthly Aggregate",
+                "verbose_name_plural": "Dividend Monthly Aggregates",
+                "db_table": "dividend_monthly_aggregate",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("portfolio_id", "year", "month", "currency"), name="unique_dividend_monthly_aggregate"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+# Frozen copy of the fee description patterns at the time of this migration, keyed by FeeType name.
+# Later changes to stonks_overwatch.services.brokers.degiro.descriptions must not change this backfill.
+FEE_TYPE_PATTERNS = {
+    "FINANCE_TRANSACTION_TAX": ("Transaction Tax",),
+    "CONNECTION": ("DEGIRO Aansluitingskosten",),
+    "ADR_GDR": ("ADR/GDR Externe Kosten", "ADR/GDR Weitergabegebühr"),
+}
+
+
+def get_fee_type(description):
+    for fee_type, patterns in FEE_TYPE_PATTERNS.items():
+        if any(pattern in (description or "") for pattern in patterns):
+            return fee_type
+    return None
+
+
+def classify_cash_movements(apps, schema_editor):
+    cash_movements = apps.get_model("stonks_overwatch", "DeGiroCashMovements")
+    database = schema_editor.connection.alias
+    updated = []
+    for cash_movement in cash_movements.objects.using(database).only("id", "description"):
+        fee_type = get_fee_type(cash_movement.description)
+        if fee_type is not None:
+            cash_movement.fee_type = fee_type
+            updated.append(cash_movement)
+    cash_movements.objects.using(database).bulk_update(updated, ["fee_type"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0013_dividendmonthlyaggregate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="degirocashmovements",
+            name="fee_type",
+            field=models.CharField(blank=True, db_index=True, default=None, max_length=32, null=True),
+        ),
+        migrations.RunPython(classify_cash_movements, migrations.RunPython.noop),
+    ]
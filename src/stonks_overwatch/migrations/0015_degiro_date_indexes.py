@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0014_degirocashmovements_fee_type"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="degirocashmovements",
+            name="date",
+            field=models.DateTimeField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="degirotransactions",
+            name="date",
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
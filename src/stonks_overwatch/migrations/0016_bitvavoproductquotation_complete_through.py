@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0015_degiro_date_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bitvavoproductquotation",
+            name="complete_through",
+            field=models.DateField(blank=True, default=None, null=True),
+        ),
+    ]
@@ -0,0 +1,83 @@
+import hashlib
+from datetime import timezone as dt_timezone
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+# Frozen copy of stonks_overwatch.services.brokers.bitvavo.fingerprint at the time of this migration.
+# Later changes to that module must not change the fingerprints computed by this backfill.
+DECIMAL_QUANTIZE = Decimal("0.0000000001")
+
+
+def transaction_fingerprint(
+    executed_at, transaction_type, sent_currency, sent_amount, received_currency, received_amount
+):
+    if executed_at.tzinfo is None:
+        executed_at = executed_at.replace(tzinfo=dt_timezone.utc)
+
+    def amount(value):
+        if value is None:
+            return ""
+        try:
+            value = Decimal(str(value)).quantize(DECIMAL_QUANTIZE)
+        except InvalidOperation:
+            return ""
+        return format(value.normalize(), "f")
+
+    content = "|".join(
+        [
+            executed_at.astimezone(dt_timezone.utc).isoformat(),
+            transaction_type,
+            sent_currency or "",
+            amount(sent_amount),
+            received_currency or "",
+            amount(received_amount),
+        ]
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def fingerprint_transactions(apps, schema_editor):
+    """Store the fingerprint of the existing transactions, removing the content-identical duplicates."""
+    transactions = apps.get_model("stonks_overwatch", "BitvavoTransactions")
+    database = schema_editor.connection.alias
+    seen = set()
+    updated = []
+    duplicates = []
+    for transaction in transactions.objects.using(database).order_by("executed_at", "id"):
+        transaction.fingerprint = transaction_fingerprint(
+            transaction.executed_at,
+            transaction.type,
+            transaction.sent_currency,
+            transaction.sent_amount,
+            transaction.received_currency,
+            transaction.received_amount,
+        )
+        if transaction.fingerprint in seen:
+            duplicates.append(transaction.id)
+        else:
+            seen.add(transaction.fingerprint)
+            updated.append(transaction)
+
+    transactions.objects.using(database).filter(id__in=duplicates).delete()
+    transactions.objects.using(database).bulk_update(updated, ["fingerprint"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0016_bitvavoproductquotation_complete_through"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bitvavotransactions",
+            name="fingerprint",
+            field=models.CharField(blank=True, default=None, max_length=64, null=True),
+        ),
+        migrations.RunPython(fingerprint_transactions, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="bitvavotransactions",
+            name="fingerprint",
+            field=models.CharField(blank=True, default=None, max_length=64, null=True, unique=True),
+        ),
+    ]
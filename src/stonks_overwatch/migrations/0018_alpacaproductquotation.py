@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0017_bitvavotransactions_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AlpacaProductQuotation",
+            fields=[
+                ("symbol", models.CharField(max_length=25, primary_key=True, serialize=False)),
+                ("interval", models.CharField(max_length=10)),
+                ("last_import", models.DateTimeField()),
+                ("quotations", models.JSONField()),
+                ("complete_through", models.DateField(blank=True, default=None, null=True)),
+            ],
+            options={
+                "db_table": '"alpaca_productquotation"',
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0018_alpacaproductquotation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IBKRCashTransfer",
+            fields=[
+                ("id", models.CharField(max_length=40, primary_key=True, serialize=False)),
+                ("acct_id", models.CharField(max_length=20)),
+                ("date", models.DateField()),
+                ("currency", models.CharField(max_length=3)),
+                ("amount", models.DecimalField(decimal_places=10, max_digits=20)),
+                ("description", models.CharField(max_length=200)),
+            ],
+            options={
+                "db_table": '"ibkr_cash_transfers"',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0019_ibkrcashtransfer"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IBKRProductQuotation",
+            fields=[
+                ("conid", models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ("interval", models.CharField(max_length=10)),
+                ("last_import", models.DateTimeField()),
+                ("quotations", models.JSONField()),
+                ("complete_through", models.DateField(blank=True, default=None, null=True)),
+            ],
+            options={
+                "db_table": '"ibkr_productquotation"',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0020_ibkrproductquotation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DividendAggregateStatus",
+            fields=[
+                ("portfolio_id", models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ("computed_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "verbose_name": "Dividend Aggregate Status",
+                "verbose_name_plural": "Dividend Aggregate Statuses",
+                "db_table": "dividend_aggregate_status",
+            },
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0021_dividendaggregatestatus"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="portfoliodailyvalue",
+            name="currency",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stonks_overwatch", "0022_portfoliodailyvalue_currency"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dividendaggregatestatus",
+            name="base_currency",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+    ]
@@ -3,6 +3,7 @@ from typing import List
 from stonks_overwatch.core.aggregators.base_aggregator import BaseAggregator
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.models import AccountOverview, PortfolioId
+from stonks_overwatch.services.utilities.pagination import Page, PageQuery
 
 
 class AccountOverviewAggregatorService(BaseAggregator):
@@ -15,6 +16,10 @@ class AccountOverviewAggregatorService(BaseAggregator):
             selected_portfolio, "get_account_overview", sort_key=lambda k: k.datetime, reverse=True
         )
 
+    def get_account_overview_page(self, selected_portfolio: PortfolioId, query: PageQuery) -> Page[AccountOverview]:
+        """Return a page of the account overview of all enabled brokers, filtered and sorted by date."""
+        return self._collect_page(selected_portfolio, "get_account_overview_page", query, sort_key=lambda k: k.datetime)
+
     def aggregate_data(self, selected_portfolio: PortfolioId) -> List[AccountOverview]:
         """
         Aggregate account overview data from all enabled brokers.
@@ -1,8 +1,11 @@
 from typing import List
 
+from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.core.aggregators.base_aggregator import BaseAggregator
+from stonks_overwatch.core.models import DividendMonthlyAggregateRepository
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.models import Dividend, PortfolioId
+from stonks_overwatch.settings import DEBUG_MODE
 
 
 class DividendsAggregatorService(BaseAggregator):
@@ -13,6 +16,70 @@ class DividendsAggregatorService(BaseAggregator):
         # Use the new helper method to collect and sort dividend data
         return self._collect_and_sort(selected_portfolio, "get_dividends", sort_key=lambda k: k.payment_date)
 
+    def get_monthly_dividends(self, selected_portfolio: PortfolioId) -> List[dict]:
+        """
+        Return the paid dividends aggregated per broker, month and currency.
+
+        The aggregates are read from the DividendMonthlyAggregate table written by the update jobs.
+        Only the brokers whose aggregates were never computed, or computed in another base currency,
+        are aggregated on the fly; a broker without dividends has computed, empty aggregates.
+        """
+        enabled_brokers = [broker_name.value for broker_name in self._get_enabled_brokers(selected_portfolio)]
+        if not enabled_brokers:
+            return []
+
+        stored_aggregates = DividendMonthlyAggregateRepository.get_monthly_dividends(
+            enabled_brokers, base_currency=self.config.base_currency
+        )
+
+        monthly_dividends = []
+        for broker_name in enabled_brokers:
+            aggregates = stored_aggregates.get(broker_name)
+            if aggregates is None:
+                self._logger.debug(f"No monthly dividends computed for {broker_name}, aggregating them")
+                aggregates = self.aggregate_monthly_dividends(self._get_broker_dividends(broker_name))
+            monthly_dividends.extend(aggregates)
+
+        return sorted(monthly_dividends, key=lambda k: (k["year"], k["month"]))
+
+    def _get_broker_dividends(self, broker_name: str) -> List[Dividend]:
+        try:
+            return self._broker_services[BrokerName(broker_name)].get_dividends()
+        except Exception as e:
+            self._logger.error(f"Failed to get dividends for {broker_name}: {e}", exc_info=DEBUG_MODE)
+            return []
+
+    @staticmethod
+    def aggregate_monthly_dividends(dividends: List[Dividend]) -> List[dict]:
+        """Aggregate the paid dividends per month and currency."""
+        aggregates = {}
+        for dividend in dividends:
+            if not dividend.is_paid():
+                continue
+
+            key = (dividend.payment_date.year, dividend.payment_date.month, dividend.currency)
+            aggregate = aggregates.setdefault(
+                key,
+                {
+                    "year": key[0],
+                    "month": key[1],
+                    "currency": key[2],
+                    "net_amount": 0.0,
+                    "gross_amount": 0.0,
+                    "payouts": 0,
+                },
+            )
+            aggregate["net_amount"] += dividend.net_amount()
+            aggregate["gross_amount"] += dividend.gross_amount()
+            if dividend.amount > 0:
+                aggregate["payouts"] += 1
+
+        for aggregate in aggregates.values():
+            aggregate["net_amount"] = round(aggregate["net_amount"], 2)
+            aggregate["gross_amount"] = round(aggregate["gross_amount"], 2)
+
+        return list(aggregates.values())
+
     def aggregate_data(self, selected_portfolio: PortfolioId) -> List[Dividend]:
         """
         Aggregate dividend data from all enabled brokers.
@@ -1,17 +1,53 @@
-from typing import List
+from typing import Dict, List
 
+from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.core.aggregators.base_aggregator import BaseAggregator
 from stonks_overwatch.core.service_types import ServiceType
-from stonks_overwatch.services.models import Fee, PortfolioId
+from stonks_overwatch.services.models import Fee, FeeType, PortfolioId
+from stonks_overwatch.settings import DEBUG_MODE
 
 
 class FeesAggregatorService(BaseAggregator):
     def __init__(self):
         super().__init__(ServiceType.FEE)
+        self._broker_fees: Dict[PortfolioId, Dict[BrokerName, List[Fee]]] = {}
+
+    def _get_broker_fees(self, selected_portfolio: PortfolioId) -> Dict[BrokerName, List[Fee]]:
+        """
+        Collect the fees of each enabled broker.
+
+        The fees are retrieved once per aggregator instance, which lives for a single request, and are
+        reused by get_fee_totals if they are already loaded.
+        """
+        if selected_portfolio not in self._broker_fees:
+            self._broker_fees[selected_portfolio] = self._collect_broker_data(selected_portfolio, "get_fees")
+
+        return self._broker_fees[selected_portfolio]
 
     def get_fees(self, selected_portfolio: PortfolioId) -> list[Fee]:
-        # Use the new helper method to collect and sort fee data
-        return self._collect_and_sort(selected_portfolio, "get_fees", sort_key=lambda k: (k.date, k.time), reverse=True)
+        fees = [fee for broker_fees in self._get_broker_fees(selected_portfolio).values() for fee in broker_fees]
+        return sorted(fees, key=lambda k: (k.date, k.time), reverse=True)
+
+    def get_fee_totals(self, selected_portfolio: PortfolioId) -> Dict[FeeType, float]:
+        """
+        Return the total fee value of each fee type, over all the enabled brokers.
+
+        The fees already retrieved in this request are summed. Otherwise, each broker computes its totals
+        without the fee list when it can aggregate them in the database.
+        """
+        totals = dict.fromkeys(FeeType, 0.0)
+        loaded_fees = self._broker_fees.get(selected_portfolio, {})
+        for broker_name in self._get_enabled_brokers(selected_portfolio):
+            try:
+                broker_totals = self._broker_services[broker_name].get_fee_totals(fees=loaded_fees.get(broker_name))
+            except Exception as e:
+                self._logger.error(f"Failed to get fee totals from {broker_name}: {e}", exc_info=DEBUG_MODE)
+                continue
+
+            for fee_type, total in broker_totals.items():
+                totals[fee_type] += total
+
+        return totals
 
     def aggregate_data(self, selected_portfolio: PortfolioId) -> List[Fee]:
         """
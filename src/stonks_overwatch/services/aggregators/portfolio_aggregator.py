@@ -1,26 +1,53 @@
 from collections import defaultdict
-from typing import List
+from copy import copy
+from datetime import date
+from typing import ClassVar, Dict, List, Optional
 
+from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.core.aggregators.base_aggregator import BaseAggregator
 from stonks_overwatch.core.aggregators.data_merger import DataMerger
+from stonks_overwatch.core.models import PortfolioDailyValueRepository
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.brokers.yfinance.services.market_data_service import YFinance
 from stonks_overwatch.services.models import DailyValue, PortfolioEntry, PortfolioId, TotalPortfolio
+from stonks_overwatch.services.utilities.ttl_snapshot import TtlSnapshotMap
+from stonks_overwatch.settings import DEBUG_MODE
+from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.domain.constants import ProductType, Sector
 
 
 class PortfolioAggregatorService(BaseAggregator):
+    # Chart series built from the daily values, keyed by portfolio and interval. The aggregator only lives for
+    # a single request, so they are kept in-process and dropped by the update jobs when they store new snapshots
+    SERIES_TTL = 60 * 5
+    series_snapshots: ClassVar[TtlSnapshotMap[tuple, dict]] = TtlSnapshotMap(ttl_seconds=SERIES_TTL)
+
     def __init__(self):
         super().__init__(ServiceType.PORTFOLIO)
         self.yfinance = YFinance()
+        self._broker_portfolios: Dict[PortfolioId, Dict[BrokerName, List[PortfolioEntry]]] = {}
+
+    def _get_broker_portfolios(self, selected_portfolio: PortfolioId) -> Dict[BrokerName, List[PortfolioEntry]]:
+        """
+        Collect the portfolio of each enabled broker.
+
+        The portfolios are computed once per aggregator instance, which lives for a single request, and are
+        shared by get_portfolio and get_portfolio_total.
+        """
+        if selected_portfolio not in self._broker_portfolios:
+            self._broker_portfolios[selected_portfolio] = self._collect_broker_data(selected_portfolio, "get_portfolio")
+
+        return self._broker_portfolios[selected_portfolio]
 
     def get_portfolio(self, selected_portfolio: PortfolioId) -> List[PortfolioEntry]:
         self._logger.debug("Get Portfolio")
 
-        # Use the new helper method to collect and merge portfolio data
-        portfolio = self._collect_and_merge_lists(
-            selected_portfolio, "get_portfolio", merger_func=DataMerger.merge_portfolio_entries
-        )
+        # Merging and enriching update the entries in place, so work on copies of the broker entries
+        portfolio = [
+            copy(entry) for entries in self._get_broker_portfolios(selected_portfolio).values() for entry in entries
+        ]
+        if portfolio:
+            portfolio = DataMerger.merge_portfolio_entries(portfolio)
 
         self._calculate_product_type_shares(portfolio)
         self._fill_missing_entry_info(portfolio)
@@ -40,41 +67,41 @@ class PortfolioAggregatorService(BaseAggregator):
                 e.product_type_share = (e.value / group_total) if group_total > 0 else 0.0
 
     def _fill_missing_entry_info(self, portfolio: List[PortfolioEntry]):
+        # Only the stored ticker info is used, in a single query. Missing ticker info is fetched by the update jobs
+        symbols = {entry.symbol for entry in portfolio if entry.product_type in (ProductType.STOCK, ProductType.ETF)}
+        ticker_infos = self.yfinance.get_stored_ticker_infos(symbols) if symbols else {}
+
         for entry in portfolio:
-            self._assign_name(entry)
-            self._assign_country(entry)
-            self._assign_sector(entry)
-            self._assign_industry(entry)
+            ticker_info = ticker_infos.get(entry.symbol)
+            self._assign_name(entry, ticker_info)
+            self._assign_country(entry, ticker_info)
+            self._assign_sector_industry(entry, ticker_info)
             self._warn_if_unknown_sector(entry)
 
-    def _assign_name(self, entry: PortfolioEntry):
+    def _assign_name(self, entry: PortfolioEntry, ticker_info: Optional[dict]):
         if entry.product_type not in (ProductType.STOCK, ProductType.ETF):
             return
         if not entry.name or entry.name == entry.symbol:
-            name = self.yfinance.get_name(entry.symbol)
+            name = self.yfinance.parse_name(ticker_info)
             if name:
                 entry.name = name
 
-    def _assign_country(self, entry: PortfolioEntry):
+    def _assign_country(self, entry: PortfolioEntry, ticker_info: Optional[dict]):
         if not entry.country and entry.product_type in [ProductType.STOCK, ProductType.ETF]:
-            entry.country = self.yfinance.get_country(entry.symbol)
+            entry.country = self.yfinance.parse_country(ticker_info)
 
-    def _assign_sector(self, entry: PortfolioEntry):
+    def _assign_sector_industry(self, entry: PortfolioEntry, ticker_info: Optional[dict]):
         if entry.product_type == ProductType.CASH:
             entry.sector = Sector.CASH
         elif entry.product_type == ProductType.CRYPTO:
             entry.sector = Sector.CRYPTO
         elif entry.product_type == ProductType.ETF:
             entry.sector = Sector.ETF
-        elif entry.product_type == ProductType.STOCK and entry.sector in (None, Sector.UNKNOWN):
-            sector, _ = self.yfinance.get_sector_industry(entry.symbol)
-            if sector != Sector.UNKNOWN:
+        elif entry.product_type == ProductType.STOCK:
+            sector, industry = self.yfinance.parse_sector_industry(ticker_info)
+            if entry.sector in (None, Sector.UNKNOWN) and sector != Sector.UNKNOWN:
                 entry.sector = sector
-
-    def _assign_industry(self, entry: PortfolioEntry):
-        if entry.product_type == ProductType.STOCK and (not entry.industry or entry.industry == "Unknown"):
-            _, industry = self.yfinance.get_sector_industry(entry.symbol)
-            if industry and industry != "Unknown":
+            if (not entry.industry or entry.industry == "Unknown") and industry and industry != "Unknown":
                 entry.industry = industry
 
     def _warn_if_unknown_sector(self, entry: PortfolioEntry):
@@ -84,18 +111,15 @@ class PortfolioAggregatorService(BaseAggregator):
     def get_portfolio_total(self, selected_portfolio: PortfolioId) -> TotalPortfolio:
         self._logger.debug(f"Get Portfolio Total. Selected Portfolio: {selected_portfolio}")
 
-        # Use the new helper method to collect and merge portfolio totals
-        merged_total = self._collect_and_merge_objects(
-            selected_portfolio,
-            "get_portfolio_total",
-            expected_type=TotalPortfolio,
-            merger_func=DataMerger.merge_total_portfolios,
-            portfolio=None,
-        )
+        totals = []
+        for broker_name, portfolio in self._get_broker_portfolios(selected_portfolio).items():
+            try:
+                totals.append(self._broker_services[broker_name].get_portfolio_total(portfolio=portfolio))
+            except Exception as e:
+                self._logger.error(f"Failed to get portfolio total from {broker_name}: {e}", exc_info=DEBUG_MODE)
 
-        # If we got a merged result, return it; otherwise return empty portfolio
-        if isinstance(merged_total, TotalPortfolio):
-            return merged_total
+        if totals:
+            return DataMerger.merge_total_portfolios(totals)
         else:
             # Return empty portfolio if no data
             base_currency = self.config.base_currency
@@ -108,14 +132,90 @@ class PortfolioAggregatorService(BaseAggregator):
                 total_deposit_withdrawal=0.0,
             )
 
-    def calculate_historical_value(self, selected_portfolio: PortfolioId) -> List[DailyValue]:
-        self._logger.debug(f"Calculating historical value for {selected_portfolio}")
+    def calculate_historical_value(
+        self, selected_portfolio: PortfolioId, start_date: Optional[str] = None
+    ) -> List[DailyValue]:
+        """
+        Return the daily portfolio value, starting at `start_date` when given.
+
+        The values are read from the PortfolioDailyValue snapshots written by the update jobs. Brokers
+        without snapshots in the base currency yet are calculated on the fly. The brokers don't have
+        values for the same days (e.g. crypto brokers include the weekends), so every broker is carried
+        forward to `start_date` and to the days of the others before they are summed.
+        """
+        self._logger.debug(f"Calculating historical value for {selected_portfolio} from {start_date}")
+
+        enabled_brokers = [broker_name.value for broker_name in self._get_enabled_brokers(selected_portfolio)]
+        if not enabled_brokers:
+            return []
 
-        # Use the new helper method to collect and merge historical data
-        return self._collect_and_merge_lists(
-            selected_portfolio, "calculate_historical_value", merger_func=DataMerger.merge_historical_values
+        start = date.fromisoformat(start_date) if start_date else None
+        stored_values = PortfolioDailyValueRepository.get_daily_values(
+            enabled_brokers, start_date=start, currency=self.config.base_currency
         )
 
+        broker_values = []
+        for broker_name in enabled_brokers:
+            snapshots = stored_values.get(broker_name)
+            if snapshots:
+                broker_values.append(
+                    [
+                        DailyValue(x=row["date"].strftime(LocalizationUtility.DATE_FORMAT), y=row["value"])
+                        for row in snapshots
+                    ]
+                )
+            else:
+                broker_values.append(self._calculate_broker_historical_value(broker_name, start_date))
+
+        days = {item["x"] for values in broker_values for item in values if not start_date or item["x"] >= start_date}
+        if start_date:
+            days.add(start_date)
+        days = sorted(days)
+
+        historical_values = []
+        for values in broker_values:
+            historical_values.extend(self._forward_fill(values, days))
+
+        return DataMerger.merge_historical_values(historical_values)
+
+    @staticmethod
+    def _forward_fill(values: List[DailyValue], days: List[str]) -> List[DailyValue]:
+        """
+        Return the value of every day, carrying the last known value forward.
+
+        Args:
+            values: Values sorted by date
+            days: Days to fill, sorted. Days before the first value are skipped
+        """
+        filled = []
+        index = 0
+        last_value = None
+        for day in days:
+            while index < len(values) and values[index]["x"] <= day:
+                last_value = values[index]["y"]
+                index += 1
+            if last_value is not None:
+                filled.append(DailyValue(x=day, y=last_value))
+
+        return filled
+
+    def _calculate_broker_historical_value(self, broker_name: str, start_date: Optional[str]) -> List[DailyValue]:
+        self._logger.debug(f"No portfolio snapshots stored for {broker_name}, calculating them")
+        try:
+            values = sorted(
+                self._broker_services[BrokerName(broker_name)].calculate_historical_value(), key=lambda k: k["x"]
+            )
+        except Exception as e:
+            self._logger.error(f"Failed to calculate historical value for {broker_name}: {e}", exc_info=DEBUG_MODE)
+            return []
+
+        if not start_date:
+            return values
+
+        # Keep the last value before the start date, as the snapshots do
+        index = next((i for i, item in enumerate(values) if item["x"] >= start_date), len(values))
+        return values[max(index - 1, 0) :]
+
     def aggregate_data(self, selected_portfolio: PortfolioId) -> List[PortfolioEntry]:
         """
         Aggregate portfolio data from all enabled brokers.
@@ -3,6 +3,7 @@ from typing import List
 from stonks_overwatch.core.aggregators.base_aggregator import BaseAggregator
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.models import PortfolioId, Transaction
+from stonks_overwatch.services.utilities.pagination import Page, PageQuery
 
 
 class TransactionsAggregatorService(BaseAggregator):
@@ -18,6 +19,12 @@ class TransactionsAggregatorService(BaseAggregator):
             reverse=True,
         )
 
+    def get_transactions_page(self, selected_portfolio: PortfolioId, query: PageQuery) -> Page[Transaction]:
+        """Return a page of the transactions of all enabled brokers, filtered and sorted by date."""
+        return self._collect_page(
+            selected_portfolio, "get_transactions_page", query, sort_key=lambda k: (k.date, k.time)
+        )
+
     def aggregate_data(self, selected_portfolio: PortfolioId) -> List[Transaction]:
         """
         Aggregate transaction data from all enabled brokers.
@@ -6,13 +6,14 @@ raw HTTP access to the activities endpoint (dividends, deposits) which is not
 yet exposed in alpaca-py.
 """
 
-from datetime import date, datetime, timezone as dt_timezone
+from datetime import date, datetime, time, timezone as dt_timezone
 from typing import Any, Dict, List, Optional
 
 import requests
-from alpaca.data.enums import DataFeed
+from alpaca.data.enums import Adjustment, DataFeed
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockLatestQuoteRequest
+from alpaca.data.requests import StockBarsRequest, StockLatestQuoteRequest
+from alpaca.data.timeframe import TimeFrame
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import QueryOrderStatus
 from alpaca.trading.requests import GetOrdersRequest
@@ -87,6 +88,12 @@ class AlpacaClient:
             mode = "paper" if paper else "live"
             self.logger.info(f"Alpaca client initialized in {mode} trading mode")
 
+    @property
+    def account_key(self) -> tuple:
+        """Identify the account the client connects to, by its API key and trading mode."""
+        credentials = self.alpaca_config.get_credentials
+        return (credentials.api_key if credentials else None, self.alpaca_config.paper_trading)
+
     def _check_offline_mode(self) -> None:
         """
         Raise AlpacaOfflineModeError if in offline/demo mode.
@@ -155,9 +162,14 @@ class AlpacaClient:
         self.logger.debug("Retrieving open positions")
         return self._get_trading_client().get_all_positions()
 
-    def get_orders(self, after: Optional[date] = None, until: Optional[date] = None) -> List[Any]:
+    def get_orders(
+        self,
+        after: Optional[date | datetime] = None,
+        until: Optional[date] = None,
+        status: QueryOrderStatus = QueryOrderStatus.CLOSED,
+    ) -> List[Any]:
         """
-        Retrieve all closed (filled) orders using forward pagination.
+        Retrieve all the orders with the given status (closed by default) using forward pagination.
 
         The alpaca-py SDK caps each response at 500 orders.  This method
         pages forward by advancing the ``after`` cursor to the ``submitted_at``
@@ -165,8 +177,9 @@ class AlpacaClient:
         a page with fewer than 500 items is returned.
 
         Args:
-            after: Only return orders submitted after this date
+            after: Only return orders submitted after this date or timestamp
             until: Only return orders submitted before this date
+            status: Whether to return the closed or the open orders
 
         Returns:
             List of all matching Alpaca Order objects, oldest first
@@ -186,7 +199,7 @@ class AlpacaClient:
 
         while True:
             request_params: Dict[str, Any] = {
-                "status": QueryOrderStatus.CLOSED,
+                "status": status,
                 "limit": page_size,
                 "direction": "asc",
             }
@@ -223,6 +236,7 @@ class AlpacaClient:
         activity_types: Optional[List[ActivityType]] = None,
         after: Optional[date] = None,
         page_size: int = 100,
+        after_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Retrieve account activities (dividends, deposits, withdrawals) via raw HTTP.
@@ -234,6 +248,8 @@ class AlpacaClient:
             activity_types: List of activity types to filter by (e.g. [ActivityType.DIV, ActivityType.CSD])
             after: Only return activities after this date
             page_size: Number of results per page
+            after_id: Only return activities newer than this activity id. The pages are then
+                requested oldest first, starting right after it
 
         Returns:
             List of activity dictionaries
@@ -258,16 +274,16 @@ class AlpacaClient:
         }
 
         params: Dict[str, Any] = {
-            "direction": "desc",
+            "direction": "asc" if after_id else "desc",
             "page_size": page_size,
         }
         if activity_types:
             params["activity_types"] = ",".join(at.value for at in activity_types)
-        if after:
+        if after and not after_id:
             params["after"] = after.isoformat()
 
         all_results: List[Dict[str, Any]] = []
-        page_token: Optional[str] = None
+        page_token: Optional[str] = after_id
 
         while True:
             if page_token:
@@ -330,3 +346,41 @@ class AlpacaClient:
                 prices[symbol] = float(price)
 
         return prices
+
+    def get_daily_bars(self, symbols: List[str], start: date, end: date) -> Dict[str, Dict[str, float]]:
+        """
+        Retrieve the daily close prices of a list of stock symbols with a single request.
+
+        Uses the IEX feed, like get_latest_prices. The prices are not adjusted for splits, so they
+        match the quantities of the stored orders. The SDK follows the result pages.
+
+        Args:
+            symbols: List of ticker symbols (e.g. ["AAPL", "TSLA"])
+            start: First day to retrieve
+            end: Last day to retrieve (inclusive)
+
+        Returns:
+            Dictionary mapping each symbol to its close prices by date (YYYY-MM-DD)
+
+        Raises:
+            AlpacaOfflineModeError: If in offline mode
+        """
+        if not symbols:
+            return {}
+
+        self.logger.debug(f"Retrieving daily bars for {symbols} from {start} to {end}")
+        request = StockBarsRequest(
+            symbol_or_symbols=symbols,
+            timeframe=TimeFrame.Day,
+            start=datetime.combine(start, time.min, tzinfo=dt_timezone.utc),
+            end=datetime.combine(end, time.max, tzinfo=dt_timezone.utc),
+            adjustment=Adjustment.RAW,
+            feed=DataFeed.IEX,
+        )
+        bar_set = self._get_data_client().get_stock_bars(request)
+
+        bars: Dict[str, Dict[str, float]] = {}
+        for symbol, symbol_bars in bar_set.data.items():
+            bars[symbol] = {bar.timestamp.date().isoformat(): float(bar.close) for bar in symbol_bars}
+
+        return bars
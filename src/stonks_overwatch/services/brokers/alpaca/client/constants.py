@@ -140,5 +140,8 @@ DEPOSIT_ACTIVITY_TYPES = [
     ActivityType.JNL,  # Journal entry (generic) — may carry a net_amount
 ]
 
+# Order statuses returned by the closed orders query. Any other status can still change
+CLOSED_ORDER_STATUSES = ["filled", "canceled", "expired", "rejected", "replaced", "done_for_day"]
+
 ALPACA_BASE_URL = "https://api.alpaca.markets"
 ALPACA_PAPER_BASE_URL = "https://paper-api.alpaca.markets"
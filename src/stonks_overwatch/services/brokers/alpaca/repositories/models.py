@@ -54,3 +54,17 @@ class AlpacaActivity(models.Model):
     per_share_amount = models.DecimalField(max_digits=20, decimal_places=10, default=None, blank=True, null=True)
     activity_date = models.DateField(blank=True, null=True)
     description = models.CharField(max_length=500, blank=True, null=True)
+
+
+class AlpacaProductQuotation(models.Model):
+    """Stores the daily close prices of the traded symbols, imported by the UpdateService."""
+
+    class Meta:
+        db_table = '"alpaca_productquotation"'
+
+    symbol = models.CharField(max_length=25, primary_key=True)
+    interval = models.CharField(max_length=10)
+    last_import = models.DateTimeField()
+    quotations = models.JSONField()
+    # Last day whose bar was closed when it was imported. Later days still need to be imported
+    complete_through = models.DateField(default=None, blank=True, null=True)
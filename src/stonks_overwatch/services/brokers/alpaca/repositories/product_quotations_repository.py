@@ -0,0 +1,27 @@
+"""Repository for the Alpaca daily close prices."""
+
+from typing import Dict, Iterable
+
+from stonks_overwatch.services.brokers.alpaca.repositories.models import AlpacaProductQuotation
+
+
+class ProductQuotationsRepository:
+    """Data access layer for AlpacaProductQuotation records."""
+
+    @staticmethod
+    def get_products_quotations(symbols: Iterable[str]) -> Dict[str, AlpacaProductQuotation]:
+        """
+        Retrieve the stored quotations of the given symbols in a single query.
+
+        Args:
+            symbols: Ticker symbols to retrieve
+
+        Returns:
+            Dictionary mapping each symbol to its AlpacaProductQuotation. Symbols without stored
+            quotations are not included.
+        """
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+
+        return {quotation.symbol: quotation for quotation in AlpacaProductQuotation.objects.filter(symbol__in=symbols)}
@@ -8,6 +8,7 @@ from stonks_overwatch.config.alpaca import AlpacaConfig
 from stonks_overwatch.core.interfaces.account_service import AccountServiceInterface
 from stonks_overwatch.services.brokers.alpaca.client.alpaca_client import AlpacaClient
 from stonks_overwatch.services.brokers.alpaca.services.alpaca_base_service import AlpacaBaseService
+from stonks_overwatch.services.brokers.alpaca.services.portfolio_snapshot import PortfolioSnapshot
 from stonks_overwatch.services.models import AccountOverview
 from stonks_overwatch.utils.core.logger import StonksLogger
 
@@ -46,7 +47,9 @@ class AccountService(AlpacaBaseService, AccountServiceInterface):
         """
         self.logger.debug("Getting Alpaca account overview")
         try:
-            account = self.alpaca_client.get_account()
+            account = PortfolioSnapshot.get(self.alpaca_client).account
+            if account is None:
+                return []
             now = timezone.now()
 
             equity = self._to_base(float(account.equity))
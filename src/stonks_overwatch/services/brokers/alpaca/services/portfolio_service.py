@@ -1,6 +1,8 @@
 """Alpaca portfolio service implementation."""
 
 from collections import defaultdict
+from datetime import date, timedelta
+from functools import cached_property
 from typing import Dict, List, Optional
 
 from django.utils import timezone
@@ -8,10 +10,17 @@ from django.utils import timezone
 from stonks_overwatch.config.alpaca import AlpacaConfig
 from stonks_overwatch.core.interfaces import PortfolioServiceInterface
 from stonks_overwatch.services.brokers.alpaca.client.alpaca_client import AlpacaClient
+from stonks_overwatch.services.brokers.alpaca.repositories.activities_repository import ActivitiesRepository
 from stonks_overwatch.services.brokers.alpaca.repositories.orders_repository import OrdersRepository
 from stonks_overwatch.services.brokers.alpaca.repositories.positions_repository import PositionsRepository
+from stonks_overwatch.services.brokers.alpaca.repositories.product_quotations_repository import (
+    ProductQuotationsRepository,
+)
 from stonks_overwatch.services.brokers.alpaca.services.alpaca_base_service import AlpacaBaseService
+from stonks_overwatch.services.brokers.alpaca.services.deposit_service import DepositService
+from stonks_overwatch.services.brokers.alpaca.services.portfolio_snapshot import PortfolioSnapshot
 from stonks_overwatch.services.models import DailyValue, PortfolioEntry, TotalPortfolio
+from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
 from stonks_overwatch.utils.domain.constants import ProductType
 
@@ -20,8 +29,8 @@ class PortfolioService(AlpacaBaseService, PortfolioServiceInterface):
     """
     Portfolio service for Alpaca Markets.
 
-    Reads positions from the local DB (synced by UpdateService) and
-    fetches latest prices from the Market Data API via AlpacaClient.
+    Reads positions from the local DB (synced by UpdateService) and their
+    latest prices and the account from the shared PortfolioSnapshot.
     """
 
     logger = StonksLogger.get_logger("stonks_overwatch.alpaca.portfolio", "[ALPACA|PORTFOLIO]")
@@ -45,17 +54,11 @@ class PortfolioService(AlpacaBaseService, PortfolioServiceInterface):
             List of PortfolioEntry objects, one per open position
         """
         self.logger.debug("Getting Alpaca portfolio")
-        positions = PositionsRepository.get_all_positions()
-
-        symbols = [p.symbol for p in positions]
-        try:
-            latest_prices = self.alpaca_client.get_latest_prices(symbols)
-        except Exception as e:
-            self.logger.warning(f"Could not fetch latest prices, using stored prices: {e}")
-            latest_prices = {}
+        snapshot = self.get_snapshot()
+        latest_prices = snapshot.prices
 
         portfolio: List[PortfolioEntry] = []
-        for position in positions:
+        for position in snapshot.positions:
             qty = float(position.qty)
             if qty == 0:
                 continue
@@ -89,8 +92,7 @@ class PortfolioService(AlpacaBaseService, PortfolioServiceInterface):
         # Add a cash entry for the USD balance held at Alpaca so it appears
         # as a "Cash" row in the portfolio dashboard (same pattern as DEGIRO).
         try:
-            account = self.alpaca_client.get_account()
-            cash_usd = float(account.cash or 0)
+            cash_usd = float(snapshot.account.cash or 0) if snapshot.account else 0.0
             if cash_usd:
                 portfolio.append(
                     PortfolioEntry(
@@ -114,6 +116,19 @@ class PortfolioService(AlpacaBaseService, PortfolioServiceInterface):
 
         return sorted(portfolio, key=lambda k: k.symbol)
 
+    def get_snapshot(self) -> PortfolioSnapshot:
+        """Return the shared snapshot of positions, latest prices and account."""
+        return PortfolioSnapshot.get(self.alpaca_client)
+
+    def refresh(self) -> PortfolioSnapshot:
+        """Reload the shared snapshot of positions, latest prices and account."""
+        return PortfolioSnapshot.refresh(self.alpaca_client)
+
+    @cached_property
+    def deposit_service(self) -> DepositService:
+        """DepositService sharing this service configuration, created on first use."""
+        return DepositService(config=self.config)
+
     @staticmethod
     def _fifo_realized_gain(orders: list) -> tuple:
         """
@@ -219,36 +234,100 @@ class PortfolioService(AlpacaBaseService, PortfolioServiceInterface):
 
     def calculate_historical_value(self) -> List[DailyValue]:
         """
-        Calculate historical portfolio value.
+        Calculate the daily portfolio value.
 
-        Alpaca does not expose a historical portfolio-value endpoint, so this
-        returns a single data point for today using the current portfolio total.
-        This is enough for the dashboard to render and for the TWR engine to
-        have a baseline, matching the same approach used by IBKR.
+        The positions and the USD cash of every day are rebuilt from the stored filled orders and cash
+        activities (deposits, withdrawals and dividends). The positions are valued with the daily close
+        prices imported by the UpdateService. Days without a close price (holidays, or bars not imported
+        yet) use the last known close, or the last fill price of the symbol. Weekends are skipped.
 
         Returns:
-            List with one DailyValue entry for today's portfolio value
+            List of DailyValue entries in base currency, oldest first
         """
-        self.logger.debug("Calculating historical value for Alpaca (today only)")
-        try:
-            portfolio_total = self.get_portfolio_total()
-            today = timezone.now().strftime("%Y-%m-%d")
-            return [DailyValue(x=today, y=portfolio_total.current_value)]
-        except Exception as e:
-            self.logger.error(f"Error calculating historical value for Alpaca: {e}")
+        self.logger.debug("Calculating historical value for Alpaca")
+
+        orders_by_day: Dict[date, list] = defaultdict(list)
+        for order in OrdersRepository.get_filled_orders_chronological():
+            orders_by_day[order.filled_at.date()].append(order)
+
+        cash_by_day: Dict[date, float] = defaultdict(float)
+        activities = ActivitiesRepository.get_deposit_activities() + ActivitiesRepository.get_dividend_activities()
+        for activity in activities:
+            if activity.activity_date:
+                cash_by_day[activity.activity_date] += float(activity.net_amount or 0)
+
+        if not orders_by_day and not cash_by_day:
             return []
 
-    def calculate_product_growth(self) -> dict:
+        symbols = {order.symbol for orders in orders_by_day.values() for order in orders}
+        quotations = {
+            symbol: quotation.quotations
+            for symbol, quotation in ProductQuotationsRepository.get_products_quotations(symbols).items()
+        }
+
+        positions: Dict[str, float] = defaultdict(float)
+        prices: Dict[str, float] = {}
+        cash = 0.0
+        dataset: List[DailyValue] = []
+
+        day = min(list(orders_by_day) + list(cash_by_day))
+        today = timezone.now().date()
+        while day <= today:
+            cash += self._apply_orders(orders_by_day.get(day, []), positions, prices)
+            cash += cash_by_day.get(day, 0.0)
+
+            day_str = LocalizationUtility.format_date_from_date(day)
+            for symbol, quotes in quotations.items():
+                if day_str in quotes:
+                    prices[symbol] = quotes[day_str]
+
+            if day.weekday() < 5:
+                value = cash + sum(qty * prices.get(symbol, 0.0) for symbol, qty in positions.items())
+                dataset.append(DailyValue(x=day_str, y=LocalizationUtility.round_value(self._to_base(value, day))))
+
+            day += timedelta(days=1)
+
+        return dataset
+
+    @staticmethod
+    def _apply_orders(orders: list, positions: Dict[str, float], prices: Dict[str, float]) -> float:
+        """
+        Apply filled orders to the positions, and record their fill price as the last known price.
+
+        Returns:
+            The USD cash change of the orders (negative for buys, positive for sells)
         """
-        Calculate growth history per product.
+        cash_change = 0.0
+        for order in orders:
+            qty = float(order.filled_qty or 0)
+            price = float(order.filled_avg_price or 0)
+            if order.side == "buy":
+                positions[order.symbol] += qty
+                cash_change -= qty * price
+            else:
+                positions[order.symbol] -= qty
+                cash_change += qty * price
+            prices[order.symbol] = price
+
+        return cash_change
 
-        Not implemented for Alpaca yet — returns an empty dict.
+    def calculate_product_growth(self) -> dict:
+        """
+        Calculate the quantity history of each traded symbol from the stored filled orders.
 
         Returns:
-            Empty dict (product growth data not yet supported)
+            Dictionary mapping each symbol to {"history": {date (YYYY-MM-DD): quantity held after that day}}
         """
-        self.logger.debug("Product growth calculation not yet implemented for Alpaca")
-        return {}
+        self.logger.debug("Calculating Alpaca product growth")
+        product_growth: Dict[str, dict] = {}
+        for order in OrdersRepository.get_filled_orders_chronological():
+            history = product_growth.setdefault(order.symbol, {"history": {}})["history"]
+            quantity = list(history.values())[-1] if history else 0.0
+            qty = float(order.filled_qty or 0)
+            quantity += qty if order.side == "buy" else -qty
+            history[LocalizationUtility.format_date_from_date(order.filled_at.date())] = quantity
+
+        return product_growth
 
     def get_portfolio_total(self, portfolio: Optional[List[PortfolioEntry]] = None) -> TotalPortfolio:
         """
@@ -276,9 +355,7 @@ class PortfolioService(AlpacaBaseService, PortfolioServiceInterface):
         # Delegate to DepositService so the deposit definition and FX conversion
         # logic stays in one place.  Both services share the same config so
         # base_currency and historical rates are consistent.
-        from stonks_overwatch.services.brokers.alpaca.services.deposit_service import DepositService
-
-        deposits = DepositService(config=self.config).get_cash_deposits()
+        deposits = self.deposit_service.get_cash_deposits()
         total_deposit_withdrawal = sum(d.change for d in deposits)
 
         # Total P/L = current portfolio value minus total deposited.
@@ -0,0 +1,80 @@
+"""Snapshot of the Alpaca positions, latest prices and account."""
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional
+
+from stonks_overwatch.services.brokers.alpaca.client.alpaca_client import AlpacaClient
+from stonks_overwatch.services.brokers.alpaca.repositories.models import AlpacaPosition
+from stonks_overwatch.services.brokers.alpaca.repositories.positions_repository import PositionsRepository
+from stonks_overwatch.services.utilities.ttl_snapshot import TtlSnapshot, TtlSnapshotMap
+from stonks_overwatch.utils.core.logger import StonksLogger
+
+
+@dataclass(frozen=True)
+class PortfolioSnapshot:
+    """
+    Stored positions, together with their latest prices and the account, read at the same time.
+
+    The page views and template tags read the shared snapshot instead of calling the Market Data
+    and Trading APIs on every access. There is one snapshot per account (API key and trading mode).
+    It expires after TTL seconds, and the UpdateService refreshes it after every sync.
+
+    If the prices or the account cannot be fetched, the ones of the previous snapshot are kept and
+    the snapshot is not complete: it expires after RETRY_TTL seconds, so the APIs are called again soon.
+    """
+
+    TTL: ClassVar[int] = 60  # seconds
+    RETRY_TTL: ClassVar[int] = 5  # seconds
+    logger: ClassVar = StonksLogger.get_logger("stonks_overwatch.alpaca.snapshot", "[ALPACA|SNAPSHOT]")
+    _store: ClassVar[TtlSnapshotMap[tuple, "PortfolioSnapshot"]] = TtlSnapshotMap(
+        ttl_seconds=lambda snapshot: PortfolioSnapshot.TTL if snapshot.complete else PortfolioSnapshot.RETRY_TTL
+    )
+
+    positions: List[AlpacaPosition] = field(default_factory=list)
+    prices: Dict[str, float] = field(default_factory=dict)
+    account: Optional[Any] = None
+    complete: bool = True
+
+    @classmethod
+    def get(cls, client: AlpacaClient) -> "PortfolioSnapshot":
+        """Return the snapshot of the client account, loading it if it is missing or expired."""
+        store = cls._snapshot(client)
+        previous = store.peek()
+        return store.get(lambda: cls._load(client, previous))
+
+    @classmethod
+    def refresh(cls, client: AlpacaClient) -> "PortfolioSnapshot":
+        """Load the snapshot of the client account again, even if it has not expired yet."""
+        store = cls._snapshot(client)
+        previous = store.peek()
+        return store.refresh(lambda: cls._load(client, previous))
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the snapshots of every account, so the next access loads them again."""
+        cls._store.invalidate()
+
+    @classmethod
+    def _snapshot(cls, client: AlpacaClient) -> TtlSnapshot["PortfolioSnapshot"]:
+        return cls._store.snapshot(client.account_key)
+
+    @classmethod
+    def _load(cls, client: AlpacaClient, previous: Optional["PortfolioSnapshot"]) -> "PortfolioSnapshot":
+        positions = PositionsRepository.get_all_positions()
+        complete = True
+
+        try:
+            prices = client.get_latest_prices([position.symbol for position in positions])
+        except Exception as e:
+            cls.logger.warning(f"Could not fetch latest prices, using the previous or stored prices: {e}")
+            prices = previous.prices if previous else {}
+            complete = False
+
+        try:
+            account = client.get_account()
+        except Exception as e:
+            cls.logger.warning(f"Could not fetch account, using the previous one: {e}")
+            account = previous.account if previous else None
+            complete = False
+
+        return cls(positions=positions, prices=prices, account=account, complete=complete)
@@ -1,8 +1,13 @@
 """Alpaca update service implementation."""
 
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
+from alpaca.trading.enums import QueryOrderStatus
 from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
 
 from stonks_overwatch.config.alpaca import AlpacaConfig
 from stonks_overwatch.constants import BrokerName
@@ -10,10 +15,21 @@ from stonks_overwatch.core.interfaces.base_service import BaseService
 from stonks_overwatch.core.interfaces.update_service import AbstractUpdateService
 from stonks_overwatch.services.brokers.alpaca.client.alpaca_client import AlpacaClient
 from stonks_overwatch.services.brokers.alpaca.client.constants import (
+    CLOSED_ORDER_STATUSES,
     DEPOSIT_ACTIVITY_TYPES,
     DIVIDEND_ACTIVITY_TYPES,
 )
-from stonks_overwatch.services.brokers.alpaca.repositories.models import AlpacaActivity, AlpacaOrder, AlpacaPosition
+from stonks_overwatch.services.brokers.alpaca.repositories.models import (
+    AlpacaActivity,
+    AlpacaOrder,
+    AlpacaPosition,
+    AlpacaProductQuotation,
+)
+from stonks_overwatch.services.brokers.alpaca.repositories.product_quotations_repository import (
+    ProductQuotationsRepository,
+)
+from stonks_overwatch.services.brokers.alpaca.services.portfolio_service import PortfolioService
+from stonks_overwatch.services.brokers.alpaca.services.portfolio_snapshot import PortfolioSnapshot
 from stonks_overwatch.utils.core.logger import StonksLogger
 
 
@@ -21,10 +37,14 @@ class UpdateService(BaseService, AbstractUpdateService):
     """
     Update service for Alpaca Markets.
 
-    Syncs positions, orders, and activities (dividends, deposits) from the
-    Alpaca API into the local database for use by the read services.
+    Syncs positions, orders, activities (dividends, deposits) and the daily
+    close prices of the traded symbols from the Alpaca API into the local
+    database for use by the read services.
     """
 
+    QUOTATION_INTERVAL = "1Day"
+    BATCH_SIZE = 500
+
     logger = StonksLogger.get_logger("stonks_overwatch.alpaca.update_service", "[ALPACA|UPDATE]")
 
     def __init__(
@@ -67,6 +87,11 @@ class UpdateService(BaseService, AbstractUpdateService):
             self.update_positions()
             self.update_orders()
             self.update_activities()
+            self.update_quotations()
+            self.refresh_portfolio()
+            self.update_ticker_info()
+            self.update_portfolio_snapshot()
+            self.update_dividend_aggregates()
             self._record_sync(success=True)
         except Exception as error:
             self.logger.error("Cannot update Alpaca data!")
@@ -84,30 +109,123 @@ class UpdateService(BaseService, AbstractUpdateService):
             raise
 
     def update_orders(self) -> None:
-        """Fetch all closed orders from Alpaca and upsert them into the DB."""
+        """
+        Fetch the closed and the open orders from Alpaca and upsert them into the DB.
+
+        The open orders are stored too, so the next sync knows which orders can still be filled. Only the closed
+        orders submitted since the oldest order stored as open, or since the newest stored order if none is open,
+        are requested.
+        """
         self._log_message("Updating Alpaca orders...")
         try:
             config = self.alpaca_client.alpaca_config
             after = config.start_date if config else None
+            watermark = self._get_orders_watermark()
+            if watermark:
+                # The API only returns the orders submitted strictly after the cursor
+                after = watermark - timedelta(seconds=1)
             orders = self.alpaca_client.get_orders(after=after)
+            orders += self.alpaca_client.get_orders(status=QueryOrderStatus.OPEN)
             self._import_orders(orders)
         except Exception as error:
             self.logger.error("Failed to update Alpaca orders: %s", str(error), exc_info=True)
             raise
 
+    @staticmethod
+    def _get_orders_watermark() -> Optional[datetime]:
+        """Return the submission time of the oldest order still open at the last sync, or of the newest order."""
+        oldest_open = (
+            AlpacaOrder.objects.exclude(status__in=CLOSED_ORDER_STATUSES)
+            .aggregate(oldest=Min("submitted_at"))
+            .get("oldest")
+        )
+        return oldest_open or AlpacaOrder.objects.aggregate(newest=Max("submitted_at"))["newest"]
+
     def update_activities(self) -> None:
-        """Fetch dividend and deposit activities from Alpaca and upsert them into the DB."""
+        """
+        Fetch dividend and deposit activities from Alpaca and upsert them into the DB.
+
+        The activity ids start with their date, so only the activities after the newest stored id
+        are requested.
+        """
         self._log_message("Updating Alpaca activities...")
         try:
             all_types = DIVIDEND_ACTIVITY_TYPES + DEPOSIT_ACTIVITY_TYPES
             config = self.alpaca_client.alpaca_config
             after = config.start_date if config else None
-            activities = self.alpaca_client.get_activities(activity_types=all_types, after=after)
+            newest_id = AlpacaActivity.objects.aggregate(newest=Max("activity_id"))["newest"]
+            activities = self.alpaca_client.get_activities(activity_types=all_types, after=after, after_id=newest_id)
             self._import_activities(activities)
         except Exception as error:
             self.logger.error("Failed to update Alpaca activities: %s", str(error), exc_info=True)
             raise
 
+    def refresh_portfolio(self) -> None:
+        """Reload the shared PortfolioSnapshot, so the views read the positions just imported."""
+        self._log_message("Refreshing Alpaca portfolio snapshot...")
+        PortfolioSnapshot.refresh(self.alpaca_client)
+
+    def update_quotations(self) -> None:
+        """
+        Import the daily close prices of the traded symbols into the DB.
+
+        Each symbol needs the bars from its first fill through the day it was closed, or through
+        yesterday if it is still held. Only the days after the stored ones are requested, with a
+        single request for all the symbols sharing the same range.
+        """
+        self._log_message("Updating Alpaca daily bars...")
+        product_growth = PortfolioService(config=self.config).calculate_product_growth()
+        stored_quotations = ProductQuotationsRepository.get_products_quotations(product_growth.keys())
+        yesterday = timezone.now().date() - timedelta(days=1)
+
+        symbols_by_range: Dict[Tuple[date, date], List[str]] = defaultdict(list)
+        for symbol, data in product_growth.items():
+            import_range = self._get_import_range(data["history"], stored_quotations.get(symbol), yesterday)
+            if import_range:
+                symbols_by_range[import_range].append(symbol)
+
+        for (start, end), symbols in symbols_by_range.items():
+            try:
+                bars = self.alpaca_client.get_daily_bars(symbols, start, end)
+            except Exception as error:
+                self.logger.error(f"Cannot import daily bars for {symbols} from {start} to {end}: {error}")
+                continue
+
+            for symbol in symbols:
+                stored = stored_quotations.get(symbol)
+                quotations = {**(stored.quotations if stored else {}), **bars.get(symbol, {})}
+                self._retry_database_operation(
+                    AlpacaProductQuotation.objects.update_or_create,
+                    symbol=symbol,
+                    defaults={
+                        "interval": self.QUOTATION_INTERVAL,
+                        "last_import": timezone.now(),
+                        "quotations": dict(sorted(quotations.items())),
+                        "complete_through": end,
+                    },
+                )
+
+    @staticmethod
+    def _get_import_range(
+        history: Dict[str, float], stored: Optional[AlpacaProductQuotation], yesterday: date
+    ) -> Optional[Tuple[date, date]]:
+        """
+        Return the days whose bars still have to be imported for a symbol, or None if it is up to date.
+
+        Args:
+            history: Quantity held after each day with fills, by date (YYYY-MM-DD)
+            stored: The stored quotations of the symbol, if any
+            yesterday: Last day whose bar is closed
+        """
+        days = list(history.keys())
+        start = date.fromisoformat(days[0])
+        end = date.fromisoformat(days[-1]) if abs(history[days[-1]]) < 1e-6 else yesterday
+        if stored and stored.complete_through:
+            start = max(start, stored.complete_through + timedelta(days=1))
+        end = min(end, yesterday)
+
+        return (start, end) if start <= end else None
+
     def _import_positions(self, positions: List[Any]) -> None:
         """Clear and repopulate the positions table from live API data.
 
@@ -137,31 +255,35 @@ class UpdateService(BaseService, AbstractUpdateService):
                     self.logger.error(f"Cannot import position {getattr(position, 'symbol', '?')}: {error}")
 
     def _import_orders(self, orders: List[Any]) -> None:
-        """Upsert orders into the DB, keyed by order_id."""
+        """Upsert orders into the DB, keyed by order_id, with a single statement per batch."""
+        rows = []
         for order in orders:
             try:
-                self._retry_database_operation(
-                    AlpacaOrder.objects.update_or_create,
-                    order_id=str(order.id),
-                    defaults={
-                        "symbol": str(order.symbol),
-                        "qty": str(order.qty) if order.qty else None,
-                        "filled_qty": str(order.filled_qty) if order.filled_qty else None,
-                        "filled_avg_price": str(order.filled_avg_price) if order.filled_avg_price else None,
-                        "side": str(order.side.value) if hasattr(order.side, "value") else str(order.side),
-                        "order_type": str(order.order_type.value)
+                rows.append(
+                    AlpacaOrder(
+                        order_id=str(order.id),
+                        symbol=str(order.symbol),
+                        qty=str(order.qty) if order.qty else None,
+                        filled_qty=str(order.filled_qty) if order.filled_qty else None,
+                        filled_avg_price=str(order.filled_avg_price) if order.filled_avg_price else None,
+                        side=str(order.side.value) if hasattr(order.side, "value") else str(order.side),
+                        order_type=str(order.order_type.value)
                         if hasattr(order.order_type, "value")
                         else str(order.order_type),
-                        "status": str(order.status.value) if hasattr(order.status, "value") else str(order.status),
-                        "submitted_at": order.submitted_at,
-                        "filled_at": order.filled_at,
-                    },
+                        status=str(order.status.value) if hasattr(order.status, "value") else str(order.status),
+                        submitted_at=order.submitted_at,
+                        filled_at=order.filled_at,
+                    )
                 )
             except Exception as error:
                 self.logger.error(f"Cannot import order {getattr(order, 'id', '?')}: {error}")
 
+        self._bulk_upsert(AlpacaOrder, rows, "order_id")
+        self._mark_history_changed(row.filled_at or row.submitted_at for row in rows)
+
     def _import_activities(self, activities: List[Dict[str, Any]]) -> None:
-        """Upsert activities into the DB, keyed by activity id."""
+        """Upsert activities into the DB, keyed by activity id, with a single statement per batch."""
+        rows = []
         for activity in activities:
             try:
                 activity_id = activity.get("id", "")
@@ -173,19 +295,39 @@ class UpdateService(BaseService, AbstractUpdateService):
                 if activity_date_raw and "T" in str(activity_date_raw):
                     activity_date_raw = str(activity_date_raw).split("T")[0]
 
-                self._retry_database_operation(
-                    AlpacaActivity.objects.update_or_create,
-                    activity_id=str(activity_id),
-                    defaults={
-                        "activity_type": activity.get("activity_type", ""),
-                        "symbol": activity.get("symbol"),
-                        "qty": activity.get("qty"),
-                        "price": activity.get("price"),
-                        "net_amount": activity.get("net_amount"),
-                        "per_share_amount": activity.get("per_share_amount"),
-                        "activity_date": activity_date_raw,
-                        "description": activity.get("description"),
-                    },
+                rows.append(
+                    AlpacaActivity(
+                        activity_id=str(activity_id),
+                        activity_type=activity.get("activity_type", ""),
+                        symbol=activity.get("symbol"),
+                        qty=activity.get("qty"),
+                        price=activity.get("price"),
+                        net_amount=activity.get("net_amount"),
+                        per_share_amount=activity.get("per_share_amount"),
+                        activity_date=activity_date_raw,
+                        description=activity.get("description"),
+                    )
                 )
             except Exception as error:
                 self.logger.error(f"Cannot import activity {activity.get('id', '?')}: {error}")
+
+        self._bulk_upsert(AlpacaActivity, rows, "activity_id")
+        self._mark_history_changed(date.fromisoformat(str(row.activity_date)) for row in rows if row.activity_date)
+
+    def _bulk_upsert(self, model, rows: List[Any], unique_field: str) -> None:
+        """Insert the rows, updating the stored ones with the same unique_field value."""
+        if not rows:
+            return
+
+        update_fields = [
+            field.name for field in model._meta.concrete_fields if not field.primary_key and field.name != unique_field
+        ]
+        self._retry_database_operation(
+            model.objects.bulk_create,
+            rows,
+            update_conflicts=True,
+            unique_fields=[unique_field],
+            update_fields=update_fields,
+            batch_size=self.BATCH_SIZE,
+        )
+        self._log_message(f"Stored {len(rows)} {model._meta.verbose_name_plural}")
@@ -25,6 +25,8 @@ class BitvavoOfflineModeError(Exception):
 @singleton
 class BitvavoService:
     START_TIMESTAMP = 0
+    # Maximum number of candlesticks returned by a single candles request
+    CANDLES_LIMIT = 1440
 
     logger = StonksLogger.get_logger("stonks_overwatch.bitvavo_service", "[BITVAVO|CLIENT]")
     _client: Bitvavo = None
@@ -76,10 +78,16 @@ class BitvavoService:
         self.logger.debug("Retrieving account")
         return self.get_client().account()
 
-    def account_history(self) -> Any:
-        """Returns the transaction history for this account."""
-        self.logger.debug("Retrieving account history")
-        options = {"fromDate": self.START_TIMESTAMP}
+    def account_history(self, from_date: Optional[datetime] = None) -> Any:
+        """
+        Returns the transaction history for this account.
+
+        If from_date is provided, only the transactions executed since then are requested, so an incremental
+        update only walks the pages with new transactions.
+        """
+        self.logger.debug(f"Retrieving account history from {from_date}")
+        from_timestamp = int(from_date.timestamp() * 1000) if from_date else self.START_TIMESTAMP
+        options = {"fromDate": from_timestamp}
 
         all_results = []
         current_page = 1
@@ -130,18 +138,24 @@ class BitvavoService:
         """
         Retrieve the Open, High, Low, Close, Volume (OHLCV) data you use to create candlestick charts for market with
         interval time between each candlestick.
-        Candlestick data is always returned in chronological data from oldest to newest. Data is returned when trades
+        Candlestick data is returned in chronological order, from oldest to newest. Data is returned when trades
         are made in the interval represented by that candlestick. When no trades occur you see a gap in data flow,
         zero trades are represented by zero candlesticks.
+
+        The endpoint only returns the CANDLES_LIMIT most recent candlesticks of the range, so longer ranges are
+        requested page by page, moving the end of the range back to the oldest candlestick received. An error page
+        raises a RuntimeError, so a partial range is never returned as if it were complete.
         """
         self.logger.debug(f"Retrieving candles for market {market} with interval {interval} from {start} to {end}")
-        # FIXME: Return a maximum of limit candlesticks for trades made from start.
-        #  If interval is longer we need to split the request in multiple requests.
-        response = self.get_client().candles(market, interval, {}, start=start, end=end)
-        result = []
-        for candle in response:
-            result.append(
-                {
+        end = end or datetime.now(tz=dt_timezone.utc)
+        candles = {}
+        while end > start:
+            response = self.get_client().candles(market, interval, {}, limit=self.CANDLES_LIMIT, start=start, end=end)
+            if isinstance(response, dict):
+                raise RuntimeError(f"Cannot retrieve candles for market {market}: {response}")
+
+            for candle in response:
+                candles[candle[0]] = {
                     "timestamp": datetime.fromtimestamp(candle[0] / 1000, tz=dt_timezone.utc),
                     "open": candle[1],
                     "high": candle[2],
@@ -149,8 +163,13 @@ class BitvavoService:
                     "close": candle[4],
                     "volume": candle[5],
                 }
-            )
-        return sorted(result, key=lambda k: k["timestamp"])
+
+            if len(response) < self.CANDLES_LIMIT:
+                break
+            # The end of the range is inclusive, continue right before the oldest candlestick received
+            end = datetime.fromtimestamp((min(candle[0] for candle in response) - 1) / 1000, tz=dt_timezone.utc)
+
+        return sorted(candles.values(), key=lambda k: k["timestamp"])
 
     def deposit_history(self) -> Any:
         """Returns the deposit history of the account."""
@@ -0,0 +1,62 @@
+"""
+Content fingerprint of the Bitvavo transactions.
+
+Bitvavo API bug: the same trade can appear on multiple pages of the account history with a different
+transactionId. The fingerprint identifies a transaction by its content instead, and is stored in a unique
+column, so the duplicates are rejected when they are inserted.
+"""
+
+import hashlib
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal, InvalidOperation
+
+from django.utils.dateparse import parse_datetime
+
+# Precision of the amounts stored in BitvavoTransactions
+DECIMAL_QUANTIZE = Decimal("0.0000000001")
+
+
+def to_decimal(value: str | float | Decimal | None) -> Decimal | None:
+    """Convert an amount to a Decimal with the stored precision, or None if it is not a number."""
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value)).quantize(DECIMAL_QUANTIZE)
+    except InvalidOperation:
+        return None
+
+
+def transaction_fingerprint(
+    executed_at: str | datetime,
+    transaction_type: str,
+    sent_currency: str | None,
+    sent_amount: str | float | Decimal | None,
+    received_currency: str | None,
+    received_amount: str | float | Decimal | None,
+) -> str:
+    """
+    Return the fingerprint of a transaction.
+
+    The values can come from the API (ISO strings) or from the database (datetime and Decimal), and produce
+    the same fingerprint for the same transaction.
+    """
+    if isinstance(executed_at, str):
+        executed_at = parse_datetime(executed_at)
+    if executed_at.tzinfo is None:
+        executed_at = executed_at.replace(tzinfo=dt_timezone.utc)
+
+    def amount(value) -> str:
+        value = to_decimal(value)
+        return "" if value is None else format(value.normalize(), "f")
+
+    content = "|".join(
+        [
+            executed_at.astimezone(dt_timezone.utc).isoformat(),
+            transaction_type,
+            sent_currency or "",
+            amount(sent_amount),
+            received_currency or "",
+            amount(received_amount),
+        ]
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
@@ -1,5 +1,7 @@
+from typing import Iterable
+
 from stonks_overwatch.services.brokers.bitvavo.repositories.models import BitvavoAssets
-from stonks_overwatch.utils.database.db_utils import dictfetchone, get_connection_for_model
+from stonks_overwatch.utils.database.db_utils import dictfetchone, get_connection_for_model, snake_to_camel
 
 
 class AssetsRepository:
@@ -14,3 +16,9 @@ class AssetsRepository:
                 [symbol],
             )
             return dictfetchone(cursor)
+
+    @staticmethod
+    def get_assets(symbols: Iterable[str]) -> dict[str, dict]:
+        """Gets the assets of the given symbols with a single query, keyed by symbol. Unknown symbols are skipped."""
+        assets = BitvavoAssets.objects.filter(symbol__in=list(symbols)).values()
+        return {asset["symbol"]: {snake_to_camel(key): value for key, value in asset.items()} for asset in assets}
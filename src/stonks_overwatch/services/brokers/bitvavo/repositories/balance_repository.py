@@ -107,11 +107,13 @@ class BalanceRepository:
                 balance_dict[symbol] = min(raw_amount, calc_amount)
 
         # Round each balance to the correct number of decimals from BitvavoAssets
+        asset_decimals = dict(
+            BitvavoAssets.objects.filter(symbol__in=list(balance_dict.keys())).values_list("symbol", "decimals")
+        )
         for symbol in list(balance_dict.keys()):
-            try:
-                asset = BitvavoAssets.objects.get(symbol=symbol)
-                decimals = asset.decimals or 0
-            except BitvavoAssets.DoesNotExist:
+            if symbol in asset_decimals:
+                decimals = asset_decimals[symbol] or 0
+            else:
                 decimals = 8  # Default to 8 decimals if not found
             balance_dict[symbol] = round(balance_dict[symbol], decimals)
 
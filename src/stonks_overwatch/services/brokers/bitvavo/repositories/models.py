@@ -26,6 +26,8 @@ class BitvavoTransactions(models.Model):
     fees_currency = models.CharField(max_length=10, default=None, blank=True, null=True)
     fees_amount = models.DecimalField(max_digits=20, decimal_places=10, default=None, blank=True, null=True)
     address = models.CharField(max_length=100, default=None, blank=True, null=True)
+    # Content fingerprint, see stonks_overwatch.services.brokers.bitvavo.fingerprint
+    fingerprint = models.CharField(max_length=64, unique=True, default=None, blank=True, null=True)
 
 
 class BitvavoProductQuotation(models.Model):
@@ -36,6 +38,8 @@ class BitvavoProductQuotation(models.Model):
     interval = models.CharField(max_length=10)
     last_import = models.DateTimeField()
     quotations = models.JSONField()
+    # Last day whose candle was closed when it was imported. Later days still need to be imported
+    complete_through = models.DateField(default=None, blank=True, null=True)
 
 
 class BitvavoAssets(models.Model):
@@ -1,7 +1,8 @@
 import json
+from typing import Iterable
 
 from stonks_overwatch.services.brokers.bitvavo.repositories.models import BitvavoProductQuotation
-from stonks_overwatch.utils.database.db_utils import dictfetchone, get_connection_for_model
+from stonks_overwatch.utils.database.db_utils import dictfetchone, get_connection_for_model, snake_to_camel
 
 
 class ProductQuotationsRepository:
@@ -27,6 +28,23 @@ class ProductQuotationsRepository:
 
         return None
 
+    @staticmethod
+    def get_products_quotations(symbols: Iterable[str]) -> dict[str, dict]:
+        """Gets the stored quotations of the specified products from the DB, in a single query.
+
+        ### Returns
+            Dict with the symbol as key, and the quotations and the date they are complete through as value.
+            Products without stored quotations are not included.
+        """
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+
+        rows = BitvavoProductQuotation.objects.filter(symbol__in=symbols).values(
+            "symbol", "quotations", "complete_through"
+        )
+        return {row["symbol"]: {snake_to_camel(key): value for key, value in row.items()} for row in rows}
+
     @staticmethod
     def get_product_price(symbol: str) -> float:
         """Gets the last quotation from the specified product_id from the DB.
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone as dt_timezone
-from typing import List, Optional
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from django.utils import timezone
 
@@ -17,6 +17,7 @@ from stonks_overwatch.services.brokers.bitvavo.repositories.transactions_reposit
 from stonks_overwatch.services.brokers.bitvavo.services.deposit_service import DepositsService
 from stonks_overwatch.services.brokers.bitvavo.services.transaction_service import TransactionsService
 from stonks_overwatch.services.models import DailyValue, PortfolioEntry, TotalPortfolio
+from stonks_overwatch.services.utilities.ttl_snapshot import TtlSnapshot
 from stonks_overwatch.utils.core.datetime import DateTimeUtility
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
@@ -52,12 +53,21 @@ class PortfolioService(BaseService, PortfolioServiceInterface):
 
     logger = StonksLogger.get_logger("stonks_overwatch.portfolio_data.bitvavo", "[BITVAVO|PORTFOLIO]")
 
+    # Prices of all the Bitvavo markets, shared by get_portfolio and get_portfolio_total across requests
+    TICKER_PRICES_TTL = 30  # seconds
+    ticker_prices: TtlSnapshot[Dict[str, float]] = TtlSnapshot(ttl_seconds=TICKER_PRICES_TTL)
+
     def __init__(self, config: Optional[BaseConfig] = None):
         super().__init__(config)
         self.bitvavo_service = BitvavoService()
         self.deposits = DepositsService()
         # Use base_currency property from BaseService which handles dependency injection
 
+    @staticmethod
+    def invalidate_ticker_prices() -> None:
+        """Drops the ticker prices snapshot, so the next portfolio request fetches them again."""
+        PortfolioService.ticker_prices.invalidate()
+
     @staticmethod
     def __is_currency(symbol: str) -> bool:
         return symbol == "EUR"
@@ -98,20 +108,23 @@ class PortfolioService(BaseService, PortfolioServiceInterface):
         # {'symbol': 'ETH', 'amount': Decimal('0.44640997')},
         # {'symbol': 'XRP', 'amount': Decimal('653.026591')},
         # {'symbol': 'BTC', 'amount': Decimal('0.04473927')}]
-        for item in balance:
-            if item["amount"] == "0" or self.__is_currency(item["symbol"]):
-                continue
-
-            price = self._get_ticket_quotation(item["symbol"])
+        positions = [item for item in balance if item["amount"] != "0" and not self.__is_currency(item["symbol"])]
+        symbols = [item["symbol"] for item in positions]
+        prices = self._get_ticker_prices(symbols)
+        assets = AssetsRepository.get_assets(symbols)
+        break_even_prices = self._get_break_even_prices()
+
+        for item in positions:
+            price = prices[item["symbol"]]
             value = float(item["amount"]) * price
-            asset = AssetsRepository.get_asset(item["symbol"])
-            break_even_price = self._get_break_even_price(item["symbol"])
+            asset = assets.get(item["symbol"], {})
+            break_even_price = break_even_prices.get(item["symbol"], 0.0)
             unrealized_gain = (price - break_even_price) * float(item["amount"])
 
             bitvavo_portfolio.append(
                 PortfolioEntry(
                     symbol=item["symbol"],
-                    name=asset["name"],
+                    name=asset.get("name", item["symbol"]),
                     shares=item["amount"],
                     product_type=ProductType.CRYPTO,
                     product_currency=self.base_currency,
@@ -186,23 +199,30 @@ class PortfolioService(BaseService, PortfolioServiceInterface):
             total_deposit_withdrawal=total_deposit_withdrawal,
         )
 
-    def _get_break_even_price(self, symbol: str) -> float:
-        transactions_history = TransactionsRepository.get_transactions_raw()
-
-        total_cost = 0.0
-        total_quantity = 0.0
+    @staticmethod
+    def _get_break_even_prices() -> Dict[str, float]:
+        """Calculates the break-even price of every received asset, reading the transactions once."""
+        total_costs = {}
+        total_quantities = {}
 
-        for transaction in transactions_history:
+        for transaction in TransactionsRepository.get_transactions_raw():
             if transaction["type"] == "deposit":
                 continue
 
-            if transaction["receivedCurrency"] != symbol:
-                continue
-
-            total_cost += float(transaction.get("sentAmount") or 0.0) + float(transaction.get("feesAmount") or 0.0)
-            total_quantity += float(transaction.get("receivedAmount") or 0.0)
+            symbol = transaction["receivedCurrency"]
+            total_costs[symbol] = (
+                total_costs.get(symbol, 0.0)
+                + float(transaction.get("sentAmount") or 0.0)
+                + float(transaction.get("feesAmount") or 0.0)
+            )
+            total_quantities[symbol] = total_quantities.get(symbol, 0.0) + float(
+                transaction.get("receivedAmount") or 0.0
+            )
 
-        return total_cost / total_quantity if total_quantity > 0 else 0.0
+        return {
+            symbol: total_costs[symbol] / quantity if quantity > 0 else 0.0
+            for symbol, quantity in total_quantities.items()
+        }
 
     @staticmethod
     def _get_growth_final_date(date_str: str):
@@ -307,40 +327,64 @@ class PortfolioService(BaseService, PortfolioServiceInterface):
 
     def _create_products_quotation(self) -> dict:
         """
-        Creates product quotations based on portfolio data and product information.
+        Creates product quotations based on portfolio data and the quotations stored by the update job.
+
+        The candles are never requested here, so the historical value does not depend on the Bitvavo API.
+        Quotations that are not stored yet are reported, and imported by the next update.
         """
         product_growth = self.calculate_product_growth()
+        stored_quotations = ProductQuotationsRepository.get_products_quotations(product_growth.keys())
         tradeable_products = {}
 
         for key, data in product_growth.items():
             data["productId"] = key
 
             product_history_dates = list(data["history"].keys())
-
-            start_date = LocalizationUtility.ensure_aware(
-                LocalizationUtility.convert_string_to_datetime(product_history_dates[0])
-            )
-            candles = self.bitvavo_service.candles(f"{key}-{self.base_currency}", "1d", start_date)
-            # Creates the dictionary with the date as key and the value as the close price
-            date_to_value = {
-                start_date + timedelta(days=i): candle["close"]
-                for i, candle in enumerate(candles)
-                if candle["timestamp"] >= start_date
-            }
-            quotes = {
-                LocalizationUtility.format_date_from_date(date): float(value) for date, value in date_to_value.items()
-            }
+            stored = stored_quotations.get(key, {})
+            missing_range = self.get_missing_quotation_range(data["history"], stored.get("completeThrough"))
+            if missing_range:
+                self.logger.warning(f"Missing quotations for '{key}' from {missing_range[0]} to {missing_range[1]}")
 
             data["quotation"] = {
                 "fromDate": product_history_dates[0],
                 "toDate": product_history_dates[-1],
                 "interval": DateTimeUtility.calculate_interval(product_history_dates[0]),
-                "quotes": quotes,
+                "quotes": stored.get("quotations") or {},
             }
             tradeable_products[key] = data
 
         return tradeable_products
 
+    @staticmethod
+    def get_missing_quotation_range(history: dict, complete_through: Optional[date]) -> Optional[Tuple[str, str]]:
+        """
+        Returns the first and last day whose quotation is needed but not stored yet.
+
+        The quotations are needed from the first transaction until the position was closed or, for the open
+        positions, until yesterday: the last day with a closed candle.
+
+        Returns:
+            The range of missing days, or None if the stored quotations are complete
+        """
+        history_dates = list(history.keys())
+        if history[history_dates[-1]] == 0:
+            last_needed = date.fromisoformat(history_dates[-1])
+        else:
+            last_needed = LocalizationUtility.now().date() - timedelta(days=1)
+
+        if complete_through is not None:
+            first_missing = complete_through + timedelta(days=1)
+        else:
+            first_missing = date.fromisoformat(history_dates[0])
+
+        if first_missing > last_needed:
+            return None
+
+        return (
+            LocalizationUtility.format_date_from_date(first_missing),
+            LocalizationUtility.format_date_from_date(last_needed),
+        )
+
     @staticmethod
     def _is_weekend(date_str: str) -> bool:
         # Parse the date string into a datetime object
@@ -348,11 +392,43 @@ class PortfolioService(BaseService, PortfolioServiceInterface):
         # Check if the day of the week is Saturday (5) or Sunday (6)
         return day.weekday() >= 5
 
-    def _get_ticket_quotation(self, symbol: str) -> float:
+    def _get_ticker_prices(self, symbols: Iterable[str]) -> Dict[str, float]:
+        """
+        Returns the current price of each symbol in the base currency.
+
+        The prices of all the markets come from a single ticker request, kept in the ticker_prices snapshot.
+        Symbols without a ticker price fall back to their last stored quotation.
+        """
         try:
-            ticker_json = self.bitvavo_service.ticker_price(symbol + "-" + self.base_currency)
-            return float(ticker_json["price"])
+            market_prices = self.ticker_prices.get(self.__load_ticker_prices)
         except Exception as e:
-            self.logger.error(f"Failed to get ticker quotation for {symbol}: {e}")
-            # Fallback to price if ticker quotation fails}
-            return ProductQuotationsRepository.get_product_price(symbol)
+            self.logger.error(f"Failed to get ticker prices: {e}")
+            market_prices = {}
+
+        prices = {}
+        missing = []
+        for symbol in symbols:
+            market = f"{symbol}-{self.base_currency}"
+            if market in market_prices:
+                prices[symbol] = market_prices[market]
+            else:
+                missing.append(symbol)
+
+        if missing:
+            self.logger.warning(f"No ticker price for {missing}, using the last stored quotations")
+            stored_quotations = ProductQuotationsRepository.get_products_quotations(missing)
+            for symbol in missing:
+                quotations = stored_quotations.get(symbol, {}).get("quotations") or {}
+                prices[symbol] = list(quotations.values())[-1] if quotations else 0.0
+
+        return prices
+
+    def __load_ticker_prices(self) -> Dict[str, float]:
+        response = self.bitvavo_service.ticker_price()
+        if isinstance(response, dict):
+            if "market" not in response:
+                raise RuntimeError(f"Cannot retrieve ticker prices: {response}")
+            # A single market is returned as an object instead of a list
+            response = [response]
+
+        return {ticker["market"]: float(ticker["price"]) for ticker in response if ticker.get("price")}
@@ -1,9 +1,9 @@
 import os
-from datetime import timedelta
-from decimal import Decimal, InvalidOperation
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
 from typing import Optional
 
 from degiro_connector.quotecast.models.chart import Interval
+from django.db.models import Max
 from django.utils import timezone
 
 from stonks_overwatch.config.bitvavo import BitvavoConfig
@@ -11,12 +11,16 @@ from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.core.interfaces.base_service import BaseService
 from stonks_overwatch.core.interfaces.update_service import AbstractUpdateService
 from stonks_overwatch.services.brokers.bitvavo.client.bitvavo_client import BitvavoService
+from stonks_overwatch.services.brokers.bitvavo.fingerprint import transaction_fingerprint
 from stonks_overwatch.services.brokers.bitvavo.repositories.models import (
     BitvavoAssets,
     BitvavoBalance,
     BitvavoProductQuotation,
     BitvavoTransactions,
 )
+from stonks_overwatch.services.brokers.bitvavo.repositories.product_quotations_repository import (
+    ProductQuotationsRepository,
+)
 from stonks_overwatch.services.brokers.bitvavo.services.portfolio_service import PortfolioService
 from stonks_overwatch.utils.core.datetime import DateTimeUtility
 from stonks_overwatch.utils.core.debug import save_to_json
@@ -26,6 +30,21 @@ from stonks_overwatch.utils.core.logger import StonksLogger
 
 class UpdateService(BaseService, AbstractUpdateService):
     logger = StonksLogger.get_logger("stonks_overwatch.bitvavo.update_service", "[BITVAVO|UPDATE]")
+    # Fields refreshed when a stored transaction is sent again with the same transactionId
+    TRANSACTION_UPDATE_FIELDS = [
+        "executed_at",
+        "type",
+        "price_currency",
+        "price_amount",
+        "sent_currency",
+        "sent_amount",
+        "received_currency",
+        "received_amount",
+        "fees_currency",
+        "fees_amount",
+        "address",
+        "fingerprint",
+    ]
 
     def __init__(self, import_folder: str = None, debug_mode: bool = None, config: Optional[BitvavoConfig] = None):
         """
@@ -60,6 +79,9 @@ class UpdateService(BaseService, AbstractUpdateService):
             self.update_transactions()
             self.update_portfolio()
             self.update_assets()
+            self.update_ticker_info()
+            self.update_portfolio_snapshot()
+            self.update_dividend_aggregates()
             self._record_sync(success=True)
         except Exception as error:
             self.logger.error("Cannot Update Portfolio!")
@@ -81,6 +103,8 @@ class UpdateService(BaseService, AbstractUpdateService):
 
         self.__import_balance(balance + staking_balance)
         self.__import_quotation()
+        # The views value the balances just imported with fresh ticker prices
+        PortfolioService.invalidate_ticker_prices()
 
     def update_assets(self):
         """Update the Account DB data. Only does it if the data is older than today."""
@@ -98,14 +122,16 @@ class UpdateService(BaseService, AbstractUpdateService):
         """Update the Account DB data. Only does it if the data is older than today."""
         self._log_message("Updating Transactions Data....")
 
-        transactions = self.bitvavo_service.account_history()
+        # Only the transactions since the newest stored one are requested. The boundary is included, so the
+        # transactions executed at the same time are not lost, and the ones already stored are skipped
+        newest_executed_at = BitvavoTransactions.objects.aggregate(newest=Max("executed_at"))["newest"]
+        transactions = self.bitvavo_service.account_history(newest_executed_at)
 
         if self.debug_mode:
             transactions_file = os.path.join(self.import_folder, "transactions.json")
             save_to_json(transactions, transactions_file)
 
         self.__import_transactions(transactions)
-        self.__deduplicate_transactions()
 
     def __import_quotation(self) -> None:  # noqa: C901
         product_growth = self.portfolio_data.calculate_product_growth()
@@ -132,16 +158,31 @@ class UpdateService(BaseService, AbstractUpdateService):
         for key in delete_keys:
             del product_growth[key]
 
+        stored_quotations = ProductQuotationsRepository.get_products_quotations(product_growth.keys())
+        # The candle of today is still open, so the quotations are only complete through yesterday
+        yesterday = LocalizationUtility.format_date_from_date(timezone.now().date() - timedelta(days=1))
+
         # We need to use the productIds to get the daily quote for each product
         for key in product_growth.keys():
             interval = product_growth[key]["quotation"]["interval"]
-            quotes_dict = self._create_products_quotation(key, product_growth[key])
+            stored = stored_quotations.get(key, {})
+            from_date = self._get_import_start_date(product_growth[key], stored)
+            if from_date > product_growth[key]["quotation"]["to_date"]:
+                self.logger.debug(f"Quotations of '{key}' are already complete")
+                continue
+
+            try:
+                quotes_dict = self._create_products_quotation(key, product_growth[key], stored, from_date)
+            except RuntimeError as error:
+                # Keep the stored quotations and their complete_through, the range is retried on the next update
+                self.logger.error(f"Cannot import the quotations of '{key}': {error}")
+                continue
 
             if not quotes_dict:
                 self.logger.info(f"Quotation not found for '{key}' / {interval}")
                 continue
 
-            # Update the data ONLY if we get something back from DeGiro
+            # Update the data ONLY if we get something back from Bitvavo
             if quotes_dict:
                 self._retry_database_operation(
                     BitvavoProductQuotation.objects.update_or_create,
@@ -150,27 +191,46 @@ class UpdateService(BaseService, AbstractUpdateService):
                         "interval": Interval.P1D,
                         "last_import": LocalizationUtility.now(),
                         "quotations": quotes_dict,
+                        "complete_through": date.fromisoformat(
+                            min(product_growth[key]["quotation"]["to_date"], yesterday)
+                        ),
                     },
                 )
 
-    def _create_products_quotation(self, symbol: str, data: dict) -> dict:
-        product_history_dates = list(data["history"].keys())
+    @staticmethod
+    def _get_import_start_date(data: dict, stored: dict) -> str:
+        """
+        Returns the first day whose candle must be imported: the day after the stored quotations are complete
+        through or, if that is unknown, the last stored day or the first day of the product history.
+        """
+        if stored.get("completeThrough"):
+            return LocalizationUtility.format_date_from_date(stored["completeThrough"] + timedelta(days=1))
+        if stored.get("quotations"):
+            return max(stored["quotations"])
+        return data["quotation"]["from_date"]
+
+    def _create_products_quotation(self, symbol: str, data: dict, stored: dict, from_date: str) -> dict:
+        """
+        Returns the daily close prices of the product, merged with the stored ones.
 
-        start_date = LocalizationUtility.ensure_aware(
-            LocalizationUtility.convert_string_to_datetime(product_history_dates[0])
+        Only the candles from from_date are requested. The candles are keyed by their own timestamp, so the days
+        without trades are gaps instead of shifting the following prices.
+        """
+        quotes = dict(stored.get("quotations") or {})
+
+        start_date = datetime.combine(date.fromisoformat(from_date), time.min, tzinfo=dt_timezone.utc)
+        end_date = datetime.combine(date.fromisoformat(data["quotation"]["to_date"]), time.max, tzinfo=dt_timezone.utc)
+        candles = self.bitvavo_service.candles(
+            f"{symbol}-{self.currency}", "1d", start_date, min(end_date, LocalizationUtility.now())
         )
-        candles = self.bitvavo_service.candles(f"{symbol}-{self.currency}", "1d", start_date)
-        # Creates the dictionary with the date as key and the value as the close price
-        date_to_value = {
-            start_date + timedelta(days=i): candle["close"]
-            for i, candle in enumerate(candles)
-            if candle["timestamp"] >= start_date
-        }
-        quotes = {
-            LocalizationUtility.format_date_from_date(date): float(value) for date, value in date_to_value.items()
-        }
-
-        return quotes
+        if not candles:
+            return {}
+
+        for candle in candles:
+            if candle["timestamp"] >= start_date:
+                quotes[LocalizationUtility.format_date_from_date(candle["timestamp"])] = float(candle["close"])
+
+        return dict(sorted(quotes.items()))
 
     def __import_balance(self, balance: list[dict]) -> None:
         # Clear existing balances to avoid stale data
@@ -192,90 +252,68 @@ class UpdateService(BaseService, AbstractUpdateService):
                 self.logger.error(f"Cannot import position: {row}")
                 self.logger.error("Exception: %s", str(error), exc_info=True)
 
-    # Matches DecimalField(decimal_places=10) precision used in BitvavoTransactions.
-    _DECIMAL_QUANTIZE = Decimal("0.0000000001")
-
-    @staticmethod
-    def __to_decimal(value: str | float | None) -> Decimal | None:
-        if value is None:
-            return None
-        try:
-            return Decimal(str(value)).quantize(UpdateService._DECIMAL_QUANTIZE)
-        except InvalidOperation:
-            return None
-
     def __import_transactions(self, transactions: list[dict]) -> None:
-        # Sort the transactions by executedAt to ensure they are processed in the correct order
+        # Sort the transactions by executedAt, so the oldest copy of a duplicated transaction is the one stored
         transactions.sort(key=lambda item: item["executedAt"])
+        new_transactions = []
         for row in transactions:
             try:
-                # Bitvavo API bug: the same trade can appear on multiple pages with a different transactionId.
-                # Skip if a content-identical record already exists under a different ID.
-                # __deduplicate_transactions is the authoritative cleanup; this check avoids inserting in the
-                # first place when precision allows a reliable match.
-                duplicate_exists = (
-                    BitvavoTransactions.objects.filter(
+                new_transactions.append(
+                    BitvavoTransactions(
+                        transaction_id=row["transactionId"],
                         executed_at=row["executedAt"],
                         type=row["type"],
-                        sent_currency=row.get("sentCurrency"),
-                        sent_amount=self.__to_decimal(row.get("sentAmount")),
-                        received_currency=row.get("receivedCurrency"),
-                        received_amount=self.__to_decimal(row.get("receivedAmount")),
+                        price_currency=row.get("priceCurrency", None),
+                        price_amount=row.get("priceAmount", None),
+                        sent_currency=row.get("sentCurrency", None),
+                        sent_amount=row.get("sentAmount", None),
+                        received_currency=row.get("receivedCurrency", None),
+                        received_amount=row.get("receivedAmount", None),
+                        fees_currency=row.get("feesCurrency", None),
+                        fees_amount=row.get("feesAmount", None),
+                        address=row.get("address", None),
+                        fingerprint=transaction_fingerprint(
+                            row["executedAt"],
+                            row["type"],
+                            row.get("sentCurrency"),
+                            row.get("sentAmount"),
+                            row.get("receivedCurrency"),
+                            row.get("receivedAmount"),
+                        ),
                     )
-                    .exclude(transaction_id=row["transactionId"])
-                    .exists()
-                )
-                if duplicate_exists:
-                    self.logger.debug(
-                        f"Skipping duplicate transaction {row['transactionId']} (same content, different ID)"
-                    )
-                    continue
-
-                self._retry_database_operation(
-                    BitvavoTransactions.objects.update_or_create,
-                    transaction_id=row["transactionId"],
-                    defaults={
-                        "executed_at": row["executedAt"],
-                        "type": row["type"],
-                        "price_currency": row.get("priceCurrency", None),
-                        "price_amount": row.get("priceAmount", None),
-                        "sent_currency": row.get("sentCurrency", None),
-                        "sent_amount": row.get("sentAmount", None),
-                        "received_currency": row.get("receivedCurrency", None),
-                        "received_amount": row.get("receivedAmount", None),
-                        "fees_currency": row.get("feesCurrency", None),
-                        "fees_amount": row.get("feesAmount", None),
-                        "address": row.get("address", None),
-                    },
                 )
             except Exception as error:
                 self.logger.error(f"Cannot import position: {row}")
                 self.logger.error("Exception: %s", str(error), exc_info=True)
 
-    def __deduplicate_transactions(self) -> None:
-        """Remove transactions that are content-identical but have different transactionIds (Bitvavo API bug)."""
-        seen: set[tuple] = set()
-        to_delete: list[int] = []
-
-        for txn in BitvavoTransactions.objects.order_by("executed_at", "id").only(
-            "id", "executed_at", "type", "sent_currency", "sent_amount", "received_currency", "received_amount"
-        ):
-            fingerprint = (
-                txn.executed_at,
-                txn.type,
-                txn.sent_currency,
-                txn.sent_amount,
-                txn.received_currency,
-                txn.received_amount,
+        # A transaction with the fingerprint of an older one, or of a stored one with another transactionId,
+        # is a duplicate and is skipped
+        fingerprints = {}
+        for new_transaction in new_transactions:
+            fingerprints.setdefault(new_transaction.fingerprint, new_transaction)
+        stored_fingerprints = dict(
+            BitvavoTransactions.objects.filter(fingerprint__in=fingerprints.keys()).values_list(
+                "fingerprint", "transaction_id"
             )
-            if fingerprint in seen:
-                to_delete.append(txn.id)
-            else:
-                seen.add(fingerprint)
-
-        if to_delete:
-            count, _ = BitvavoTransactions.objects.filter(id__in=to_delete).delete()
-            self.logger.info(f"Removed {count} duplicate transaction(s)")
+        )
+        by_transaction_id = {}
+        for fingerprint, new_transaction in fingerprints.items():
+            if stored_fingerprints.get(fingerprint, new_transaction.transaction_id) == new_transaction.transaction_id:
+                by_transaction_id.setdefault(new_transaction.transaction_id, new_transaction)
+        new_transactions = list(by_transaction_id.values())
+
+        # The transactions sent again with the same transactionId are updated with their latest content
+        stored_before = BitvavoTransactions.objects.count()
+        self._retry_database_operation(
+            BitvavoTransactions.objects.bulk_create,
+            new_transactions,
+            update_conflicts=True,
+            unique_fields=["transaction_id"],
+            update_fields=self.TRANSACTION_UPDATE_FIELDS,
+            batch_size=500,
+        )
+        stored = BitvavoTransactions.objects.count() - stored_before
+        self._log_message(f"Stored {stored} new transactions and refreshed {len(new_transactions) - stored}")
 
     def __import_assets(self, assets: list[dict]) -> None:
         for row in assets:
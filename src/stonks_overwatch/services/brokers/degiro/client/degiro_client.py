@@ -1,10 +1,9 @@
-import os
 from datetime import timedelta
 from typing import Any, List, Optional
 
 import polars as pl
-import requests_cache
 from degiro_connector.core.exceptions import DeGiroConnectionError, MaintenanceError
+from degiro_connector.core.models.model_connection import ModelConnection
 from degiro_connector.quotecast.models.chart import Chart, ChartRequest, Interval
 from degiro_connector.quotecast.tools.chart_fetcher import ChartFetcher
 from degiro_connector.trading.api import API as TradingApi  # noqa: N811
@@ -12,15 +11,20 @@ from degiro_connector.trading.models.agenda import AgendaRequest, CalendarType
 from degiro_connector.trading.models.credentials import Credentials
 from django.utils import timezone
 
-import stonks_overwatch.settings
 from stonks_overwatch.config.base_config import BaseConfig
 from stonks_overwatch.config.degiro import DegiroConfig, DegiroCredentials
 from stonks_overwatch.constants import BrokerName
+from stonks_overwatch.services.brokers.degiro.client.http_cache import CachedModelSession
 from stonks_overwatch.settings import TIME_ZONE
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
 from stonks_overwatch.utils.core.singleton import singleton
 
+# Schema of the daily quotations returned by `DeGiroService._get_product_daily_quotation`
+QUOTATION_SCHEMA = {"date": pl.Date, "price": pl.Float64}
+# Seconds before the chart fetcher connection expires. Same default the ChartFetcher uses on its own
+CHART_CONNECTION_TIMEOUT = 600
+
 
 class DeGiroOfflineModeError(Exception):
     """Exception raised for data validation errors."""
@@ -133,8 +137,8 @@ class DeGiroService:
     degiro_config: Optional[DegiroConfig] = None
     force: bool = False
     is_maintenance_mode: bool = False
-
-    __cache_path = os.path.join(stonks_overwatch.settings.STONKS_OVERWATCH_CACHE_DIR, "http_request.cache")
+    _chart_fetcher: Optional[ChartFetcher] = None
+    _user_token: Optional[int] = None
 
     def __init__(
         self,
@@ -158,6 +162,7 @@ class DeGiroService:
         self.set_credentials(credentials_manager)
         self.force = force
         self.is_maintenance_mode = False
+        self._reset_session_state()
 
     def set_credentials(self, credentials_manager: CredentialsManager):
         """
@@ -166,23 +171,36 @@ class DeGiroService:
         """
         if credentials_manager is not None:
             self.credentials_manager = credentials_manager
-            self.api_client = TradingApi(credentials=self.credentials_manager.credentials)
+            self.api_client = self._build_api_client(self.credentials_manager.credentials)
+            self._reset_session_state()
             self.logger.debug("Credentials set for API client")
         elif self.credentials_manager is None:
             # Initialize with empty credentials if none provided
             self.credentials_manager = CredentialsManager()
-            self.api_client = TradingApi(credentials=self.credentials_manager.credentials)
+            self.api_client = self._build_api_client(self.credentials_manager.credentials)
+            self._reset_session_state()
             self.logger.debug("Default credentials manager initialized")
 
+    @staticmethod
+    def _build_api_client(credentials: Credentials) -> TradingApi:
+        """Create the Trading API client, with the HTTP cache installed from the start."""
+        connection_storage = ModelConnection(timeout=TradingApi.TRADING_TIMEOUT)
+        session_storage = CachedModelSession(hooks=connection_storage.build_hooks())
+        return TradingApi(
+            credentials=credentials, connection_storage=connection_storage, session_storage=session_storage
+        )
+
+    def _reset_session_state(self) -> None:
+        """Drop the state bound to the current session (user token and chart fetcher)."""
+        self._chart_fetcher = None
+        self._user_token = None
+
     def connect(self):
         """Connect to the DeGiro API."""
-        with requests_cache.enabled(
-            cache_name=self.__cache_path,
-            expire_after=timedelta(minutes=15),
-            allowable_methods=["GET", "HEAD", "POST"],
-            ignored_parameters=["oneTimePassword"],
-        ):
-            self.api_client.connect()
+        self.api_client.connect()
+
+        # A new session may belong to a different user, so the memoised token is no longer valid
+        self._reset_session_state()
 
         if self.credentials_manager.credentials.int_account is None:
             int_account = self._get_int_account()
@@ -271,20 +289,29 @@ class DeGiroService:
         daily_quotations = self._get_product_daily_quotation(
             identifier_type=identifier_type, identifier_value=identifier_value, period=period
         )
-        if not daily_quotations:
+        if daily_quotations.is_empty():
             self.logger.error(
                 f"Product Quotations for '{symbol}' ({identifier_type}:{identifier_value}) / {period} not found"
             )
             return {}
-        last_key = next(reversed(daily_quotations))
-        last_value = daily_quotations[last_key]
+        last_value = daily_quotations["price"][-1]
         last_quotation = self._get_product_last_quotation(identifier_type, identifier_value, symbol, last_value)
-        return daily_quotations | last_quotation
+        quotes = dict(
+            zip(
+                daily_quotations["date"].dt.strftime(LocalizationUtility.DATE_FORMAT).to_list(),
+                daily_quotations["price"].to_list(),
+                strict=True,
+            )
+        )
+        return quotes | last_quotation
 
-    def _get_product_daily_quotation(self, identifier_type: str, identifier_value: str, period: Interval) -> dict:
+    def _get_product_daily_quotation(
+        self, identifier_type: str, identifier_value: str, period: Interval
+    ) -> pl.DataFrame:
         """
         Get the list of quotations for the provided product for the indicated interval.
-        The response is a list of date-value pairs.
+        The response is a `(date, price)` DataFrame with one row per calendar day, where the days without
+        quotation (weekends, holidays, ...) carry the last known price.
         """
         self.check_connection()
 
@@ -293,38 +320,37 @@ class DeGiroService:
         )
         if not chart:
             self.logger.warning(f"No chart found for '{identifier_type}:{identifier_value}' / {period}")
-            return {}
+            return pl.DataFrame(schema=QUOTATION_SCHEMA)
 
-        quotes = {}
+        series_quotes = []
         for series in chart.series:
-            if series.type != "time":
+            if series.type != "time" or not series.data:
                 continue
 
             init_date = LocalizationUtility.convert_string_to_date(series.times.split("/")[0])
-            last_date = init_date
+            series_quotes.append(
+                pl.DataFrame(data=series.data, orient="row", schema=["offset", "price"]).select(
+                    (pl.lit(init_date) + pl.duration(days=pl.col("offset"))).cast(pl.Date).alias("date"),
+                    pl.col("price").cast(pl.Float64),
+                )
+            )
 
-            data_frame = pl.DataFrame(data=series.data, orient="row")
-            for row in data_frame.rows(named=True):
-                delta_days = row["column_0"]
-                current_date = init_date + timedelta(days=delta_days)
-
-                # Fill missing days
-                missing_days = (current_date - last_date).days
-                if missing_days > 1:
-                    last_known_value = quotes.get(LocalizationUtility.format_date_from_date(last_date), row["column_1"])
-                    for day_offset in range(1, missing_days):
-                        missing_date = last_date + timedelta(days=day_offset)
-                        quotes[LocalizationUtility.format_date_from_date(missing_date)] = last_known_value
-
-                # Add the current day's quotation
-                current_date_str = LocalizationUtility.format_date_from_date(current_date)
-                quotes[current_date_str] = row["column_1"]
-                last_date = current_date
+        if not series_quotes:
+            return pl.DataFrame(schema=QUOTATION_SCHEMA)
 
-        return quotes
+        quotes = pl.concat(series_quotes).unique(subset="date", keep="last").sort("date")
+
+        # Fill missing days with the last known value
+        all_dates = pl.date_range(quotes["date"].min(), quotes["date"].max(), interval="1d", eager=True).alias("date")
+        return (
+            all_dates.to_frame()
+            .join(quotes, on="date", how="left")
+            .with_columns(pl.col("price").forward_fill())
+            .select(QUOTATION_SCHEMA.keys())
+        )
 
     def _get_product_last_quotation(
-        self, identifier_type: str, identifier_value: str, symbol: str, default_quotation: str
+        self, identifier_type: str, identifier_value: str, symbol: str, default_quotation: float
     ) -> dict:
         """
         Get the list of quotations for the provided product for the indicated interval.
@@ -363,32 +389,63 @@ class DeGiroService:
     def __is_chart_error_type(chart: Chart | None) -> bool:
         return chart.get("series", [{}])[0].get("type") == "error"
 
+    @staticmethod
+    def _product_series(identifier_type: str, identifier_value: str) -> list[str]:
+        """Series needed to quote a product: its metadata and its price time series."""
+        return [
+            f"{identifier_type}:{identifier_value}",
+            f"price:{identifier_type}:{identifier_value}",
+        ]
+
     def _get_chart(
         self, identifier_type: str, identifier_value: str, period: Interval, resolution: Interval
     ) -> Chart | None:
-        user_token = self._get_user_token()
-        chart_fetcher = ChartFetcher(user_token=user_token)
+        return self._get_chart_series(
+            series=self._product_series(identifier_type, identifier_value), period=period, resolution=resolution
+        )
+
+    def _get_chart_series(self, series: List[str], period: Interval, resolution: Interval) -> Chart | None:
+        """
+        Get a chart with all the requested series in a single call.
+
+        The QuoteCast API accepts several series per request as long as they share the same period and resolution,
+        so callers that need data for multiple products can fetch them in one round-trip.
+        """
         chart_request = ChartRequest(
             culture="nl-NL",
             period=period,
             requestid="1",
             resolution=resolution,
-            series=[
-                f"{identifier_type}:{identifier_value}",
-                f"price:{identifier_type}:{identifier_value}",
-            ],
+            series=series,
             tz=TIME_ZONE,
         )
-        response = chart_fetcher.get_chart(chart_request=chart_request, raw=True)
+        response = self._get_chart_fetcher().get_chart(chart_request=chart_request, raw=True)
         if not response or self.__is_chart_error_type(response):
             return None
         return Chart.model_validate(response)
 
+    def _get_chart_fetcher(self) -> ChartFetcher:
+        """
+        Get the ChartFetcher bound to the current session.
+
+        The fetcher keeps its own HTTP session, so reusing it avoids building a new session per chart request.
+        It's recreated after every (re)connection.
+        """
+        if self._chart_fetcher is None:
+            connection_storage = ModelConnection(timeout=CHART_CONNECTION_TIMEOUT)
+            self._chart_fetcher = ChartFetcher(
+                user_token=self._get_user_token(),
+                connection_storage=connection_storage,
+                session_storage=CachedModelSession(hooks=connection_storage.build_hooks()),
+            )
+        return self._chart_fetcher
+
     def _get_user_token(self) -> int:
-        client_details = self.get_client_details()
-        user_token = client_details["data"]["id"]
+        if self._user_token is None:
+            client_details = self.get_client_details()
+            self._user_token = client_details["data"]["id"]
 
-        return user_token
+        return self._user_token
 
     def _get_int_account(self) -> int:
         client_details = self.get_client_details()
@@ -0,0 +1,151 @@
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from threading import Lock
+from typing import Dict, List, Optional
+
+import requests
+import requests_cache
+from degiro_connector.core.constants import headers as default_headers
+from degiro_connector.core.models.model_session import ModelSession
+from requests_cache import DO_NOT_CACHE
+
+import stonks_overwatch.settings
+from stonks_overwatch.utils.core.logger import StonksLogger
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Expiration applied to the DeGiro endpoints whose URL starts with any of the patterns."""
+
+    name: str
+    patterns: List[str]
+    expire_after: timedelta
+
+
+# Caching is opt-in per endpoint. Anything not listed here (login, account, orders, transactions, ...)
+# always goes to the network.
+# The products info endpoint (product_search/secure/v5/products/info) is deliberately not cached: it returns the
+# live closePrice used by the portfolio.
+CACHE_POLICIES: List[CachePolicy] = [
+    CachePolicy(
+        name="product_search",
+        patterns=[
+            f"trader.degiro.nl/product_search/secure/v5/{endpoint}"
+            for endpoint in [
+                "bonds",
+                "etfs",
+                "funds",
+                "futures",
+                "leverageds",
+                "options",
+                "products/lookup",
+                "warrants",
+            ]
+        ]
+        + ["trader.degiro.nl/productsearch/"],
+        expire_after=timedelta(hours=24),
+    ),
+    CachePolicy(
+        name="company_profile",
+        patterns=["trader.degiro.nl/dgtbxdsservice/secure/company-profile/"],
+        expire_after=timedelta(hours=24),
+    ),
+    CachePolicy(
+        name="charts",
+        patterns=["charting.vwdservices.com/hchart/"],
+        expire_after=timedelta(minutes=15),
+    ),
+]
+
+
+class HttpCacheStats:
+    """Process-wide cache hit/miss counters for the cacheable DeGiro endpoints."""
+
+    logger = StonksLogger.get_logger("stonks_overwatch.degiro_http_cache", "[DEGIRO|HTTP_CACHE]")
+
+    _lock = Lock()
+    _counters: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def record(cls, policy_name: str, from_cache: bool) -> None:
+        with cls._lock:
+            counters = cls._counters.setdefault(policy_name, {"hits": 0, "misses": 0})
+            counters["hits" if from_cache else "misses"] += 1
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, int]]:
+        with cls._lock:
+            return {name: dict(counters) for name, counters in cls._counters.items()}
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._counters = {}
+
+    @classmethod
+    def log_summary(cls) -> None:
+        """
+        Write the counters to the application log, so they show up in the logs window, and reset them
+        so each update job summarises only its own requests.
+        """
+        with cls._lock:
+            snapshot = cls._counters
+            cls._counters = {}
+        if not snapshot:
+            cls.logger.info("No cacheable requests performed")
+            return
+
+        for name, counters in sorted(snapshot.items()):
+            total = counters["hits"] + counters["misses"]
+            ratio = counters["hits"] / total * 100 if total else 0.0
+            cls.logger.info(f"{name}: {counters['hits']} hits / {counters['misses']} misses ({ratio:.1f}% hit ratio)")
+
+
+def get_cache_policy(url: Optional[str]) -> Optional[CachePolicy]:
+    """Returns the cache policy that applies to the URL, if any."""
+    if not url:
+        return None
+
+    base_url = url.split("://")[-1]
+    for policy in CACHE_POLICIES:
+        if any(base_url.startswith(pattern) for pattern in policy.patterns):
+            return policy
+    return None
+
+
+def _record_cache_usage(response: requests.Response, *args, **kwargs) -> requests.Response:
+    """Response hook that updates the HttpCacheStats counters."""
+    policy = get_cache_policy(response.url)
+    if policy is not None:
+        HttpCacheStats.record(policy.name, getattr(response, "from_cache", False))
+    return response
+
+
+class CachedModelSession(ModelSession):
+    """
+    ModelSession that builds `requests_cache` sessions.
+
+    The DeGiro clients use it when they are constructed, so every request (with or without an established
+    connection) goes through the same cache and per-endpoint expiration rules.
+    """
+
+    cache_path = os.path.join(stonks_overwatch.settings.STONKS_OVERWATCH_CACHE_DIR, "http_request.cache")
+
+    @staticmethod
+    def build_session(headers: dict | None = None, hooks: dict | None = None) -> requests.Session:
+        session = requests_cache.CachedSession(
+            cache_name=CachedModelSession.cache_path,
+            expire_after=DO_NOT_CACHE,
+            urls_expire_after={
+                pattern: policy.expire_after for policy in CACHE_POLICIES for pattern in policy.patterns
+            },
+            allowable_methods=["GET", "HEAD", "POST"],
+            ignored_parameters=["oneTimePassword"],
+        )
+        session.headers.update(headers if isinstance(headers, dict) else default_headers.HEADERS)
+        if isinstance(hooks, dict):
+            session.hooks.update(hooks)
+        session.hooks["response"] = [*session.hooks.get("response", []), _record_cache_usage]
+
+        return session
@@ -9,6 +9,8 @@ description strings with a language comment. Each constant's docstring explains
 of the system uses it, so the impact of any change is immediately visible.
 """
 
+import re
+
 from stonks_overwatch.services.models import FeeType
 
 # Descriptions DeGiro uses for cash deposits and withdrawals.
@@ -50,9 +52,12 @@ DIVIDEND_DESCRIPTIONS: frozenset[str] = frozenset(
 )
 
 # Substring patterns used to classify account fee types.
-# Used in FeesService.__get_fee_type() — a description matches a FeeType if it contains
+# Used in get_fee_type() when importing the cash movements — a description matches a FeeType if it contains
 # any of the strings in the corresponding set.
-# To add a new language variant, append the new substring to the relevant FeeType set.
+# To add a new language variant, append the new substring to the relevant FeeType set. The fee type is stored
+# once, when a cash movement is imported, and the import is incremental, so the stored movements are not
+# reclassified: also add a data migration that backfills the fee_type of the matching movements, with a frozen
+# copy of the new patterns (see migrations/0014_degirocashmovements_fee_type.py).
 FEE_TYPE_PATTERNS: dict[FeeType, frozenset[str]] = {
     FeeType.FINANCE_TRANSACTION_TAX: frozenset(
         [
@@ -71,3 +76,18 @@ FEE_TYPE_PATTERNS: dict[FeeType, frozenset[str]] = {
         ]
     ),
 }
+
+# All the FEE_TYPE_PATTERNS compiled into a single alternation, with one named group per FeeType,
+# so a description is scanned once instead of once per pattern.
+FEE_TYPE_REGEX: re.Pattern = re.compile(
+    "|".join(
+        f"(?P<{fee_type.name}>{'|'.join(re.escape(pattern) for pattern in sorted(patterns))})"
+        for fee_type, patterns in FEE_TYPE_PATTERNS.items()
+    )
+)
+
+
+def get_fee_type(description: str) -> FeeType | None:
+    """Returns the FeeType of an account cash movement description, or None if it is not a fee."""
+    match = FEE_TYPE_REGEX.search(description or "")
+    return FeeType[match.lastgroup] if match else None
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Optional
 
 from stonks_overwatch.services.brokers.degiro.descriptions import DEPOSIT_DESCRIPTIONS
 from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroCashMovements
@@ -20,6 +21,97 @@ class CashMovementsRepository:
             )
             return dictfetchall(cursor)
 
+    @staticmethod
+    def get_cash_movements_page_raw(
+        limit: int,
+        after_id: Optional[int] = None,
+        offset: int = 0,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        symbol: Optional[str] = None,
+        movement_type: Optional[str] = None,
+        ascending: bool = False,
+    ) -> list[dict]:
+        """
+        Return a page of the cash movements, sorted by date and id.
+
+        The page starts right after the cash movement after_id (keyset pagination), so its cost does not
+        depend on how deep in the history it is. The offset is only applied when after_id is None.
+        The symbol filter is a case-insensitive substring match on the product symbol.
+        """
+        direction = "ASC" if ascending else "DESC"
+        comparison = ">" if ascending else "<"
+        conditions = []
+        params = []
+        if after_id is not None:
+            conditions.append(
+                f"""(date {comparison} (SELECT date FROM degiro_cashmovements WHERE id = %s)
+                    OR (date = (SELECT date FROM degiro_cashmovements WHERE id = %s) AND id {comparison} %s))"""
+            )
+            params += [after_id, after_id, after_id]
+        if start_date is not None:
+            conditions.append("date >= %s")
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            conditions.append("date < %s")
+            params.append((end_date + timedelta(days=1)).isoformat())
+        if symbol:
+            conditions.append("CAST(product_id AS INTEGER) IN (SELECT id FROM degiro_productinfo WHERE symbol LIKE %s)")
+            params.append(f"%{symbol}%")
+        if movement_type:
+            conditions.append("UPPER(type) = UPPER(%s)")
+            params.append(movement_type)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params += [limit, offset if after_id is None else 0]
+
+        connection = get_connection_for_model(DeGiroCashMovements)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT *
+                FROM degiro_cashmovements
+                {where}
+                ORDER BY date {direction}, id {direction}
+                LIMIT %s OFFSET %s
+                """,
+                params,
+            )
+            return dictfetchall(cursor)
+
+    @staticmethod
+    def get_fee_movements_raw() -> list[dict]:
+        """Return the cash movements classified as account fees at import time, newest first."""
+        connection = get_connection_for_model(DeGiroCashMovements)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT *
+                FROM degiro_cashmovements
+                WHERE fee_type IS NOT NULL
+                ORDER BY date DESC, id DESC
+                """
+            )
+            return dictfetchall(cursor)
+
+    @staticmethod
+    def get_fee_totals_raw() -> list[dict]:
+        """
+        Return the account fees summed per fee type, currency and day.
+
+        The day is kept in the grouping so the totals can be converted with the FX rate of that day.
+        """
+        connection = get_connection_for_model(DeGiroCashMovements)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT fee_type, currency, DATE(date) AS fee_date, SUM(change) AS total
+                FROM degiro_cashmovements
+                WHERE fee_type IS NOT NULL
+                GROUP BY fee_type, currency, DATE(date)
+                """
+            )
+            return dictfetchall(cursor)
+
     @staticmethod
     def get_cash_deposits_raw() -> list[dict]:
         connection = get_connection_for_model(DeGiroCashMovements)
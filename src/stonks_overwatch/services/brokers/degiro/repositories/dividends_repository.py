@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroAgendaDividend, DeGiroUpcomingPayments
 from stonks_overwatch.utils.database.db_utils import dictfetchall, get_connection_for_model
 
@@ -18,17 +20,25 @@ class DividendsRepository:
             return dictfetchall(cursor)
 
     @staticmethod
-    def get_forecasted_payments(isin: str) -> dict:
+    def get_forecasted_payments_by_isin(isins: Iterable[str]) -> dict[str, dict]:
+        """Return the latest forecasted payment of each of the given ISINs, indexed by ISIN."""
+        isins = list(isins)
+        if not isins:
+            return {}
+
         connection = get_connection_for_model(DeGiroAgendaDividend)
+        placeholders = ", ".join(["%s"] * len(isins))
         with connection.cursor() as cursor:
             cursor.execute(
-                """
+                f"""
                 SELECT *
                 FROM degiro_agendadividend
-                WHERE isin = %s
+                WHERE isin IN ({placeholders})
                 ORDER BY date_time DESC, event_id DESC
                 """,
-                [isin],
+                isins,
             )
-            result = dictfetchall(cursor)
-            return result[0] if result else None
+            result = {}
+            for row in dictfetchall(cursor):
+                result.setdefault(row["isin"], row)
+            return result
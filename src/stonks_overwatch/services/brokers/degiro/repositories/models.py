@@ -7,7 +7,7 @@ class DeGiroCashMovements(models.Model):
     class Meta:
         db_table = '"degiro_cashmovements"'
 
-    date = models.DateTimeField()
+    date = models.DateTimeField(db_index=True)
     value_date = models.DateTimeField()
     description = models.CharField(max_length=200)
     currency = models.CharField(max_length=3)
@@ -20,6 +20,8 @@ class DeGiroCashMovements(models.Model):
     change = models.DecimalField(max_digits=10, decimal_places=2, default=None, blank=True, null=True)
     exchange_rate = models.DecimalField(max_digits=10, decimal_places=2, default=None, blank=True, null=True)
     order_id = models.CharField(max_length=200, default=None, blank=True, null=True)
+    # FeeType name derived from the description at import time, None for movements that are not fees
+    fee_type = models.CharField(max_length=32, default=None, blank=True, null=True, db_index=True)
 
 
 class DeGiroTransactions(models.Model):
@@ -28,7 +30,7 @@ class DeGiroTransactions(models.Model):
 
     id = models.PositiveIntegerField(primary_key=True)
     product_id = models.PositiveIntegerField()
-    date = models.DateTimeField()
+    date = models.DateTimeField(db_index=True)
     buysell = models.CharField(max_length=1)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     quantity = models.DecimalField(max_digits=20, decimal_places=10)
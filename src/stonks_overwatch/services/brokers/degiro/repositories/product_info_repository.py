@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroProductInfo
 from stonks_overwatch.utils.database.db_utils import snake_to_camel
 
@@ -54,17 +56,22 @@ class ProductInfoRepository:
         return ProductInfoRepository.get_products_info_raw([product_id]).get(product_id, {})
 
     @staticmethod
-    def get_product_info_from_name(name: str) -> dict:
-        """Gets product information from the given product name. The information is retrieved from the DB.
+    def get_products_info_by_name(names: Iterable[str]) -> dict[str, dict]:
+        """Gets product information from the given product names. The information is retrieved from the DB.
         ### Parameters
-            * productName
+            * names: iterable of str
+                - The product names to query
         ### Returns
-            Product Info
+            dict: product infos indexed by product name. Names without product are not included.
         """
-        row = DeGiroProductInfo.objects.filter(name=name).values().first()
-        if row is None:
-            return None
-        return {snake_to_camel(key): value for key, value in row.items()}
+        names = set(names)
+        if not names:
+            return {}
+
+        result_map = {}
+        for row in DeGiroProductInfo.objects.filter(name__in=names).order_by("id").values():
+            result_map.setdefault(row["name"], {snake_to_camel(key): value for key, value in row.items()})
+        return result_map
 
     @staticmethod
     def get_products_isin() -> list[str]:
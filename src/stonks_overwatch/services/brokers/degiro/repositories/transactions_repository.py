@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Optional
 
 from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroTransactions
 from stonks_overwatch.utils.database.db_utils import dictfetchall, get_connection_for_model, snake_to_camel
@@ -17,6 +18,79 @@ class TransactionsRepository:
             )
             return dictfetchall(cursor)
 
+    @staticmethod
+    def get_transactions_page_raw(
+        limit: int,
+        after_id: Optional[int] = None,
+        offset: int = 0,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        symbol: Optional[str] = None,
+        buysell: Optional[str] = None,
+        ascending: bool = False,
+    ) -> list[dict]:
+        """
+        Return a page of the transactions whose product is known, sorted by date and id.
+
+        The page starts right after the transaction after_id (keyset pagination), so its cost does not
+        depend on how deep in the history it is. The offset is only applied when after_id is None.
+        The symbol filter is a case-insensitive substring match on the product symbol.
+        """
+        direction = "ASC" if ascending else "DESC"
+        comparison = ">" if ascending else "<"
+        conditions = []
+        params = []
+        if after_id is not None:
+            conditions.append(
+                f"""(t.date {comparison} (SELECT date FROM degiro_transactions WHERE id = %s)
+                    OR (t.date = (SELECT date FROM degiro_transactions WHERE id = %s) AND t.id {comparison} %s))"""
+            )
+            params += [after_id, after_id, after_id]
+        if start_date is not None:
+            conditions.append("t.date >= %s")
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            conditions.append("t.date < %s")
+            params.append((end_date + timedelta(days=1)).isoformat())
+        if symbol:
+            conditions.append("p.symbol LIKE %s")
+            params.append(f"%{symbol}%")
+        if buysell:
+            conditions.append("t.buysell = %s")
+            params.append(buysell)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params += [limit, offset if after_id is None else 0]
+
+        connection = get_connection_for_model(DeGiroTransactions)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT t.*
+                FROM degiro_transactions t
+                JOIN degiro_productinfo p ON p.id = t.product_id
+                {where}
+                ORDER BY t.date {direction}, t.id {direction}
+                LIMIT %s OFFSET %s
+                """,
+                params,
+            )
+            return dictfetchall(cursor)
+
+    @staticmethod
+    def get_total_fees_in_base_currency() -> float:
+        """Return the sum of the fees of the transactions whose product is known."""
+        connection = get_connection_for_model(DeGiroTransactions)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT SUM(total_fees_in_base_currency)
+                FROM degiro_transactions
+                WHERE product_id IN (SELECT id FROM degiro_productinfo)
+                """
+            )
+            result = cursor.fetchone()[0]
+            return float(result) if result is not None else 0.0
+
     @staticmethod
     def get_products_transactions() -> list[dict]:
         connection = get_connection_for_model(DeGiroTransactions)
@@ -7,6 +7,7 @@ from stonks_overwatch.services.brokers.degiro.repositories.cash_movements_reposi
 from stonks_overwatch.services.brokers.degiro.repositories.product_info_repository import ProductInfoRepository
 from stonks_overwatch.services.brokers.degiro.services.helper import is_non_tradeable_product
 from stonks_overwatch.services.models import AccountOverview
+from stonks_overwatch.services.utilities.pagination import Page, PageQuery
 from stonks_overwatch.utils.core.logger import StonksLogger
 
 
@@ -21,6 +22,33 @@ class AccountOverviewService(AccountServiceInterface, BaseService):
         # FETCH DATA
         account_overview = CashMovementsRepository.get_cash_movements_raw()
 
+        return self.__to_account_overview(account_overview)
+
+    def get_account_overview_page(self, query: PageQuery) -> Page[AccountOverview]:
+        self.logger.debug("Get Account Overview Page")
+        after_id = int(query.cursor) if query.cursor and query.cursor.isdigit() else None
+        # Fetch one extra row to know if there is a next page
+        cash_movements = CashMovementsRepository.get_cash_movements_page_raw(
+            limit=query.limit + 1,
+            after_id=after_id,
+            offset=query.offset,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            symbol=query.symbol,
+            movement_type=query.type,
+            ascending=query.ascending,
+        )
+        has_more = len(cash_movements) > query.limit
+        cash_movements = cash_movements[: query.limit]
+        item_cursors = [str(cash_movement["id"]) for cash_movement in cash_movements]
+
+        return Page(
+            items=self.__to_account_overview(cash_movements),
+            next_cursor=item_cursors[-1] if has_more else None,
+            item_cursors=item_cursors,
+        )
+
+    def __to_account_overview(self, account_overview: List[dict]) -> List[AccountOverview]:
         products_ids = []
         for cash_movement in account_overview:
             if cash_movement["productId"] is not None:
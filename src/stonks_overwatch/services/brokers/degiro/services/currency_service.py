@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from currency_converter import CurrencyConverter
 
@@ -17,12 +19,59 @@ from stonks_overwatch.utils.currency import get_standard_currency, normalize
 class CurrencyMapEntry:
     product_id: int
     inverse: bool
-    quotations: Optional[Dict[date, float]] = None
+
+
+@dataclass(frozen=True)
+class QuotationSeries:
+    """FX quotations of a currency pair, sorted by date."""
+
+    dates: List[date] = field(default_factory=list)
+    rates: List[float] = field(default_factory=list)
+
+    def rate_at(self, fx_date: Optional[date]) -> Optional[float]:
+        """
+        Returns the rate for the given date, or the last known rate before it.
+        If no date is provided, the latest rate is returned.
+        """
+        if not self.dates:
+            return None
+        if fx_date is None:
+            return self.rates[-1]
+
+        index = bisect_right(self.dates, fx_date)
+        if index == 0:
+            return None
+        return self.rates[index - 1]
+
+
+@lru_cache(maxsize=32)
+def _load_quotation_series(product_id: int) -> QuotationSeries:
+    """
+    Loads the quotations for the currency pair product.
+
+    The series is shared by all CurrencyConverterService instances in the process, until
+    CurrencyConverterService.invalidate_quotations() is called.
+    """
+    quotations = ProductQuotationsRepository.get_product_quotations(product_id)
+    if not quotations:
+        return QuotationSeries()
+
+    sorted_quotations = sorted(
+        (LocalizationUtility.convert_string_to_date(date_str), value) for date_str, value in quotations.items()
+    )
+    return QuotationSeries(
+        dates=[fx_date for fx_date, _ in sorted_quotations], rates=[rate for _, rate in sorted_quotations]
+    )
 
 
 class CurrencyConverterService:
     logger = StonksLogger.get_logger("stonks_overwatch.currency_converter", "[DEGIRO|CURRENCY_CONVERTER]")
 
+    @staticmethod
+    def invalidate_quotations() -> None:
+        """Drops the cached FX quotations. Must be called after new quotations are stored."""
+        _load_quotation_series.cache_clear()
+
     def __init__(self):
         self.currency_converter = CurrencyConverter(fallback_on_missing_rate=True, fallback_on_wrong_date=True)
         self.known_currency_pairs = CurrencyFX.known_currencies()
@@ -53,53 +102,81 @@ class CurrencyConverterService:
         amount, currency = normalize(amount, currency)
         new_currency = get_standard_currency(new_currency)
 
-        # If both currencies are the same, no conversion is needed
-        if currency == new_currency:
-            return amount
-
-        # If we know the currencies, we can use DeGiro's data
-        if currency in self.known_currency_pairs and new_currency in self.known_currency_pairs:
-            return self.__convert(amount, currency, new_currency, fx_date)
+        return amount * self.__rates(currency, new_currency, {fx_date})[fx_date]
 
-        # Fallback
-        return self.currency_converter.convert(amount, currency, new_currency, fx_date)
+    def convert_many(
+        self,
+        amounts: List[float],
+        currencies: List[str],
+        new_currency: str = "EUR",
+        fx_dates: Optional[List[Optional[date]]] = None,
+    ) -> List[float]:
+        """
+        Convert a batch of amounts to the same currency.
 
-    def __convert(self, amount: float, currency: str, new_currency: str, fx_date: date = None):
-        if self.currency_maps[currency][new_currency].quotations is None:
-            self.currency_maps[currency][new_currency].quotations = self.__load_quotations(currency, new_currency)
+        The amounts are grouped by currency: the currency is normalised, and its quotation series is
+        loaded, once per group. The rate of each distinct date is then looked up in that series.
 
-        quotations = self.currency_maps[currency][new_currency].quotations
+        Args:
+            amounts: The amounts to convert.
+            currencies: Source currency code of each amount (may be a derived currency like GBX).
+            new_currency: Target currency code. Must be a standard ISO code.
+            fx_dates: Optional date of each amount for the FX rate lookup.
 
-        if not quotations:
-            self.logger.debug(f"Empty quotations for {currency}/{new_currency}, falling back to currency_converter")
-            return self.currency_converter.convert(amount, currency, new_currency, fx_date)
+        Returns:
+            Converted amounts in new_currency, in the same order.
+        """
+        if fx_dates is None:
+            fx_dates = [None] * len(amounts)
+        new_currency = get_standard_currency(new_currency)
 
-        last_known_date = list(quotations.keys())[-1]
-        if fx_date is None or fx_date > last_known_date:
-            fx_date = last_known_date
+        dates_by_currency: Dict[str, set] = {}
+        for currency, fx_date in zip(currencies, fx_dates, strict=True):
+            dates_by_currency.setdefault(currency, set()).add(fx_date)
 
-        fx_rate = quotations[fx_date]
+        rates = {
+            currency: self.__rates(currency, new_currency, currency_dates)
+            for currency, currency_dates in dates_by_currency.items()
+        }
 
-        if fx_rate is None:
-            self.logger.warning(f"Cannot find FX rate for {currency}/{new_currency} on {fx_date}")
-            return self.currency_converter.convert(amount, currency, new_currency, fx_date)
+        return [
+            (amount or 0.0) * rates[currency][fx_date]
+            for amount, currency, fx_date in zip(amounts, currencies, fx_dates, strict=True)
+        ]
 
-        if self.currency_maps[currency][new_currency].inverse:
-            return amount * (1 / fx_rate)
+    def __rates(self, currency: str, new_currency: str, fx_dates: set) -> Dict[Optional[date], float]:
+        """
+        Returns the rate converting one unit of currency to new_currency, for each of the dates.
 
-        return amount * fx_rate
+        The DeGiro quotations are used when both currencies are known, with the currency_converter
+        as fallback for the other currencies and the dates without quotation.
+        """
+        unit, currency = normalize(1.0, currency)
+        # If both currencies are the same, no conversion is needed
+        if currency == new_currency:
+            return dict.fromkeys(fx_dates, unit)
 
-    def __load_quotations(self, currency: str, new_currency: str) -> Dict[date, float]:
-        product_id = self.currency_maps[currency][new_currency].product_id
-        tmp_quotations = ProductQuotationsRepository.get_product_quotations(product_id)
+        if currency not in self.known_currency_pairs or new_currency not in self.known_currency_pairs:
+            return {
+                fx_date: self.currency_converter.convert(unit, currency, new_currency, fx_date) for fx_date in fx_dates
+            }
 
-        if tmp_quotations is None:
-            self.logger.warning(f"No quotations found for {currency}/{new_currency} (productId={product_id})")
-            return {}
+        currency_map = self.currency_maps[currency][new_currency]
+        quotations = _load_quotation_series(currency_map.product_id)
+        if not quotations.dates:
+            self.logger.debug(f"Empty quotations for {currency}/{new_currency}, falling back to currency_converter")
 
-        return {
-            LocalizationUtility.convert_string_to_date(date_str): value for date_str, value in tmp_quotations.items()
-        }
+        rates = {}
+        for fx_date in fx_dates:
+            fx_rate = quotations.rate_at(fx_date)
+            if fx_rate is None:
+                if quotations.dates:
+                    self.logger.warning(f"Cannot find FX rate for {currency}/{new_currency} on {fx_date}")
+                rates[fx_date] = self.currency_converter.convert(unit, currency, new_currency, fx_date)
+            else:
+                rates[fx_date] = unit * (1 / fx_rate if currency_map.inverse else fx_rate)
+
+        return rates
 
     @staticmethod
     def __calculate_maps() -> Dict[str, Dict[str, CurrencyMapEntry]]:
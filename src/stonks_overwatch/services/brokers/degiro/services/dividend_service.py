@@ -51,39 +51,37 @@ class DividendsService(BaseService, DividendServiceInterface):
 
     def _get_dividends(self) -> List[Dividend]:
         overview = self.account_overview.get_account_overview()
+        transactions = [transaction for transaction in overview if transaction.description in DIVIDEND_DESCRIPTIONS]
+
+        # Convert all the payments to the base currency in a single pass
+        changes = self.currency_service.convert_many(
+            [transaction.change for transaction in transactions],
+            [transaction.currency for transaction in transactions],
+            self.base_currency,
+            [transaction.datetime.date() for transaction in transactions],
+        )
 
         # Group transactions by date and stock symbol to combine dividend and tax
         dividend_groups = {}
 
-        for transaction in overview:
-            if transaction.description in DIVIDEND_DESCRIPTIONS:
-                # Create a key to group by date and stock symbol
-                key = (transaction.value_datetime.date(), transaction.stock_symbol)
-
-                transaction_change = transaction.change
-                currency = transaction.currency
-                payment_date = transaction.datetime.date()
-
-                if currency != self.base_currency:
-                    transaction_change = self.currency_service.convert(
-                        transaction_change, currency, self.base_currency, payment_date
-                    )
-                    currency = self.base_currency
-
-                if key not in dividend_groups:
-                    dividend_groups[key] = {
-                        "payment_date": transaction.value_datetime,
-                        "stock_name": transaction.stock_name,
-                        "stock_symbol": transaction.stock_symbol,
-                        "currency": currency,
-                        "amount": 0.0,
-                        "taxes": 0.0,
-                    }
-
-                if transaction_change > 0:
-                    dividend_groups[key]["amount"] += transaction_change
-                else:
-                    dividend_groups[key]["taxes"] += abs(transaction_change)
+        for transaction, transaction_change in zip(transactions, changes, strict=True):
+            # Create a key to group by date and stock symbol
+            key = (transaction.value_datetime.date(), transaction.stock_symbol)
+
+            if key not in dividend_groups:
+                dividend_groups[key] = {
+                    "payment_date": transaction.value_datetime,
+                    "stock_name": transaction.stock_name,
+                    "stock_symbol": transaction.stock_symbol,
+                    "currency": self.base_currency,
+                    "amount": 0.0,
+                    "taxes": 0.0,
+                }
+
+            if transaction_change > 0:
+                dividend_groups[key]["amount"] += transaction_change
+            else:
+                dividend_groups[key]["taxes"] += abs(transaction_change)
 
         # Convert grouped data to Dividend objects
         dividends = []
@@ -106,35 +104,41 @@ class DividendsService(BaseService, DividendServiceInterface):
         result = []
         try:
             upcoming_payments = DividendsRepository.get_upcoming_payments()
+            stocks = ProductInfoRepository.get_products_info_by_name(
+                payment["product"] for payment in upcoming_payments
+            )
+
+            payments = []
+            for payment in upcoming_payments:
+                if payment["product"] in stocks:
+                    payments.append(payment)
+                else:
+                    self.logger.warning(f"Stock info not found for {payment['product']}. Skipping upcoming dividend.")
+
+            # Convert all the payments to the base currency in a single pass
+            amounts = self.currency_service.convert_many(
+                [float(payment["amount"]) for payment in payments],
+                [payment["currency"] for payment in payments],
+                self.base_currency,
+            )
 
             # Group payments by date and stock symbol to combine dividend and tax
             dividend_groups = {}
 
-            for payment in upcoming_payments:
+            for payment, amount in zip(payments, amounts, strict=True):
                 stock_name = payment["product"]
-                stock = ProductInfoRepository.get_product_info_from_name(stock_name)
-                if not stock:
-                    self.logger.warning(f"Stock info not found for {stock_name}. Skipping upcoming dividend.")
-                    continue
-
-                stock_symbol = stock.get("symbol", "")
+                stock_symbol = stocks[stock_name].get("symbol", "")
                 payment_date = datetime.combine(payment["payDate"], time.min)
 
                 # Create a key to group by date and stock symbol
                 key = (payment_date.date(), stock_symbol)
 
-                amount = float(payment["amount"])
-                currency = payment["currency"]
-                if currency != self.base_currency:
-                    amount = self.currency_service.convert(amount, currency, self.base_currency)
-                    currency = self.base_currency
-
                 if key not in dividend_groups:
                     dividend_groups[key] = {
                         "payment_date": payment_date,
                         "stock_name": stock_name,
                         "stock_symbol": stock_symbol,
-                        "currency": currency,
+                        "currency": self.base_currency,
                         "amount": 0.0,
                         "taxes": 0.0,
                     }
@@ -166,49 +170,56 @@ class DividendsService(BaseService, DividendServiceInterface):
     def _get_forecasted_dividends(self) -> List[Dividend]:
         result = []
 
-        portfolio = self.portfolio_service.get_portfolio
-
-        for entry in portfolio:
-            if entry.is_open and entry.product_type == ProductType.STOCK:
-                forecasted_dividends = DividendsRepository.get_forecasted_payments(isin=entry.isin)
-
-                if forecasted_dividends:
-                    amount = float(0.0)
-                    if "dividend" in forecasted_dividends and forecasted_dividends["dividend"] is not None:
-                        amount = float(forecasted_dividends["dividend"]) * entry.shares
-                    else:
-                        self.logger.warning(f"No dividend amount found for {entry.name} ({entry.isin})")
-
-                    currency = forecasted_dividends["currency"]
-                    if currency != self.base_currency:
-                        amount = self.currency_service.convert(amount, currency, self.base_currency)
-                        currency = self.base_currency
-
-                    result.append(
-                        Dividend(
-                            dividend_type=DividendType.FORECASTED,
-                            payment_date=forecasted_dividends["paymentDate"],
-                            stock_name=entry.name,
-                            stock_symbol=entry.symbol,
-                            currency=currency,
-                            amount=amount,
-                        )
-                    )
+        entries = [
+            entry
+            for entry in self.portfolio_service.get_portfolio
+            if entry.is_open and entry.product_type == ProductType.STOCK
+        ]
+        forecasts = DividendsRepository.get_forecasted_payments_by_isin({entry.isin for entry in entries})
+        entries = [entry for entry in entries if forecasts.get(entry.isin)]
+
+        amounts = []
+        for entry in entries:
+            forecasted_dividends = forecasts[entry.isin]
+            amount = float(0.0)
+            if "dividend" in forecasted_dividends and forecasted_dividends["dividend"] is not None:
+                amount = float(forecasted_dividends["dividend"]) * entry.shares
+            else:
+                self.logger.warning(f"No dividend amount found for {entry.name} ({entry.isin})")
+            amounts.append(amount)
+
+        # Convert all the payments to the base currency in a single pass
+        amounts = self.currency_service.convert_many(
+            amounts, [forecasts[entry.isin]["currency"] for entry in entries], self.base_currency
+        )
+
+        for entry, amount in zip(entries, amounts, strict=True):
+            forecasted_dividends = forecasts[entry.isin]
+            result.append(
+                Dividend(
+                    dividend_type=DividendType.FORECASTED,
+                    payment_date=forecasted_dividends["paymentDate"],
+                    stock_name=entry.name,
+                    stock_symbol=entry.symbol,
+                    currency=self.base_currency,
+                    amount=amount,
+                )
+            )
 
-                    if (
-                        forecasted_dividends["exDividendDate"]
-                        and forecasted_dividends["exDividendDate"].date() > timezone.now().date()
-                    ):
-                        result.append(
-                            Dividend(
-                                dividend_type=DividendType.EX_DIVIDEND,
-                                payment_date=forecasted_dividends["exDividendDate"],
-                                stock_name=entry.name,
-                                stock_symbol=entry.symbol,
-                                currency=currency,
-                                amount=amount,
-                                payout_date=forecasted_dividends["paymentDate"],
-                            )
-                        )
+            if (
+                forecasted_dividends["exDividendDate"]
+                and forecasted_dividends["exDividendDate"].date() > timezone.now().date()
+            ):
+                result.append(
+                    Dividend(
+                        dividend_type=DividendType.EX_DIVIDEND,
+                        payment_date=forecasted_dividends["exDividendDate"],
+                        stock_name=entry.name,
+                        stock_symbol=entry.symbol,
+                        currency=self.base_currency,
+                        amount=amount,
+                        payout_date=forecasted_dividends["paymentDate"],
+                    )
+                )
 
         return result
@@ -1,10 +1,10 @@
-from typing import Optional
+from datetime import date
+from typing import Dict, List, Optional
 
 from stonks_overwatch.config.base_config import BaseConfig
 from stonks_overwatch.core.interfaces.base_service import BaseService
 from stonks_overwatch.core.interfaces.fee_service import FeeServiceInterface
 from stonks_overwatch.services.brokers.degiro.client.degiro_client import DeGiroService
-from stonks_overwatch.services.brokers.degiro.descriptions import FEE_TYPE_PATTERNS
 from stonks_overwatch.services.brokers.degiro.repositories.cash_movements_repository import CashMovementsRepository
 from stonks_overwatch.services.brokers.degiro.repositories.product_info_repository import ProductInfoRepository
 from stonks_overwatch.services.brokers.degiro.repositories.transactions_repository import TransactionsRepository
@@ -38,39 +38,55 @@ class FeesService(FeeServiceInterface, BaseService):
         return sorted(total_fees, key=lambda k: (k.date, k.time), reverse=True)
 
     def get_account_fees(self) -> list[Fee]:
-        cash_movements = CashMovementsRepository.get_cash_movements_raw()
+        cash_movements = CashMovementsRepository.get_fee_movements_raw()
 
-        my_fees = []
-        for cash_movement in cash_movements:
-            fee_type = self.__get_fee_type(cash_movement["description"])
-            if fee_type is None:
-                continue
-
-            fee_value = cash_movement["change"]
-            currency_value = cash_movement["currency"]
-            if currency_value != self.base_currency:
-                fx_date = cash_movement["date"].date()
-                fee_value = self.currency_service.convert(fee_value, currency_value, self.base_currency, fx_date)
-                currency_value = self.base_currency
+        # Convert all the fees to the base currency in a single pass
+        fee_values = self.currency_service.convert_many(
+            [cash_movement["change"] for cash_movement in cash_movements],
+            [cash_movement["currency"] for cash_movement in cash_movements],
+            self.base_currency,
+            [cash_movement["date"].date() for cash_movement in cash_movements],
+        )
 
+        my_fees = []
+        for cash_movement, fee_value in zip(cash_movements, fee_values, strict=True):
             my_fees.append(
                 Fee(
                     date=cash_movement["date"].strftime(LocalizationUtility.DATE_FORMAT),
                     time=cash_movement["date"].strftime(LocalizationUtility.TIME_FORMAT),
-                    type=fee_type,
+                    type=FeeType[cash_movement["feeType"]],
                     description=cash_movement["description"],
                     fee_value=fee_value,
-                    currency=currency_value,
+                    currency=self.base_currency,
                 )
             )
 
         return my_fees
 
-    def __get_fee_type(self, description: str) -> FeeType | None:
-        for fee_type, patterns in FEE_TYPE_PATTERNS.items():
-            if any(pattern in description for pattern in patterns):
-                return fee_type
-        return None
+    def get_fee_totals(self, fees: Optional[List[Fee]] = None) -> Dict[FeeType, float]:
+        """
+        Retrieves the total fee value of each fee type.
+
+        The given fees are summed. Otherwise, the totals are aggregated in the database: the fee type of
+        the account cash movements is stored when they are imported, so the individual fees are not needed.
+        """
+        if fees is not None:
+            return super().get_fee_totals(fees=fees)
+
+        totals = dict.fromkeys(FeeType, 0.0)
+        totals[FeeType.TRANSACTION] = TransactionsRepository.get_total_fees_in_base_currency()
+
+        rows = CashMovementsRepository.get_fee_totals_raw()
+        fee_values = self.currency_service.convert_many(
+            [row["total"] for row in rows],
+            [row["currency"] for row in rows],
+            self.base_currency,
+            [date.fromisoformat(row["feeDate"]) for row in rows],
+        )
+        for row, fee_value in zip(rows, fee_values, strict=True):
+            totals[FeeType[row["feeType"]]] += fee_value
+
+        return totals
 
     def get_transaction_fees(self) -> list[Fee]:
         transactions_history = TransactionsRepository.get_transactions_raw()
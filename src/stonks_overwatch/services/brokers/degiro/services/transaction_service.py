@@ -8,6 +8,7 @@ from stonks_overwatch.services.brokers.degiro.client.degiro_client import DeGiro
 from stonks_overwatch.services.brokers.degiro.repositories.product_info_repository import ProductInfoRepository
 from stonks_overwatch.services.brokers.degiro.repositories.transactions_repository import TransactionsRepository
 from stonks_overwatch.services.models import Transaction
+from stonks_overwatch.services.utilities.pagination import Page, PageQuery
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
 
@@ -15,6 +16,8 @@ from stonks_overwatch.utils.core.logger import StonksLogger
 class TransactionsService(BaseService, TransactionServiceInterface):
     logger = StonksLogger.get_logger("stonks_overwatch.transactions_data.degiro", "[DEGIRO|TRANSACTIONS]")
 
+    BUY_SELL_CODES = {"buy": "B", "sell": "S"}
+
     def __init__(
         self,
         degiro_service: Optional[DeGiroService] = None,
@@ -41,6 +44,42 @@ class TransactionsService(BaseService, TransactionServiceInterface):
         products_info = ProductInfoRepository.get_products_info_raw(products_ids)
 
         # DISPLAY PRODUCTS_INFO
+        my_transactions = self.__to_transactions(transactions_history, products_info)
+
+        return sorted(my_transactions, key=lambda k: (k.date, k.time), reverse=True)
+
+    def get_transactions_page(self, query: PageQuery) -> Page[Transaction]:
+        buysell = None
+        if query.type:
+            buysell = self.BUY_SELL_CODES.get(query.type.lower())
+            if buysell is None:
+                return Page()
+
+        after_id = int(query.cursor) if query.cursor and query.cursor.isdigit() else None
+        # Fetch one extra row to know if there is a next page
+        rows = TransactionsRepository.get_transactions_page_raw(
+            limit=query.limit + 1,
+            after_id=after_id,
+            offset=query.offset,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            symbol=query.symbol,
+            buysell=buysell,
+            ascending=query.ascending,
+        )
+        has_more = len(rows) > query.limit
+        rows = rows[: query.limit]
+
+        products_info = ProductInfoRepository.get_products_info_raw(list({int(row["productId"]) for row in rows}))
+        item_cursors = [str(row["id"]) for row in rows]
+
+        return Page(
+            items=self.__to_transactions(rows, products_info),
+            next_cursor=item_cursors[-1] if has_more else None,
+            item_cursors=item_cursors,
+        )
+
+    def __to_transactions(self, transactions_history: List[dict], products_info: dict) -> List[Transaction]:
         my_transactions = []
         for transaction in transactions_history:
             info = products_info.get(transaction["productId"])
@@ -70,7 +109,7 @@ class TransactionsService(BaseService, TransactionServiceInterface):
                 )
             )
 
-        return sorted(my_transactions, key=lambda k: (k.date, k.time), reverse=True)
+        return my_transactions
 
     @staticmethod
     def __convert_buy_sell(buy_sell: str) -> str:
@@ -15,6 +15,8 @@ from stonks_overwatch.core.interfaces.base_service import BaseService
 from stonks_overwatch.core.interfaces.update_service import AbstractUpdateService
 from stonks_overwatch.services.brokers.degiro.client.constants import CurrencyFX
 from stonks_overwatch.services.brokers.degiro.client.degiro_client import DeGiroService
+from stonks_overwatch.services.brokers.degiro.client.http_cache import HttpCacheStats
+from stonks_overwatch.services.brokers.degiro.descriptions import get_fee_type
 from stonks_overwatch.services.brokers.degiro.repositories.cash_movements_repository import CashMovementsRepository
 from stonks_overwatch.services.brokers.degiro.repositories.models import (
     DeGiroAgendaDividend,
@@ -27,6 +29,7 @@ from stonks_overwatch.services.brokers.degiro.repositories.models import (
 )
 from stonks_overwatch.services.brokers.degiro.repositories.product_info_repository import ProductInfoRepository
 from stonks_overwatch.services.brokers.degiro.repositories.transactions_repository import TransactionsRepository
+from stonks_overwatch.services.brokers.degiro.services.currency_service import CurrencyConverterService
 from stonks_overwatch.services.brokers.degiro.services.helper import is_non_tradeable_product
 from stonks_overwatch.services.brokers.degiro.services.portfolio_service import PortfolioService
 from stonks_overwatch.services.brokers.degiro.services.session_checker import DeGiroSessionChecker
@@ -137,11 +140,16 @@ class UpdateService(BaseService, AbstractUpdateService):
             self.update_company_profile()
             self.update_yfinance()
             self.update_dividends()
+            self.update_ticker_info()
+            self.update_portfolio_snapshot()
+            self.update_dividend_aggregates()
             self._record_sync(success=True)
         except Exception as error:
             self.logger.error("Cannot Update Portfolio!")
             self.logger.error("Exception: %s", str(error), exc_info=True)
             self._record_sync(success=False)
+        finally:
+            HttpCacheStats.log_summary()
 
     def update_account(self):
         """Update the Account DB data. Only does it if the data is older than today."""
@@ -233,6 +241,8 @@ class UpdateService(BaseService, AbstractUpdateService):
 
         self.__import_products_info(products_info)
         self.__import_products_quotation()
+        # FX pairs are stored as product quotations, so the converter needs to reload them
+        CurrencyConverterService.invalidate_quotations()
 
     def __update_company_profile(self) -> dict:
         company_profiles = self.__get_company_profiles()
@@ -294,57 +304,52 @@ class UpdateService(BaseService, AbstractUpdateService):
                             "balance_total": row.get("balance_total", None),
                             "exchange_rate": self.__conv(row.get("exchangeRate", None)),
                             "order_id": row.get("orderId", None),
+                            "fee_type": self.__get_fee_type_name(row["description"]),
                         },
                     )
                 except Exception as error:
                     self.logger.error(f"Cannot import row: {row}")
                     self.logger.error("Exception: %s", str(error))
 
+            self._mark_history_changed(LocalizationUtility.convert_string_to_datetime(row["date"]) for row in cash_data)
+
+    @staticmethod
+    def __get_fee_type_name(description: str) -> str | None:
+        fee_type = get_fee_type(description)
+        return fee_type.name if fee_type else None
+
     def __transform_json(self, account_overview: dict) -> list[dict] | None:
         """Flattens the data from deGiro `get_account_overview`."""
+        if account_overview.get("data") and account_overview["data"].get("cashMovements"):
+            return self._transform_cash_movements(account_overview["data"]["cashMovements"]).to_dicts()
+        return None
 
-        def _flatten_json(data: list[dict], sep: str = "_") -> list[dict]:
-            """Manually flatten nested JSON data similar to pd.json_normalize."""
-            flattened = []
-            for item in data:
-                flat_item = {}
-                for key, value in item.items():
-                    if isinstance(value, dict):
-                        # Flatten nested dictionaries
-                        for nested_key, nested_value in value.items():
-                            flat_item[f"{key}{sep}{nested_key}"] = nested_value
-                    else:
-                        flat_item[key] = value
-                flattened.append(flat_item)
-            return flattened
-
-        def _fix_columns(dataframe: pl.DataFrame, columns: list[str], func) -> pl.DataFrame:
-            """Apply a function to specified columns."""
-            for col in columns:
-                if col in dataframe.columns:
-                    dataframe = dataframe.with_columns(
-                        pl.col(col).map_elements(func, return_dtype=pl.String).alias(col)
-                    )
-            return dataframe
+    @staticmethod
+    def _transform_cash_movements(cash_movements: list[dict]) -> pl.DataFrame:
+        """
+        Flattens and normalizes the cash movements using native polars expressions.
 
-        if account_overview.get("data") and account_overview["data"].get("cashMovements"):
-            # Flatten the JSON data manually
-            flattened_data = _flatten_json(account_overview["data"]["cashMovements"], sep="_")
-            df = pl.DataFrame(flattened_data)
-
-            # Fix id values format
-            df = _fix_columns(
-                df,
-                ["productId", "id", "exchangeRate", "orderId"],
-                lambda x: None if (x is None) else str(x).replace(".0", ""),
+        Nested objects (like `balance`) become `<key>_<field>` columns, ids are stored as strings without
+        a trailing `.0` and `change` is stored as a string.
+        """
+        df = pl.DataFrame(cash_movements, infer_schema_length=None)
+
+        # Flatten nested dictionaries
+        struct_columns = [name for name, dtype in df.schema.items() if isinstance(dtype, pl.Struct)]
+        if struct_columns:
+            df = df.with_columns(pl.col(name).name.prefix_fields(f"{name}_") for name in struct_columns).unnest(
+                struct_columns
             )
-            df = _fix_columns(df, ["change"], lambda x: None if (x is None) else str(x))
 
-            # Sort the DataFrame by the 'date' column
-            df = df.sort("date")
+        # Fix id values format
+        id_columns = [name for name in ["productId", "id", "exchangeRate", "orderId"] if name in df.columns]
+        df = df.with_columns(
+            pl.col(id_columns).cast(pl.String).str.replace(r"\.0$", ""),
+            *([pl.col("change").cast(pl.String)] if "change" in df.columns else []),
+        )
 
-            return df.to_dicts()
-        return None
+        # Sort the DataFrame by the 'date' column
+        return df.sort("date")
 
     def __get_transaction_history(self, from_date: date) -> dict:
         """Import Transactions data from DeGiro. Uses the `get_transactions_history` method."""
@@ -392,6 +397,10 @@ class UpdateService(BaseService, AbstractUpdateService):
                 self.logger.error(f"Cannot import row: {row}")
                 self.logger.error("Exception: %s", str(error))
 
+        self._mark_history_changed(
+            LocalizationUtility.convert_string_to_datetime(row["date"]) for row in transactions_history["data"]
+        )
+
     def __get_product_ids(self) -> list:
         """Get the list of product ids from the DB.
 
@@ -0,0 +1,87 @@
+"""
+Net external cash flows of an IBKR account.
+
+The IBKR Web API doesn't provide the deposits and withdrawals of an account. They are derived from the account
+performance instead: the daily NAV changes because of the market (the time-weighted return of the day) and because
+of the external cash flows, so the flow of a day is the NAV change that the return doesn't explain:
+
+    flow[d] = nav[d] - nav[d - 1] * (1 + cps[d]) / (1 + cps[d - 1])
+
+where cps are the cumulative returns since the start of the period.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Tuple
+
+# Differences below this amount, or this fraction of the NAV, are rounding noise of the reported returns
+MIN_FLOW_AMOUNT = 1.0
+MIN_FLOW_RATIO = 0.0001
+
+
+@dataclass(frozen=True)
+class CashFlow:
+    date: date
+    amount: float
+    currency: str
+    opening: bool = False
+
+
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _is_noise(flow: float, nav: float) -> bool:
+    return abs(flow) < max(MIN_FLOW_AMOUNT, abs(nav) * MIN_FLOW_RATIO)
+
+
+def performance_window(performance: dict) -> Optional[Tuple[date, date]]:
+    """Return the first and last days of the performance period, None if it has no days."""
+    dates = performance["nav"]["dates"]
+    if not dates:
+        return None
+    return _parse_date(dates[0]), _parse_date(dates[-1])
+
+
+def net_cash_flows(performance: dict, account_id: str, include_start: bool = False) -> List[CashFlow]:
+    """
+    Return the days of the performance period with external cash flows.
+
+    ### Parameters
+        * performance: dict
+            - Response of the account performance endpoint, with daily frequency.
+        * account_id: str
+            - Account whose NAV and returns are used.
+        * include_start: bool
+            - If True, the NAV at the start of the period is returned as an opening flow on the first day. Used
+              on the first import, when the account was already funded before the period.
+    ### Returns
+        list: the cash flows, sorted by date. Positive amounts are deposits, negative ones withdrawals.
+    """
+    nav_entry = next((entry for entry in performance["nav"]["data"] if entry["id"] == account_id), None)
+    cps_entry = next((entry for entry in performance["cps"]["data"] if entry["id"] == account_id), None)
+    if nav_entry is None or cps_entry is None:
+        return []
+
+    currency = nav_entry["baseCurrency"]
+    dates = performance["nav"]["dates"]
+    navs = nav_entry["navs"]
+    returns = dict(zip(performance["cps"]["dates"], cps_entry["returns"], strict=True))
+
+    flows = []
+    previous_nav = float(nav_entry["startNAV"]["val"])
+    previous_return = 0.0
+    if include_start and dates and not _is_noise(previous_nav, 0.0):
+        flows.append(CashFlow(date=_parse_date(dates[0]), amount=previous_nav, currency=currency, opening=True))
+
+    for day, nav in zip(dates, navs, strict=True):
+        if nav is None or day not in returns:
+            continue
+        cumulative_return = float(returns[day])
+        flow = float(nav) - previous_nav * (1 + cumulative_return) / (1 + previous_return)
+        if not _is_noise(flow, previous_nav):
+            flows.append(CashFlow(date=_parse_date(day), amount=flow, currency=currency))
+        previous_nav = float(nav)
+        previous_return = cumulative_return
+
+    return flows
@@ -8,6 +8,7 @@ from dateutil.parser import parse
 from django.utils.timezone import is_naive, make_aware
 from ibind import IbkrClient
 from ibind.oauth.oauth1a import OAuth1aConfig
+from ibind.support.py_utils import execute_in_parallel
 
 from stonks_overwatch.config.ibkr import IbkrConfig
 from stonks_overwatch.constants import BrokerName
@@ -23,6 +24,9 @@ class IbkrService:
         currency: str
 
     logger = StonksLogger.get_logger("stonks_overwatch.ibkr_service", "[IBKR|CLIENT]")
+    # The gateway accepts 10 requests per second. Keep a margin for the other requests of the session
+    MAX_PARALLEL_REQUESTS = 4
+    MAX_REQUESTS_PER_SECOND = 5
     client: IbkrClient = None
     account: IbkrAccount = None
     tzinfos = {
@@ -123,12 +127,57 @@ class IbkrService:
         self.client.positions(self.account.account_id)
         return self.client.positions(self.account.account_id).data
 
-    def transaction_history(self, conid: str, currency: str) -> dict:
+    def transaction_history(self, conid: str, currency: str, days: Optional[int] = None) -> dict:
         self.logger.debug("Transaction History")
         return self.client.transaction_history(
-            account_ids=self.account.account_id, conids=conid, currency=currency
+            account_ids=self.account.account_id, conids=conid, currency=currency, days=days
         ).data
 
+    def transaction_histories(
+        self, days_by_conid: dict[int, Optional[int]], currency: str
+    ) -> dict[int, dict | Exception]:
+        """
+        Transaction history of several contracts, for the given number of days of each one (None for the default).
+
+        The endpoint only accepts one contract per request, so the requests are sent in parallel, with a bounded
+        number of workers and requests per second. Failed requests return their exception.
+        """
+        requests = {
+            conid: {"kwargs": {"conid": str(conid), "currency": currency, "days": days}}
+            for conid, days in days_by_conid.items()
+        }
+        return execute_in_parallel(
+            self.transaction_history,
+            requests=requests,
+            max_workers=self.MAX_PARALLEL_REQUESTS,
+            max_per_second=self.MAX_REQUESTS_PER_SECOND,
+        )
+
+    def get_account_performance(self, period: str) -> dict:
+        """Daily NAV and cumulative returns of the account. Period is one of 1D, 7D, MTD, 1M, YTD or 1Y."""
+        self.logger.debug(f"Account Performance ({period})")
+        return self.client.account_performance(account_ids=self.account.account_id, period=period).data
+
+    def get_daily_bars(self, conids: list[int], period: str) -> dict[int, dict[str, float]]:
+        """
+        Daily close prices of the contracts for the period before today (e.g. 30d), as {conid: {YYYY-MM-DD: close}}.
+
+        All the contracts are requested in a single batch; the client sends them in parallel within the gateway
+        limit of concurrent history requests. Contracts whose request fails are not included.
+        """
+        self.logger.debug(f"Daily Bars ({period}) for {conids}")
+        history = self.client.marketdata_history_by_conids(
+            [str(conid) for conid in conids], period=period, bar="1d", outside_rth=False
+        )
+
+        bars = {}
+        for conid, records in history.items():
+            if isinstance(records, Exception):
+                self.logger.warning(f"Cannot retrieve daily bars for {conid}: {records}")
+                continue
+            bars[int(conid)] = {record["date"].date().isoformat(): record["close"] for record in records}
+        return bars
+
     def get_default_currency(self) -> str:
         return self.account.currency
 
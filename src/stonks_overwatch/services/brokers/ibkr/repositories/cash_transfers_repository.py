@@ -0,0 +1,31 @@
+from datetime import date
+
+from django.db.models import Min, Sum
+
+from stonks_overwatch.services.brokers.ibkr.repositories.models import IBKRCashTransfer
+from stonks_overwatch.utils.database.db_utils import snake_to_camel
+
+
+class CashTransfersRepository:
+    @staticmethod
+    def get_cash_transfers_raw() -> list[dict]:
+        """Return the stored cash transfers, newest first."""
+        return [
+            {snake_to_camel(key): value for key, value in row.items()}
+            for row in IBKRCashTransfer.objects.order_by("-date", "id").values()
+        ]
+
+    @staticmethod
+    def get_total_cash_deposits_raw() -> float:
+        """Return the net amount deposited in the accounts, in their base currency."""
+        total = IBKRCashTransfer.objects.aggregate(total=Sum("amount"))["total"]
+        return float(total) if total is not None else 0.0
+
+    @staticmethod
+    def has_cash_transfers() -> bool:
+        return IBKRCashTransfer.objects.exists()
+
+    @staticmethod
+    def get_first_transfer_date() -> date | None:
+        """Return the date of the oldest stored cash transfer, None if there is no entry."""
+        return IBKRCashTransfer.objects.aggregate(first=Min("date"))["first"]
@@ -52,3 +52,31 @@ class IBKRTransactions(models.Model):
     amt = models.DecimalField(max_digits=20, decimal_places=10)
     type = models.CharField(max_length=200)
     desc = models.CharField(max_length=200)
+
+
+class IBKRCashTransfer(models.Model):
+    """Net external cash flow (deposits minus withdrawals) of an account on a day, in the account base currency."""
+
+    class Meta:
+        db_table = '"ibkr_cash_transfers"'
+
+    id = models.CharField(primary_key=True, max_length=40)
+    acct_id = models.CharField(max_length=20)
+    date = models.DateField()
+    currency = models.CharField(max_length=3)
+    amount = models.DecimalField(max_digits=20, decimal_places=10)
+    description = models.CharField(max_length=200)
+
+
+class IBKRProductQuotation(models.Model):
+    """Stores the daily close prices of the traded contracts, imported by the UpdateService."""
+
+    class Meta:
+        db_table = '"ibkr_productquotation"'
+
+    conid = models.PositiveIntegerField(primary_key=True)
+    interval = models.CharField(max_length=10)
+    last_import = models.DateTimeField()
+    quotations = models.JSONField()
+    # Last day whose bar was closed when it was imported. Later days still need to be imported
+    complete_through = models.DateField(default=None, blank=True, null=True)
@@ -0,0 +1,14 @@
+from typing import Dict, Iterable
+
+from stonks_overwatch.services.brokers.ibkr.repositories.models import IBKRProductQuotation
+
+
+class ProductQuotationsRepository:
+    @staticmethod
+    def get_products_quotations(conids: Iterable[int]) -> Dict[int, IBKRProductQuotation]:
+        """Return the stored quotations of the given contracts, indexed by conid. Retrieved with a single query."""
+        conids = list(conids)
+        if not conids:
+            return {}
+
+        return {quotation.conid: quotation for quotation in IBKRProductQuotation.objects.filter(conid__in=conids)}
@@ -1,5 +1,8 @@
 from datetime import datetime
 
+from django.db.models import Max
+
+from stonks_overwatch.services.brokers.ibkr.client.constants import TransactionType
 from stonks_overwatch.services.brokers.ibkr.repositories.models import IBKRTransactions
 from stonks_overwatch.utils.database.db_utils import dictfetchall, get_connection_for_model, snake_to_camel
 
@@ -38,6 +41,28 @@ class TransactionsRepository:
             for row in IBKRTransactions.objects.filter(conid__in=conids).values()
         ]
 
+    @staticmethod
+    def get_trades_chronological() -> list[dict]:
+        """Return the Buy and Sell transactions, oldest first."""
+        return [
+            {snake_to_camel(key): value for key, value in row.items()}
+            for row in IBKRTransactions.objects.filter(
+                type__in=[TransactionType.BUY.to_string(), TransactionType.SELL.to_string()]
+            )
+            .order_by("date", "id")
+            .values()
+        ]
+
+    @staticmethod
+    def get_dividend_payments() -> list[dict]:
+        """Return the dividend payments, oldest first."""
+        return [
+            {snake_to_camel(key): value for key, value in row.items()}
+            for row in IBKRTransactions.objects.filter(type=TransactionType.DIVIDEND_PAYMENT.to_string())
+            .order_by("date", "id")
+            .values()
+        ]
+
     @staticmethod
     def get_portfolio_products(only_open: bool = False) -> list[dict]:
         connection = get_connection_for_model(IBKRTransactions)
@@ -55,6 +80,14 @@ class TransactionsRepository:
             cursor.execute(query)
             return dictfetchall(cursor)
 
+    @staticmethod
+    def get_last_movements_by_conid() -> dict[int, datetime]:
+        """Return the date of the latest stored transaction of each contract."""
+        return {
+            row["conid"]: row["last"]
+            for row in IBKRTransactions.objects.values("conid").annotate(last=Max("date")).order_by()
+        }
+
     @staticmethod
     def get_last_movement() -> datetime | None:
         """Return the latest update from the DB.
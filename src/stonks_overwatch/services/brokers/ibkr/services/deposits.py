@@ -0,0 +1,52 @@
+from datetime import datetime, time, timezone as dt_timezone
+from typing import Dict, List, Optional
+
+from stonks_overwatch.config.base_config import BaseConfig
+from stonks_overwatch.core.interfaces.deposit_service import DepositServiceInterface
+from stonks_overwatch.services.brokers.ibkr.repositories.cash_transfers_repository import CashTransfersRepository
+from stonks_overwatch.services.brokers.ibkr.services.ibkr_base_service import IbkrBaseService
+from stonks_overwatch.services.models import Deposit, DepositType
+from stonks_overwatch.utils.core.logger import StonksLogger
+
+
+class DepositsService(IbkrBaseService, DepositServiceInterface):
+    """
+    Deposits and withdrawals of the IBKR account.
+
+    Reads the cash transfers stored by the UpdateService, so no call to the IBKR gateway is needed. The transfers
+    are stored in the account base currency and converted to the base currency with the rate of their day.
+    """
+
+    logger = StonksLogger.get_logger("stonks_overwatch.deposits_service", "[IBKR|DEPOSITS]")
+
+    def __init__(self, config: Optional[BaseConfig] = None):
+        super().__init__(config)
+
+    def get_cash_deposits(self) -> List[Deposit]:
+        self.logger.debug("Get Cash Deposits")
+
+        deposits = []
+        for transfer in CashTransfersRepository.get_cash_transfers_raw():
+            amount = float(transfer["amount"])
+            deposits.append(
+                Deposit(
+                    datetime=datetime.combine(transfer["date"], time.min, tzinfo=dt_timezone.utc),
+                    type=DepositType.DEPOSIT if amount > 0 else DepositType.WITHDRAWAL,
+                    change=self._to_base(amount, transfer["currency"], transfer["date"]),
+                    currency=self.base_currency,
+                    description=transfer["description"],
+                )
+            )
+
+        return deposits
+
+    def calculate_cash_account_value(self) -> Dict[str, float]:
+        self.logger.debug("Calculate Cash Account Value")
+
+        cash_account: Dict[str, float] = {}
+        running_total = 0.0
+        for deposit in sorted(self.get_cash_deposits(), key=lambda k: k.datetime):
+            running_total += deposit.change
+            cash_account[deposit.datetime_as_date()] = running_total
+
+        return cash_account
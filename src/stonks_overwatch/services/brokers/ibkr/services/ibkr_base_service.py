@@ -0,0 +1,35 @@
+"""Base service for the IBKR services that convert stored amounts to the base currency."""
+
+from datetime import date
+
+from currency_converter import CurrencyConverter
+from django.utils.functional import cached_property
+
+from stonks_overwatch.core.interfaces.base_service import BaseService
+from stonks_overwatch.utils.core.logger import StonksLogger
+from stonks_overwatch.utils.currency import normalize
+
+
+class IbkrBaseService(BaseService):
+    """
+    Intermediate base class for the IBKR services that handle amounts in the account or contract currency.
+
+    The conversions use the offline ECB rates of the given day, so no call to the IBKR gateway is needed.
+    """
+
+    logger = StonksLogger.get_logger("stonks_overwatch.ibkr.base", "[IBKR|BASE]")
+
+    @cached_property
+    def currency_converter(self) -> CurrencyConverter:
+        return CurrencyConverter(fallback_on_missing_rate=True, fallback_on_wrong_date=True)
+
+    def _to_base(self, amount: float, currency: str, on_date: date) -> float:
+        """Converts an amount to the base currency with the rate of the given date, without calling the gateway."""
+        amount, currency = normalize(amount, currency)
+        if not amount or currency == self.base_currency:
+            return amount
+        try:
+            return self.currency_converter.convert(amount, currency, self.base_currency, date=on_date)
+        except Exception as e:
+            self.logger.warning(f"Cannot convert {currency} to {self.base_currency} on {on_date}: {e}")
+            return amount
@@ -1,5 +1,7 @@
 import time
-from typing import List, Optional
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -7,22 +9,30 @@ from iso10383 import MIC
 
 from stonks_overwatch.config.base_config import BaseConfig
 from stonks_overwatch.core.interfaces import PortfolioServiceInterface
-from stonks_overwatch.core.interfaces.base_service import BaseService
-from stonks_overwatch.services.brokers.ibkr.client.constants import AssetClass
+from stonks_overwatch.services.brokers.ibkr.client.constants import AssetClass, TransactionType
 from stonks_overwatch.services.brokers.ibkr.client.ibkr_service import IbkrService
+from stonks_overwatch.services.brokers.ibkr.repositories.cash_transfers_repository import CashTransfersRepository
 from stonks_overwatch.services.brokers.ibkr.repositories.positions_repository import PositionsRepository
+from stonks_overwatch.services.brokers.ibkr.repositories.product_quotations_repository import (
+    ProductQuotationsRepository,
+)
+from stonks_overwatch.services.brokers.ibkr.repositories.transactions_repository import TransactionsRepository
+from stonks_overwatch.services.brokers.ibkr.services.deposits import DepositsService
+from stonks_overwatch.services.brokers.ibkr.services.ibkr_base_service import IbkrBaseService
 from stonks_overwatch.services.models import Country, DailyValue, PortfolioEntry, TotalPortfolio
+from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
 from stonks_overwatch.utils.domain.constants import ProductType, Sector
 
 
-class PortfolioService(BaseService, PortfolioServiceInterface):
+class PortfolioService(IbkrBaseService, PortfolioServiceInterface):
     logger = StonksLogger.get_logger("stonks_overwatch.portfolio_data.ibkr", "[IBKR|PORTFOLIO]")
 
     def __init__(self, config: Optional[BaseConfig] = None):
         super().__init__(config)
         self.positions_repository = PositionsRepository()
         self.ibkr_service = IbkrService()
+        self.deposits = DepositsService(config)
         # Use base_currency property from BaseService which handles dependency injection
         # self.base_currency = self.base_currency  # This will use the property from BaseService
 
@@ -199,19 +209,13 @@ class PortfolioService(BaseService, PortfolioServiceInterface):
                 portfolio_total_value += entry.base_currency_value
                 # tmp_total_portfolio[entry.name] = entry.base_currency_value
 
-        # FIXME: The value needs to be properly retrieved from IBKR
-        tmp_total_portfolio["totalDepositWithdrawal"] = 10000.0
+        tmp_total_portfolio["totalDepositWithdrawal"] = CashTransfersRepository.get_total_cash_deposits_raw()
         tmp_total_portfolio["totalCash"] = self.__get_total_cash()
-        # DISABLED UNTIL WE HAVE A WAY TO CACHE THE IBKR DATA
-        # tmp_total_portfolio["totalDepositWithdrawal"] = CashMovementsRepository.get_total_cash_deposits_raw()
-        # tmp_total_portfolio["totalCash"] = CashMovementsRepository.get_total_cash()
-        #
-        # # Try to get the data directly from IBKR, so we get up-to-date values
-        # realtime_total_portfolio = self.__get_realtime_portfolio_total()
-        # if realtime_total_portfolio:
-        #     tmp_total_portfolio = realtime_total_portfolio
-
-        roi = (portfolio_total_value / tmp_total_portfolio["totalDepositWithdrawal"] - 1) * 100
+
+        if tmp_total_portfolio["totalDepositWithdrawal"] > 0:
+            roi = (portfolio_total_value / tmp_total_portfolio["totalDepositWithdrawal"] - 1) * 100
+        else:
+            roi = 0.0
         total_profit_loss = portfolio_total_value - tmp_total_portfolio["totalDepositWithdrawal"]
 
         return TotalPortfolio(
@@ -287,29 +291,141 @@ class PortfolioService(BaseService, PortfolioServiceInterface):
 
     def calculate_historical_value(self) -> List[DailyValue]:
         """
-        Calculates the historical portfolio value over time.
+        Calculates the daily value of the account, positions and cash, without calling the IBKR gateway.
+
+        The quantity held every day is rebuilt from the stored positions and trades (see calculate_product_growth),
+        and valued with the daily close prices imported by the UpdateService. Days without a close price use the
+        last known close, or the price of the last trade of the contract. Weekends are skipped.
 
-        Note: IBKR doesn't provide easy access to historical portfolio values.
-        This implementation returns a minimal dataset with current portfolio value
-        to prevent dashboard errors.
+        The cash is rebuilt from the stored deposits, trades and dividends (see _calculate_trading_cash_flows).
+        The positions held before the stored trades were paid with deposited cash, so on the first day the
+        cash is the part of the deposits not invested in them. Without cash transfers only the positions are
+        valued.
 
         Returns:
-            List[DailyValue]: List containing current portfolio value
+            List[DailyValue]: daily value in base currency, oldest first
         """
         self.logger.debug("Calculating historical value for IBKR")
 
-        try:
-            # Get current portfolio total
-            portfolio_total = self.get_portfolio_total()
-            current_date = timezone.now().strftime("%Y-%m-%d")
-
-            # Return minimal historical data with current value
-            return [DailyValue(x=current_date, y=portfolio_total.current_value)]
-        except Exception as e:
-            self.logger.error(f"Error calculating historical value: {e}")
-            # Return empty list as fallback
+        product_growth = self.calculate_product_growth()
+        cash_account = self.deposits.calculate_cash_account_value()
+        if not product_growth and not cash_account:
             return []
 
+        quotations = {
+            conid: quotation.quotations
+            for conid, quotation in ProductQuotationsRepository.get_products_quotations(product_growth.keys()).items()
+        }
+        trade_prices: Dict[int, Dict[str, float]] = defaultdict(dict)
+        for trade in TransactionsRepository.get_trades_chronological():
+            if trade["pr"] is not None:
+                trade_prices[trade["conid"]][LocalizationUtility.format_date_from_date(trade["date"].date())] = float(
+                    trade["pr"]
+                )
+        trading_cash_flows = self._calculate_trading_cash_flows() if cash_account else {}
+
+        quantities: Dict[int, float] = {}
+        prices: Dict[int, float] = {}
+        dataset: List[DailyValue] = []
+        deposits = 0.0
+        trading = 0.0
+        # Positions value and trading cash of the first day, paid with the deposits before the history
+        invested_before: Optional[float] = None
+
+        first_days = [date.fromisoformat(next(iter(data["history"]))) for data in product_growth.values()]
+        first_days += [date.fromisoformat(day) for day in cash_account]
+        day = min(first_days)
+        today = timezone.now().date()
+        while day <= today:
+            day_str = LocalizationUtility.format_date_from_date(day)
+            for conid, data in product_growth.items():
+                if day_str in data["history"]:
+                    quantities[conid] = data["history"][day_str]
+                price = quotations.get(conid, {}).get(day_str, trade_prices[conid].get(day_str))
+                if price is not None:
+                    prices[conid] = price
+
+            positions_value = sum(
+                self._to_base(quantity * prices.get(conid, 0.0), product_growth[conid]["currency"], day)
+                for conid, quantity in quantities.items()
+            )
+            deposits = cash_account.get(day_str, deposits)
+            trading += trading_cash_flows.get(day_str, 0.0)
+            if invested_before is None:
+                invested_before = positions_value + trading
+
+            if day.weekday() < 5:
+                cash = deposits + trading - invested_before if cash_account else 0.0
+                value = positions_value + cash
+                dataset.append(DailyValue(x=day_str, y=LocalizationUtility.round_value(value)))
+
+            day += timedelta(days=1)
+
+        return dataset
+
+    def _calculate_trading_cash_flows(self) -> Dict[str, float]:
+        """
+        Calculates the cash moved every day by the stored trades and dividends, in base currency.
+
+        Buys take the traded amount out of the cash and sells bring it in. The trades and dividends are converted
+        from their currency with the rate of their day.
+
+        Returns:
+            dict: {date (YYYY-MM-DD): net cash flow of the day}
+        """
+        cash_flows: Dict[str, float] = defaultdict(float)
+        for trade in TransactionsRepository.get_trades_chronological():
+            day = trade["date"].date()
+            amount = -self._signed_quantity(trade) * float(trade["pr"] or 0)
+            cash_flows[LocalizationUtility.format_date_from_date(day)] += self._to_base(amount, trade["cur"], day)
+        for dividend in TransactionsRepository.get_dividend_payments():
+            day = dividend["date"].date()
+            amount = float(dividend["amt"])
+            cash_flows[LocalizationUtility.format_date_from_date(day)] += self._to_base(amount, dividend["cur"], day)
+
+        return cash_flows
+
     def calculate_product_growth(self) -> dict:
-        # TODO: Implement product growth calculation
-        pass
+        """
+        Calculates the quantity held of each contract over time.
+
+        The IBKR Web API only provides the trades of the last 90 days, so the history is rebuilt backwards from the
+        current positions: the quantity held before the stored trades is the current one minus the traded quantity.
+        The history starts with the oldest stored trade or cash transfer.
+
+        Returns:
+            dict: {conid: {"currency": currency, "history": {date (YYYY-MM-DD): quantity held after that day}}}
+        """
+        self.logger.debug("Calculating product growth for IBKR")
+
+        trades = TransactionsRepository.get_trades_chronological()
+        first_days = [trade["date"].date() for trade in trades[:1]]
+        first_transfer = CashTransfersRepository.get_first_transfer_date()
+        if first_transfer:
+            first_days.append(first_transfer)
+        start = LocalizationUtility.format_date_from_date(min(first_days, default=timezone.now().date()))
+
+        quantities: Dict[int, float] = defaultdict(float)
+        product_growth: Dict[int, dict] = {}
+        for position in self.positions_repository.get_all_positions():
+            quantities[position["conid"]] = float(position["position"] or 0)
+            product_growth[position["conid"]] = {"currency": position["currency"], "history": {}}
+        for trade in trades:
+            quantities[trade["conid"]] -= self._signed_quantity(trade)
+            product_growth.setdefault(trade["conid"], {"currency": trade["cur"], "history": {}})
+
+        for conid, data in product_growth.items():
+            if abs(quantities[conid]) > 1e-6:
+                data["history"][start] = quantities[conid]
+        for trade in trades:
+            quantities[trade["conid"]] += self._signed_quantity(trade)
+            day = LocalizationUtility.format_date_from_date(trade["date"].date())
+            product_growth[trade["conid"]]["history"][day] = quantities[trade["conid"]]
+
+        return {conid: data for conid, data in product_growth.items() if data["history"]}
+
+    @staticmethod
+    def _signed_quantity(trade: dict) -> float:
+        """Quantity of a trade, positive for buys and negative for sells."""
+        quantity = abs(float(trade["qty"] or 0))
+        return quantity if trade["type"] == TransactionType.BUY.to_string() else -quantity
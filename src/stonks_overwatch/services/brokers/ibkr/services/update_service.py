@@ -1,20 +1,43 @@
+import math
 import os
-from typing import Optional
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 
 from django.core.cache import cache
+from django.db import transaction as db_transaction
+from django.utils import timezone
 
 from stonks_overwatch.config.ibkr import IbkrConfig
 from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.core.interfaces.base_service import DependencyInjectionMixin
 from stonks_overwatch.core.interfaces.update_service import AbstractUpdateService
+from stonks_overwatch.services.brokers.ibkr.cash_flows import net_cash_flows, performance_window
 from stonks_overwatch.services.brokers.ibkr.client.ibkr_service import IbkrService
-from stonks_overwatch.services.brokers.ibkr.repositories.models import IBKRPosition, IBKRTransactions
+from stonks_overwatch.services.brokers.ibkr.repositories.cash_transfers_repository import CashTransfersRepository
+from stonks_overwatch.services.brokers.ibkr.repositories.models import (
+    IBKRCashTransfer,
+    IBKRPosition,
+    IBKRProductQuotation,
+    IBKRTransactions,
+)
 from stonks_overwatch.services.brokers.ibkr.repositories.positions_repository import PositionsRepository
+from stonks_overwatch.services.brokers.ibkr.repositories.product_quotations_repository import (
+    ProductQuotationsRepository,
+)
+from stonks_overwatch.services.brokers.ibkr.repositories.transactions_repository import TransactionsRepository
+from stonks_overwatch.services.brokers.ibkr.services.portfolio import PortfolioService
 from stonks_overwatch.utils.core.debug import save_to_json
 
 CACHE_KEY_UPDATE_PORTFOLIO = "portfolio_data_update_from_ibkr"
 # Cache the result for 1 hour (3600 seconds)
 CACHE_TIMEOUT = 3600
+# Longest period provided by the account performance endpoint
+CASH_TRANSFERS_PERIOD = "1Y"
+OPENING_BALANCE_SUFFIX = "_start"
+OPENING_BALANCE_DESCRIPTION = "Opening balance (estimated)"
+QUOTATION_INTERVAL = "1d"
+BATCH_SIZE = 500
 
 
 class UpdateService(DependencyInjectionMixin, AbstractUpdateService):
@@ -51,6 +74,11 @@ class UpdateService(DependencyInjectionMixin, AbstractUpdateService):
         try:
             self.update_portfolio()
             self.update_transactions()
+            self.update_cash_transfers()
+            self.update_quotations()
+            self.update_ticker_info()
+            self.update_portfolio_snapshot()
+            self.update_dividend_aggregates()
             self._record_sync(success=True)
         except Exception as error:
             self.logger.error("Cannot Update Portfolio!")
@@ -78,42 +106,223 @@ class UpdateService(DependencyInjectionMixin, AbstractUpdateService):
         return cached_data
 
     def update_transactions(self):
-        """Update the Account DB data. Only does it if the data is older than today."""
+        """
+        Update the transactions of the open positions.
+
+        Only the days after the latest stored transaction of each position are requested. The requests are sent in
+        parallel (see IbkrService.transaction_histories), and the transactions are stored with bulk upserts.
+        """
         self._log_message("Updating Transactions Data....")
 
+        positions = PositionsRepository.get_all_positions()
+        last_movements = TransactionsRepository.get_last_movements_by_conid()
+        today = timezone.now().date()
+        days_by_conid = {}
+        for position in positions:
+            last_movement = last_movements.get(position["conid"])
+            # The last stored day is requested again, since it may have been imported before it was complete
+            days_by_conid[position["conid"]] = (today - last_movement.date()).days + 1 if last_movement else None
+            self._log_message(
+                f"Updating transactions for '{position['contractDesc']}' position '{position['conid']}'"
+                f" ({days_by_conid[position['conid']] or 'default'} days)"
+            )
+
+        histories = self.ibkr_service.transaction_histories(days_by_conid, self.base_currency)
+
         transactions = {}
-        for position in PositionsRepository.get_all_positions():
-            self._log_message(f"Updating transactions for '{position['contractDesc']}' position '{position['conid']}'")
-            history = self.ibkr_service.transaction_history(position["conid"], self.base_currency)
-
-            transactions[position["conid"]] = history.get("transactions", {})
-            for transaction in history.get("transactions", {}):
-                try:
-                    transaction_date = self.ibkr_service.convert_date(transaction["date"])
-                    self._retry_database_operation(
-                        IBKRTransactions.objects.update_or_create,
-                        id=f"{transaction['conid']}_{int(transaction_date.timestamp())}",
-                        defaults={
-                            "acct_id": transaction["acctid"],
-                            "conid": transaction["conid"],
-                            "date": transaction_date,
-                            "cur": transaction["cur"],
-                            "fx_rate": transaction["fxRate"],
-                            "pr": transaction.get("pr", None),
-                            "qty": transaction.get("qty", None),
-                            "amt": transaction["amt"],
-                            "type": transaction["type"],
-                            "desc": transaction["desc"],
-                        },
-                    )
-                except Exception as error:
-                    self.logger.error(f"Cannot import transaction: {transaction}")
-                    self.logger.error(error, exc_info=True)
+        for conid, history in histories.items():
+            if isinstance(history, Exception):
+                self.logger.error(f"Cannot retrieve transactions for position '{conid}': {history}")
+                continue
+            transactions[conid] = history.get("transactions", [])
+
+        self.__import_transactions([row for rows in transactions.values() for row in rows])
 
         if self.debug_mode:
             transactions_file = os.path.join(self.import_folder, "transactions.json")
             save_to_json(transactions, transactions_file)
 
+    def __import_transactions(self, transactions: list[dict]) -> None:
+        """Store the transactions into the DB. Transactions already stored are updated."""
+        rows = {}
+        for transaction in transactions:
+            try:
+                transaction_date = self.ibkr_service.convert_date(transaction["date"])
+                row = IBKRTransactions(
+                    id=f"{transaction['conid']}_{int(transaction_date.timestamp())}",
+                    acct_id=transaction["acctid"],
+                    conid=transaction["conid"],
+                    date=transaction_date,
+                    cur=transaction["cur"],
+                    fx_rate=transaction["fxRate"],
+                    pr=transaction.get("pr", None),
+                    qty=transaction.get("qty", None),
+                    amt=transaction["amt"],
+                    type=transaction["type"],
+                    desc=transaction["desc"],
+                )
+                rows[row.id] = row
+            except Exception as error:
+                self.logger.error(f"Cannot import transaction: {transaction}")
+                self.logger.error(error, exc_info=True)
+
+        if not rows:
+            return
+
+        self._retry_database_operation(
+            IBKRTransactions.objects.bulk_create,
+            list(rows.values()),
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["acct_id", "conid", "date", "cur", "fx_rate", "pr", "qty", "amt", "type", "desc"],
+            batch_size=BATCH_SIZE,
+        )
+        self._mark_history_changed(row.date for row in rows.values())
+        self._log_message(f"Stored {len(rows)} transactions")
+
+    def update_cash_transfers(self):
+        """
+        Update the deposits and withdrawals of the account.
+
+        The IBKR Web API doesn't provide them, so the daily net cash flows are derived from the account
+        performance (see cash_flows.py). The flows of the last year are imported on every run and replace the
+        stored ones of the same days, so a day whose flow is now below the noise threshold is dropped. On the first
+        import, the NAV at the start of the period is stored as the opening balance: it is an estimate, the
+        deposits made before the period are unknown.
+        """
+        self._log_message("Updating Cash Transfers Data....")
+
+        account_id = self.ibkr_service.account.account_id
+        performance = self.ibkr_service.get_account_performance(CASH_TRANSFERS_PERIOD)
+
+        if self.debug_mode:
+            performance_file = os.path.join(self.import_folder, "account_performance.json")
+            save_to_json(performance, performance_file)
+
+        flows = net_cash_flows(performance, account_id, include_start=not CashTransfersRepository.has_cash_transfers())
+        transfers = [
+            IBKRCashTransfer(
+                id=f"{account_id}_{flow.date:%Y%m%d}" + (OPENING_BALANCE_SUFFIX if flow.opening else ""),
+                acct_id=account_id,
+                date=flow.date,
+                currency=flow.currency,
+                amount=round(flow.amount, 2),
+                description=OPENING_BALANCE_DESCRIPTION
+                if flow.opening
+                else ("Deposit" if flow.amount > 0 else "Withdrawal"),
+            )
+            for flow in flows
+        ]
+        window = performance_window(performance)
+        if window is None:
+            return
+
+        stored = self.__cash_transfer_days(IBKRCashTransfer.objects.filter(acct_id=account_id, date__range=window))
+        self._retry_database_operation(self.__replace_cash_transfers, account_id, window, transfers)
+        # Added, changed and dropped transfers change the deposits of the snapshots
+        self._mark_history_changed(day for day, _ in stored ^ self.__cash_transfer_days(transfers))
+        self._log_message(f"Stored {len(transfers)} cash transfers")
+
+    @staticmethod
+    def __cash_transfer_days(transfers) -> set[tuple[date, float]]:
+        """Days and amounts of the transfers, without the opening balance."""
+        return {
+            (transfer.date, float(transfer.amount))
+            for transfer in transfers
+            if not transfer.id.endswith(OPENING_BALANCE_SUFFIX)
+        }
+
+    @staticmethod
+    def __replace_cash_transfers(account_id: str, window: tuple[date, date], transfers: List[IBKRCashTransfer]):
+        """Replace the stored transfers of the days in the window, keeping the opening balance."""
+        with db_transaction.atomic():
+            IBKRCashTransfer.objects.filter(acct_id=account_id, date__range=window).exclude(
+                id__endswith=OPENING_BALANCE_SUFFIX
+            ).delete()
+            IBKRCashTransfer.objects.bulk_create(
+                transfers,
+                update_conflicts=True,
+                unique_fields=["id"],
+                update_fields=["acct_id", "date", "currency", "amount", "description"],
+            )
+
+    def update_quotations(self):
+        """
+        Import the daily close prices of the held and traded contracts into the DB.
+
+        Each contract needs the bars from the start of its history through the day it was closed, or through
+        yesterday if it is still held. Only the days after the stored ones are requested. The history endpoint
+        returns the bars of a period before today, so the contracts sharing the same period are requested in a
+        single batch.
+        """
+        self._log_message("Updating Quotations Data....")
+
+        product_growth = PortfolioService(config=self.config).calculate_product_growth()
+        stored_quotations = ProductQuotationsRepository.get_products_quotations(product_growth.keys())
+        today = timezone.now().date()
+        yesterday = today - timedelta(days=1)
+
+        conids_by_period: Dict[str, List[int]] = defaultdict(list)
+        for conid, data in product_growth.items():
+            start = self._get_import_start(data["history"], stored_quotations.get(conid), yesterday)
+            if start:
+                conids_by_period[self._get_period(start, today)].append(conid)
+
+        for period, conids in conids_by_period.items():
+            try:
+                bars = self.ibkr_service.get_daily_bars(conids, period)
+            except Exception as error:
+                self.logger.error(f"Cannot import daily bars for {conids} ({period}): {error}")
+                continue
+
+            for conid in conids:
+                if conid not in bars:
+                    continue
+                stored = stored_quotations.get(conid)
+                # Today's bar is not closed yet
+                new_bars = {day: close for day, close in bars[conid].items() if day < today.isoformat()}
+                quotations = {**(stored.quotations if stored else {}), **new_bars}
+                self._retry_database_operation(
+                    IBKRProductQuotation.objects.update_or_create,
+                    conid=conid,
+                    defaults={
+                        "interval": QUOTATION_INTERVAL,
+                        "last_import": timezone.now(),
+                        "quotations": dict(sorted(quotations.items())),
+                        "complete_through": yesterday,
+                    },
+                )
+
+    @staticmethod
+    def _get_import_start(
+        history: Dict[str, float], stored: Optional[IBKRProductQuotation], yesterday: date
+    ) -> Optional[date]:
+        """
+        Return the first day whose bar still has to be imported for a contract, or None if it is up to date.
+
+        :param history:
+            Quantity held after each day, by date (YYYY-MM-DD)
+        :param stored:
+            The stored quotations of the contract, if any
+        :param yesterday:
+            Last day whose bar is closed
+        """
+        days = list(history.keys())
+        start = date.fromisoformat(days[0])
+        end = date.fromisoformat(days[-1]) if abs(history[days[-1]]) < 1e-6 else yesterday
+        if stored and stored.complete_through:
+            start = max(start, stored.complete_through + timedelta(days=1))
+
+        return start if start <= min(end, yesterday) else None
+
+    @staticmethod
+    def _get_period(start: date, today: date) -> str:
+        """Return the history period covering the days from start through today."""
+        days = (today - start).days + 1
+        if days <= 1000:
+            return f"{days}d"
+        return f"{math.ceil(days / 365)}y"
+
     def __update_portfolio(self):
         """Update the Portfolio DB data."""
         open_positions = self.ibkr_service.get_open_positions()
@@ -1,8 +1,8 @@
 import json
-from typing import List
+from typing import Dict, Iterable, List
 
 from stonks_overwatch.services.brokers.yfinance.repositories.models import YFinanceStockSplits, YFinanceTickerInfo
-from stonks_overwatch.utils.database.db_utils import dictfetchone, get_connection_for_model
+from stonks_overwatch.utils.database.db_utils import dictfetchall, dictfetchone, get_connection_for_model
 
 
 class YFinanceRepository:
@@ -32,6 +32,28 @@ class YFinanceRepository:
 
         return None
 
+    @staticmethod
+    def get_ticker_infos(symbols: Iterable[str]) -> Dict[str, dict]:
+        """Return the stored ticker info of the given symbols, in a single query."""
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+
+        connection = get_connection_for_model(YFinanceTickerInfo)
+        placeholders = ", ".join(["%s"] * len(symbols))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT symbol, data
+                FROM yfinance_ticker_info
+                WHERE symbol IN ({placeholders})
+                """,
+                symbols,
+            )
+            results = dictfetchall(cursor)
+
+        return {row["symbol"]: json.loads(row["data"]) for row in results}
+
     @staticmethod
     def get_stock_splits(symbol: str) -> List[dict] | None:
         connection = get_connection_for_model(YFinanceStockSplits)
@@ -1,5 +1,5 @@
 import time
-from typing import List
+from typing import Dict, Iterable, List
 
 from yfinance.exceptions import YFRateLimitError
 
@@ -37,7 +37,10 @@ class YFinance:
         if ticker_info is not None:
             return ticker_info
 
-        # If not cached, fetch from yfinance with retry logic
+        return self._fetch_ticker_info_with_retry(symbol, max_retries)
+
+    def _fetch_ticker_info_with_retry(self, symbol: str, max_retries: int = 3) -> dict | None:
+        """Fetch the ticker info from yfinance and store it, retrying on rate limit errors."""
         for attempt in range(max_retries):
             try:
                 ticker = self.client.get_ticker(symbol)
@@ -64,6 +67,43 @@ class YFinance:
 
         return None
 
+    def get_stored_ticker_infos(self, symbols: Iterable[str]) -> Dict[str, dict]:
+        """
+        Get the stored ticker info of the given symbols with a single query.
+
+        Yahoo Finance is never called, symbols without stored info are missing from the result. They are
+        fetched by the broker update jobs through `update_ticker_infos`.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Dictionary mapping each symbol to its ticker info
+        """
+        return self.repository.get_ticker_infos({symbol for symbol in symbols if symbol})
+
+    def update_ticker_infos(self, symbols: Iterable[str]) -> int:
+        """
+        Fetch from Yahoo Finance the ticker info of the symbols that are not stored yet.
+
+        Each missing symbol is requested only once, no matter how many brokers or positions use it.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Number of symbols whose ticker info was fetched
+        """
+        symbols = {symbol for symbol in symbols if symbol}
+        missing_symbols = sorted(symbols - self.repository.get_ticker_infos(symbols).keys())
+
+        fetched = 0
+        for symbol in missing_symbols:
+            if self._fetch_ticker_info_with_retry(symbol) is not None:
+                fetched += 1
+
+        return fetched
+
     def get_stock_splits(self, symbol: str) -> List[StockSplit]:
         """Get stock splits for a given ticker. Retrieves the data from the DB, if not found,
         fetches it from Yahoo Finance.
@@ -100,7 +140,11 @@ class YFinance:
         Returns:
             Country object or None if not found
         """
-        ticker_info = self._get_ticker_info_with_retry(symbol)
+        return self.parse_country(self._get_ticker_info_with_retry(symbol))
+
+    @staticmethod
+    def parse_country(ticker_info: dict | None) -> Country | None:
+        """Extract the country from the ticker info."""
         if ticker_info is None:
             return None
 
@@ -128,7 +172,11 @@ class YFinance:
         Returns:
             Company name string, or None if not found
         """
-        ticker_info = self._get_ticker_info_with_retry(symbol)
+        return self.parse_name(self._get_ticker_info_with_retry(symbol))
+
+    @staticmethod
+    def parse_name(ticker_info: dict | None) -> str | None:
+        """Extract the company name from the ticker info."""
         if ticker_info is None:
             return None
         return ticker_info.get("longName") or ticker_info.get("shortName") or None
@@ -143,7 +191,11 @@ class YFinance:
         Returns:
             Tuple of (Sector, industry string or None)
         """
-        ticker_info = self._get_ticker_info_with_retry(symbol)
+        return self.parse_sector_industry(self._get_ticker_info_with_retry(symbol))
+
+    @staticmethod
+    def parse_sector_industry(ticker_info: dict | None) -> tuple[Sector, str | None]:
+        """Extract the sector and industry from the ticker info."""
         if ticker_info is None:
             return Sector.UNKNOWN, None
 
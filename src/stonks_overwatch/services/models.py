@@ -3,6 +3,7 @@ import re
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Optional, TypedDict
 
 import pycountry
@@ -51,22 +52,55 @@ class AccountOverview:
         return ""
 
 
+# Country names used by brokers and Yahoo Finance that pycountry does not know
+COUNTRY_ALIASES = {
+    "usa": "US",
+    "united states of america": "US",
+    "uk": "GB",
+    "great britain": "GB",
+    "england": "GB",
+    "korea": "KR",
+    "russia": "RU",
+    "turkey": "TR",
+    "czech republic": "CZ",
+    "holland": "NL",
+    "the netherlands": "NL",
+    "ivory coast": "CI",
+    "macau": "MO",
+    "macao": "MO",
+    "curacao": "CW",
+}
+
+
+@lru_cache(maxsize=1)
+def _country_index() -> Dict[str, str]:
+    """Map the lower-cased pycountry names, official and common names, plus the known aliases, to alpha_2 codes."""
+    index = {}
+    for country in pycountry.countries:
+        for attribute in ("name", "official_name", "common_name"):
+            name = getattr(country, attribute, None)
+            if name:
+                index[name.lower()] = country.alpha_2
+    index.update(COUNTRY_ALIASES)
+    return index
+
+
+@lru_cache(maxsize=512)
+def _resolve_country(name: str) -> str:
+    """Return the alpha_2 code of a country name, only falling back to the (slow) fuzzy search when needed."""
+    # Remove anything between parentheses
+    cleaned_name = re.sub(r"\(.*?\)", "", name).strip()
+    iso_code = _country_index().get(cleaned_name.lower())
+    if iso_code is None:
+        # FIXME: Retrieving the first match. How do we handle if the match is not correct?
+        iso_code = pycountry.countries.search_fuzzy(cleaned_name)[0].alpha_2
+    return iso_code
+
+
 class Country:
     def __init__(self, iso_code: str):
-        if len(iso_code) == 2:
-            self.iso_code = iso_code.upper()
-            self.country = pycountry.countries.get(alpha_2=self.iso_code)
-        else:
-            # FIXME: Retrieving the first match. How do we handle if the match is not correct?
-            self.country = pycountry.countries.search_fuzzy(Country.__clean_string(iso_code))[0]
-            self.iso_code = self.country.alpha_2
-
-    @staticmethod
-    def __clean_string(input_string: str) -> str:
-        # Remove anything between parentheses
-        cleaned_string = re.sub(r"\(.*?\)", "", input_string)
-        # Strip the string
-        return cleaned_string.strip()
+        self.iso_code = iso_code.upper() if len(iso_code) == 2 else _resolve_country(iso_code)
+        self.country = pycountry.countries.get(alpha_2=self.iso_code)
 
     def get_name(self) -> str:
         return self.country.name
@@ -0,0 +1,147 @@
+import base64
+import json
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PageQuery:
+    """
+    Position, filters and sorting of a page of history entries (transactions, account movements...).
+
+    The cursor is opaque for the callers: it is the next_cursor of the previous page. The offset is only
+    used when no cursor is provided, to reach a page that was not visited sequentially.
+    """
+
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+    offset: int = 0
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    symbol: Optional[str] = None
+    type: Optional[str] = None
+    ascending: bool = False
+
+    def matches(self, entry_date: date, symbol: Optional[str], entry_type: Optional[str]) -> bool:
+        """Return whether an entry passes the date, symbol and type filters."""
+        if self.start_date and entry_date < self.start_date:
+            return False
+        if self.end_date and entry_date > self.end_date:
+            return False
+        if self.symbol and self.symbol.lower() not in (symbol or "").lower():
+            return False
+        if self.type and self.type.lower() != (entry_type or "").lower():
+            return False
+        return True
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    A page of entries.
+
+    item_cursors holds, for every item, the cursor pointing right after it. The aggregators use them to
+    resume each broker exactly after the last item it contributed to a merged page.
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    item_cursors: List[str] = field(default_factory=list)
+
+
+def paginate(
+    entries: List[T],
+    query: PageQuery,
+    entry_date: Callable[[T], date],
+    entry_symbol: Callable[[T], Optional[str]],
+    entry_type: Callable[[T], Optional[str]],
+    sort_key: Callable[[T], object],
+) -> Page[T]:
+    """
+    Filter, sort and slice an in-memory list of entries.
+
+    Fallback for the brokers whose history cannot be filtered in their repositories. The cursor is the
+    position in the filtered list.
+    """
+    filtered = [entry for entry in entries if query.matches(entry_date(entry), entry_symbol(entry), entry_type(entry))]
+    filtered.sort(key=sort_key, reverse=not query.ascending)
+
+    try:
+        start = int(query.cursor) if query.cursor else query.offset
+    except ValueError:
+        start = 0
+    items = filtered[start : start + query.limit]
+    item_cursors = [str(start + index + 1) for index in range(len(items))]
+    next_cursor = item_cursors[-1] if items and start + len(items) < len(filtered) else None
+
+    return Page(items=items, next_cursor=next_cursor, item_cursors=item_cursors)
+
+
+def collect_pages(fetch_page: Callable[[PageQuery], Page[T]], query: PageQuery) -> List[T]:
+    """
+    Return every entry matching the filters and sorting of the query, following the cursors page by page.
+
+    Used by the exports, which need the full history instead of the page shown in the table.
+    """
+    entries = []
+    page_query = replace(query, limit=MAX_PAGE_SIZE, cursor=None, offset=0)
+    while True:
+        page = fetch_page(page_query)
+        entries.extend(page.items)
+        if not page.next_cursor:
+            return entries
+        page_query = replace(page_query, cursor=page.next_cursor)
+
+
+def encode_cursor(positions: Dict[str, Optional[str]]) -> str:
+    """Encode the position of every broker in a single opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(positions, sort_keys=True).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Dict[str, Optional[str]]:
+    """Decode a cursor created by encode_cursor. Invalid cursors restart from the first page."""
+    if not cursor:
+        return {}
+    try:
+        positions = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        return {}
+    return positions if isinstance(positions, dict) else {}
+
+
+def page_query_from_params(params) -> PageQuery:
+    """
+    Build a PageQuery from the request query parameters.
+
+    Supported parameters: limit, cursor, offset, start_date, end_date (ISO dates), symbol, type and
+    order (asc or desc). Invalid values fall back to their defaults.
+    """
+
+    def parse_int(name: str, default: int) -> int:
+        try:
+            return int(params.get(name, default))
+        except (TypeError, ValueError):
+            return default
+
+    def parse_date(name: str) -> Optional[date]:
+        try:
+            return datetime.fromisoformat(params[name]).date() if params.get(name) else None
+        except ValueError:
+            return None
+
+    return PageQuery(
+        limit=min(max(parse_int("limit", DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE),
+        cursor=params.get("cursor") or None,
+        offset=max(parse_int("offset", 0), 0),
+        start_date=parse_date("start_date"),
+        end_date=parse_date("end_date"),
+        symbol=(params.get("symbol") or "").strip() or None,
+        type=(params.get("type") or "").strip() or None,
+        ascending=params.get("order", "desc").lower() == "asc",
+    )
@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar
+
+from django.http import HttpRequest
+
+from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
+from stonks_overwatch.services.models import PortfolioEntry, PortfolioId, TotalPortfolio
+
+T = TypeVar("T")
+
+
+class RequestServices:
+    """
+    Aggregator services shared by the view and the template tags rendering a single request.
+
+    An instance is attached to every request by the RequestServicesMiddleware, so the aggregators
+    are created once per request and the portfolio is only computed once, no matter how many
+    components need it.
+    """
+
+    REQUEST_ATTRIBUTE = "services"
+
+    def __init__(self):
+        self._aggregators: Dict[type, Any] = {}
+        self._results: Dict[Tuple[str, PortfolioId], Any] = {}
+
+    @staticmethod
+    def for_request(request: HttpRequest) -> "RequestServices":
+        """Return the services of the request, creating them if the middleware did not run (e.g. in tests)."""
+        services = getattr(request, RequestServices.REQUEST_ATTRIBUTE, None)
+        if services is None:
+            services = RequestServices()
+            setattr(request, RequestServices.REQUEST_ATTRIBUTE, services)
+        return services
+
+    def get(self, aggregator_class: Type[T]) -> T:
+        """Return the request instance of the aggregator class."""
+        if aggregator_class not in self._aggregators:
+            self._aggregators[aggregator_class] = aggregator_class()
+        return self._aggregators[aggregator_class]
+
+    def get_portfolio(self, selected_portfolio: PortfolioId) -> List[PortfolioEntry]:
+        return self._memoize(
+            "portfolio",
+            selected_portfolio,
+            lambda: self.get(PortfolioAggregatorService).get_portfolio(selected_portfolio),
+        )
+
+    def get_portfolio_total(self, selected_portfolio: PortfolioId) -> TotalPortfolio:
+        return self._memoize(
+            "portfolio_total",
+            selected_portfolio,
+            lambda: self.get(PortfolioAggregatorService).get_portfolio_total(selected_portfolio),
+        )
+
+    def _memoize(self, name: str, selected_portfolio: PortfolioId, compute: Callable[[], T]) -> T:
+        key = (name, selected_portfolio)
+        if key not in self._results:
+            self._results[key] = compute()
+        return self._results[key]
@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar, Union
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class TtlSnapshot(Generic[T]):
+    """
+    In-process snapshot of a value that expires after a fixed number of seconds.
+
+    Used for broker data that is expensive to fetch and only needs to be approximately current (e.g. live
+    prices), so it can be shared by the requests served within the TTL. Failed loads are not stored.
+
+    The TTL is either a number of seconds, or a function returning it for the loaded value, e.g. to retry
+    sooner a value that could only be partially loaded.
+    """
+
+    def __init__(self, ttl_seconds: Union[float, Callable[[T], float]]):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._expires_at = 0.0
+
+    def get(self, loader: Callable[[], T]) -> T:
+        """Return the stored value, loading it with the loader if it is missing or expired."""
+        with self._lock:
+            if self._value is None or time.monotonic() >= self._expires_at:
+                self._store(loader())
+            return self._value
+
+    def refresh(self, loader: Callable[[], T]) -> T:
+        """Load and store the value, even if the current one has not expired yet."""
+        with self._lock:
+            self._store(loader())
+            return self._value
+
+    def peek(self) -> Optional[T]:
+        """Return the stored value, even if it has expired, without loading it."""
+        with self._lock:
+            return self._value
+
+    def invalidate(self) -> None:
+        """Drop the stored value, so the next get() loads it again."""
+        with self._lock:
+            self._value = None
+            self._expires_at = 0.0
+
+    def _store(self, value: T) -> None:
+        ttl_seconds = self.ttl_seconds(value) if callable(self.ttl_seconds) else self.ttl_seconds
+        self._value = value
+        self._expires_at = time.monotonic() + ttl_seconds
+
+
+class TtlSnapshotMap(Generic[K, T]):
+    """
+    One TtlSnapshot per key, for values that depend on the request parameters (e.g. the selected portfolio).
+
+    invalidate() drops every key, so the writers of the underlying data don't need to know which keys exist.
+    """
+
+    def __init__(self, ttl_seconds: Union[float, Callable[[T], float]]):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._snapshots: Dict[K, TtlSnapshot[T]] = {}
+
+    def snapshot(self, key: K) -> TtlSnapshot[T]:
+        """Return the TtlSnapshot of the key, creating it if it doesn't exist."""
+        with self._lock:
+            return self._snapshots.setdefault(key, TtlSnapshot(self.ttl_seconds))
+
+    def get(self, key: K, loader: Callable[[], T]) -> T:
+        """Return the value stored for the key, loading it with the loader if it is missing or expired."""
+        return self.snapshot(key).get(loader)
+
+    def invalidate(self) -> None:
+        """Drop the values of every key, so the next get() loads them again."""
+        with self._lock:
+            self._snapshots = {}
@@ -29,4 +29,8 @@
         }
         return `${value}<br><small class=\"fw-lighter\">${row.name}</small>`;
     };
+
+    window.valueDateFormatter = function (value, row) {
+        return `${value}<br><small class=\"fw-lighter\">${row.value_time}</small>`;
+    };
 })();
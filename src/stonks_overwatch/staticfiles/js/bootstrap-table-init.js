@@ -20,6 +20,9 @@
     const sortName = script.dataset.sortName || "date";
     const minHeightRaw = parseInt(script.dataset.minHeight || "400", 10);
     const isWebapp = script.dataset.isWebapp === "true";
+    const serverUrl = script.dataset.serverUrl || "";
+    const dataUrl = script.dataset.dataUrl || "";
+    const rowsField = script.dataset.rowsField || "rows";
 
     /**
      * Height offset to account for fixed navbar and page margins.
@@ -101,7 +104,7 @@
         const navbarHeight = $(".navbar").outerHeight() || 0;
         const tableHeight = calculateTableHeight();
 
-        $table.bootstrapTable({
+        const tableOptions = {
             search: true,
             pagination: true,
             paginationLoop: false,
@@ -142,7 +145,127 @@
             onRefresh: function () {
                 updateJumpToVisibility();
             }
-        });
+        };
+
+        if (serverUrl) {
+            Object.assign(tableOptions, serverSideOptions());
+        } else if (dataUrl) {
+            Object.assign(tableOptions, clientSideDataOptions());
+        }
+
+        $table.bootstrapTable(tableOptions);
+
+        /**
+         * Server-side pagination options.
+         *
+         * The server pages with cursors instead of offsets, so the cursor returned with each page is
+         * remembered by the offset where the next page starts. The total is unknown: it is reported as
+         * one page beyond the loaded rows while the server has more, so only the next page can be
+         * requested. The cursors are reset whenever the search or the sorting change.
+         *
+         * The server only filters by symbol and only sorts by date, so the search box says so and only
+         * the date column should be marked as sortable. The pagination switch is hidden because the
+         * server always needs a page size, and the CSV export is requested to the server so it holds
+         * the full history instead of the loaded page.
+         */
+        function serverSideOptions() {
+            let cursors = {};
+            let cursorsKey = "";
+            let requestedOffset = 0;
+            let requestedLimit = 0;
+
+            return {
+                url: serverUrl,
+                sidePagination: "server",
+                pageList: [10, 25, 50, 100, 200],
+                paginationParts: ["pageList", "pageSize"],
+                showJumpTo: false,
+                showPaginationSwitch: false,
+                showExport: false,
+                buttons: function () {
+                    return isWebapp ? { btnServerExport: serverExportButton() } : {};
+                },
+                formatSearch: function () {
+                    return "Filter by symbol";
+                },
+                escape: true,
+                ajaxOptions: {
+                    headers: { Accept: "application/json" }
+                },
+                queryParams: function (params) {
+                    requestedOffset = params.offset || 0;
+                    requestedLimit = params.limit;
+                    const query = {
+                        limit: params.limit,
+                        order: params.order || "desc"
+                    };
+                    if (params.search) {
+                        query.symbol = params.search;
+                    }
+                    // The cursors are only valid for the search and sorting they were created with
+                    const key = `${query.order}|${params.search || ""}`;
+                    if (key !== cursorsKey) {
+                        cursors = {};
+                        cursorsKey = key;
+                    }
+                    if (cursors[requestedOffset]) {
+                        query.cursor = cursors[requestedOffset];
+                    } else if (requestedOffset > 0) {
+                        query.offset = requestedOffset;
+                    }
+                    return query;
+                },
+                responseHandler: function (response) {
+                    const rows = response[rowsField] || [];
+                    const loaded = requestedOffset + rows.length;
+                    if (response.next_cursor) {
+                        cursors[loaded] = response.next_cursor;
+                    }
+                    return {
+                        rows: rows,
+                        total: response.next_cursor ? loaded + requestedLimit : loaded
+                    };
+                }
+            };
+        }
+
+        /**
+         * Options to load all the rows from the server once the page is rendered.
+         *
+         * The search, the sorting and the pagination stay in the browser, so the page is rendered
+         * without waiting for the rows.
+         */
+        function clientSideDataOptions() {
+            return {
+                url: dataUrl,
+                escape: true,
+                ajaxOptions: {
+                    headers: { Accept: "application/json" }
+                },
+                responseHandler: function (response) {
+                    return response[rowsField] || [];
+                }
+            };
+        }
+
+        /**
+         * Toolbar button downloading the CSV export of every row matching the current search and sorting.
+         */
+        function serverExportButton() {
+            return {
+                text: "Export all (CSV)",
+                icon: "bi-download",
+                attributes: { title: "Export all (CSV)" },
+                event: function () {
+                    const options = $table.bootstrapTable("getOptions");
+                    const query = { format: "csv", order: options.sortOrder || "desc" };
+                    if (options.searchText) {
+                        query.symbol = options.searchText;
+                    }
+                    window.location.href = `${serverUrl}?${$.param(query)}`;
+                }
+            };
+        }
 
         function updateJumpToVisibility() {
             const totalPages = $table.bootstrapTable("getOptions").totalPages;
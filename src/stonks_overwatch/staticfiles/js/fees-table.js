@@ -14,4 +14,8 @@
         }
         return `${value}<br><small class=\"fw-lighter\">${row.time}</small>`;
     };
+
+    window.feeTypeFormatter = function (value) {
+        return `<span class="red-pill">${value}</span>`;
+    };
 })();
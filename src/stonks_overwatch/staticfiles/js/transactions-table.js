@@ -30,6 +30,11 @@
         return `${value}<br><small class=\"fw-lighter\">${row.name}</small>`;
     };
 
+    window.buySellFormatter = function (value, row) {
+        const pill = value === "Buy" ? "green-pill" : "red-pill";
+        return `<span class=\"${pill}\">${value}</span><br><small class=\"fw-lighter\">${row.transaction_type}</small>`;
+    };
+
     window.isCurrencyColumnVisible = function () {
         return isColumnVisible("currency");
     };
@@ -7,9 +7,10 @@ from django.utils import timezone
 from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.core.factories.broker_factory import BrokerFactory
 from stonks_overwatch.core.service_types import ServiceType
-from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
 from stonks_overwatch.services.models import dataclass_to_dict
+from stonks_overwatch.services.utilities.request_services import RequestServices
 from stonks_overwatch.services.utilities.session_manager import SessionManager
+from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
 
 register = template.Library()
@@ -24,11 +25,18 @@ def index(sequence, position):
     return sequence[position]
 
 
+@register.filter
+def money(value, currency: str) -> str:
+    """Format a numeric value as a money string in the given currency."""
+    if value is None:
+        return ""
+    return LocalizationUtility.format_money_value(value=value, currency=currency)
+
+
 @register.inclusion_tag("total_overview.html", takes_context=True)
 def show_total_portfolio(context: RequestContext) -> dict:
-    portfolio = PortfolioAggregatorService()
     selected_portfolio = SessionManager.get_selected_portfolio(context.request)
-    total_portfolio = portfolio.get_portfolio_total(selected_portfolio)
+    total_portfolio = RequestServices.for_request(context.request).get_portfolio_total(selected_portfolio)
 
     return {"total_portfolio": dataclass_to_dict(total_portfolio)}
 
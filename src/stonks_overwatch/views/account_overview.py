@@ -4,7 +4,10 @@ from django.views import View
 
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.aggregators.account_overview_aggregator import AccountOverviewAggregatorService
+from stonks_overwatch.services.models import AccountOverview as AccountOverviewEntry
+from stonks_overwatch.services.utilities.pagination import collect_pages, page_query_from_params
 from stonks_overwatch.services.utilities.session_manager import SessionManager
+from stonks_overwatch.views.csv_export import csv_response, wants_csv
 from stonks_overwatch.views.mixins import CapabilityRequiredMixin
 
 
@@ -16,13 +19,37 @@ class AccountOverview(CapabilityRequiredMixin, View):
         self.account_overview = AccountOverviewAggregatorService()
 
     def get(self, request):
-        selected_portfolio = SessionManager.get_selected_portfolio(request)
-        overview = self.account_overview.get_account_overview(selected_portfolio)
-
-        if request.headers.get("Accept") == "application/json":
-            return JsonResponse(overview, safe=False)
+        if wants_csv(request):
+            # The export holds the full history, not only the page shown in the table
+            selected_portfolio = SessionManager.get_selected_portfolio(request)
+            entries = collect_pages(
+                lambda query: self.account_overview.get_account_overview_page(selected_portfolio, query),
+                page_query_from_params(request.GET),
+            )
+            return csv_response([self._to_row(entry) for entry in entries], "account_overview_export")
+        elif request.headers.get("Accept") == "application/json":
+            # The table requests the account overview page by page
+            selected_portfolio = SessionManager.get_selected_portfolio(request)
+            page = self.account_overview.get_account_overview_page(
+                selected_portfolio, page_query_from_params(request.GET)
+            )
+            overview = [self._to_row(entry) for entry in page.items]
+            return JsonResponse({"account_overview": overview, "next_cursor": page.next_cursor})
         else:
-            context = {
-                "account_overview": overview,
-            }
-            return render(request, "account_overview.html", context)
+            return render(request, "account_overview.html")
+
+    @staticmethod
+    def _to_row(entry: AccountOverviewEntry) -> dict:
+        return {
+            "date": entry.date(),
+            "time": entry.time(),
+            "type": entry.type_str(),
+            "symbol": entry.stock_symbol,
+            "name": entry.stock_name,
+            "description": entry.description,
+            "currency": entry.currency,
+            "change": entry.change,
+            "formated_change": entry.formated_change(),
+            "value_date": entry.value_date(),
+            "value_time": entry.value_time(),
+        }
@@ -0,0 +1,21 @@
+import csv
+
+from django.http import HttpResponse
+
+
+def wants_csv(request) -> bool:
+    """Return whether the request asks for the full history as CSV instead of the HTML page or a JSON page."""
+    return request.GET.get("format") == "csv"
+
+
+def csv_response(rows: list[dict], filename: str) -> HttpResponse:
+    """Return the rows as a CSV attachment, with a header line built from the keys of the first row."""
+    response = HttpResponse(content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+
+    writer = csv.writer(response)
+    if rows:
+        writer.writerow(rows[0].keys())
+        for row in rows:
+            writer.writerow(row.values())
+    return response
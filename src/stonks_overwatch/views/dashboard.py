@@ -1,11 +1,12 @@
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone as dt_timezone
+from itertools import pairwise
 from typing import Dict, List, Optional
 
 import polars as pl
 from dateutil.relativedelta import relativedelta
-from django.core.cache import cache
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.utils import timezone
@@ -14,6 +15,7 @@ from django.views import View
 from stonks_overwatch.services.aggregators.deposits_aggregator import DepositsAggregatorService
 from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
 from stonks_overwatch.services.models import DailyValue, PortfolioId
+from stonks_overwatch.services.utilities.request_services import RequestServices
 from stonks_overwatch.services.utilities.session_manager import SessionManager
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
@@ -23,7 +25,8 @@ from stonks_overwatch.utils.core.logger import StonksLogger
 class PortfolioMetrics:
     total_return: float
     annualized_return: float
-    cumulative_returns: dict[datetime, float]
+    # Columns: `date` (pl.Date) and `cumulative_return` (pl.Float64), sorted by date
+    cumulative_returns: pl.DataFrame
     total_days: int
     total_cashflows: float
 
@@ -38,13 +41,13 @@ class PortfolioPerformance:
 class Dashboard(View):
     """Dashboard view handling portfolio performance and value visualization.
     This view provides both HTML and JSON endpoints for accessing portfolio data,
-    with configurable time intervals and view types. Data is cached to optimize
-    performance.
+    with configurable time intervals and view types. The series are kept in-process
+    until they expire or new portfolio snapshots are stored.
     """
 
     logger = StonksLogger.get_logger("stonks_overwatch.dashboard.views", "[VIEW|DASHBOARD]")
-    CACHE_KEY_PORTFOLIO = "portfolio_value"
-    CACHE_TIMEOUT = 60 * 5  # 5 minutes
+    # Resolution of the chart series of each interval. Intervals up to 1Y use daily values
+    INTERVAL_RESOLUTION = {"3Y": "week", "5Y": "week", "ALL": "month"}
 
     VALID_INTERVALS = frozenset({"YTD", "MTD", "1M", "3M", "6M", "1Y", "3Y", "5Y", "ALL"})
     VALID_VIEWS = frozenset({"performance", "value"})
@@ -52,10 +55,11 @@ class Dashboard(View):
     # Data quality threshold: warn if daily return exceeds 20%
     LARGE_RETURN_THRESHOLD = 0.20
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.deposits = DepositsAggregatorService()
-        self.portfolio = PortfolioAggregatorService()
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        services = RequestServices.for_request(request)
+        self.deposits = services.get(DepositsAggregatorService)
+        self.portfolio = services.get(PortfolioAggregatorService)
 
     def get(self, request) -> JsonResponse | HttpResponse:
         """Handle GET request for a dashboard view."""
@@ -75,15 +79,27 @@ class Dashboard(View):
 
         self.logger.debug(f"Rendering dashboard view with interval: {interval} and view type: {view}")
 
+        # Shared by the requests until it expires or the update jobs store new snapshots
+        return PortfolioAggregatorService.series_snapshots.get(
+            (selected_portfolio.id, interval), lambda: self._build_dashboard_series(selected_portfolio, interval)
+        )
+
+    def _build_dashboard_series(self, selected_portfolio: PortfolioId, interval: str) -> dict:
+        """
+        Build the chart series of the interval.
+
+        The performance is calculated over the daily values, while the series sent to the frontend are
+        downsampled to the interval resolution, so the payload size does not grow with the history length.
+        """
         data = self.deposits.cash_deposits_history(selected_portfolio)
         cash_contributions = [DailyValue(x=item["date"], y=item["total_deposit"]) for item in data]
 
-        portfolio_value = self._get_portfolio_value(selected_portfolio)
-
         start_date = self._get_interval_start_date(interval)
+        portfolio_value = self._get_portfolio_value(selected_portfolio, start_date)
+
         if start_date:
-            portfolio_value = self.__filter_dashboard_values(portfolio_value, start_date)
-            cash_contributions = self.__filter_dashboard_values(cash_contributions, start_date)
+            portfolio_value = self._filter_dashboard_values(portfolio_value, start_date)
+            cash_contributions = self._filter_dashboard_values(cash_contributions, start_date)
         elif portfolio_value:
             start_date = portfolio_value[0]["x"]
         else:
@@ -92,33 +108,58 @@ class Dashboard(View):
             start_date = timezone.now().strftime("%Y-%m-%d")
 
         performance_twr = self._calculate_portfolio_performance(selected_portfolio, portfolio_value, start_date)
+
+        resolution = Dashboard.INTERVAL_RESOLUTION.get(interval)
         return {
             "portfolio": {
-                "portfolio_value": portfolio_value,
-                "cash_contributions": cash_contributions,
-                "performance": performance_twr.twr if performance_twr else [],
+                "portfolio_value": self._downsample(portfolio_value, resolution),
+                "cash_contributions": self._downsample(cash_contributions, resolution),
+                "performance": self._downsample(performance_twr.twr, resolution) if performance_twr else [],
                 "annual_twr": performance_twr.annual_twr if performance_twr else {},
                 "monthly_twr": performance_twr.monthly_twr if performance_twr else {},
             }
         }
 
     @staticmethod
-    def __filter_dashboard_values(data_values: List[DailyValue], start_date: str) -> List[DailyValue]:
-        # Ensure the list is sorted by date
-        data_values.sort(key=lambda item: item["x"])
-
-        # Find the index of the first element where 'x' is greater than or equal to start_date
-        index = next((i for i, item in enumerate(data_values) if item["x"] >= start_date), None)
-
-        # If start_date is between values, include the previous element
-        if index is not None and index > 0:
-            previous_value = data_values[index - 1]["y"]
-            data_values.insert(index, {"x": start_date, "y": previous_value})
-        elif index is None:
+    def _filter_dashboard_values(data_values: List[DailyValue], start_date: str) -> List[DailyValue]:
+        """
+        Return the values from `start_date` onwards. The values must be sorted by date.
+
+        If `start_date` falls between two values, the previous value is carried to `start_date`.
+        """
+        index = bisect_left(data_values, start_date, key=lambda item: item["x"])
+        if index == len(data_values):
             return []
 
-        # Return the filtered list
-        return data_values[index:] if index is not None else []
+        if index > 0 and data_values[index]["x"] != start_date:
+            return [DailyValue(x=start_date, y=data_values[index - 1]["y"]), *data_values[index:]]
+
+        return data_values[index:]
+
+    @staticmethod
+    def _downsample(data_values: List[DailyValue], resolution: Optional[str]) -> List[DailyValue]:
+        """
+        Keep the last value of each week or month. The first value, the interval boundary, is always kept.
+
+        Args:
+            data_values: Values sorted by date
+            resolution: "week", "month" or None to keep the daily values
+        """
+        if resolution is None or len(data_values) <= 2:
+            return data_values
+
+        if resolution == "week":
+            buckets = [datetime.fromisoformat(item["x"]).isocalendar()[:2] for item in data_values]
+        else:
+            buckets = [item["x"][:7] for item in data_values]
+
+        sampled = [data_values[0]]
+        for index, (current, following) in enumerate(pairwise(buckets[1:]), start=1):
+            if current != following:
+                sampled.append(data_values[index])
+        sampled.append(data_values[-1])
+
+        return sampled
 
     @staticmethod
     def _get_interval_start_date(interval: str) -> str | None:  # noqa: C901
@@ -166,16 +207,9 @@ class Dashboard(View):
 
         return view
 
-    def _get_portfolio_value(self, selected_portfolio: PortfolioId) -> List[DailyValue]:
-        """Get historical portfolio value."""
-        portfolio_value = cache.get(Dashboard.CACHE_KEY_PORTFOLIO)
-
-        if portfolio_value is None:
-            portfolio_value = self.portfolio.calculate_historical_value(selected_portfolio)
-
-            cache.set(Dashboard.CACHE_KEY_PORTFOLIO, portfolio_value, timeout=Dashboard.CACHE_TIMEOUT)
-
-        return portfolio_value
+    def _get_portfolio_value(self, selected_portfolio: PortfolioId, start_date: str | None = None) -> List[DailyValue]:
+        """Get historical portfolio value, from the start date when given."""
+        return self.portfolio.calculate_historical_value(selected_portfolio, start_date=start_date)
 
     @staticmethod
     def _calculate_twr(
@@ -184,93 +218,75 @@ class Dashboard(View):
         """
         Calculate Time-Weighted Return (TWR) for an investment portfolio.
 
+        The daily returns are linked with a single cumulative product, so any sub-period return can later be
+        derived from the cumulative series as `(1 + end) / (1 + start) - 1`.
+
         Parameters:
-        date_range (list): List of datetime objects representing dates of values/cashflows
+        date_range (list): List of dates (YYYY-MM-DD) of values/cashflows
         market_value_per_day (dict[day, value]): List of portfolio values at each date
         daily_cash_flows (dict[day, value]): List of cashflows (positive for inflows, negative for outflows)
                          Same length as dates and values, 0 if no cashflow on that date
 
         Returns:
-        float: Time-weighted return as a decimal (e.g., 0.05 for 5% return)
-        dict: Additional metrics including sub-period returns
+        PortfolioMetrics: Time-weighted return as a decimal (e.g., 0.05 for 5% return) and additional metrics
+                          including the cumulative returns
         """
-
-        # Initialize lists for dates, values, and cashflows
-        dates = []
-        cashflows = []
-        values = []
-
-        for day in date_range:
-            dates.append(day)
-            cashflows.append(daily_cash_flows.get(day, 0.0))
-            values.append(market_value_per_day.get(day, 0.0))
-
-        if len(dates) != len(values) or len(dates) != len(cashflows):
-            raise ValueError("All input lists must have the same length")
-
-        if len(dates) < 2:
+        if len(date_range) < 2:
             raise ValueError("Need at least two periods to calculate returns")
 
-        # Convert dates to datetime if they're strings
-        dates = [
-            d if isinstance(d, datetime) else datetime.strptime(d, "%Y-%m-%d").replace(tzinfo=dt_timezone.utc)
-            for d in dates
-        ]
-
-        # Calculate sub-period returns
-        cumulative_returns = {}
-        modified_values = values.copy()
-
-        # Calculate daily returns and accumulate
-        cumulative_return = 1.0
-
-        logger = StonksLogger.get_logger("stonks_overwatch.dashboard.twr", "[TWR|CALCULATION]")
-
-        for i in range(len(dates) - 1):
-            start_value = modified_values[i]
-            if start_value == 0:
-                continue  # Skip periods with zero starting value to avoid division by zero
-
-            end_value = modified_values[i + 1]
-            cashflow = cashflows[i + 1]
-
-            # Adjust end value for any cashflows
-            adjusted_end_value = end_value - cashflow
-
-            # Update cumulative return
-            daily_return = (adjusted_end_value - start_value) / start_value
-            cumulative_return *= 1 + daily_return
+        daily_values = pl.DataFrame(
+            {
+                "date": date_range,
+                "value": [market_value_per_day.get(day, 0.0) for day in date_range],
+                "cashflow": [daily_cash_flows.get(day, 0.0) for day in date_range],
+            },
+            schema={"date": pl.String, "value": pl.Float64, "cashflow": pl.Float64},
+        ).with_columns(pl.col("date").str.to_date(LocalizationUtility.DATE_FORMAT))
+
+        # Each period goes from the previous day to the current one. The return is attributed to the END date
+        # of the period. Periods with zero starting value are skipped to avoid division by zero.
+        periods = (
+            daily_values.with_columns(
+                pl.col("date").shift(1).alias("start_date"),
+                pl.col("value").shift(1).alias("start_value"),
+            )
+            .slice(1)
+            .filter(pl.col("start_value") != 0)
+            .with_columns(
+                # Adjust end value for any cashflows
+                ((pl.col("value") - pl.col("cashflow") - pl.col("start_value")) / pl.col("start_value")).alias(
+                    "daily_return"
+                )
+            )
+            .with_columns(((1 + pl.col("daily_return")).cum_prod() - 1).alias("cumulative_return"))
+        )
 
-            # Data quality check: warn about unusually large daily returns
-            if abs(daily_return) > Dashboard.LARGE_RETURN_THRESHOLD:
+        # Data quality check: warn about unusually large daily returns
+        large_returns = periods.filter(pl.col("daily_return").abs() > Dashboard.LARGE_RETURN_THRESHOLD)
+        if not large_returns.is_empty():
+            logger = StonksLogger.get_logger("stonks_overwatch.dashboard.twr", "[TWR|CALCULATION]")
+            for row in large_returns.iter_rows(named=True):
                 logger.warning(
-                    f"Large daily return detected: {daily_return:.2%} from "
-                    f"{dates[i].strftime('%Y-%m-%d')} to {dates[i + 1].strftime('%Y-%m-%d')} "
-                    f"(€{start_value:,.2f} → €{end_value:,.2f}, cashflow: €{cashflow:,.2f}). "
+                    f"Large daily return detected: {row['daily_return']:.2%} from "
+                    f"{row['start_date'].strftime('%Y-%m-%d')} to {row['date'].strftime('%Y-%m-%d')} "
+                    f"(€{row['start_value']:,.2f} → €{row['value']:,.2f}, cashflow: €{row['cashflow']:,.2f}). "
                     f"This may indicate data quality issues or corporate actions."
                 )
 
-            # Fix: Attribute the return to the END date of the period, not the start date
-            cumulative_returns[dates[i + 1]] = cumulative_return - 1
-
-            # Modify next period's starting value to include cashflow
-            if i < len(dates) - 2:
-                modified_values[i + 1] = end_value
-
         # Calculate TWR
-        total_return = cumulative_return - 1
+        total_return = periods["cumulative_return"][-1] if not periods.is_empty() else 0.0
 
         # Calculate annualized TWR
-        total_days = (dates[-1] - dates[0]).days
+        total_days = (daily_values["date"][-1] - daily_values["date"][0]).days
         annualized_return = (1 + total_return) ** (365.25 / total_days) - 1
 
         # Prepare results
         return PortfolioMetrics(
             total_return=total_return,
             annualized_return=annualized_return,
-            cumulative_returns=cumulative_returns,
+            cumulative_returns=periods.select("date", "cumulative_return"),
             total_days=total_days,
-            total_cashflows=sum(cashflows),
+            total_cashflows=daily_values["cashflow"].sum(),
         )
 
     @staticmethod
@@ -340,9 +356,14 @@ class Dashboard(View):
         annual_twr, monthly_twr = self._derive_period_returns(main_twr.cumulative_returns)
 
         # Format cumulative returns for frontend
+        cumulative_returns = main_twr.cumulative_returns
         twr_series = [
-            DailyValue(x=LocalizationUtility.format_date_from_date(date), y=return_value)
-            for date, return_value in main_twr.cumulative_returns.items()
+            DailyValue(x=date, y=return_value)
+            for date, return_value in zip(
+                cumulative_returns["date"].dt.strftime(LocalizationUtility.DATE_FORMAT).to_list(),
+                cumulative_returns["cumulative_return"].to_list(),
+                strict=True,
+            )
         ]
 
         return PortfolioPerformance(twr=twr_series, annual_twr=annual_twr, monthly_twr=monthly_twr)
@@ -385,51 +406,51 @@ class Dashboard(View):
 
         return [date.strftime("%Y-%m-%d") for date in business_dates.to_list()]
 
-    def _derive_period_returns(self, cumulative_returns: dict[datetime, float]) -> tuple[dict, dict]:
+    @staticmethod
+    def _derive_period_returns(cumulative_returns: pl.DataFrame) -> tuple[dict, dict]:
         """
         Derive annual and monthly returns from cumulative returns.
-        Much more efficient than recalculating TWR for each period.
+        Each period return only needs the first and last cumulative values of the period,
+        so the series is scanned once instead of recalculating TWR for each period.
         """
-        annual_twr = {}
-        monthly_twr = defaultdict(self.__default_monthly_values)
-
-        # Group returns by year and month
-        returns_by_year = defaultdict(list)
-        returns_by_month = defaultdict(list)
-
-        for date, cum_return in cumulative_returns.items():
-            year = str(date.year)
-            month_name = LocalizationUtility.month_name(f"{date.month:02d}")
-
-            returns_by_year[year].append((date, cum_return))
-            returns_by_month[(year, month_name)].append((date, cum_return))
-
-        # Calculate annual returns (from first to last day of each year)
-        for year, year_returns in returns_by_year.items():
-            if len(year_returns) >= 2:
-                year_returns.sort(key=lambda x: x[0])
-                start_return = year_returns[0][1]
-                end_return = year_returns[-1][1]
-                # Convert from cumulative returns to period return
-                annual_twr[year] = (1 + end_return) / (1 + start_return) - 1
-
-        # Calculate monthly returns (from first to last day of each month)
-        for (year, month_name), month_returns in returns_by_month.items():
-            if len(month_returns) >= 2:
-                month_returns.sort(key=lambda x: x[0])
-                start_return = month_returns[0][1]
-                end_return = month_returns[-1][1]
-                # Convert from cumulative returns to period return
-                monthly_twr[year][month_name] = (1 + end_return) / (1 + start_return) - 1
-
-        # Sort and convert to final format
-        annual_twr = dict(sorted(annual_twr.items(), key=lambda x: x[0], reverse=True))
-        monthly_twr = dict(
-            sorted(
-                {year: dict(months) for year, months in monthly_twr.items()}.items(), key=lambda x: x[0], reverse=True
-            )
+        if cumulative_returns.is_empty():
+            return {}, {}
+
+        returns = cumulative_returns.sort("date").with_columns(
+            pl.col("date").dt.year().alias("year"), pl.col("date").dt.month().alias("month")
         )
 
+        def period_returns(group_by: list[str]) -> pl.DataFrame:
+            # Convert from cumulative returns to period return (from first to last day of each period)
+            return (
+                returns.group_by(group_by, maintain_order=True)
+                .agg(
+                    pl.len().alias("days"),
+                    pl.col("cumulative_return").first().alias("start_return"),
+                    pl.col("cumulative_return").last().alias("end_return"),
+                )
+                .filter(pl.col("days") >= 2)
+                .with_columns(((1 + pl.col("end_return")) / (1 + pl.col("start_return")) - 1).alias("return"))
+            )
+
+        annual_twr = {
+            str(year): period_return
+            for year, period_return in period_returns(["year"])
+            .sort("year", descending=True)
+            .select("year", "return")
+            .iter_rows()
+        }
+
+        monthly_twr = {}
+        for year, month, period_return in (
+            period_returns(["year", "month"])
+            .sort("year", descending=True)
+            .select("year", "month", "return")
+            .iter_rows()
+        ):
+            year_months = monthly_twr.setdefault(str(year), Dashboard.__default_monthly_values())
+            year_months[LocalizationUtility.month_name(month)] = period_return
+
         return annual_twr, monthly_twr
 
     def _correct_cash_flow_timing(self, cash_flows: dict, market_value_per_day: dict) -> dict:
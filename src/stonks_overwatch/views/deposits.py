@@ -5,7 +5,7 @@ from django.views import View
 from stonks_overwatch.config.config import Config
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.aggregators.deposits_aggregator import DepositsAggregatorService
-from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
+from stonks_overwatch.services.utilities.request_services import RequestServices
 from stonks_overwatch.services.utilities.session_manager import SessionManager
 from stonks_overwatch.utils.core.logger import StonksLogger
 from stonks_overwatch.views.mixins import CapabilityRequiredMixin
@@ -15,10 +15,9 @@ class Deposits(CapabilityRequiredMixin, View):
     required_capability = ServiceType.DEPOSIT
     logger = StonksLogger.get_logger("stonks_overwatch.deposits.views", "[VIEW|DEPOSITS]")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.deposits_aggregator = DepositsAggregatorService()
-        self.portfolio_aggregator = PortfolioAggregatorService()
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.deposits_aggregator = RequestServices.for_request(request).get(DepositsAggregatorService)
 
     def get(self, request):
         selected_portfolio = SessionManager.get_selected_portfolio(request)
@@ -28,7 +27,7 @@ class Deposits(CapabilityRequiredMixin, View):
         cash_contributions = [{"x": item["date"], "y": item["total_deposit"]} for item in data]
 
         deposits = self.deposits_aggregator.get_cash_deposits(selected_portfolio)
-        total_portfolio = self.portfolio_aggregator.get_portfolio_total(selected_portfolio)
+        total_portfolio = RequestServices.for_request(request).get_portfolio_total(selected_portfolio)
 
         context = {
             "total_deposits": total_portfolio.total_deposit_withdrawal_formatted,
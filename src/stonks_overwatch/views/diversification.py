@@ -4,8 +4,8 @@ from django.shortcuts import render
 from django.views import View
 
 from stonks_overwatch.config.config import Config
-from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
 from stonks_overwatch.services.models import PortfolioEntry
+from stonks_overwatch.services.utilities.request_services import RequestServices
 from stonks_overwatch.services.utilities.session_manager import SessionManager
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
@@ -18,11 +18,10 @@ class Diversification(View):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.base_currency = Config.get_global().base_currency
-        self.portfolio = PortfolioAggregatorService()
 
     def get(self, request):
         selected_portfolio = SessionManager.get_selected_portfolio(request)
-        portfolio = self.portfolio.get_portfolio(selected_portfolio)
+        portfolio = RequestServices.for_request(request).get_portfolio(selected_portfolio)
         product_types = self._get_product_types(portfolio)
         stocks = self._get_positions(portfolio, ProductType.STOCK)
         etfs = self._get_positions(portfolio, ProductType.ETF)
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone as dt_timezone
+from datetime import date, datetime, timezone as dt_timezone
 from typing import List
 
 from django.http import JsonResponse
@@ -10,7 +10,7 @@ from stonks_overwatch.config.config import Config
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.aggregators.dividends_aggregator import DividendsAggregatorService
 from stonks_overwatch.services.brokers.degiro.client.constants import ProductType
-from stonks_overwatch.services.models import Dividend
+from stonks_overwatch.services.models import Dividend, PortfolioId
 from stonks_overwatch.services.utilities.session_manager import SessionManager
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
@@ -40,55 +40,35 @@ class Dividends(CapabilityRequiredMixin, View):
         if not dividends_overview:
             return render(request, "dividends.html", {})
 
+        # Handle AJAX requests, which only need the calendar or the diversification
+        if request.headers.get("Accept") == "application/json":
+            return self._handle_json_request(
+                request, selected_portfolio, dividends_overview, diversification_option, calendar_year
+            )
+
+        monthly_dividends = self.dividends.get_monthly_dividends(selected_portfolio)
+
         # Calculate basic totals
         total_net_dividends = self._get_total_net_dividends(dividends_overview)
         total_gross_dividends = self._get_total_gross_dividends(dividends_overview)
         total_tax_dividends = total_net_dividends - total_gross_dividends
 
-        # Get calendar and years
-        dividends_calendar = self._get_dividends_calendar(dividends_overview)
-
         # Get diversification years (only years with paid dividends)
         diversification_years = self._get_diversification_years(dividends_overview)
         diversification_options = [self.ALL_TIME_OPTION] + diversification_years
+        dividends_diversification = self._get_option_diversification(dividends_overview, diversification_option)
 
-        # Filter dividends for diversification if a specific year is selected
-        filtered_dividends = self._filter_dividends_by_option(dividends_overview, diversification_option)
-        dividends_diversification = self._get_diversification(filtered_dividends)
-
-        # Calculate growth and filter calendar for the selected year
-        dividends_growth = self._get_dividends_growth(dividends_calendar["calendar"])
-
-        # Filter calendar for the selected year
-        filtered_calendar = self._filter_calendar_by_year(dividends_calendar["calendar"], calendar_year)
-        total_year_dividends: float = sum(month_data.get("total", 0) for month_data in filtered_calendar.values())
-
-        dividends_calendar["calendar"] = filtered_calendar
-
-        # Handle AJAX requests
-        if request.headers.get("Accept") == "application/json":
-            return self._handle_json_request(
-                request,
-                diversification_option,
-                dividends_calendar,
-                dividends_diversification,
-                diversification_options,
-                total_year_dividends,
-            )
+        # Get calendar of the selected year, and the growth of every year
+        dividends_calendar = self._get_dividends_calendar(dividends_overview, monthly_dividends)
+        dividends_growth = self._get_dividends_growth(monthly_dividends, dividends_calendar["years"])
+        total_year_dividends = self._filter_calendar_year(dividends_calendar, calendar_year)
 
         context = {
-            "totalNetDividends": LocalizationUtility.format_money_value(
-                value=total_net_dividends, currency=self.base_currency
-            ),
-            "totalGrossDividends": LocalizationUtility.format_money_value(
-                value=total_gross_dividends, currency=self.base_currency
-            ),
-            "totalTaxDividends": LocalizationUtility.format_money_value(
-                value=total_tax_dividends, currency=self.base_currency
-            ),
-            "totalYearDividends": LocalizationUtility.format_money_value(
-                value=total_year_dividends, currency=self.base_currency
-            ),
+            "totalNetDividends": total_net_dividends,
+            "totalGrossDividends": total_gross_dividends,
+            "totalTaxDividends": total_tax_dividends,
+            "totalYearDividends": total_year_dividends,
+            "baseCurrency": self.base_currency,
             "dividendsCalendar": dividends_calendar,
             "dividendsDiversification": dividends_diversification,
             "dividendsGrowth": dividends_growth,
@@ -138,31 +118,43 @@ class Dividends(CapabilityRequiredMixin, View):
         """Filter calendar to only include entries for the specified year."""
         return {key: value for key, value in calendar.items() if key.endswith(str(year))}
 
+    def _filter_calendar_year(self, dividends_calendar: dict, year: int) -> float:
+        """Keep only the months of the year in the calendar, and return the dividends total of the year."""
+        dividends_calendar["calendar"] = self._filter_calendar_by_year(dividends_calendar["calendar"], year)
+        return sum(month_data.get("total", 0) for month_data in dividends_calendar["calendar"].values())
+
+    def _get_option_diversification(self, dividends: List[Dividend], option: str) -> dict:
+        """Diversification of the dividends of the selected option (all time or a year)."""
+        return self._get_diversification(self._filter_dividends_by_option(dividends, option))
+
     def _handle_json_request(
         self,
         request,
+        selected_portfolio: PortfolioId,
+        dividends_overview: List[Dividend],
         diversification_option: str,
-        dividends_calendar: dict,
-        dividends_diversification: dict,
-        diversification_options: List[str],
-        total_year_dividends: float,
+        calendar_year: int,
     ):
         """Handle AJAX/JSON requests for different data types."""
         # Request for calendar HTML only
         if request.GET.get("html_only"):
+            monthly_dividends = self.dividends.get_monthly_dividends(selected_portfolio)
+            dividends_calendar = self._get_dividends_calendar(dividends_overview, monthly_dividends)
+            total_year_dividends = self._filter_calendar_year(dividends_calendar, calendar_year)
             return render(
                 request,
                 "dividends/calendar.html",
                 {
                     "dividendsCalendar": dividends_calendar,
-                    "totalYearDividends": LocalizationUtility.format_money_value(
-                        value=total_year_dividends, currency=self.base_currency
-                    ),
+                    "totalYearDividends": total_year_dividends,
+                    "baseCurrency": self.base_currency,
                 },
             )
 
         # Request for diversification data
         if request.GET.get("diversification_option"):
+            dividends_diversification = self._get_option_diversification(dividends_overview, diversification_option)
+
             # Return both HTML and chart data as JSON
             from django.template.loader import render_to_string
 
@@ -188,7 +180,13 @@ class Dividends(CapabilityRequiredMixin, View):
         # Default JSON response
         return JsonResponse({"error": "Invalid request parameters"}, status=400)
 
-    def _get_dividends_calendar(self, dividends: List[Dividend]) -> dict:
+    def _get_dividends_calendar(self, dividends: List[Dividend], monthly_dividends: List[dict]) -> dict:
+        """
+        Build the dividends calendar.
+
+        The payouts and totals of each month come from the precomputed monthly aggregates, the
+        dividends are only used to list the (paid, announced and forecasted) payments of each day.
+        """
         dividends_calendar = {}
 
         if not dividends:
@@ -201,19 +199,10 @@ class Dividends(CapabilityRequiredMixin, View):
 
         for month_date in period_dates:
             month = month_date.strftime(LocalizationUtility.MONTH_YEAR_FORMAT)
-            month_entry = dividends_calendar.setdefault(month, {})
-            month_entry.setdefault("payouts", 0)
-            month_entry.setdefault("total", 0)
-            month_entry.setdefault(
-                "formatedTotal",
-                LocalizationUtility.format_money_value(
-                    value=0,
-                    currency_symbol=LocalizationUtility.get_currency_symbol(self.base_currency),
-                ),
-            )
+            dividends_calendar[month] = {"payouts": 0, "total": 0.0}
 
         for dividend_pay in dividends:
-            month_entry = dividends_calendar.setdefault(dividend_pay.month_year(), {})
+            month_entry = dividends_calendar.setdefault(dividend_pay.month_year(), {"payouts": 0, "total": 0.0})
             days = month_entry.setdefault("days", {})
             day_entry = days.setdefault(dividend_pay.day(), {})
 
@@ -223,41 +212,27 @@ class Dividends(CapabilityRequiredMixin, View):
                 day_entry[dividend_pay.stock_symbol].amount += dividend_pay.amount
                 day_entry[dividend_pay.stock_symbol].taxes += dividend_pay.taxes
 
-            # Number of Payouts in the month
-            payouts = month_entry.setdefault("payouts", 0)
-
-            if dividend_pay.is_paid():
-                if dividend_pay.amount > 0:
-                    month_entry["payouts"] = payouts + 1
-                # Total payout in the month
-                month_entry["total"] = round(month_entry.setdefault("total", 0) + dividend_pay.net_amount(), 2)
-                month_entry["formatedTotal"] = LocalizationUtility.format_money_value(
-                    value=month_entry["total"], currency=dividend_pay.currency
-                )
+        for aggregate in monthly_dividends:
+            month = date(aggregate["year"], aggregate["month"], 1).strftime(LocalizationUtility.MONTH_YEAR_FORMAT)
+            month_entry = dividends_calendar.setdefault(month, {"payouts": 0, "total": 0.0})
+            month_entry["payouts"] += aggregate["payouts"]
+            month_entry["total"] = round(month_entry["total"] + aggregate["net_amount"], 2)
 
         return {
             "years": years,
             "calendar": dividends_calendar,
         }
 
-    def _get_dividends_growth(self, dividends_calendar: dict) -> dict:
-        dividends_growth = {}
-
-        for month_year in dividends_calendar.keys():
-            dt = datetime.strptime(month_year, LocalizationUtility.MONTH_YEAR_FORMAT).replace(tzinfo=dt_timezone.utc)
-            month_number = int(dt.strftime("%m"))
-            year = int(dt.strftime("%Y"))
-
-            if year not in dividends_growth:
-                dividends_growth[year] = [0] * 12
-
-            month_entry = dividends_calendar.setdefault(month_year, {})
+    def _get_dividends_growth(self, monthly_dividends: List[dict], years: List[int]) -> dict:
+        """Net dividends of every month of the calendar years, read from the monthly aggregates."""
+        # We want the Dividend Growth chronologically sorted
+        dividends_growth = {year: [0] * 12 for year in sorted(years)}
 
-            dividends_growth[year][month_number - 1] = round(month_entry["total"], 2)
+        for aggregate in monthly_dividends:
+            months = dividends_growth.setdefault(aggregate["year"], [0] * 12)
+            months[aggregate["month"] - 1] = round(months[aggregate["month"] - 1] + aggregate["net_amount"], 2)
 
-        # We want the Dividend Growth chronologically sorted
-        dividends_growth = dict(sorted(dividends_growth.items(), key=lambda item: item[0]))
-        return dividends_growth
+        return dict(sorted(dividends_growth.items()))
 
     def _get_total_net_dividends(self, dividends_list: List[Dividend]) -> float:
         total_net_dividends = 0
@@ -5,6 +5,7 @@ from django.views import View
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.aggregators.fees_aggregator import FeesAggregatorService
 from stonks_overwatch.services.models import FeeType
+from stonks_overwatch.services.utilities.request_services import RequestServices
 from stonks_overwatch.services.utilities.session_manager import SessionManager
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from stonks_overwatch.utils.core.logger import StonksLogger
@@ -17,40 +18,40 @@ class Fees(CapabilityRequiredMixin, View):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.fees = FeesAggregatorService()
         self.base_currency = "EUR"
 
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.fees = RequestServices.for_request(request).get(FeesAggregatorService)
+
     def get(self, request):
         selected_portfolio = SessionManager.get_selected_portfolio(request)
-        fees = self.fees.get_fees(selected_portfolio)
+
+        if request.headers.get("Accept") == "application/json":
+            # The table loads the fees once the page is rendered, the summary cards only need the totals
+            fees = []
+            for fee in self.fees.get_fees(selected_portfolio):
+                fee_data = fee.to_dict()
+                fee_data["type"] = str(fee.type)
+                fees.append(fee_data)
+            return JsonResponse({"fees": fees})
+
+        fee_totals = self.fees.get_fee_totals(selected_portfolio)
         base_currency_symbol = LocalizationUtility.get_currency_symbol(self.base_currency)
-        transaction_fees = 0
-        exchange_fees = 0
-        ftt_fees = 0
-        adr_fees = 0
-        for fee in fees:
-            if fee.type == FeeType.TRANSACTION:
-                transaction_fees += fee.fee_value
-            elif fee.type == FeeType.FINANCE_TRANSACTION_TAX:
-                ftt_fees += fee.fee_value
-            elif fee.type == FeeType.CONNECTION:
-                exchange_fees += fee.fee_value
-            elif fee.type == FeeType.ADR_GDR:
-                adr_fees += fee.fee_value
 
         context = {
             "transaction_fees": LocalizationUtility.format_money_value(
-                value=transaction_fees, currency_symbol=base_currency_symbol
+                value=fee_totals[FeeType.TRANSACTION], currency_symbol=base_currency_symbol
             ),
             "exchange_fees": LocalizationUtility.format_money_value(
-                value=exchange_fees, currency_symbol=base_currency_symbol
+                value=fee_totals[FeeType.CONNECTION], currency_symbol=base_currency_symbol
+            ),
+            "ftt_fees": LocalizationUtility.format_money_value(
+                value=fee_totals[FeeType.FINANCE_TRANSACTION_TAX], currency_symbol=base_currency_symbol
+            ),
+            "adr_fees": LocalizationUtility.format_money_value(
+                value=fee_totals[FeeType.ADR_GDR], currency_symbol=base_currency_symbol
             ),
-            "ftt_fees": LocalizationUtility.format_money_value(value=ftt_fees, currency_symbol=base_currency_symbol),
-            "adr_fees": LocalizationUtility.format_money_value(value=adr_fees, currency_symbol=base_currency_symbol),
-            "fees": [fee.to_dict() for fee in fees],
         }
 
-        if request.headers.get("Accept") == "application/json":
-            return JsonResponse(context, safe=False)
-        else:
-            return render(request, "fees.html", context)
+        return render(request, "fees.html", context)
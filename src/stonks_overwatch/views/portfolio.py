@@ -3,8 +3,8 @@ from enum import Enum
 from django.shortcuts import render
 from django.views import View
 
-from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
 from stonks_overwatch.services.models import PortfolioEntry
+from stonks_overwatch.services.utilities.request_services import RequestServices
 from stonks_overwatch.services.utilities.session_manager import SessionManager
 from stonks_overwatch.utils.core.logger import StonksLogger
 from stonks_overwatch.utils.domain.constants import ProductType
@@ -31,15 +31,11 @@ class PositionStatus(Enum):
 class Portfolio(View):
     logger = StonksLogger.get_logger("stonks_overwatch.dashboard.views", "[VIEW|PORTFOLIO]")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.portfolio_aggregator = PortfolioAggregatorService()
-
     def get(self, request):
         selected_portfolio = SessionManager.get_selected_portfolio(request)
         self.logger.debug(f"Selected Portfolio: {selected_portfolio}")
 
-        portfolio = self.portfolio_aggregator.get_portfolio(selected_portfolio)
+        portfolio = RequestServices.for_request(request).get_portfolio(selected_portfolio)
 
         status = self.__parse_request_interval(request)
 
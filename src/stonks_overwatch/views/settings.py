@@ -234,6 +234,7 @@ class SettingsView(View):
             config.appearance = data["appearance"]
         if "base_currency" in data:
             config.base_currency = data["base_currency"]
+            self._clear_series_cache()
 
         return JsonResponse({"success": True, "message": "General settings saved successfully"})
 
@@ -260,6 +261,18 @@ class SettingsView(View):
             self.logger.error(f"Error clearing broker factory cache: {str(e)}")
             # Don't raise exception - settings were saved successfully
 
+        # The enabled brokers may have changed
+        self._clear_series_cache()
+
+    def _clear_series_cache(self) -> None:
+        """
+        Drop the cached dashboard series, which depend on the base currency and the enabled brokers.
+        """
+        from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
+
+        PortfolioAggregatorService.series_snapshots.invalidate()
+        self.logger.debug("Cleared the dashboard series cache")
+
     def _reconfigure_jobs(self) -> None:
         """
         Trigger job scheduler reconfiguration to pick up updated settings.
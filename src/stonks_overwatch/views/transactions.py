@@ -5,24 +5,34 @@ from django.views import View
 from stonks_overwatch.core.service_types import ServiceType
 from stonks_overwatch.services.aggregators.transactions_aggregator import TransactionsAggregatorService
 from stonks_overwatch.services.models import dataclass_to_dict
+from stonks_overwatch.services.utilities.pagination import collect_pages, page_query_from_params
+from stonks_overwatch.services.utilities.request_services import RequestServices
 from stonks_overwatch.services.utilities.session_manager import SessionManager
+from stonks_overwatch.views.csv_export import csv_response, wants_csv
 from stonks_overwatch.views.mixins import CapabilityRequiredMixin
 
 
 class Transactions(CapabilityRequiredMixin, View):
     required_capability = ServiceType.TRANSACTION
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.transactions = TransactionsAggregatorService()
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        self.transactions = RequestServices.for_request(request).get(TransactionsAggregatorService)
 
     def get(self, request):
-        selected_portfolio = SessionManager.get_selected_portfolio(request)
-        transactions = self.transactions.get_transactions(selected_portfolio)
-        transactions_data = [dataclass_to_dict(transaction) for transaction in transactions]
-
-        if request.headers.get("Accept") == "application/json":
-            return JsonResponse({"transactions": transactions_data}, safe=False)
+        if wants_csv(request):
+            # The export holds the full history, not only the page shown in the table
+            selected_portfolio = SessionManager.get_selected_portfolio(request)
+            transactions = collect_pages(
+                lambda query: self.transactions.get_transactions_page(selected_portfolio, query),
+                page_query_from_params(request.GET),
+            )
+            return csv_response([dataclass_to_dict(transaction) for transaction in transactions], "transactions_export")
+        elif request.headers.get("Accept") == "application/json":
+            # The table requests the transactions page by page
+            selected_portfolio = SessionManager.get_selected_portfolio(request)
+            page = self.transactions.get_transactions_page(selected_portfolio, page_query_from_params(request.GET))
+            transactions_data = [dataclass_to_dict(transaction) for transaction in page.items]
+            return JsonResponse({"transactions": transactions_data, "next_cursor": page.next_cursor})
         else:
-            context = {"transactions": transactions_data}
-            return render(request, "transactions.html", context)
+            return render(request, "transactions.html")
@@ -324,6 +324,16 @@ def _register_authentication_services():
         print(f"Warning: Could not register authentication services for tests: {e}")
 
 
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """Reset the process-wide caches, so data stored by one test doesn't leak into the next one."""
+    from stonks_overwatch.services.brokers.degiro.services.currency_service import CurrencyConverterService
+
+    CurrencyConverterService.invalidate_quotations()
+    yield
+    CurrencyConverterService.invalidate_quotations()
+
+
 @pytest.fixture(autouse=True)
 def reset_global_config():
     """Reset the global configuration before each test to ensure clean state."""
@@ -0,0 +1,113 @@
+from datetime import datetime, timezone
+
+from stonks_overwatch.constants import BrokerName
+from stonks_overwatch.core.interfaces.update_service import AbstractUpdateService
+from stonks_overwatch.core.models import (
+    DividendAggregateStatus,
+    DividendMonthlyAggregate,
+    DividendMonthlyAggregateRepository,
+)
+from stonks_overwatch.services.aggregators.dividends_aggregator import DividendsAggregatorService
+from stonks_overwatch.services.models import Dividend, DividendType
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+class DividendsUpdateService(AbstractUpdateService):
+    def update_all(self):
+        pass
+
+
+def _dividend(dividend_type: DividendType, month: int, day: int, amount: float, taxes: float, currency="EUR"):
+    return Dividend(
+        dividend_type=dividend_type,
+        payment_date=datetime(2024, month, day, tzinfo=timezone.utc),
+        stock_name="Apple Inc.",
+        stock_symbol="AAPL",
+        currency=currency,
+        amount=amount,
+        taxes=taxes,
+    )
+
+
+DIVIDENDS = [
+    _dividend(DividendType.PAID, 1, 10, 10.0, 1.5),
+    _dividend(DividendType.PAID, 1, 20, 5.0, 0.75),
+    _dividend(DividendType.PAID, 1, 21, 2.0, 0.0, currency="USD"),
+    _dividend(DividendType.PAID, 2, 5, 0.0, 0.3),
+    _dividend(DividendType.FORECASTED, 3, 1, 12.0, 1.8),
+]
+
+
+def test_aggregate_monthly_dividends():
+    aggregates = DividendsAggregatorService.aggregate_monthly_dividends(DIVIDENDS)
+
+    assert aggregates == [
+        {"year": 2024, "month": 1, "currency": "EUR", "net_amount": 12.75, "gross_amount": 15.0, "payouts": 2},
+        {"year": 2024, "month": 1, "currency": "USD", "net_amount": 2.0, "gross_amount": 2.0, "payouts": 1},
+        # Tax corrections are aggregated, but do not count as payouts
+        {"year": 2024, "month": 2, "currency": "EUR", "net_amount": -0.3, "gross_amount": 0.0, "payouts": 0},
+    ]
+
+
+@pytest.mark.django_db
+class TestDividendMonthlyAggregateRepository:
+    def test_save_monthly_dividends_replaces_stored_aggregates(self):
+        aggregates = DividendsAggregatorService.aggregate_monthly_dividends(DIVIDENDS)
+        assert DividendMonthlyAggregateRepository.save_monthly_dividends("degiro", aggregates, "EUR") == 3
+        DividendMonthlyAggregateRepository.save_monthly_dividends("ibkr", aggregates[:1], "EUR")
+
+        written = DividendMonthlyAggregateRepository.save_monthly_dividends("degiro", aggregates[1:], "EUR")
+
+        assert written == 2
+        assert DividendMonthlyAggregate.objects.filter(portfolio_id="degiro").count() == 2
+        assert DividendMonthlyAggregate.objects.filter(portfolio_id="ibkr").count() == 1
+
+    def test_get_monthly_dividends(self):
+        aggregates = DividendsAggregatorService.aggregate_monthly_dividends(DIVIDENDS)
+        DividendMonthlyAggregateRepository.save_monthly_dividends("degiro", list(reversed(aggregates)), "EUR")
+
+        DividendMonthlyAggregateRepository.save_monthly_dividends("bitvavo", [], "EUR")
+        DividendMonthlyAggregateRepository.save_monthly_dividends("alpaca", aggregates, "USD")
+
+        result = DividendMonthlyAggregateRepository.get_monthly_dividends(
+            ["degiro", "bitvavo", "ibkr", "alpaca"], base_currency="EUR"
+        )
+
+        assert [(row["month"], row["currency"]) for row in result["degiro"]] == [(1, "EUR"), (1, "USD"), (2, "EUR")]
+        assert result["degiro"][0]["net_amount"] == 12.75
+        # Computed without dividends, while the ibkr aggregates were never computed
+        assert result["bitvavo"] == []
+        assert "ibkr" not in result
+        # Computed in another base currency
+        assert "alpaca" not in result
+
+
+@pytest.mark.django_db
+def test_update_dividend_aggregates(tmp_path):
+    dividends_service = MagicMock()
+    dividends_service.get_dividends.return_value = DIVIDENDS
+    dividends_service.base_currency = "EUR"
+    factory = MagicMock()
+    factory.broker_supports_service.return_value = True
+    factory.create_service.return_value = dividends_service
+
+    with patch("stonks_overwatch.core.factories.broker_factory.BrokerFactory", return_value=factory):
+        DividendsUpdateService(BrokerName.DEGIRO, import_folder=str(tmp_path)).update_dividend_aggregates()
+
+    rows = DividendMonthlyAggregate.objects.filter(portfolio_id="degiro").order_by("month", "currency")
+    assert [(row.month, row.currency, row.payouts) for row in rows] == [(1, "EUR", 2), (1, "USD", 1), (2, "EUR", 0)]
+    assert DividendAggregateStatus.objects.get(portfolio_id="degiro").base_currency == "EUR"
+
+
+@pytest.mark.django_db
+def test_update_dividend_aggregates_skips_brokers_without_dividends(tmp_path):
+    factory = MagicMock()
+    factory.broker_supports_service.return_value = False
+
+    with patch("stonks_overwatch.core.factories.broker_factory.BrokerFactory", return_value=factory):
+        DividendsUpdateService(BrokerName.BITVAVO, import_folder=str(tmp_path)).update_dividend_aggregates()
+
+    factory.create_service.assert_not_called()
+    assert not DividendMonthlyAggregate.objects.exists()
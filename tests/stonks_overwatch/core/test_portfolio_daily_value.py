@@ -0,0 +1,162 @@
+from datetime import date, datetime, timezone
+
+from stonks_overwatch.constants import BrokerName
+from stonks_overwatch.core.interfaces.update_service import AbstractUpdateService
+from stonks_overwatch.core.models import PortfolioDailyValue, PortfolioDailyValueRepository
+from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
+from stonks_overwatch.services.models import Deposit, DepositType, TotalPortfolio
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+class SnapshotUpdateService(AbstractUpdateService):
+    def update_all(self):
+        pass
+
+
+def _daily_value(day: int, value: float) -> dict:
+    return {"date": date(2024, 1, day), "value": value, "cash": None, "deposits": 100.0}
+
+
+@pytest.mark.django_db
+class TestPortfolioDailyValueRepository:
+    def test_save_daily_values_only_writes_new_and_changed_dates(self):
+        written = PortfolioDailyValueRepository.save_daily_values(
+            "degiro", [_daily_value(1, 100.0), _daily_value(2, 110.0), _daily_value(3, 120.0)], "EUR"
+        )
+        assert written == 3
+
+        # Day 1 unchanged, day 2 changed by a backdated transaction, day 3 is the last snapshot, day 4 is new
+        written = PortfolioDailyValueRepository.save_daily_values(
+            "degiro",
+            [_daily_value(1, 100.0), _daily_value(2, 115.0), _daily_value(3, 120.0), _daily_value(4, 130.0)],
+            "EUR",
+        )
+        assert written == 3
+
+        values = PortfolioDailyValue.objects.filter(portfolio_id="degiro").order_by("date")
+        assert [row.value for row in values] == [100.0, 115.0, 120.0, 130.0]
+        assert PortfolioDailyValueRepository.get_last_date("degiro") == date(2024, 1, 4)
+        assert PortfolioDailyValueRepository.get_last_date("bitvavo") is None
+
+    def test_save_daily_values_ignores_rounding_noise_and_rewrites_other_currencies(self):
+        PortfolioDailyValueRepository.save_daily_values("degiro", [_daily_value(1, 0.3), _daily_value(2, 1.0)], "EUR")
+
+        written = PortfolioDailyValueRepository.save_daily_values(
+            "degiro", [_daily_value(1, 0.1 + 0.2), _daily_value(2, 1.0)], "EUR"
+        )
+        assert written == 1
+
+        written = PortfolioDailyValueRepository.save_daily_values(
+            "degiro", [_daily_value(1, 0.3), _daily_value(2, 1.0)], "USD"
+        )
+        assert written == 2
+        assert set(PortfolioDailyValue.objects.values_list("currency", flat=True)) == {"USD"}
+
+    def test_get_daily_values_includes_previous_snapshot(self):
+        PortfolioDailyValueRepository.save_daily_values(
+            "degiro", [_daily_value(1, 100.0), _daily_value(5, 150.0)], "EUR"
+        )
+        PortfolioDailyValueRepository.save_daily_values(
+            "bitvavo", [_daily_value(3, 10.0), _daily_value(4, 20.0)], "EUR"
+        )
+        PortfolioDailyValueRepository.save_daily_values("ibkr", [_daily_value(2, 1.0), _daily_value(4, 2.0)], "USD")
+
+        result = PortfolioDailyValueRepository.get_daily_values(
+            ["degiro", "bitvavo", "ibkr"], start_date=date(2024, 1, 4), currency="EUR"
+        )
+
+        assert [row["date"] for row in result["degiro"]] == [date(2024, 1, 1), date(2024, 1, 5)]
+        assert [row["value"] for row in result["bitvavo"]] == [10.0, 20.0]
+        assert result["ibkr"] == []
+
+
+@pytest.mark.django_db
+def test_update_portfolio_snapshot(tmp_path):
+    portfolio_service = MagicMock()
+    portfolio_service.calculate_historical_value.return_value = [
+        {"x": "2024-01-02", "y": 110.0},
+        {"x": "2024-01-01", "y": 100.0},
+        {"x": "2024-01-03", "y": 120.0},
+    ]
+    portfolio_service.get_portfolio_total.return_value = TotalPortfolio(
+        base_currency="EUR",
+        total_pl=0.0,
+        total_cash=25.0,
+        current_value=120.0,
+        total_roi=0.0,
+        total_deposit_withdrawal=0.0,
+    )
+    deposit_service = MagicMock()
+    deposit_service.get_cash_deposits.return_value = [
+        Deposit(datetime(2024, 1, 2, 10, tzinfo=timezone.utc), DepositType.DEPOSIT, 50.0, "EUR", "Deposit"),
+        Deposit(datetime(2023, 12, 1, 10, tzinfo=timezone.utc), DepositType.DEPOSIT, 100.0, "EUR", "Deposit"),
+    ]
+
+    factory = MagicMock()
+    factory.create_service.side_effect = lambda broker_name, service_type: (
+        portfolio_service if service_type.value == "portfolio" else deposit_service
+    )
+
+    with (
+        patch("stonks_overwatch.core.factories.broker_factory.BrokerFactory", return_value=factory),
+        patch.object(PortfolioAggregatorService, "series_snapshots") as series_snapshots,
+    ):
+        SnapshotUpdateService(BrokerName.DEGIRO, import_folder=str(tmp_path)).update_portfolio_snapshot()
+
+    series_snapshots.invalidate.assert_called_once()
+    rows = list(PortfolioDailyValue.objects.filter(portfolio_id="degiro").order_by("date"))
+    assert [row.value for row in rows] == [100.0, 110.0, 120.0]
+    assert [row.deposits for row in rows] == [100.0, 150.0, 150.0]
+    assert [row.cash for row in rows] == [None, None, 25.0]
+    assert {row.currency for row in rows} == {"EUR"}
+
+
+def _snapshot_factory(historical_value: list[dict]) -> MagicMock:
+    portfolio_service = MagicMock()
+    portfolio_service.calculate_historical_value.return_value = historical_value
+    portfolio_service.get_portfolio_total.return_value = TotalPortfolio(
+        base_currency="EUR",
+        total_pl=0.0,
+        total_cash=0.0,
+        current_value=0.0,
+        total_roi=0.0,
+        total_deposit_withdrawal=0.0,
+    )
+    factory = MagicMock()
+    factory.create_service.side_effect = lambda broker_name, service_type: (
+        portfolio_service if service_type.value == "portfolio" else None
+    )
+    return factory
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("changed_since, first_rewritten", [(None, 13), (date(2024, 1, 5), 5)])
+def test_update_portfolio_snapshot_rewrites_from_the_last_week_or_the_changed_history(
+    tmp_path, changed_since, first_rewritten
+):
+    PortfolioDailyValueRepository.save_daily_values("degiro", [_daily_value(day, 1.0) for day in range(1, 21)], "EUR")
+    factory = _snapshot_factory([{"x": f"2024-01-{day:02d}", "y": 2.0} for day in range(1, 22)])
+    service = SnapshotUpdateService(BrokerName.DEGIRO, import_folder=str(tmp_path))
+    service._mark_history_changed([changed_since, date(2024, 1, 18)])
+
+    with patch("stonks_overwatch.core.factories.broker_factory.BrokerFactory", return_value=factory):
+        service.update_portfolio_snapshot()
+
+    rows = PortfolioDailyValue.objects.filter(portfolio_id="degiro").order_by("date")
+    assert [row.date.day for row in rows if row.value == 2.0] == list(range(first_rewritten, 22))
+    assert service._history_changed_since is None
+
+
+@pytest.mark.django_db
+def test_update_portfolio_snapshot_rewrites_every_snapshot_after_a_base_currency_change(tmp_path):
+    PortfolioDailyValueRepository.save_daily_values("degiro", [_daily_value(day, 1.0) for day in range(1, 21)], "USD")
+    factory = _snapshot_factory([{"x": f"2024-01-{day:02d}", "y": 2.0} for day in range(1, 22)])
+
+    with patch("stonks_overwatch.core.factories.broker_factory.BrokerFactory", return_value=factory):
+        SnapshotUpdateService(BrokerName.DEGIRO, import_folder=str(tmp_path)).update_portfolio_snapshot()
+
+    rows = PortfolioDailyValue.objects.filter(portfolio_id="degiro")
+    assert {(row.value, row.currency) for row in rows} == {(2.0, "EUR")}
+    assert rows.count() == 21
@@ -32,7 +32,7 @@ def mock_full_credentials():
 @pytest.fixture(scope="function", autouse=True)
 def disable_requests_cache():
     """Replace CachedSession with a regular Session for all test functions"""
-    with patch("requests_cache.CachedSession", requests.Session):
+    with patch("requests_cache.CachedSession", lambda *args, **kwargs: requests.Session()):
         yield
 
 
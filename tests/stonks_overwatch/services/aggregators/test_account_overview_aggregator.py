@@ -1,4 +1,5 @@
 from stonks_overwatch.config.base_config import BaseConfig
+from stonks_overwatch.core.interfaces.account_service import AccountServiceInterface
 from stonks_overwatch.services.aggregators.account_overview_aggregator import AccountOverviewAggregatorService
 from stonks_overwatch.services.brokers.bitvavo.services.account_service import (
     AccountOverviewService as BitvavoAccountOverviewService,
@@ -7,6 +8,7 @@ from stonks_overwatch.services.brokers.degiro.services.account_service import (
     AccountOverviewService as DeGiroAccountOverviewService,
 )
 from stonks_overwatch.services.models import AccountOverview, PortfolioId
+from stonks_overwatch.services.utilities.pagination import PageQuery
 
 import pytest
 from unittest.mock import patch
@@ -108,3 +110,44 @@ def test_get_account_overview_aggregator_only_bitvavo(mock_bitvavo_get_account_o
     assert overview[0].stock_name == "Bitcoin"
     assert overview[1].description == "Bought 1 Bitcoin"
     assert overview[1].stock_name == "Bitcoin"
+
+
+@pytest.fixture
+def mock_degiro_get_account_overview_page():
+    # Page the mocked DeGiro account overview in memory, as the brokers without a database push-down do
+    with patch.object(
+        DeGiroAccountOverviewService, "get_account_overview_page", AccountServiceInterface.get_account_overview_page
+    ) as mock_method:
+        yield mock_method
+
+
+def test_get_account_overview_page_walks_all_brokers(mock_degiro_get_account_overview_page):
+    BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+
+    aggregator = AccountOverviewAggregatorService()
+    first = aggregator.get_account_overview_page(PortfolioId.ALL, PageQuery(limit=3))
+    second = aggregator.get_account_overview_page(PortfolioId.ALL, PageQuery(limit=3, cursor=first.next_cursor))
+
+    assert [entry.description for entry in first.items] == [
+        "Bought 0.5 Bitcoin",
+        "Degiro Cash Sweep Transfer",
+        "Koop 2 @ 100,000 EUR",
+    ]
+    assert first.next_cursor is not None
+    assert [entry.description for entry in second.items] == ["Bought 1 Bitcoin"]
+    assert second.next_cursor is None
+
+
+def test_get_account_overview_page_with_offset_and_filters(mock_degiro_get_account_overview_page):
+    BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+
+    aggregator = AccountOverviewAggregatorService()
+    offset_page = aggregator.get_account_overview_page(PortfolioId.ALL, PageQuery(limit=2, offset=2))
+    filtered_page = aggregator.get_account_overview_page(
+        PortfolioId.ALL, PageQuery(symbol="btc", type="transaction", ascending=True)
+    )
+
+    assert [entry.description for entry in offset_page.items] == ["Koop 2 @ 100,000 EUR", "Bought 1 Bitcoin"]
+    assert offset_page.next_cursor is None
+    assert [entry.description for entry in filtered_page.items] == ["Bought 1 Bitcoin", "Bought 0.5 Bitcoin"]
+    assert filtered_page.next_cursor is None
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+
+from stonks_overwatch.constants import BrokerName
+from stonks_overwatch.services.aggregators.dividends_aggregator import DividendsAggregatorService
+from stonks_overwatch.services.models import Dividend, DividendType, PortfolioId
+
+from unittest.mock import MagicMock, patch
+
+
+def test_get_monthly_dividends_reads_aggregates_and_aggregates_missing_brokers():
+    """Computed aggregates are used, even if empty; brokers never computed are aggregated on the fly."""
+    svc = DividendsAggregatorService()
+    svc._global_config = MagicMock(base_currency="EUR")
+    ibkr_service = MagicMock()
+    ibkr_service.get_dividends.return_value = [
+        Dividend(
+            dividend_type=DividendType.PAID,
+            payment_date=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            stock_name="Microsoft",
+            stock_symbol="MSFT",
+            currency="EUR",
+            amount=4.0,
+            taxes=1.0,
+        )
+    ]
+    degiro_service = MagicMock()
+    bitvavo_service = MagicMock()
+    svc._broker_services = {
+        BrokerName.DEGIRO: degiro_service,
+        BrokerName.BITVAVO: bitvavo_service,
+        BrokerName.IBKR: ibkr_service,
+    }
+    stored = {
+        "degiro": [
+            {"year": 2024, "month": 2, "currency": "EUR", "net_amount": 8.5, "gross_amount": 10.0, "payouts": 1},
+        ],
+        # Computed, without dividends
+        "bitvavo": [],
+    }
+
+    with (
+        patch.object(svc, "_is_broker_enabled", return_value=True),
+        patch(
+            "stonks_overwatch.services.aggregators.dividends_aggregator.DividendMonthlyAggregateRepository"
+        ) as mock_repository,
+    ):
+        mock_repository.get_monthly_dividends.return_value = stored
+        result = svc.get_monthly_dividends(PortfolioId.ALL)
+
+    mock_repository.get_monthly_dividends.assert_called_once_with(["degiro", "bitvavo", "ibkr"], base_currency="EUR")
+    degiro_service.get_dividends.assert_not_called()
+    bitvavo_service.get_dividends.assert_not_called()
+    assert [(row["month"], row["net_amount"], row["payouts"]) for row in result] == [(1, 3.0, 1), (2, 8.5, 1)]
@@ -0,0 +1,61 @@
+from stonks_overwatch.constants import BrokerName
+from stonks_overwatch.core.interfaces.fee_service import FeeServiceInterface
+from stonks_overwatch.services.aggregators.fees_aggregator import FeesAggregatorService
+from stonks_overwatch.services.models import Fee, FeeType, PortfolioId
+
+from unittest.mock import MagicMock, patch
+
+
+class ListFeeService(FeeServiceInterface):
+    def __init__(self, fees: list[Fee]):
+        self.fees = fees
+        self.calls = 0
+
+    def get_fees(self) -> list[Fee]:
+        self.calls += 1
+        return self.fees
+
+
+def _fee(date: str, fee_type: FeeType, value: float) -> Fee:
+    return Fee(date=date, time="10:00:00", type=fee_type, description="", fee_value=value, currency="EUR")
+
+
+def test_get_fee_totals_shares_the_broker_fees():
+    svc = FeesAggregatorService()
+    bitvavo_service = ListFeeService([_fee("2024-01-02", FeeType.TRANSACTION, -1.0)])
+    degiro_fees = [_fee("2024-01-03", FeeType.CONNECTION, -2.5)]
+    degiro_service = MagicMock()
+    degiro_service.get_fees.return_value = degiro_fees
+    degiro_service.get_fee_totals.return_value = {FeeType.CONNECTION: -2.5, FeeType.TRANSACTION: -3.0}
+    svc._broker_services = {BrokerName.DEGIRO: degiro_service, BrokerName.BITVAVO: bitvavo_service}
+
+    with patch.object(svc, "_is_broker_enabled", return_value=True):
+        fees = svc.get_fees(PortfolioId.ALL)
+        totals = svc.get_fee_totals(PortfolioId.ALL)
+
+    assert [fee.date for fee in fees] == ["2024-01-03", "2024-01-02"]
+    assert totals[FeeType.TRANSACTION] == -4.0
+    assert totals[FeeType.CONNECTION] == -2.5
+    assert totals[FeeType.ADR_GDR] == 0.0
+    # The fees of each broker are only retrieved once per request
+    assert bitvavo_service.calls == 1
+    degiro_service.get_fees.assert_called_once()
+    degiro_service.get_fee_totals.assert_called_once_with(fees=degiro_fees)
+
+
+def test_get_fee_totals_without_the_fees():
+    svc = FeesAggregatorService()
+    bitvavo_service = ListFeeService([_fee("2024-01-02", FeeType.TRANSACTION, -1.0)])
+    degiro_service = MagicMock()
+    degiro_service.get_fee_totals.return_value = {FeeType.CONNECTION: -2.5, FeeType.TRANSACTION: -3.0}
+    svc._broker_services = {BrokerName.DEGIRO: degiro_service, BrokerName.BITVAVO: bitvavo_service}
+
+    with patch.object(svc, "_is_broker_enabled", return_value=True):
+        totals = svc.get_fee_totals(PortfolioId.ALL)
+
+    assert totals[FeeType.TRANSACTION] == -4.0
+    assert totals[FeeType.CONNECTION] == -2.5
+    # The brokers aggregating in the database don't load the fee list
+    degiro_service.get_fees.assert_not_called()
+    degiro_service.get_fee_totals.assert_called_once_with(fees=None)
+    assert bitvavo_service.calls == 1
@@ -1,6 +1,10 @@
+from datetime import date
+
+from stonks_overwatch.constants import BrokerName
 from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
-from stonks_overwatch.services.models import PortfolioEntry
-from stonks_overwatch.utils.domain.constants import ProductType
+from stonks_overwatch.services.brokers.yfinance.services.market_data_service import YFinance
+from stonks_overwatch.services.models import PortfolioEntry, PortfolioId, TotalPortfolio
+from stonks_overwatch.utils.domain.constants import ProductType, Sector
 
 import pytest
 from unittest.mock import MagicMock, patch
@@ -10,6 +14,10 @@ from unittest.mock import MagicMock, patch
 def aggregator():
     with patch("stonks_overwatch.services.aggregators.portfolio_aggregator.YFinance") as mock_yf_class:
         mock_yf = MagicMock()
+        mock_yf.get_stored_ticker_infos.return_value = {}
+        mock_yf.parse_name.side_effect = YFinance.parse_name
+        mock_yf.parse_country.side_effect = YFinance.parse_country
+        mock_yf.parse_sector_industry.side_effect = YFinance.parse_sector_industry
         mock_yf_class.return_value = mock_yf
         svc = PortfolioAggregatorService()
         svc.yfinance = mock_yf
@@ -21,69 +29,191 @@ class TestAssignName:
 
     def test_resolves_name_when_name_equals_symbol(self, aggregator):
         """Name is replaced with the full company name when it currently matches the ticker."""
-        svc, mock_yf = aggregator
-        mock_yf.get_name.return_value = "Apple Inc."
+        svc, _ = aggregator
         entry = PortfolioEntry(symbol="AAPL", name="AAPL", product_type=ProductType.STOCK)
 
-        svc._assign_name(entry)
+        svc._assign_name(entry, {"longName": "Apple Inc.", "shortName": "Apple"})
 
         assert entry.name == "Apple Inc."
-        mock_yf.get_name.assert_called_once_with("AAPL")
 
     def test_resolves_name_when_name_is_empty(self, aggregator):
         """Name is filled in when the broker left it blank."""
-        svc, mock_yf = aggregator
-        mock_yf.get_name.return_value = "Tesla Inc."
+        svc, _ = aggregator
         entry = PortfolioEntry(symbol="TSLA", name="", product_type=ProductType.STOCK)
 
-        svc._assign_name(entry)
+        svc._assign_name(entry, {"shortName": "Tesla Inc."})
 
         assert entry.name == "Tesla Inc."
 
     def test_does_not_overwrite_existing_name(self, aggregator):
         """A name already set by the broker (e.g. DEGIRO) is not replaced."""
-        svc, mock_yf = aggregator
+        svc, _ = aggregator
         entry = PortfolioEntry(symbol="AAPL", name="Apple Inc.", product_type=ProductType.STOCK)
 
-        svc._assign_name(entry)
+        svc._assign_name(entry, {"longName": "Apple Incorporated"})
 
         assert entry.name == "Apple Inc."
-        mock_yf.get_name.assert_not_called()
 
     def test_skips_cash_entries(self, aggregator):
-        """Cash entries are never looked up in yfinance."""
-        svc, mock_yf = aggregator
+        """Cash entries are never enriched with yfinance data."""
+        svc, _ = aggregator
         entry = PortfolioEntry(symbol="USD", name="USD", product_type=ProductType.CASH)
 
-        svc._assign_name(entry)
+        svc._assign_name(entry, {"longName": "US Dollar Inc."})
 
-        mock_yf.get_name.assert_not_called()
+        assert entry.name == "USD"
 
     def test_skips_crypto_entries(self, aggregator):
-        """Crypto entries are never looked up in yfinance."""
-        svc, mock_yf = aggregator
+        """Crypto entries are never enriched with yfinance data."""
+        svc, _ = aggregator
         entry = PortfolioEntry(symbol="BTC", name="BTC", product_type=ProductType.CRYPTO)
 
-        svc._assign_name(entry)
+        svc._assign_name(entry, {"longName": "Bitcoin Inc."})
 
-        mock_yf.get_name.assert_not_called()
+        assert entry.name == "BTC"
 
     def test_resolves_name_for_etf(self, aggregator):
         """ETF entries are enriched the same as stocks."""
-        svc, mock_yf = aggregator
-        mock_yf.get_name.return_value = "iShares Core S&P 500 ETF"
+        svc, _ = aggregator
         entry = PortfolioEntry(symbol="IVV", name="IVV", product_type=ProductType.ETF)
 
-        svc._assign_name(entry)
+        svc._assign_name(entry, {"longName": "iShares Core S&P 500 ETF"})
 
         assert entry.name == "iShares Core S&P 500 ETF"
 
-    def test_keeps_symbol_when_yfinance_returns_none(self, aggregator):
-        """If yfinance has no name, the existing value (ticker) is preserved."""
-        svc, mock_yf = aggregator
-        mock_yf.get_name.return_value = None
+    def test_keeps_symbol_when_ticker_info_is_missing(self, aggregator):
+        """If there is no stored ticker info, the existing value (ticker) is preserved."""
+        svc, _ = aggregator
         entry = PortfolioEntry(symbol="XYZ", name="XYZ", product_type=ProductType.STOCK)
 
-        svc._assign_name(entry)
+        svc._assign_name(entry, None)
 
         assert entry.name == "XYZ"
+
+
+class TestFillMissingEntryInfo:
+    """Tests for PortfolioAggregatorService._fill_missing_entry_info()."""
+
+    def test_reads_ticker_info_in_one_batch(self, aggregator):
+        """All the symbols are resolved with a single lookup of the stored ticker info."""
+        svc, mock_yf = aggregator
+        mock_yf.get_stored_ticker_infos.return_value = {
+            "AAPL": {"longName": "Apple Inc.", "country": "United States", "sector": "Technology", "industry": "Chips"}
+        }
+        portfolio = [
+            PortfolioEntry(symbol="AAPL", name="AAPL", product_type=ProductType.STOCK),
+            PortfolioEntry(symbol="AAPL", name="AAPL", product_type=ProductType.STOCK),
+            PortfolioEntry(symbol="XYZ", name="XYZ", product_type=ProductType.STOCK),
+            PortfolioEntry(symbol="EUR", name="EUR", product_type=ProductType.CASH),
+        ]
+
+        svc._fill_missing_entry_info(portfolio)
+
+        mock_yf.get_stored_ticker_infos.assert_called_once_with({"AAPL", "XYZ"})
+        assert [entry.name for entry in portfolio] == ["Apple Inc.", "Apple Inc.", "XYZ", "EUR"]
+        assert portfolio[0].sector == Sector.TECHNOLOGY
+        assert portfolio[0].industry == "Chips"
+        assert portfolio[0].country.get_name() == "United States"
+        assert portfolio[2].sector is None
+        assert portfolio[3].sector == Sector.CASH
+
+
+class TestCalculateHistoricalValue:
+    """Tests for PortfolioAggregatorService.calculate_historical_value()."""
+
+    def test_reads_snapshots_and_calculates_missing_brokers(self, aggregator):
+        """Stored snapshots are used when available; other brokers are calculated on the fly."""
+        svc, _ = aggregator
+        svc._global_config = MagicMock(base_currency="EUR")
+        bitvavo_service = MagicMock()
+        bitvavo_service.calculate_historical_value.return_value = [
+            {"x": "2024-01-03", "y": 20.0},
+            {"x": "2024-01-01", "y": 5.0},
+            {"x": "2024-01-02", "y": 10.0},
+        ]
+        degiro_service = MagicMock()
+        svc._broker_services = {BrokerName.DEGIRO: degiro_service, BrokerName.BITVAVO: bitvavo_service}
+        snapshots = {
+            "degiro": [
+                {"date": date(2024, 1, 1), "value": 100.0},
+                {"date": date(2024, 1, 3), "value": 120.0},
+            ],
+            "bitvavo": [],
+        }
+
+        with (
+            patch.object(svc, "_is_broker_enabled", return_value=True),
+            patch(
+                "stonks_overwatch.services.aggregators.portfolio_aggregator.PortfolioDailyValueRepository"
+            ) as mock_repository,
+        ):
+            mock_repository.get_daily_values.return_value = snapshots
+            result = svc.calculate_historical_value(PortfolioId.ALL, start_date="2024-01-02")
+
+        mock_repository.get_daily_values.assert_called_once_with(
+            ["degiro", "bitvavo"], start_date=date(2024, 1, 2), currency="EUR"
+        )
+        degiro_service.calculate_historical_value.assert_not_called()
+        # DEGIRO has no snapshot on the 2nd, its value of the 1st is carried forward
+        assert result == [
+            {"x": "2024-01-02", "y": 110.0},
+            {"x": "2024-01-03", "y": 140.0},
+        ]
+
+    def test_forward_fills_every_broker_to_the_start_date(self, aggregator):
+        svc, _ = aggregator
+        svc._broker_services = {BrokerName.DEGIRO: MagicMock(), BrokerName.BITVAVO: MagicMock()}
+        snapshots = {
+            # Only the value before the start is stored for the range
+            "degiro": [{"date": date(2024, 1, 1), "value": 100.0}],
+            "bitvavo": [
+                {"date": date(2024, 1, 5), "value": 10.0},
+                {"date": date(2024, 1, 6), "value": 12.0},
+            ],
+        }
+
+        with (
+            patch.object(svc, "_is_broker_enabled", return_value=True),
+            patch(
+                "stonks_overwatch.services.aggregators.portfolio_aggregator.PortfolioDailyValueRepository"
+            ) as mock_repository,
+        ):
+            mock_repository.get_daily_values.return_value = snapshots
+            result = svc.calculate_historical_value(PortfolioId.ALL, start_date="2024-01-04")
+
+        assert result == [
+            {"x": "2024-01-04", "y": 100.0},
+            {"x": "2024-01-05", "y": 110.0},
+            {"x": "2024-01-06", "y": 112.0},
+        ]
+
+
+class TestPortfolioTotal:
+    """Tests for PortfolioAggregatorService.get_portfolio_total()."""
+
+    def test_reuses_broker_portfolios(self, aggregator):
+        """The broker portfolios collected by get_portfolio are passed to the broker totals."""
+        svc, _ = aggregator
+        broker_portfolio = [PortfolioEntry(symbol="IVV", name="iShares Core S&P 500 ETF", product_type=ProductType.ETF)]
+        broker_service = MagicMock()
+        broker_service.get_portfolio_total.return_value = TotalPortfolio(
+            base_currency="EUR",
+            total_pl=10.0,
+            total_cash=5.0,
+            current_value=110.0,
+            total_roi=10.0,
+            total_deposit_withdrawal=100.0,
+        )
+        svc._broker_services = {BrokerName.DEGIRO: broker_service}
+
+        with patch.object(
+            svc, "_collect_broker_data", return_value={BrokerName.DEGIRO: broker_portfolio}
+        ) as mock_collect:
+            portfolio = svc.get_portfolio(PortfolioId.ALL)
+            total = svc.get_portfolio_total(PortfolioId.ALL)
+
+        mock_collect.assert_called_once_with(PortfolioId.ALL, "get_portfolio")
+        broker_service.get_portfolio_total.assert_called_once_with(portfolio=broker_portfolio)
+        assert total.current_value == 110.0
+        # The aggregated entries are copies, the broker portfolio is left untouched
+        assert portfolio[0] is not broker_portfolio[0]
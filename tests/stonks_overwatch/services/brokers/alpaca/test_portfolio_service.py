@@ -1,16 +1,30 @@
 """Tests for the Alpaca portfolio service."""
 
-from datetime import datetime, timezone as dt_tz
+from datetime import date, datetime, timezone as dt_tz
 from decimal import Decimal
 
-from stonks_overwatch.services.brokers.alpaca.repositories.models import AlpacaOrder, AlpacaPosition
+from stonks_overwatch.services.brokers.alpaca.repositories.models import (
+    AlpacaActivity,
+    AlpacaOrder,
+    AlpacaPosition,
+    AlpacaProductQuotation,
+)
 from stonks_overwatch.services.brokers.alpaca.services.portfolio_service import PortfolioService
+from stonks_overwatch.services.brokers.alpaca.services.portfolio_snapshot import PortfolioSnapshot
 
 import pytest
 from django.test import TestCase
 from unittest.mock import MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def invalidate_snapshot():
+    """Every test mocks its own prices and account, so it must not read the snapshot of a previous test."""
+    PortfolioSnapshot.invalidate()
+    yield
+    PortfolioSnapshot.invalidate()
+
+
 @pytest.mark.django_db
 class TestAlpacaPortfolioService(TestCase):
     def setUp(self):
@@ -326,3 +340,157 @@ class TestAlpacaClosedPositions(TestCase):
         closed = [e for e in service.get_portfolio if not e.is_open]
 
         assert closed == []
+
+
+@pytest.mark.django_db
+class TestAlpacaHistoricalValue(TestCase):
+    """Tests for calculate_historical_value() and calculate_product_growth()."""
+
+    def setUp(self):
+        AlpacaActivity.objects.create(
+            activity_id="act-csd-001",
+            activity_type="CSD",
+            net_amount=Decimal("2000.00"),
+            activity_date=date(2024, 1, 8),
+        )
+        AlpacaOrder.objects.create(
+            order_id="o1",
+            symbol="AAPL",
+            side="buy",
+            qty=Decimal("10"),
+            filled_qty=Decimal("10"),
+            filled_avg_price=Decimal("150.00"),
+            order_type="market",
+            status="filled",
+            submitted_at=datetime(2024, 1, 9, 15, 0, tzinfo=dt_tz.utc),
+            filled_at=datetime(2024, 1, 9, 15, 0, tzinfo=dt_tz.utc),
+        )
+        # The 2024-01-11 bar is missing, so the previous close is used
+        AlpacaProductQuotation.objects.create(
+            symbol="AAPL",
+            interval="1Day",
+            last_import=datetime(2024, 1, 13, tzinfo=dt_tz.utc),
+            quotations={"2024-01-09": 155.0, "2024-01-10": 160.0, "2024-01-12": 158.0},
+            complete_through=date(2024, 1, 12),
+        )
+
+    def _make_service(self):
+        with patch("stonks_overwatch.services.brokers.alpaca.services.portfolio_service.AlpacaClient"):
+            service = PortfolioService()
+        service._to_base = lambda amount, *_args, **_kw: amount  # type: ignore[method-assign]
+        return service
+
+    @patch("stonks_overwatch.services.brokers.alpaca.services.portfolio_service.timezone.now")
+    def test_calculate_historical_value_values_positions_with_stored_bars(self, mock_now):
+        mock_now.return_value = datetime(2024, 1, 15, 12, 0, tzinfo=dt_tz.utc)
+
+        historical_value = self._make_service().calculate_historical_value()
+
+        # Weekends are skipped, and today uses the last stored close
+        assert [(entry["x"], entry["y"]) for entry in historical_value] == [
+            ("2024-01-08", 2000.0),
+            ("2024-01-09", 2050.0),
+            ("2024-01-10", 2100.0),
+            ("2024-01-11", 2100.0),
+            ("2024-01-12", 2080.0),
+            ("2024-01-15", 2080.0),
+        ]
+
+    def test_calculate_historical_value_without_data(self):
+        AlpacaActivity.objects.all().delete()
+        AlpacaOrder.objects.all().delete()
+
+        assert self._make_service().calculate_historical_value() == []
+
+    def test_calculate_product_growth(self):
+        AlpacaOrder.objects.create(
+            order_id="o2",
+            symbol="AAPL",
+            side="sell",
+            qty=Decimal("4"),
+            filled_qty=Decimal("4"),
+            filled_avg_price=Decimal("160.00"),
+            order_type="market",
+            status="filled",
+            submitted_at=datetime(2024, 1, 10, 15, 0, tzinfo=dt_tz.utc),
+            filled_at=datetime(2024, 1, 10, 15, 0, tzinfo=dt_tz.utc),
+        )
+
+        assert self._make_service().calculate_product_growth() == {
+            "AAPL": {"history": {"2024-01-09": 10.0, "2024-01-10": 6.0}}
+        }
+
+
+@pytest.mark.django_db
+class TestAlpacaPortfolioSnapshot(TestCase):
+    """Tests for the shared PortfolioSnapshot read by get_portfolio."""
+
+    def setUp(self):
+        AlpacaPosition.objects.create(symbol="AAPL", qty=Decimal("10"), current_price=Decimal("165.00"))
+
+    @patch("stonks_overwatch.services.brokers.alpaca.services.portfolio_service.AlpacaClient")
+    def test_get_portfolio_reads_the_snapshot(self, mock_client_class):
+        """Repeated accesses, from any service instance, only call the APIs once."""
+        mock_client = MagicMock()
+        mock_client.get_latest_prices.return_value = {"AAPL": 170.0}
+        mock_client.get_account.return_value = MagicMock(cash="100.00")
+        mock_client_class.return_value = mock_client
+
+        _ = PortfolioService().get_portfolio
+        portfolio = PortfolioService().get_portfolio
+
+        assert next(e for e in portfolio if e.symbol == "AAPL").price == 170.0
+        mock_client.get_latest_prices.assert_called_once_with(["AAPL"])
+        mock_client.get_account.assert_called_once()
+
+    @patch("stonks_overwatch.services.brokers.alpaca.services.portfolio_service.AlpacaClient")
+    def test_refresh_reloads_the_snapshot(self, mock_client_class):
+        mock_client = MagicMock()
+        mock_client.get_latest_prices.side_effect = [{"AAPL": 170.0}, {"AAPL": 175.0}]
+        mock_client.get_account.return_value = MagicMock(cash="0")
+        mock_client_class.return_value = mock_client
+        service = PortfolioService()
+
+        assert service.get_snapshot().prices == {"AAPL": 170.0}
+        assert service.refresh().prices == {"AAPL": 175.0}
+        assert next(e for e in service.get_portfolio if e.symbol == "AAPL").price == 175.0
+
+    def test_failed_fetch_keeps_the_previous_snapshot(self):
+        """A failed fetch keeps the previous prices and account, and is retried after RETRY_TTL."""
+        client = MagicMock(account_key=("key", True))
+        client.get_latest_prices.side_effect = [{"AAPL": 170.0}, Exception("API unavailable"), {"AAPL": 175.0}]
+        client.get_account.return_value = MagicMock(cash="100.00")
+
+        with patch(
+            "stonks_overwatch.services.utilities.ttl_snapshot.time.monotonic",
+            side_effect=[0.0, 61.0, 61.0, 67.0, 67.0],
+        ):
+            assert PortfolioSnapshot.get(client).complete
+            snapshot = PortfolioSnapshot.get(client)
+            assert snapshot.prices == {"AAPL": 170.0}
+            assert not snapshot.complete
+            assert PortfolioSnapshot.get(client).prices == {"AAPL": 175.0}
+
+    def test_snapshot_per_account(self):
+        live_client = MagicMock(account_key=("key", False))
+        live_client.get_latest_prices.return_value = {"AAPL": 170.0}
+        paper_client = MagicMock(account_key=("key", True))
+        paper_client.get_latest_prices.return_value = {"AAPL": 1.0}
+
+        assert PortfolioSnapshot.get(live_client).prices == {"AAPL": 170.0}
+        assert PortfolioSnapshot.get(paper_client).prices == {"AAPL": 1.0}
+        assert PortfolioSnapshot.get(live_client).prices == {"AAPL": 170.0}
+        live_client.get_latest_prices.assert_called_once()
+
+    @patch("stonks_overwatch.services.brokers.alpaca.services.portfolio_service.AlpacaClient")
+    def test_snapshot_without_account(self, mock_client_class):
+        """When the account cannot be fetched the portfolio has no cash entry."""
+        mock_client = MagicMock()
+        mock_client.get_latest_prices.return_value = {}
+        mock_client.get_account.side_effect = Exception("API unavailable")
+        mock_client_class.return_value = mock_client
+
+        portfolio = PortfolioService().get_portfolio
+
+        assert [e.symbol for e in portfolio] == ["AAPL"]
+        assert portfolio[0].price == 165.0
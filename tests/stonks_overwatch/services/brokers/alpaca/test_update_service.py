@@ -0,0 +1,183 @@
+"""Tests for the Alpaca update service."""
+
+from datetime import date, datetime, timedelta, timezone as dt_tz
+from decimal import Decimal
+
+from alpaca.trading.enums import QueryOrderStatus
+
+from stonks_overwatch.services.brokers.alpaca.repositories.models import (
+    AlpacaActivity,
+    AlpacaOrder,
+    AlpacaProductQuotation,
+)
+from stonks_overwatch.services.brokers.alpaca.services.update_service import UpdateService
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+YESTERDAY = date(2024, 1, 14)
+_T1 = datetime(2024, 1, 10, 15, 0, tzinfo=dt_tz.utc)
+
+
+def _make_service() -> UpdateService:
+    service = UpdateService.__new__(UpdateService)
+    service.alpaca_client = MagicMock()
+    service.alpaca_client.alpaca_config.start_date = date(2024, 1, 1)
+    service.debug_mode = False
+    service._injected_config = None
+    service._global_config = None
+    return service
+
+
+def test_get_import_range_for_open_position():
+    history = {"2024-01-09": 10.0}
+
+    assert UpdateService._get_import_range(history, None, YESTERDAY) == (date(2024, 1, 9), YESTERDAY)
+
+
+def test_get_import_range_for_closed_position():
+    history = {"2024-01-09": 10.0, "2024-01-11": 0.0}
+
+    assert UpdateService._get_import_range(history, None, YESTERDAY) == (date(2024, 1, 9), date(2024, 1, 11))
+
+
+def test_get_import_range_starts_after_the_stored_bars():
+    history = {"2024-01-09": 10.0}
+    stored = AlpacaProductQuotation(symbol="AAPL", complete_through=date(2024, 1, 12))
+
+    assert UpdateService._get_import_range(history, stored, YESTERDAY) == (date(2024, 1, 13), YESTERDAY)
+
+    stored.complete_through = YESTERDAY
+    assert UpdateService._get_import_range(history, stored, YESTERDAY) is None
+
+
+@pytest.mark.django_db
+@patch("stonks_overwatch.services.brokers.alpaca.services.update_service.timezone.now")
+@patch("stonks_overwatch.services.brokers.alpaca.services.update_service.PortfolioService")
+def test_update_quotations_requests_the_missing_bars_once(mock_portfolio_class, mock_now):
+    mock_now.return_value = datetime(2024, 1, 15, 12, 0, tzinfo=dt_tz.utc)
+    mock_portfolio_class.return_value.calculate_product_growth.return_value = {
+        "AAPL": {"history": {"2024-01-09": 10.0}},
+        "TSLA": {"history": {"2024-01-09": 5.0}},
+    }
+    AlpacaProductQuotation.objects.create(
+        symbol="AAPL",
+        interval="1Day",
+        last_import=datetime(2024, 1, 10, tzinfo=dt_tz.utc),
+        quotations={"2024-01-09": 155.0},
+        complete_through=date(2024, 1, 9),
+    )
+    AlpacaProductQuotation.objects.create(
+        symbol="TSLA",
+        interval="1Day",
+        last_import=datetime(2024, 1, 10, tzinfo=dt_tz.utc),
+        quotations={"2024-01-09": 200.0},
+        complete_through=date(2024, 1, 9),
+    )
+    service = _make_service()
+    service.alpaca_client.get_daily_bars.return_value = {
+        "AAPL": {"2024-01-10": 160.0, "2024-01-12": 158.0},
+        "TSLA": {"2024-01-10": 210.0},
+    }
+
+    service.update_quotations()
+
+    service.alpaca_client.get_daily_bars.assert_called_once_with(["AAPL", "TSLA"], date(2024, 1, 10), YESTERDAY)
+    aapl = AlpacaProductQuotation.objects.get(symbol="AAPL")
+    assert aapl.quotations == {"2024-01-09": 155.0, "2024-01-10": 160.0, "2024-01-12": 158.0}
+    assert aapl.complete_through == YESTERDAY
+    assert AlpacaProductQuotation.objects.get(symbol="TSLA").quotations == {"2024-01-09": 200.0, "2024-01-10": 210.0}
+
+
+def _order(order_id: str, status: str, filled_qty: str | None) -> MagicMock:
+    return MagicMock(
+        id=order_id,
+        symbol="AAPL",
+        qty="10",
+        filled_qty=filled_qty,
+        filled_avg_price="150.00" if filled_qty else None,
+        side=MagicMock(value="buy"),
+        order_type=MagicMock(value="limit"),
+        status=MagicMock(value=status),
+        submitted_at=_T1,
+        filled_at=_T1 if filled_qty else None,
+    )
+
+
+@pytest.mark.django_db
+def test_update_orders_upserts_from_the_newest_stored_order():
+    service = _make_service()
+    service.alpaca_client.get_orders.side_effect = [[_order("o1", "filled", "4")], []]
+
+    service.update_orders()
+
+    service.alpaca_client.get_orders.assert_any_call(after=date(2024, 1, 1))
+    service.alpaca_client.get_orders.assert_any_call(status=QueryOrderStatus.OPEN)
+    assert AlpacaOrder.objects.get(order_id="o1").filled_qty == Decimal("4")
+
+    # Without open orders, the next request starts from the newest stored order
+    service.alpaca_client.get_orders.reset_mock()
+    service.alpaca_client.get_orders.side_effect = [[_order("o1", "filled", "10"), _order("o2", "canceled", None)], []]
+
+    service.update_orders()
+
+    service.alpaca_client.get_orders.assert_any_call(after=_T1 - timedelta(seconds=1))
+    assert AlpacaOrder.objects.count() == 2
+    assert AlpacaOrder.objects.get(order_id="o1").filled_qty == Decimal("10")
+
+
+@pytest.mark.django_db
+def test_update_orders_requests_again_the_orders_open_at_the_last_sync():
+    service = _make_service()
+    submitted_long_ago = _T1 - timedelta(days=90)
+    open_order = _order("o1", "accepted", None)
+    open_order.submitted_at = submitted_long_ago
+    service.alpaca_client.get_orders.side_effect = [[_order("o2", "filled", "1")], [open_order]]
+
+    service.update_orders()
+
+    assert AlpacaOrder.objects.get(order_id="o1").status == "accepted"
+
+    # The open order is filled later: the closed orders are requested from its submission
+    filled_order = _order("o1", "filled", "10")
+    filled_order.submitted_at = submitted_long_ago
+    service.alpaca_client.get_orders.reset_mock()
+    service.alpaca_client.get_orders.side_effect = [[filled_order], []]
+
+    service.update_orders()
+
+    service.alpaca_client.get_orders.assert_any_call(after=submitted_long_ago - timedelta(seconds=1))
+    order = AlpacaOrder.objects.get(order_id="o1")
+    assert (order.status, order.filled_qty) == ("filled", Decimal("10"))
+
+
+@pytest.mark.django_db
+def test_update_activities_continues_after_the_newest_stored_activity():
+    service = _make_service()
+    service.alpaca_client.get_activities.return_value = [
+        {
+            "id": "20240110000000000::a",
+            "activity_type": "CSD",
+            "net_amount": "1000",
+            "date": "2024-01-10",
+        },
+        {
+            "id": "20240112000000000::b",
+            "activity_type": "DIV",
+            "symbol": "AAPL",
+            "net_amount": "2.5",
+            "transaction_time": "2024-01-12T10:00:00Z",
+        },
+    ]
+
+    service.update_activities()
+
+    assert service.alpaca_client.get_activities.call_args.kwargs["after_id"] is None
+    assert AlpacaActivity.objects.get(activity_id="20240112000000000::b").activity_date == date(2024, 1, 12)
+
+    service.alpaca_client.get_activities.return_value = []
+
+    service.update_activities()
+
+    assert service.alpaca_client.get_activities.call_args.kwargs["after_id"] == "20240112000000000::b"
+    assert AlpacaActivity.objects.count() == 2
@@ -1,7 +1,11 @@
+from datetime import datetime, timezone
+
 from stonks_overwatch.config.base_config import BaseConfig
 from stonks_overwatch.services.brokers.bitvavo.client.bitvavo_client import BitvavoService
 
 import pook
+import pytest
+from unittest.mock import patch
 
 
 @pook.on
@@ -93,6 +97,19 @@ def test_account_history():
     assert result[0]["priceCurrency"] == "EUR"
 
 
+@pook.on
+def test_account_history_from_date():
+    BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+    pook.get("https://api.bitvavo.com/v2/account/history").param("fromDate", "1739024805000").param("page", "1").reply(
+        200
+    ).json({"items": [], "currentPage": 1, "totalPages": 1})
+    client = BitvavoService()
+
+    result = client.account_history(datetime(2025, 2, 8, 14, 26, 45, tzinfo=timezone.utc))
+
+    assert result == []
+
+
 @pook.on
 def test_deposit_history():
     BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
@@ -114,3 +131,58 @@ def test_deposit_history():
     assert len(result) == 1
     assert result[0]["symbol"] == "EUR"
     assert result[0]["amount"] == "400"
+
+
+@pook.on
+def test_candles_are_paged():
+    BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+    day = 24 * 60 * 60 * 1000
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 1, 4, tzinfo=timezone.utc)
+    first_timestamp = int(start.timestamp() * 1000)
+
+    # The most recent candles come first, newest to oldest
+    pook.get("https://api.bitvavo.com/v2/BTC-EUR/candles").param("end", str(int(end.timestamp() * 1000))).reply(
+        200
+    ).json(
+        [
+            [first_timestamp + 3 * day, "4", "4", "4", "4", "1"],
+            [first_timestamp + 2 * day, "3", "3", "3", "3", "1"],
+        ]
+    )
+    pook.get("https://api.bitvavo.com/v2/BTC-EUR/candles").param("end", str(first_timestamp + 2 * day - 1)).reply(
+        200
+    ).json([[first_timestamp, "1", "1", "1", "1", "1"]])
+
+    client = BitvavoService()
+    with patch.object(BitvavoService, "CANDLES_LIMIT", 2):
+        candles = client.candles("BTC-EUR", "1d", start, end)
+
+    assert [candle["close"] for candle in candles] == ["1", "3", "4"]
+    assert candles[0]["timestamp"] == start
+
+
+@pook.on
+def test_candles_raise_on_an_error_page():
+    BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+    day = 24 * 60 * 60 * 1000
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 1, 4, tzinfo=timezone.utc)
+    first_timestamp = int(start.timestamp() * 1000)
+
+    pook.get("https://api.bitvavo.com/v2/BTC-EUR/candles").param("end", str(int(end.timestamp() * 1000))).reply(
+        200
+    ).json(
+        [
+            [first_timestamp + 3 * day, "4", "4", "4", "4", "1"],
+            [first_timestamp + 2 * day, "3", "3", "3", "3", "1"],
+        ]
+    )
+    # The older page fails, the candles received so far are not a complete range
+    pook.get("https://api.bitvavo.com/v2/BTC-EUR/candles").param("end", str(first_timestamp + 2 * day - 1)).reply(
+        200
+    ).json({"errorCode": 110, "error": "Too many requests"})
+
+    client = BitvavoService()
+    with patch.object(BitvavoService, "CANDLES_LIMIT", 2), pytest.raises(RuntimeError):
+        client.candles("BTC-EUR", "1d", start, end)
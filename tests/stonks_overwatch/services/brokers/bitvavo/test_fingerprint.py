@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from stonks_overwatch.services.brokers.bitvavo.fingerprint import to_decimal, transaction_fingerprint
+
+
+def test_to_decimal():
+    assert to_decimal("299.25137861999997") == Decimal("299.2513786200")
+    assert to_decimal(None) is None
+    assert to_decimal("null") is None
+
+
+def test_transaction_fingerprint_matches_api_and_stored_values():
+    from_api = transaction_fingerprint(
+        "2025-02-08T14:26:45.000Z", "buy", "EUR", "299.25137861999997", "BTC", "0.00318807"
+    )
+    from_database = transaction_fingerprint(
+        datetime(2025, 2, 8, 14, 26, 45, tzinfo=timezone.utc),
+        "buy",
+        "EUR",
+        Decimal("299.2513786200"),
+        "BTC",
+        Decimal("0.0031880700"),
+    )
+
+    assert from_api == from_database
+    assert len(from_api) == 64
+
+
+def test_transaction_fingerprint_depends_on_the_content():
+    fingerprint = transaction_fingerprint("2025-02-08T14:26:45.000Z", "buy", "EUR", "300", "BTC", "0.00318807")
+
+    assert fingerprint != transaction_fingerprint("2025-02-08T14:26:45.000Z", "buy", "EUR", "300", "BTC", "0.003")
+    assert fingerprint != transaction_fingerprint("2025-02-08T14:26:46.000Z", "buy", "EUR", "300", "BTC", "0.00318807")
+    assert fingerprint != transaction_fingerprint("2025-02-08T14:26:45.000Z", "sell", "EUR", "300", "BTC", "0.00318807")
@@ -1,9 +1,13 @@
+from datetime import date, timedelta
+
+from django.utils import timezone
 from isodate import parse_datetime
 
 from stonks_overwatch.config.base_config import BaseConfig
 from stonks_overwatch.services.brokers.bitvavo.repositories.models import (
     BitvavoAssets,
     BitvavoBalance,
+    BitvavoProductQuotation,
     BitvavoTransactions,
 )
 from stonks_overwatch.services.brokers.bitvavo.services.portfolio_service import PortfolioService
@@ -12,11 +16,13 @@ from stonks_overwatch.services.models import PortfolioEntry, ProductType
 import pook
 import pytest
 from django.test import TestCase
+from unittest.mock import patch
 
 
 @pytest.mark.django_db
 class TestPortfolioService(TestCase):
     def setUp(self):
+        PortfolioService.invalidate_ticker_prices()
         self.created_objects = {}
         self.fixture_balance_repository()
         self.fixture_transactions_repository()
@@ -135,6 +141,38 @@ class TestPortfolioService(TestCase):
         assert portfolio[1].base_currency_value == 100.0
         assert portfolio[1].unrealized_gain == 0.0
 
+    def test_get_ticker_prices_uses_a_single_request(self):
+        BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+        service = PortfolioService()
+
+        with patch.object(service.bitvavo_service, "ticker_price") as mock_ticker_price:
+            mock_ticker_price.return_value = [
+                {"market": "BTC-EUR", "price": "75398"},
+                {"market": "ETH-EUR", "price": "2500"},
+                {"market": "ETH-BTC", "price": "0.03"},
+            ]
+            assert service._get_ticker_prices(["BTC", "ETH"]) == {"BTC": 75398.0, "ETH": 2500.0}
+            # The second call is served from the snapshot
+            assert PortfolioService()._get_ticker_prices(["BTC"]) == {"BTC": 75398.0}
+
+        mock_ticker_price.assert_called_once_with()
+
+    def test_get_ticker_prices_falls_back_to_stored_quotations(self):
+        BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+        BitvavoProductQuotation.objects.create(
+            symbol="BTC",
+            interval="P1D",
+            last_import=timezone.now(),
+            quotations={"2025-02-08": 90000.0, "2025-02-09": 91000.0},
+        )
+        service = PortfolioService()
+
+        with patch.object(service.bitvavo_service, "ticker_price") as mock_ticker_price:
+            mock_ticker_price.return_value = {"errorCode": 110, "error": "Invalid endpoint."}
+            prices = service._get_ticker_prices(["BTC", "ADA"])
+
+        assert prices == {"BTC": 91000.0, "ADA": 0.0}
+
     @pook.on
     def test_get_portfolio_total(self):
         BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
@@ -176,3 +214,34 @@ class TestPortfolioService(TestCase):
         assert total_portfolio.total_roi_formatted == "-14.91%"
         assert total_portfolio.total_deposit_withdrawal == 400
         assert total_portfolio.total_deposit_withdrawal_formatted == "€ 400.00"
+
+    def test_create_products_quotation_reads_stored_quotations(self):
+        BaseConfig.CONFIG_PATH = "tests/resources/stonks_overwatch/config/sample-config.json"
+        BitvavoProductQuotation.objects.create(
+            symbol="BTC",
+            interval="P1D",
+            last_import=timezone.now(),
+            quotations={"2025-02-08": 90000.0, "2025-02-09": 91000.0},
+            complete_through=date(2025, 2, 9),
+        )
+        service = PortfolioService()
+
+        with patch.object(service.bitvavo_service, "candles") as mock_candles:
+            products = service._create_products_quotation()
+
+        mock_candles.assert_not_called()
+        assert products["BTC"]["quotation"]["quotes"] == {"2025-02-08": 90000.0, "2025-02-09": 91000.0}
+
+    def test_get_missing_quotation_range(self):
+        closed = {"2025-02-08": 1.0, "2025-02-10": 0}
+        open_position = {"2025-02-08": 1.0}
+        yesterday = timezone.now().date() - timedelta(days=1)
+
+        assert PortfolioService.get_missing_quotation_range(closed, date(2025, 2, 10)) is None
+        assert PortfolioService.get_missing_quotation_range(closed, date(2025, 2, 8)) == ("2025-02-09", "2025-02-10")
+        assert PortfolioService.get_missing_quotation_range(closed, None) == ("2025-02-08", "2025-02-10")
+        assert PortfolioService.get_missing_quotation_range(open_position, yesterday) is None
+        assert PortfolioService.get_missing_quotation_range(open_position, date(2025, 2, 8)) == (
+            "2025-02-09",
+            yesterday.isoformat(),
+        )
@@ -0,0 +1,163 @@
+from datetime import date, datetime, timezone
+
+from stonks_overwatch.services.brokers.bitvavo.fingerprint import transaction_fingerprint
+from stonks_overwatch.services.brokers.bitvavo.repositories.models import BitvavoProductQuotation, BitvavoTransactions
+from stonks_overwatch.services.brokers.bitvavo.services.portfolio_service import PortfolioService
+from stonks_overwatch.services.brokers.bitvavo.services.update_service import UpdateService
+
+import pytest
+from unittest.mock import MagicMock
+
+
+def _candle(day: int, close: str) -> dict:
+    return {"timestamp": datetime(2024, 1, day, tzinfo=timezone.utc), "close": close}
+
+
+def _update_service() -> UpdateService:
+    service = UpdateService.__new__(UpdateService)
+    service.bitvavo_service = MagicMock()
+    service.currency = "EUR"
+    service.debug_mode = False
+    return service
+
+
+def _transaction(transaction_id: str, executed_at: str, received_amount: str) -> dict:
+    return {
+        "transactionId": transaction_id,
+        "executedAt": executed_at,
+        "type": "buy",
+        "priceCurrency": "EUR",
+        "priceAmount": "93866",
+        "sentCurrency": "EUR",
+        "sentAmount": "299.25137861999997",
+        "receivedCurrency": "BTC",
+        "receivedAmount": received_amount,
+        "feesCurrency": "EUR",
+        "feesAmount": "0.7486213800000314",
+        "address": "null",
+    }
+
+
+def test_get_import_start_date():
+    data = {"quotation": {"from_date": "2024-01-01", "to_date": "2024-01-10"}}
+
+    assert UpdateService._get_import_start_date(data, {}) == "2024-01-01"
+    assert UpdateService._get_import_start_date(data, {"quotations": {"2024-01-01": 1.0, "2024-01-05": 2.0}}) == (
+        "2024-01-05"
+    )
+    assert (
+        UpdateService._get_import_start_date(
+            data, {"quotations": {"2024-01-05": 2.0}, "completeThrough": date(2024, 1, 4)}
+        )
+        == "2024-01-05"
+    )
+
+
+def test_create_products_quotation_merges_the_stored_quotations():
+    service = _update_service()
+    # The 2024-01-03 candle is missing: there were no trades that day
+    service.bitvavo_service.candles.return_value = [_candle(2, "2.5"), _candle(4, "4")]
+    data = {"quotation": {"from_date": "2024-01-01", "to_date": "2024-01-04"}}
+    stored = {"quotations": {"2024-01-01": 1.0, "2024-01-02": 2.0}}
+
+    quotes = service._create_products_quotation("BTC", data, stored, "2024-01-02")
+
+    assert quotes == {"2024-01-01": 1.0, "2024-01-02": 2.5, "2024-01-04": 4.0}
+    market, interval, start, end = service.bitvavo_service.candles.call_args.args
+    assert (market, interval) == ("BTC-EUR", "1d")
+    assert start == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert end.date() == date(2024, 1, 4)
+
+
+def test_create_products_quotation_without_stored_quotations():
+    service = _update_service()
+    service.bitvavo_service.candles.return_value = [_candle(1, "1"), _candle(2, "2")]
+    data = {"quotation": {"from_date": "2024-01-01", "to_date": "2024-01-02"}}
+
+    quotes = service._create_products_quotation("BTC", data, {}, "2024-01-01")
+
+    assert quotes == {"2024-01-01": 1.0, "2024-01-02": 2.0}
+    assert service.bitvavo_service.candles.call_args.args[2] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.django_db
+def test_import_quotation_keeps_the_stored_quotations_when_the_candles_fail():
+    service = _update_service()
+    service.portfolio_data = MagicMock()
+    service.portfolio_data.calculate_product_growth.return_value = {"BTC": {"history": {"2024-01-01": 1.0}}}
+    BitvavoProductQuotation.objects.create(
+        symbol="BTC",
+        interval="P1D",
+        last_import=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        quotations={"2024-01-01": 1.0},
+        complete_through=date(2024, 1, 1),
+    )
+    service.bitvavo_service.candles.side_effect = RuntimeError("Too many requests")
+
+    service._UpdateService__import_quotation()
+
+    stored = BitvavoProductQuotation.objects.get(symbol="BTC")
+    assert stored.quotations == {"2024-01-01": 1.0}
+    assert stored.complete_through == date(2024, 1, 1)
+
+
+@pytest.mark.django_db
+def test_update_portfolio_invalidates_the_ticker_prices():
+    service = _update_service()
+    service.portfolio_data = MagicMock()
+    service.portfolio_data.calculate_product_growth.return_value = {}
+    service.bitvavo_service.balance.return_value = [{"symbol": "BTC", "available": "0.5"}]
+    service.bitvavo_service.staking_balance.return_value = []
+    PortfolioService.ticker_prices.refresh(lambda: {"BTC-EUR": 1.0})
+
+    service.update_portfolio()
+
+    assert PortfolioService.ticker_prices.peek() is None
+
+
+@pytest.mark.django_db
+def test_update_transactions_imports_new_transactions_only():
+    service = _update_service()
+    service.bitvavo_service.account_history.return_value = [
+        _transaction("a", "2025-02-08T14:26:45.000Z", "0.00318807"),
+        # Bitvavo API bug: the same transaction with a different transactionId
+        _transaction("b", "2025-02-08T14:26:45.000Z", "0.00318807"),
+        _transaction("c", "2025-02-09T10:00:00.000Z", "0.001"),
+    ]
+
+    service.update_transactions()
+
+    assert service.bitvavo_service.account_history.call_args.args == (None,)
+    assert sorted(BitvavoTransactions.objects.values_list("transaction_id", flat=True)) == ["a", "c"]
+
+    # The next update starts at the newest stored transaction, and skips the ones already stored
+    service.bitvavo_service.account_history.return_value = [
+        _transaction("c", "2025-02-09T10:00:00.000Z", "0.001"),
+        _transaction("d", "2025-02-10T10:00:00.000Z", "0.002"),
+    ]
+
+    service.update_transactions()
+
+    assert service.bitvavo_service.account_history.call_args.args == (datetime(2025, 2, 9, 10, tzinfo=timezone.utc),)
+    assert sorted(BitvavoTransactions.objects.values_list("transaction_id", flat=True)) == ["a", "c", "d"]
+
+
+@pytest.mark.django_db
+def test_update_transactions_refreshes_the_transactions_sent_again():
+    service = _update_service()
+    service.bitvavo_service.account_history.return_value = [_transaction("a", "2025-02-08T14:26:45.000Z", "0.001")]
+    service.update_transactions()
+
+    # The same transactionId with a corrected amount, and a copy of it with another transactionId
+    service.bitvavo_service.account_history.return_value = [
+        _transaction("a", "2025-02-08T14:26:45.000Z", "0.002"),
+        _transaction("b", "2025-02-08T14:26:45.000Z", "0.002"),
+    ]
+    service.update_transactions()
+
+    stored = BitvavoTransactions.objects.get()
+    assert stored.transaction_id == "a"
+    assert float(stored.received_amount) == 0.002
+    assert stored.fingerprint == transaction_fingerprint(
+        "2025-02-08T14:26:45.000Z", "buy", "EUR", "299.25137861999997", "BTC", "0.002"
+    )
@@ -4,7 +4,7 @@ import pathlib
 from django.utils.dateparse import parse_datetime
 
 from stonks_overwatch.services.brokers.degiro.repositories.dividends_repository import DividendsRepository
-from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroUpcomingPayments
+from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroAgendaDividend, DeGiroUpcomingPayments
 from tests.stonks_overwatch.assertions import assert_dates_descending
 from tests.stonks_overwatch.base_repository_test import BaseRepositoryTest
 
@@ -33,3 +33,36 @@ class TestDividendsRepository(BaseRepositoryTest):
         upcoming_dividends = DividendsRepository.get_upcoming_payments()
         assert len(upcoming_dividends) == 6
         assert_dates_descending(data=upcoming_dividends, date_column="payDate")
+
+    def test_get_forecasted_payments_by_isin(self):
+        def create_agenda_dividend(event_id: int, isin: str, date_time: str, dividend: float):
+            DeGiroAgendaDividend.objects.create(
+                event_id=event_id,
+                isin=isin,
+                ric="",
+                organization_name=isin,
+                date_time=parse_datetime(date_time),
+                last_update=parse_datetime(date_time),
+                country_code="US",
+                event_type="ExDividends",
+                ex_dividend_date=parse_datetime(date_time),
+                payment_date=parse_datetime(date_time),
+                dividend=dividend,
+                yield_value=1.0,
+                currency="USD",
+                market_cap="LARGE_CAP",
+            )
+
+        create_agenda_dividend(1, "US5949181045", "2025-05-15T14:00:00+02:00", 0.83)
+        create_agenda_dividend(2, "US5949181045", "2025-08-14T14:00:00+02:00", 0.91)
+        create_agenda_dividend(3, "US0378331005", "2025-05-12T14:00:00+02:00", 0.26)
+        create_agenda_dividend(4, "US1912161007", "2025-06-13T14:00:00+02:00", 0.51)
+
+        isins = {"US5949181045", "US0378331005", "NL0000000000"}
+        forecasts = DividendsRepository.get_forecasted_payments_by_isin(isins)
+
+        assert sorted(forecasts.keys()) == ["US0378331005", "US5949181045"]
+        # The latest event of each ISIN is returned
+        assert forecasts["US5949181045"]["eventId"] == 2
+        assert forecasts["US5949181045"]["dividend"] == 0.91
+        assert DividendsRepository.get_forecasted_payments_by_isin([]) == {}
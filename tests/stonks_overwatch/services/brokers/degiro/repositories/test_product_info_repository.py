@@ -47,10 +47,12 @@ class TestProductInfoRepository(BaseRepositoryTest):
         product = ProductInfoRepository.get_product_info_from_id(999999)
         self.assertEqual(product, {})
 
-    def test_get_product_info_from_name(self):
-        """Test retrieving product info by company name."""
-        product = ProductInfoRepository.get_product_info_from_name("Microsoft Corp")
-        self.assert_dict_contains(product, name="Microsoft Corp", symbol="MSFT", currency="USD", isin="US5949181045")
+    def test_get_products_info_by_name(self):
+        """Test retrieving product info by a set of company names."""
+        products = ProductInfoRepository.get_products_info_by_name({"Microsoft Corp", "Apple Inc", "Unknown Corp"})
+        self.assertEqual(sorted(products.keys()), ["Apple Inc", "Microsoft Corp"])
+        self.assert_dict_contains(products["Apple Inc"], symbol="AAPL", isin="US0378331005")
+        self.assertEqual(ProductInfoRepository.get_products_info_by_name([]), {})
 
     def test_get_product_info_from_isin(self):
         """Test retrieving product ISINs."""
@@ -1,6 +1,7 @@
-from datetime import datetime
+import json
+from datetime import date, datetime
 
-from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroTransactions
+from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroProductInfo, DeGiroTransactions
 from stonks_overwatch.services.brokers.degiro.repositories.transactions_repository import TransactionsRepository
 from tests.stonks_overwatch.base_repository_test import BaseRepositoryTest
 
@@ -64,3 +65,34 @@ class TestTransactionsRepository(BaseRepositoryTest):
         self.model_class.objects.all().delete()
         last_movement = TransactionsRepository.get_last_movement()
         self.assertIsNone(last_movement)
+
+    def test_get_transactions_page_raw(self):
+        """Test paging the transactions with a keyset cursor and filters."""
+        with open("tests/resources/stonks_overwatch/repositories/degiro/product_info_data.json", "r") as file:
+            for value in json.load(file).values():
+                DeGiroProductInfo.objects.create(**value)
+        apple_buy = self.model_class.objects.get(id=188748018)
+        for transaction_id, product_id, day, buysell in [
+            (188748019, 331868, 12, "S"),
+            (188748020, 332111, 13, "B"),
+            (188748021, 999999, 14, "B"),  # Unknown product
+        ]:
+            apple_buy.pk = transaction_id
+            apple_buy.product_id = product_id
+            apple_buy.date = datetime.fromisoformat(f"2020-03-{day}T10:00:00Z")
+            apple_buy.buysell = buysell
+            apple_buy.save(force_insert=True)
+
+        first_page = TransactionsRepository.get_transactions_page_raw(limit=2)
+        second_page = TransactionsRepository.get_transactions_page_raw(limit=2, after_id=first_page[-1]["id"])
+        sells = TransactionsRepository.get_transactions_page_raw(limit=10, buysell="S")
+        apple = TransactionsRepository.get_transactions_page_raw(limit=10, symbol="aap", ascending=True)
+        by_date = TransactionsRepository.get_transactions_page_raw(
+            limit=10, start_date=date(2020, 3, 12), end_date=date(2020, 3, 12)
+        )
+
+        self.assertEqual([row["id"] for row in first_page], [188748020, 188748019])
+        self.assertEqual([row["id"] for row in second_page], [188748018])
+        self.assertEqual([row["id"] for row in sells], [188748019])
+        self.assertEqual([row["id"] for row in apple], [188748018, 188748019])
+        self.assertEqual([row["id"] for row in by_date], [188748019])
@@ -1,10 +1,12 @@
 import json
 import pathlib
+from datetime import date
 
 from isodate import parse_datetime
 
 from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroCashMovements, DeGiroProductInfo
 from stonks_overwatch.services.brokers.degiro.services.account_service import AccountOverviewService
+from stonks_overwatch.services.utilities.pagination import PageQuery
 
 import pytest
 from django.test import TestCase
@@ -78,3 +80,43 @@ class TestAccountOverviewService(TestCase):
         assert overview[2].currency == "EUR"
         assert overview[2].change == -200.0
         assert overview[2].formated_change() == "€ -200.00"
+
+    def test_get_account_overview_page_walks_history(self):
+        overview = self.account_overview.get_account_overview()
+
+        pages = [self.account_overview.get_account_overview_page(PageQuery(limit=4))]
+        while pages[-1].next_cursor is not None:
+            pages.append(
+                self.account_overview.get_account_overview_page(PageQuery(limit=4, cursor=pages[-1].next_cursor))
+            )
+
+        assert [len(page.items) for page in pages] == [4, 4, 1]
+        assert [entry.description for page in pages for entry in page.items] == [
+            entry.description for entry in overview
+        ]
+
+    def test_get_account_overview_page_with_offset(self):
+        page = self.account_overview.get_account_overview_page(PageQuery(limit=2, offset=7))
+
+        assert [entry.description for entry in page.items] == ["iDEAL Deposit", "iDEAL storting"]
+        assert page.next_cursor is None
+
+    def test_get_account_overview_page_filters(self):
+        by_type = self.account_overview.get_account_overview_page(PageQuery(type="cash_transaction", ascending=True))
+        by_symbol = self.account_overview.get_account_overview_page(PageQuery(symbol="aapl"))
+        by_date = self.account_overview.get_account_overview_page(
+            PageQuery(start_date=date(2024, 1, 1), end_date=date(2024, 9, 15))
+        )
+
+        assert [entry.description for entry in by_type.items] == [
+            "iDEAL storting",
+            "iDEAL Deposit",
+            "Dividend",
+            "Terugstorting",
+        ]
+        assert [entry.description for entry in by_symbol.items] == ["Koop 2 @ 100,000 EUR"]
+        assert [entry.description for entry in by_date.items] == [
+            "Terugstorting",
+            "Koop 2 @ 100,000 EUR",
+            "Storting mislukt; IDEAL@5.000 EUR",
+        ]
@@ -3,6 +3,9 @@ import pathlib
 
 from stonks_overwatch.services.brokers.degiro.client.constants import CurrencyFX
 from stonks_overwatch.services.brokers.degiro.repositories.models import DeGiroProductQuotation
+from stonks_overwatch.services.brokers.degiro.repositories.product_quotations_repository import (
+    ProductQuotationsRepository,
+)
 from stonks_overwatch.services.brokers.degiro.services.currency_service import (
     CurrencyConverterService,
     CurrencyMapEntry,
@@ -11,6 +14,7 @@ from stonks_overwatch.utils.core.localization import LocalizationUtility
 
 import pytest
 from django.test import TestCase
+from unittest.mock import patch
 
 
 @pytest.mark.django_db
@@ -80,3 +84,50 @@ class TestCurrencyConverterService(TestCase):
     def test_convert_usd_to_eur(self):
         result = self.currency_service.convert(1.0, "USD", "EUR")
         assert round(result, 3) == round(0.896, 3)
+
+    def test_convert_before_first_quotation_uses_fallback(self):
+        result = self.currency_service.convert(
+            1.0, "EUR", "USD", LocalizationUtility.convert_string_to_date("2000-01-03")
+        )
+        assert result > 0
+
+    def test_quotations_are_shared_and_invalidated(self):
+        other_service = CurrencyConverterService()
+        fx_date = LocalizationUtility.convert_string_to_date("2020-03-14")
+
+        with patch.object(
+            ProductQuotationsRepository,
+            "get_product_quotations",
+            wraps=ProductQuotationsRepository.get_product_quotations,
+        ) as mock_get_quotations:
+            self.currency_service.convert(1.0, "EUR", "USD", fx_date)
+            other_service.convert(1.0, "USD", "EUR", fx_date)
+            assert mock_get_quotations.call_count == 1
+
+            CurrencyConverterService.invalidate_quotations()
+            other_service.convert(1.0, "USD", "EUR", fx_date)
+            assert mock_get_quotations.call_count == 2
+
+    def test_convert_many(self):
+        fx_date = LocalizationUtility.convert_string_to_date("2020-03-14")
+        other_date = LocalizationUtility.convert_string_to_date("2000-01-03")
+        amounts = [1.0, 2.0, 10.0, 5.0, None, 3.0, 250.0]
+        currencies = ["USD", "USD", "EUR", "USD", "USD", "USD", "GBX"]
+        fx_dates = [fx_date, fx_date, fx_date, None, fx_date, other_date, fx_date]
+        CurrencyConverterService.invalidate_quotations()
+
+        with patch.object(
+            ProductQuotationsRepository,
+            "get_product_quotations",
+            wraps=ProductQuotationsRepository.get_product_quotations,
+        ) as mock_get_quotations:
+            result = self.currency_service.convert_many(amounts, currencies, "EUR", fx_dates)
+            # The quotations of each currency are loaded once for all its dates
+            assert mock_get_quotations.call_count == 1
+
+        expected = [
+            self.currency_service.convert(amount, currency, "EUR", day)
+            for amount, currency, day in zip(amounts, currencies, fx_dates, strict=True)
+        ]
+        assert result == pytest.approx(expected)
+        assert result[4] == 0.0
@@ -4,10 +4,10 @@ from datetime import date
 
 from degiro_connector.core.constants import urls
 from degiro_connector.core.exceptions import DeGiroConnectionError
-from degiro_connector.quotecast.models.chart import Interval
+from degiro_connector.quotecast.models.chart import Chart, Interval
 from degiro_connector.trading.models.credentials import Credentials
 
-from stonks_overwatch.services.brokers.degiro.client.degiro_client import CredentialsManager
+from stonks_overwatch.services.brokers.degiro.client.degiro_client import QUOTATION_SCHEMA, CredentialsManager
 from stonks_overwatch.utils.core.localization import LocalizationUtility
 from tests.stonks_overwatch.fixtures import (
     DeGiroServiceTest,
@@ -18,6 +18,7 @@ from tests.stonks_overwatch.fixtures import (
 
 import pook
 import pytest
+from unittest.mock import patch
 
 
 def test_credentials_manager_init(mock_degiro_config: mock_degiro_config, mock_full_credentials: mock_full_credentials):
@@ -171,6 +172,8 @@ def test_degiro_service_update_credentials(disable_requests_cache: disable_reque
             "statusText": "success",
         }
     )
+    # Client details are never served from the HTTP cache, so they need to be mocked as well
+    pook.get(urls.CLIENT_DETAILS).reply(200).json({"data": {"id": 98765, "intAccount": 1234567}})
 
     service.connect()
 
@@ -212,3 +215,75 @@ def test_get_product_quotation(
     assert quotes["2024-09-09"] == 220.91
     assert quotes["2024-10-04"] == 226.8
     assert quotes[today] == 226.8
+
+
+@pook.on
+def test_chart_fetcher_and_user_token_are_reused(
+    disable_requests_cache: disable_requests_cache, mock_full_credentials: mock_full_credentials
+):
+    manager = CredentialsManager(mock_full_credentials)
+    chart_data_file = pathlib.Path("tests/resources/stonks_overwatch/services/aapl-chart-fetcher.json")
+    with open(chart_data_file, "r") as file:
+        chart_data = f"vwd.hchart.seriesRequestManager.sync_response({file.read()})"
+
+    client_details_file = pathlib.Path("tests/resources/stonks_overwatch/services/client-details.json")
+    with open(client_details_file, "r") as file:
+        client_details = json.load(file)
+
+    pook.post(urls.LOGIN + "/totp").times(2).reply(200).json({"sessionId": "abcdefg12345"})
+    pook.get(urls.CLIENT_DETAILS).times(2).reply(200).json(client_details)
+    pook.get(urls.CHART).times(4).reply(200).json(chart_data)
+
+    service = DeGiroServiceTest(manager)
+    service.connect()
+
+    with patch.object(service, "get_client_details", wraps=service.get_client_details) as mock_client_details:
+        service.get_product_quotation("350015372", "US0378331005", Interval.P1M, "AAPL")
+        chart_fetcher = service._get_chart_fetcher()
+        service.get_product_quotation("350015372", "US0378331005", Interval.P1M, "AAPL")
+
+        assert service._get_chart_fetcher() is chart_fetcher
+        assert chart_fetcher.user_token == service._get_user_token()
+        assert mock_client_details.call_count == 1
+
+    # Reconnecting must drop the session bound state
+    service.connect()
+    assert service._chart_fetcher is None
+    assert service._user_token is None
+
+
+def test_get_product_daily_quotation_fills_missing_days(
+    mock_degiro_config: mock_degiro_config, mock_full_credentials: mock_full_credentials
+):
+    service = DeGiroServiceTest(CredentialsManager(mock_full_credentials))
+    chart = Chart(
+        end="2024-09-09T00:00:00",
+        requestid="1",
+        resolution="P1D",
+        start="2024-09-05T00:00:00",
+        series=[
+            {
+                "expires": "2024-10-06T11:16:47",
+                "data": {"issueId": 350015372},
+                "id": "issueid:350015372",
+                "type": "object",
+            },
+            {
+                "expires": "2024-10-06T11:16:47",
+                "data": [[0, 222.38], [1, 220.80], [4, 220.91]],
+                "id": "price:issueid:350015372",
+                "type": "time",
+                "times": "2024-09-05T00:00:00/P1D",
+            },
+        ],
+    )
+
+    with (
+        patch.object(service, "check_connection", return_value=True),
+        patch.object(service, "_get_chart", return_value=chart),
+    ):
+        quotes = service._get_product_daily_quotation("issueid", "350015372", Interval.P1M)
+
+    assert quotes.schema == QUOTATION_SCHEMA
+    assert quotes["date"].to_list() == [date(2024, 9, day) for day in range(5, 10)]
+    assert quotes["price"].to_list() == [222.38, 220.80, 220.80, 220.80, 220.91]
@@ -6,6 +6,7 @@ from isodate import parse_date, parse_datetime
 from stonks_overwatch.config.degiro import DegiroCredentials
 from stonks_overwatch.services.brokers.degiro.client.degiro_client import CredentialsManager
 from stonks_overwatch.services.brokers.degiro.repositories.models import (
+    DeGiroAgendaDividend,
     DeGiroCashMovements,
     DeGiroProductInfo,
     DeGiroProductQuotation,
@@ -15,13 +16,15 @@ from stonks_overwatch.services.brokers.degiro.services.account_service import Ac
 from stonks_overwatch.services.brokers.degiro.services.currency_service import CurrencyConverterService
 from stonks_overwatch.services.brokers.degiro.services.dividend_service import DividendsService
 from stonks_overwatch.services.brokers.degiro.services.portfolio_service import PortfolioService
-from stonks_overwatch.services.models import DividendType
+from stonks_overwatch.services.models import DividendType, PortfolioEntry
 from stonks_overwatch.utils.core.localization import LocalizationUtility
+from stonks_overwatch.utils.domain.constants import ProductType
 from tests.stonks_overwatch.fixtures import DeGiroServiceTest
 
 import pook
 import pytest
 from django.test import TestCase
+from unittest.mock import PropertyMock, patch
 
 
 @pytest.mark.django_db
@@ -138,3 +141,35 @@ class TestDividendsService(TestCase):
         assert upcoming_dividends[0].taxes == pytest.approx(2.78, rel=1e-2)
         assert upcoming_dividends[0].formated_net_amount() == "€ 15.81"
         assert upcoming_dividends[0].dividend_type == DividendType.ANNOUNCED
+
+    def test_get_forecasted_dividends(self):
+        DeGiroAgendaDividend.objects.create(
+            event_id=1,
+            isin="US5949181045",
+            ric="MSFT.OQ",
+            organization_name="Microsoft Corp",
+            date_time=parse_datetime("2020-03-12T14:00:00+02:00"),
+            last_update=parse_datetime("2020-03-01T14:00:00+02:00"),
+            country_code="US",
+            event_type="ExDividends",
+            ex_dividend_date=parse_datetime("2020-03-12T14:00:00+02:00"),
+            payment_date=parse_datetime("2020-03-14T14:00:00+02:00"),
+            dividend=0.5,
+            yield_value=1.0,
+            currency="USD",
+            market_cap="LARGE_CAP",
+        )
+        stock = {"product_type": ProductType.STOCK, "is_open": True}
+        portfolio = [
+            PortfolioEntry(name="Microsoft Corp", symbol="MSFT", isin="US5949181045", shares=10.0, **stock),
+            PortfolioEntry(name="Apple Inc", symbol="AAPL", isin="US0378331005", shares=5.0, **stock),
+        ]
+
+        with patch.object(PortfolioService, "get_portfolio", new_callable=PropertyMock, return_value=portfolio):
+            forecasted_dividends = self.dividends_service._get_forecasted_dividends()
+
+        assert len(forecasted_dividends) == 1
+        assert forecasted_dividends[0].dividend_type == DividendType.FORECASTED
+        assert forecasted_dividends[0].stock_symbol == "MSFT"
+        assert forecasted_dividends[0].currency == "EUR"
+        assert forecasted_dividends[0].amount == pytest.approx(self.currency_service.convert(5.0, "USD", "EUR"))
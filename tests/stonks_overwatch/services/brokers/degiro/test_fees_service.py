@@ -0,0 +1,101 @@
+import json
+import pathlib
+
+from isodate import parse_datetime
+
+from stonks_overwatch.services.brokers.degiro.descriptions import get_fee_type
+from stonks_overwatch.services.brokers.degiro.repositories.cash_movements_repository import CashMovementsRepository
+from stonks_overwatch.services.brokers.degiro.repositories.models import (
+    DeGiroCashMovements,
+    DeGiroProductInfo,
+    DeGiroTransactions,
+)
+from stonks_overwatch.services.brokers.degiro.services.fee_service import FeesService
+from stonks_overwatch.services.models import FeeType
+
+import pytest
+from django.test import TestCase
+from unittest.mock import MagicMock, patch
+
+
+@pytest.mark.parametrize(
+    "description, fee_type",
+    [
+        ("Spanish Transaction Tax", FeeType.FINANCE_TRANSACTION_TAX),
+        ("DEGIRO Aansluitingskosten 2024 (Euronext Amsterdam - EAM)", FeeType.CONNECTION),
+        ("ADR/GDR Weitergabegebühr", FeeType.ADR_GDR),
+        ("ADR/GDR Externe Kosten", FeeType.ADR_GDR),
+        ("iDEAL storting", None),
+        ("", None),
+    ],
+)
+def test_get_fee_type(description, fee_type):
+    assert get_fee_type(description) == fee_type
+
+
+@pytest.mark.django_db
+class TestFeesService(TestCase):
+    def setUp(self):
+        for file_name, model in (
+            ("product_info_data.json", DeGiroProductInfo),
+            ("transactions_data.json", DeGiroTransactions),
+        ):
+            data_file = pathlib.Path(f"tests/resources/stonks_overwatch/repositories/degiro/{file_name}")
+            with open(data_file, "r") as file:
+                for value in json.load(file).values():
+                    model.objects.create(**value)
+
+        self.create_cash_movement("2024-01-05T10:00:00Z", "Spanish Transaction Tax", -1.5)
+        self.create_cash_movement("2024-01-05T11:00:00Z", "Spanish Transaction Tax", -0.5)
+        self.create_cash_movement("2024-02-01T10:00:00Z", "DEGIRO Aansluitingskosten 2024", -2.5)
+        self.create_cash_movement("2024-02-02T10:00:00Z", "iDEAL storting", 1000.0)
+
+        self.fees_service = FeesService(degiro_service=MagicMock())
+
+    @staticmethod
+    def create_cash_movement(date: str, description: str, change: float):
+        fee_type = get_fee_type(description)
+        DeGiroCashMovements.objects.create(
+            date=parse_datetime(date),
+            value_date=parse_datetime(date),
+            description=description,
+            currency="EUR",
+            type="CASH_TRANSACTION",
+            change=change,
+            fee_type=fee_type.name if fee_type else None,
+        )
+
+    def test_get_account_fees(self):
+        fees = self.fees_service.get_account_fees()
+
+        assert [fee.type for fee in fees] == [
+            FeeType.CONNECTION,
+            FeeType.FINANCE_TRANSACTION_TAX,
+            FeeType.FINANCE_TRANSACTION_TAX,
+        ]
+        assert [fee.fee_value for fee in fees] == [-2.5, -0.5, -1.5]
+        assert all(fee.currency == "EUR" for fee in fees)
+
+    def test_get_fee_totals_matches_fees(self):
+        totals = self.fees_service.get_fee_totals()
+
+        assert totals[FeeType.FINANCE_TRANSACTION_TAX] == pytest.approx(-2.0)
+        assert totals[FeeType.CONNECTION] == pytest.approx(-2.5)
+        assert totals[FeeType.ADR_GDR] == 0.0
+        assert totals[FeeType.TRANSACTION] == pytest.approx(-2.980108825)
+
+        expected = dict.fromkeys(FeeType, 0.0)
+        for fee in self.fees_service.get_fees():
+            expected[fee.type] += fee.fee_value
+        assert totals == pytest.approx(expected)
+
+    def test_get_fee_totals_sums_the_given_fees(self):
+        fees = self.fees_service.get_account_fees()[:1]
+
+        with patch.object(CashMovementsRepository, "get_fee_totals_raw") as get_fee_totals_raw:
+            totals = self.fees_service.get_fee_totals(fees=fees)
+
+        get_fee_totals_raw.assert_not_called()
+        assert totals[FeeType.CONNECTION] == pytest.approx(-2.5)
+        assert totals[FeeType.FINANCE_TRANSACTION_TAX] == 0.0
+        assert totals[FeeType.TRANSACTION] == 0.0
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+import requests
+from degiro_connector.core.constants import urls
+
+from stonks_overwatch.services.brokers.degiro.client.http_cache import (
+    HttpCacheStats,
+    _record_cache_usage,
+    get_cache_policy,
+)
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    HttpCacheStats.reset()
+    yield
+    HttpCacheStats.reset()
+
+
+def _response(url: str, from_cache: bool | None = None) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    if from_cache is not None:
+        response.from_cache = from_cache
+    return response
+
+
+def test_cache_policy_per_endpoint():
+    assert get_cache_policy(urls.PRODUCT_SEARCH_STOCKS).expire_after == timedelta(hours=24)
+    assert get_cache_policy(urls.PRODUCT_SEARCH_LOOKUP).expire_after == timedelta(hours=24)
+    assert get_cache_policy(urls.PRODUCT_SEARCH_ETFS).expire_after == timedelta(hours=24)
+    assert get_cache_policy(urls.CHART).expire_after == timedelta(minutes=15)
+
+
+def test_live_account_and_price_endpoints_are_never_cached():
+    for url in [
+        urls.LOGIN,
+        urls.PRODUCTS_INFO,
+        urls.ACCOUNT_INFO,
+        urls.ACCOUNT_OVERVIEW,
+        urls.ORDERS_HISTORY,
+        urls.ORDER_CONFIRM,
+        None,
+    ]:
+        assert get_cache_policy(url) is None
+
+
+def test_cache_usage_is_counted_per_endpoint():
+    _record_cache_usage(_response(urls.CHART, from_cache=False))
+    _record_cache_usage(_response(urls.CHART, from_cache=True))
+    _record_cache_usage(_response(urls.CHART, from_cache=True))
+    _record_cache_usage(_response(urls.PRODUCT_SEARCH_LOOKUP))
+    _record_cache_usage(_response(urls.ACCOUNT_INFO, from_cache=False))
+
+    assert HttpCacheStats.snapshot() == {
+        "charts": {"hits": 2, "misses": 1},
+        "product_search": {"hits": 0, "misses": 1},
+    }
+
+
+def test_log_summary_resets_the_counters():
+    _record_cache_usage(_response(urls.CHART, from_cache=True))
+
+    HttpCacheStats.log_summary()
+
+    assert HttpCacheStats.snapshot() == {}
@@ -0,0 +1,34 @@
+from stonks_overwatch.services.brokers.degiro.services.update_service import UpdateService
+
+
+def test_transform_cash_movements():
+    cash_movements = [
+        {
+            "id": 2,
+            "date": "2024-01-02T10:00:00+01:00",
+            "productId": 331868,
+            "change": -120.5,
+            "exchangeRate": 1.05,
+            "orderId": "abc-def",
+            "balance": {"unsettledCash": 0.0, "flatexCash": 10.0, "total": 10.0},
+        },
+        {
+            "id": 1,
+            "date": "2024-01-01T10:00:00+01:00",
+            "change": 100.0,
+            "balance": {"unsettledCash": 0.0, "flatexCash": 100.0, "total": 100.0},
+        },
+    ]
+
+    rows = UpdateService._transform_cash_movements(cash_movements).to_dicts()
+
+    assert [row["id"] for row in rows] == ["1", "2"]
+    assert rows[0]["productId"] is None
+    assert rows[0]["change"] == "100.0"
+    assert rows[0]["balance_total"] == 100.0
+    assert rows[1]["productId"] == "331868"
+    assert rows[1]["change"] == "-120.5"
+    assert rows[1]["exchangeRate"] == "1.05"
+    assert rows[1]["orderId"] == "abc-def"
+    assert rows[1]["balance_flatexCash"] == 10.0
+    assert "balance" not in rows[1]
@@ -0,0 +1,56 @@
+"""Tests for the IBKR net cash flows."""
+
+from datetime import date
+
+from stonks_overwatch.services.brokers.ibkr.cash_flows import CashFlow, net_cash_flows
+
+
+def _performance(start_nav: float, dates: list[str], navs: list[float], returns: list[float]) -> dict:
+    return {
+        "nav": {
+            "data": [
+                {
+                    "id": "U1234567",
+                    "baseCurrency": "EUR",
+                    "startNAV": {"date": "20231229", "val": start_nav},
+                    "navs": navs,
+                }
+            ],
+            "dates": dates,
+            "freq": "D",
+        },
+        "cps": {"data": [{"id": "U1234567", "returns": returns}], "dates": dates, "freq": "D"},
+    }
+
+
+def test_net_cash_flows_ignores_market_moves():
+    performance = _performance(1000.0, ["20240102", "20240103"], [1010.0, 1005.0], [0.01, 0.005])
+
+    assert net_cash_flows(performance, "U1234567") == []
+
+
+def test_net_cash_flows_returns_deposits_and_withdrawals():
+    # +1% on the first day plus a deposit of 500, flat second day with a withdrawal of 200
+    performance = _performance(1000.0, ["20240102", "20240103"], [1510.0, 1310.0], [0.01, 0.01])
+
+    flows = net_cash_flows(performance, "U1234567")
+
+    assert [(flow.date, round(flow.amount, 2)) for flow in flows] == [
+        (date(2024, 1, 2), 500.0),
+        (date(2024, 1, 3), -200.0),
+    ]
+    assert all(flow.currency == "EUR" for flow in flows)
+
+
+def test_net_cash_flows_includes_the_opening_balance():
+    performance = _performance(1000.0, ["20240102"], [1010.0], [0.01])
+
+    assert net_cash_flows(performance, "U1234567", include_start=True) == [
+        CashFlow(date=date(2024, 1, 2), amount=1000.0, currency="EUR", opening=True)
+    ]
+
+
+def test_net_cash_flows_for_unknown_account():
+    performance = _performance(1000.0, ["20240102"], [1510.0], [0.01])
+
+    assert net_cash_flows(performance, "U7654321") == []
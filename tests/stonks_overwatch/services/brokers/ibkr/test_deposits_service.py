@@ -0,0 +1,65 @@
+"""Tests for the IBKR deposits service."""
+
+from datetime import date
+from decimal import Decimal
+
+from stonks_overwatch.services.brokers.ibkr.repositories.models import IBKRCashTransfer
+from stonks_overwatch.services.brokers.ibkr.services.deposits import DepositsService
+from stonks_overwatch.services.brokers.ibkr.services.ibkr_base_service import IbkrBaseService
+from stonks_overwatch.services.models import DepositType
+
+import pytest
+from django.test import TestCase
+from unittest.mock import MagicMock, patch
+
+
+@pytest.mark.django_db
+class TestIbkrDepositsService(TestCase):
+    def setUp(self):
+        for id, day, amount, description in [
+            ("U1_20240102_start", date(2024, 1, 2), "1000.00", "Opening balance"),
+            ("U1_20240110", date(2024, 1, 10), "500.00", "Deposit"),
+            ("U1_20240120", date(2024, 1, 20), "-200.00", "Withdrawal"),
+        ]:
+            IBKRCashTransfer.objects.create(
+                id=id, acct_id="U1", date=day, currency="EUR", amount=Decimal(amount), description=description
+            )
+        self.service = DepositsService()
+
+    def test_get_cash_deposits(self):
+        with patch.object(IbkrBaseService, "base_currency", "EUR"):
+            deposits = self.service.get_cash_deposits()
+
+        assert [deposit.datetime_as_date() for deposit in deposits] == ["2024-01-20", "2024-01-10", "2024-01-02"]
+        assert [deposit.type for deposit in deposits] == [
+            DepositType.WITHDRAWAL,
+            DepositType.DEPOSIT,
+            DepositType.DEPOSIT,
+        ]
+        assert [deposit.change for deposit in deposits] == [-200.0, 500.0, 1000.0]
+        assert deposits[0].currency == "EUR"
+        assert deposits[2].description == "Opening balance"
+
+    def test_calculate_cash_account_value(self):
+        with patch.object(IbkrBaseService, "base_currency", "EUR"):
+            cash_account = self.service.calculate_cash_account_value()
+
+        assert cash_account == {
+            "2024-01-02": 1000.0,
+            "2024-01-10": 1500.0,
+            "2024-01-20": 1300.0,
+        }
+
+    def test_get_cash_deposits_converts_to_the_base_currency(self):
+        converter = MagicMock()
+        converter.convert.side_effect = lambda amount, currency, new_currency, date: amount * 1.1
+
+        with (
+            patch.object(IbkrBaseService, "base_currency", "USD"),
+            patch.object(IbkrBaseService, "currency_converter", converter),
+        ):
+            deposits = self.service.get_cash_deposits()
+
+        assert [deposit.change for deposit in deposits] == pytest.approx([-220.0, 550.0, 1100.0])
+        assert {deposit.currency for deposit in deposits} == {"USD"}
+        converter.convert.assert_any_call(500.0, "EUR", "USD", date=date(2024, 1, 10))
@@ -0,0 +1,141 @@
+"""Tests for the IBKR portfolio service."""
+
+from datetime import date, datetime, timezone as dt_tz
+from decimal import Decimal
+
+from stonks_overwatch.services.brokers.ibkr.repositories.models import (
+    IBKRCashTransfer,
+    IBKRPosition,
+    IBKRProductQuotation,
+    IBKRTransactions,
+)
+from stonks_overwatch.services.brokers.ibkr.services.ibkr_base_service import IbkrBaseService
+from stonks_overwatch.services.brokers.ibkr.services.portfolio import PortfolioService
+
+import pytest
+from django.test import TestCase
+from unittest.mock import MagicMock, patch
+
+
+def _trade(conid: int, day: date, trade_type: str, qty: str, price: str) -> IBKRTransactions:
+    trade_date = datetime(day.year, day.month, day.day, 15, 0, tzinfo=dt_tz.utc)
+    return IBKRTransactions.objects.create(
+        id=f"{conid}_{int(trade_date.timestamp())}",
+        acct_id="U1",
+        conid=conid,
+        date=trade_date,
+        cur="EUR",
+        pr=Decimal(price),
+        qty=Decimal(qty),
+        amt=Decimal(qty) * Decimal(price),
+        type=trade_type,
+        desc=trade_type,
+    )
+
+
+@pytest.mark.django_db
+@patch("stonks_overwatch.services.brokers.ibkr.services.portfolio.IbkrService")
+class TestIbkrHistoricalValue(TestCase):
+    def setUp(self):
+        # 10 shares held before the stored trades, 5 bought on the 9th
+        IBKRPosition.objects.create(conid=1, acct_id="U1", contract_desc="AAA", position=Decimal("15"), currency="EUR")
+        _trade(1, date(2024, 1, 9), "Buy", "5", "11")
+        # Fully sold on the 10th
+        _trade(2, date(2024, 1, 8), "Buy", "2", "50")
+        _trade(2, date(2024, 1, 10), "Sell", "-2", "55")
+        IBKRCashTransfer.objects.create(
+            id="U1_20240105_start",
+            acct_id="U1",
+            date=date(2024, 1, 5),
+            currency="EUR",
+            amount=Decimal("1000"),
+            description="Opening balance",
+        )
+        IBKRTransactions.objects.create(
+            id="1_dividend",
+            acct_id="U1",
+            conid=1,
+            date=datetime(2024, 1, 11, 9, 0, tzinfo=dt_tz.utc),
+            cur="EUR",
+            amt=Decimal("3"),
+            type="Dividend Payment",
+            desc="Dividend",
+        )
+        IBKRProductQuotation.objects.create(
+            conid=1,
+            interval="1d",
+            last_import=datetime(2024, 1, 12, tzinfo=dt_tz.utc),
+            quotations={"2024-01-05": 10.0, "2024-01-08": 10.0, "2024-01-09": 11.0, "2024-01-10": 12.0},
+            complete_through=date(2024, 1, 11),
+        )
+
+    def test_calculate_product_growth(self, _mock_ibkr_service):
+        product_growth = PortfolioService().calculate_product_growth()
+
+        assert product_growth == {
+            1: {"currency": "EUR", "history": {"2024-01-05": 15.0 - 5.0, "2024-01-09": 15.0}},
+            2: {"currency": "EUR", "history": {"2024-01-08": 2.0, "2024-01-10": 0.0}},
+        }
+
+    @patch("stonks_overwatch.services.brokers.ibkr.services.portfolio.timezone.now")
+    def test_calculate_historical_value(self, mock_now, _mock_ibkr_service):
+        mock_now.return_value = datetime(2024, 1, 11, 12, 0, tzinfo=dt_tz.utc)
+        service = PortfolioService()
+
+        with patch.object(PortfolioService, "base_currency", "EUR"):
+            values = service.calculate_historical_value()
+
+        # The opening balance paid the 10 shares held before the trades, the rest is cash
+        cash = 1000.0 - 100.0
+        assert [(entry["x"], entry["y"]) for entry in values] == [
+            ("2024-01-05", 100.0 + cash),
+            # Weekend skipped. Contract 2 is valued with its trade price
+            ("2024-01-08", 100.0 + 2 * 50.0 + cash - 100.0),
+            ("2024-01-09", 15 * 11.0 + 2 * 50.0 + cash - 100.0 - 55.0),
+            ("2024-01-10", 15 * 12.0 + cash - 100.0 - 55.0 + 110.0),
+            # No bar yet, the last known close is used. A dividend is paid
+            ("2024-01-11", 15 * 12.0 + cash - 100.0 - 55.0 + 110.0 + 3.0),
+        ]
+
+    @patch("stonks_overwatch.services.brokers.ibkr.services.portfolio.timezone.now")
+    def test_calculate_historical_value_converts_transfers_and_dividends(self, mock_now, _mock_ibkr_service):
+        mock_now.return_value = datetime(2024, 1, 11, 12, 0, tzinfo=dt_tz.utc)
+        IBKRCashTransfer.objects.update(currency="USD", amount=Decimal("2000"))
+        IBKRTransactions.objects.filter(id="1_dividend").update(cur="USD", amt=Decimal("6"))
+        converter = MagicMock()
+        converter.convert.side_effect = lambda amount, currency, new_currency, date: amount / 2
+        service = PortfolioService()
+
+        with (
+            patch.object(IbkrBaseService, "base_currency", "EUR"),
+            patch.object(IbkrBaseService, "currency_converter", converter),
+        ):
+            values = service.calculate_historical_value()
+
+        cash = 1000.0 - 100.0
+        assert values[0] == {"x": "2024-01-05", "y": 100.0 + cash}
+        assert values[-1] == {"x": "2024-01-11", "y": 15 * 12.0 + cash - 100.0 - 55.0 + 110.0 + 3.0}
+
+    @patch("stonks_overwatch.services.brokers.ibkr.services.portfolio.timezone.now")
+    def test_calculate_historical_value_without_cash_transfers(self, mock_now, _mock_ibkr_service):
+        mock_now.return_value = datetime(2024, 1, 11, 12, 0, tzinfo=dt_tz.utc)
+        IBKRCashTransfer.objects.all().delete()
+        service = PortfolioService()
+
+        with patch.object(PortfolioService, "base_currency", "EUR"):
+            values = service.calculate_historical_value()
+
+        # Only the positions are valued, from the first trade
+        assert [(entry["x"], entry["y"]) for entry in values] == [
+            ("2024-01-08", 10 * 10.0 + 2 * 50.0),
+            ("2024-01-09", 15 * 11.0 + 2 * 50.0),
+            ("2024-01-10", 15 * 12.0),
+            ("2024-01-11", 15 * 12.0),
+        ]
+
+    def test_calculate_historical_value_without_history(self, _mock_ibkr_service):
+        IBKRPosition.objects.all().delete()
+        IBKRTransactions.objects.all().delete()
+        IBKRCashTransfer.objects.all().delete()
+
+        assert PortfolioService().calculate_historical_value() == []
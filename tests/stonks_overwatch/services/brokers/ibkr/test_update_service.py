@@ -0,0 +1,208 @@
+"""Tests for the IBKR update service."""
+
+import copy
+from datetime import date, datetime, timezone as dt_tz
+from decimal import Decimal
+
+from stonks_overwatch.services.brokers.ibkr.client.ibkr_service import IbkrService
+from stonks_overwatch.services.brokers.ibkr.repositories.models import (
+    IBKRCashTransfer,
+    IBKRPosition,
+    IBKRProductQuotation,
+    IBKRTransactions,
+)
+from stonks_overwatch.services.brokers.ibkr.services.update_service import UpdateService
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+YESTERDAY = date(2024, 1, 14)
+
+PERFORMANCE = {
+    "nav": {
+        "data": [
+            {
+                "id": "U1234567",
+                "baseCurrency": "EUR",
+                "startNAV": {"date": "20231229", "val": 1000.0},
+                "navs": [1510.0, 1310.0],
+            }
+        ],
+        "dates": ["20240102", "20240103"],
+        "freq": "D",
+    },
+    "cps": {"data": [{"id": "U1234567", "returns": [0.01, 0.01]}], "dates": ["20240102", "20240103"], "freq": "D"},
+}
+
+
+def _make_service() -> UpdateService:
+    service = UpdateService.__new__(UpdateService)
+    service.ibkr_service = MagicMock()
+    service.ibkr_service.account.account_id = "U1234567"
+    service.ibkr_service.convert_date.side_effect = IbkrService.convert_date
+    service.logger = MagicMock()
+    service.debug_mode = False
+    service._injected_config = None
+    service._global_config = None
+    return service
+
+
+@pytest.mark.django_db
+def test_update_cash_transfers_stores_the_opening_balance_on_the_first_import():
+    service = _make_service()
+    service.ibkr_service.get_account_performance.return_value = PERFORMANCE
+
+    service.update_cash_transfers()
+
+    service.ibkr_service.get_account_performance.assert_called_once_with("1Y")
+    transfers = {transfer.id: transfer for transfer in IBKRCashTransfer.objects.all()}
+    assert set(transfers) == {"U1234567_20240102_start", "U1234567_20240102", "U1234567_20240103"}
+    assert transfers["U1234567_20240102_start"].amount == Decimal("1000")
+    assert transfers["U1234567_20240102"].amount == Decimal("500")
+    assert transfers["U1234567_20240103"].description == "Withdrawal"
+    assert transfers["U1234567_20240103"].date == date(2024, 1, 3)
+
+
+@pytest.mark.django_db
+def test_update_cash_transfers_overwrites_the_imported_days():
+    service = _make_service()
+    service.ibkr_service.get_account_performance.return_value = PERFORMANCE
+
+    service.update_cash_transfers()
+    service.update_cash_transfers()
+
+    assert IBKRCashTransfer.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_update_cash_transfers_drops_the_days_without_flow_in_the_imported_window():
+    service = _make_service()
+    service.ibkr_service.get_account_performance.return_value = PERFORMANCE
+    service.update_cash_transfers()
+
+    # The NAV of the 2nd is now explained by the return, so there is no flow that day anymore
+    performance = copy.deepcopy(PERFORMANCE)
+    performance["nav"]["data"][0]["navs"] = [1010.0, 810.0]
+    service.ibkr_service.get_account_performance.return_value = performance
+    service._history_changed_since = None
+    service.update_cash_transfers()
+
+    # The dropped transfer changes the deposits of the snapshots since that day
+    assert service._history_changed_since == date(2024, 1, 2)
+    transfers = {transfer.id: transfer for transfer in IBKRCashTransfer.objects.all()}
+    assert set(transfers) == {"U1234567_20240102_start", "U1234567_20240103"}
+    assert transfers["U1234567_20240102_start"].description == "Opening balance (estimated)"
+
+
+def test_get_import_start_for_open_position():
+    assert UpdateService._get_import_start({"2024-01-09": 10.0}, None, YESTERDAY) == date(2024, 1, 9)
+
+
+def test_get_import_start_after_the_stored_bars():
+    stored = IBKRProductQuotation(conid=1, complete_through=date(2024, 1, 12))
+
+    assert UpdateService._get_import_start({"2024-01-09": 10.0}, stored, YESTERDAY) == date(2024, 1, 13)
+
+    stored.complete_through = YESTERDAY
+    assert UpdateService._get_import_start({"2024-01-09": 10.0}, stored, YESTERDAY) is None
+
+
+def test_get_import_start_for_closed_position():
+    history = {"2024-01-09": 10.0, "2024-01-11": 0.0}
+    stored = IBKRProductQuotation(conid=1, complete_through=date(2024, 1, 11))
+
+    assert UpdateService._get_import_start(history, None, YESTERDAY) == date(2024, 1, 9)
+    assert UpdateService._get_import_start(history, stored, YESTERDAY) is None
+
+
+def test_get_period():
+    assert UpdateService._get_period(date(2024, 1, 13), date(2024, 1, 15)) == "3d"
+    assert UpdateService._get_period(date(2020, 1, 1), date(2024, 1, 15)) == "5y"
+
+
+@pytest.mark.django_db
+@patch("stonks_overwatch.services.brokers.ibkr.services.update_service.timezone.now")
+@patch("stonks_overwatch.services.brokers.ibkr.services.update_service.PortfolioService")
+def test_update_quotations_requests_the_missing_bars_once_per_period(mock_portfolio_class, mock_now):
+    mock_now.return_value = datetime(2024, 1, 15, 12, 0, tzinfo=dt_tz.utc)
+    mock_portfolio_class.return_value.calculate_product_growth.return_value = {
+        1: {"currency": "USD", "history": {"2024-01-09": 10.0}},
+        2: {"currency": "USD", "history": {"2024-01-09": 5.0}},
+        3: {"currency": "EUR", "history": {"2024-01-09": 5.0}},
+    }
+    IBKRProductQuotation.objects.create(
+        conid=3,
+        interval="1d",
+        last_import=datetime(2024, 1, 13, tzinfo=dt_tz.utc),
+        quotations={"2024-01-12": 20.0},
+        complete_through=date(2024, 1, 12),
+    )
+    service = _make_service()
+    service.ibkr_service.get_daily_bars.side_effect = [
+        {1: {"2024-01-09": 100.0, "2024-01-15": 101.0}, 2: {"2024-01-09": 50.0}},
+        {3: {"2024-01-13": 21.0}},
+    ]
+
+    service.update_quotations()
+
+    assert service.ibkr_service.get_daily_bars.call_args_list[0].args == ([1, 2], "7d")
+    assert service.ibkr_service.get_daily_bars.call_args_list[1].args == ([3], "3d")
+    quotations = {quotation.conid: quotation for quotation in IBKRProductQuotation.objects.all()}
+    # Today's bar is not stored
+    assert quotations[1].quotations == {"2024-01-09": 100.0}
+    assert quotations[3].quotations == {"2024-01-12": 20.0, "2024-01-13": 21.0}
+    assert quotations[3].complete_through == YESTERDAY
+
+
+def _transaction(conid: int, day: str, qty: float) -> dict:
+    return {
+        "acctid": "U1234567",
+        "conid": conid,
+        "date": day,
+        "cur": "EUR",
+        "fxRate": 1,
+        "pr": 10.0,
+        "qty": qty,
+        "amt": -10.0 * qty,
+        "type": "Buy",
+        "desc": "Buy",
+    }
+
+
+@pytest.mark.django_db
+@patch("stonks_overwatch.services.brokers.ibkr.services.update_service.timezone.now")
+def test_update_transactions_requests_only_the_new_days(mock_now):
+    mock_now.return_value = datetime(2024, 1, 15, 12, 0, tzinfo=dt_tz.utc)
+    for conid in [1, 2]:
+        IBKRPosition.objects.create(conid=conid, acct_id="U1234567", contract_desc=f"C{conid}", currency="EUR")
+    IBKRTransactions.objects.create(
+        id="1_1704790800",
+        acct_id="U1234567",
+        conid=1,
+        date=datetime(2024, 1, 9, 9, 0, tzinfo=dt_tz.utc),
+        cur="EUR",
+        amt=Decimal("-50"),
+        qty=Decimal("5"),
+        type="Buy",
+        desc="Buy",
+    )
+    service = _make_service()
+    service.ibkr_service.transaction_histories.return_value = {
+        1: {
+            "transactions": [
+                _transaction(1, "2024-01-09 09:00:00 UTC", 6),
+                _transaction(1, "2024-01-12 09:00:00 UTC", 1),
+            ]
+        },
+        2: RuntimeError("Too many requests"),
+    }
+
+    with patch.object(UpdateService, "base_currency", "EUR"):
+        service.update_transactions()
+
+    service.ibkr_service.transaction_histories.assert_called_once_with({1: 7, 2: None}, "EUR")
+    transactions = {transaction.id: transaction for transaction in IBKRTransactions.objects.all()}
+    assert set(transactions) == {"1_1704790800", "1_1705050000"}
+    # The stored transaction is updated
+    assert transactions["1_1704790800"].qty == Decimal("6")
+    service.logger.error.assert_called_once()
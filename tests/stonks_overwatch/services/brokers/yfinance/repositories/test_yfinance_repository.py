@@ -57,6 +57,13 @@ class TestYFinanceRepository(TestCase):
         self.assertEqual(info["symbol"], "AAPL")
         self.assertEqual(info["country"], "United States")
 
+    def test_get_ticker_infos_in_batch(self):
+        """Test retrieving the ticker info of several symbols at once."""
+        infos = YFinanceRepository.get_ticker_infos(["AAPL", "MSFT", "UNKNOWN"])
+        self.assertEqual(set(infos.keys()), {"AAPL", "MSFT"})
+        self.assertEqual(infos["AAPL"]["symbol"], "AAPL")
+        self.assertEqual(YFinanceRepository.get_ticker_infos([]), {})
+
     def test_get_unknown_symbol(self):
         """Test retrieving ticker info for an unknown symbol."""
         info = YFinanceRepository.get_ticker_info("XXX")
@@ -394,3 +394,35 @@ def test_get_name_returns_none_when_ticker_info_unavailable(
     result = yfinance_service.get_name("UNKNOWN")
 
     assert result is None
+
+
+# ---------------------------------------------------------------------------
+# Batch ticker info tests
+# ---------------------------------------------------------------------------
+
+
+def test_get_stored_ticker_infos_never_calls_yfinance(yfinance_service, mock_yfinance_client, mock_yfinance_repository):
+    """Test that the batch lookup only reads the repository, once."""
+    mock_yfinance_repository.get_ticker_infos.return_value = {"AAPL": {"longName": "Apple Inc."}}
+
+    result = yfinance_service.get_stored_ticker_infos(["AAPL", "MSFT", "AAPL", ""])
+
+    assert result == {"AAPL": {"longName": "Apple Inc."}}
+    mock_yfinance_repository.get_ticker_infos.assert_called_once_with({"AAPL", "MSFT"})
+    mock_yfinance_client.get_ticker.assert_not_called()
+
+
+def test_update_ticker_infos_fetches_each_missing_symbol_once(
+    yfinance_service, mock_yfinance_client, mock_yfinance_repository
+):
+    """Test that only the symbols without stored info are fetched, once each."""
+    mock_yfinance_repository.get_ticker_infos.return_value = {"AAPL": {"longName": "Apple Inc."}}
+    mock_ticker = MagicMock()
+    mock_ticker.info = {"longName": "Microsoft Corporation"}
+    mock_yfinance_client.get_ticker.return_value = mock_ticker
+
+    fetched = yfinance_service.update_ticker_infos(["AAPL", "MSFT", "MSFT", None])
+
+    assert fetched == 1
+    mock_yfinance_client.get_ticker.assert_called_once_with("MSFT")
+    mock_yfinance_repository.save_ticker_info.assert_called_once_with("MSFT", {"longName": "Microsoft Corporation"})
@@ -17,6 +17,7 @@ from stonks_overwatch.services.models import (
 from stonks_overwatch.utils.domain.constants import ProductType, Sector
 
 import pytest
+from unittest.mock import patch
 
 
 def test_portfolio_ids():
@@ -136,6 +137,28 @@ def test_country_by_name():
     assert country.get_flag() == "🇳🇱"
 
 
+@pytest.mark.parametrize(
+    "name, iso_code",
+    [
+        ("United States", "US"),
+        ("Korea, Republic of", "KR"),
+        ("South Korea", "KR"),
+        ("Kingdom of the Netherlands", "NL"),
+        ("Turkey", "TR"),
+        ("Netherlands (the)", "NL"),
+        ("united kingdom", "GB"),
+    ],
+)
+def test_country_by_name_exact_match(name, iso_code):
+    with patch("stonks_overwatch.services.models.pycountry.countries.search_fuzzy") as search_fuzzy:
+        assert Country(name).iso_code == iso_code
+    search_fuzzy.assert_not_called()
+
+
+def test_country_by_name_fuzzy_fallback():
+    assert Country("Bosnia").iso_code == "BA"
+
+
 def test_default_portfolio_entry():
     model = PortfolioEntry()
 
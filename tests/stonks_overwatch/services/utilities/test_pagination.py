@@ -0,0 +1,98 @@
+from datetime import date
+
+from django.http import QueryDict
+
+from stonks_overwatch.services.utilities.pagination import (
+    MAX_PAGE_SIZE,
+    PageQuery,
+    decode_cursor,
+    encode_cursor,
+    page_query_from_params,
+    paginate,
+)
+
+ENTRIES = [
+    {"date": date(2024, 1, day), "symbol": symbol, "type": entry_type}
+    for day, symbol, entry_type in [
+        (1, "AAPL", "Buy"),
+        (2, "MSFT", "Buy"),
+        (3, "AAPL", "Sell"),
+        (4, "GOOGL", "Buy"),
+        (5, "AAPL", "Buy"),
+    ]
+]
+
+
+def _paginate(query: PageQuery):
+    return paginate(
+        ENTRIES,
+        query,
+        entry_date=lambda k: k["date"],
+        entry_symbol=lambda k: k["symbol"],
+        entry_type=lambda k: k["type"],
+        sort_key=lambda k: k["date"],
+    )
+
+
+def test_paginate_walks_the_entries_with_the_cursor():
+    first = _paginate(PageQuery(limit=2))
+    second = _paginate(PageQuery(limit=2, cursor=first.next_cursor))
+    last = _paginate(PageQuery(limit=2, cursor=second.next_cursor))
+
+    assert [entry["date"].day for entry in first.items] == [5, 4]
+    assert [entry["date"].day for entry in second.items] == [3, 2]
+    assert [entry["date"].day for entry in last.items] == [1]
+    assert last.next_cursor is None
+    assert first.item_cursors == ["1", "2"]
+
+
+def test_paginate_filters_and_sorts():
+    page = _paginate(PageQuery(symbol="aap", type="buy", ascending=True))
+
+    assert [entry["date"].day for entry in page.items] == [1, 5]
+    assert page.next_cursor is None
+
+
+def test_paginate_filters_by_date_range():
+    page = _paginate(PageQuery(start_date=date(2024, 1, 2), end_date=date(2024, 1, 4)))
+
+    assert [entry["date"].day for entry in page.items] == [4, 3, 2]
+
+
+def test_paginate_uses_offset_without_cursor():
+    page = _paginate(PageQuery(limit=2, offset=3))
+
+    assert [entry["date"].day for entry in page.items] == [2, 1]
+
+
+def test_cursor_round_trip():
+    positions = {"degiro": "42", "bitvavo": None}
+
+    assert decode_cursor(encode_cursor(positions)) == positions
+    assert decode_cursor("not a cursor") == {}
+    assert decode_cursor(None) == {}
+
+
+def test_page_query_from_params():
+    query = page_query_from_params(
+        QueryDict("limit=25&cursor=abc&start_date=2024-01-01&end_date=2024-12-31&symbol=+AAPL+&type=Buy&order=asc")
+    )
+
+    assert query == PageQuery(
+        limit=25,
+        cursor="abc",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        symbol="AAPL",
+        type="Buy",
+        ascending=True,
+    )
+
+
+def test_page_query_from_invalid_params():
+    query = page_query_from_params(QueryDict(f"limit={MAX_PAGE_SIZE + 1}&offset=-5&start_date=yesterday"))
+
+    assert query.limit == MAX_PAGE_SIZE
+    assert query.offset == 0
+    assert query.start_date is None
+    assert query.ascending is False
@@ -0,0 +1,35 @@
+from stonks_overwatch.middleware.request_services import RequestServicesMiddleware
+from stonks_overwatch.services.models import PortfolioId
+from stonks_overwatch.services.utilities.request_services import RequestServices
+
+from django.test import RequestFactory
+from unittest.mock import MagicMock, patch
+
+
+def test_middleware_attaches_services_to_request():
+    request = RequestFactory().get("/")
+    middleware = RequestServicesMiddleware(lambda req: RequestServices.for_request(req))
+
+    services = middleware(request)
+
+    assert isinstance(services, RequestServices)
+    assert RequestServices.for_request(request) is services
+
+
+def test_portfolio_is_computed_once_per_request():
+    request = RequestFactory().get("/")
+    aggregator = MagicMock()
+
+    with patch(
+        "stonks_overwatch.services.utilities.request_services.PortfolioAggregatorService", return_value=aggregator
+    ) as mock_aggregator_class:
+        services = RequestServices.for_request(request)
+        portfolio = services.get_portfolio(PortfolioId.ALL)
+        total = services.get_portfolio_total(PortfolioId.ALL)
+
+        assert services.get_portfolio(PortfolioId.ALL) is portfolio
+        assert RequestServices.for_request(request).get_portfolio_total(PortfolioId.ALL) is total
+
+    mock_aggregator_class.assert_called_once()
+    aggregator.get_portfolio.assert_called_once_with(PortfolioId.ALL)
+    aggregator.get_portfolio_total.assert_called_once_with(PortfolioId.ALL)
@@ -0,0 +1,74 @@
+from stonks_overwatch.services.utilities.ttl_snapshot import TtlSnapshot, TtlSnapshotMap
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+def test_get_loads_once_within_ttl():
+    snapshot = TtlSnapshot(ttl_seconds=30)
+    loader = Mock(return_value={"BTC-EUR": 75398.0})
+
+    assert snapshot.get(loader) == {"BTC-EUR": 75398.0}
+    assert snapshot.get(loader) == {"BTC-EUR": 75398.0}
+    loader.assert_called_once()
+
+
+def test_get_reloads_after_ttl():
+    snapshot = TtlSnapshot(ttl_seconds=30)
+    loader = Mock(side_effect=[1, 2])
+
+    with patch("stonks_overwatch.services.utilities.ttl_snapshot.time.monotonic", side_effect=[0.0, 31.0, 31.0]):
+        assert snapshot.get(loader) == 1
+        assert snapshot.get(loader) == 2
+
+
+def test_refresh_and_invalidate():
+    snapshot = TtlSnapshot(ttl_seconds=30)
+    loader = Mock(side_effect=[1, 2, 3])
+
+    assert snapshot.get(loader) == 1
+    assert snapshot.refresh(loader) == 2
+    snapshot.invalidate()
+    assert snapshot.get(loader) == 3
+
+
+def test_failed_load_is_not_stored():
+    snapshot = TtlSnapshot(ttl_seconds=30)
+
+    with pytest.raises(RuntimeError):
+        snapshot.get(Mock(side_effect=RuntimeError("unavailable")))
+
+    assert snapshot.get(Mock(return_value=1)) == 1
+
+
+def test_ttl_of_the_loaded_value():
+    snapshot = TtlSnapshot(ttl_seconds=lambda value: 30 if value else 5)
+    loader = Mock(side_effect=[0, 1, 2])
+
+    with patch("stonks_overwatch.services.utilities.ttl_snapshot.time.monotonic", side_effect=[0.0, 6.0, 6.0, 30.0]):
+        assert snapshot.get(loader) == 0
+        # The empty value expired after 5 seconds, the next one lasts 30
+        assert snapshot.get(loader) == 1
+        assert snapshot.get(loader) == 1
+
+
+def test_peek_returns_the_expired_value():
+    snapshot = TtlSnapshot(ttl_seconds=30)
+    loader = Mock(return_value=1)
+
+    assert snapshot.peek() is None
+    with patch("stonks_overwatch.services.utilities.ttl_snapshot.time.monotonic", side_effect=[0.0]):
+        snapshot.get(loader)
+    assert snapshot.peek() == 1
+    loader.assert_called_once()
+
+
+def test_snapshot_map_loads_each_key_once_until_invalidated():
+    snapshots = TtlSnapshotMap(ttl_seconds=30)
+    loader = Mock(side_effect=[1, 2, 3])
+
+    assert snapshots.get(("all", "1Y"), loader) == 1
+    assert snapshots.get(("all", "ALL"), loader) == 2
+    assert snapshots.get(("all", "1Y"), loader) == 1
+    snapshots.invalidate()
+    assert snapshots.get(("all", "1Y"), loader) == 3
@@ -276,3 +276,17 @@ def test_format_relative_time(delta: timedelta, expected: str) -> None:
 )
 def test_pluralize(value: int, unit: str, expected: str) -> None:
     assert custom_tags._pluralize(value, unit) == expected
+
+
+# ---------------------------------------------------------------------------
+# money
+# ---------------------------------------------------------------------------
+
+
+def test_money_formats_value_in_currency() -> None:
+    assert custom_tags.money(1234.5, "EUR") == "€ 1,234.50"
+    assert custom_tags.money(0, "USD") == "$ 0.00"
+
+
+def test_money_handles_missing_value() -> None:
+    assert custom_tags.money(None, "EUR") == ""
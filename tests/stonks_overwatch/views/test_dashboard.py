@@ -0,0 +1,98 @@
+from datetime import date
+
+import polars as pl
+
+from stonks_overwatch.views.dashboard import Dashboard
+
+import pytest
+
+
+def test_calculate_twr_links_daily_returns():
+    dates = ["2024-01-29", "2024-01-30", "2024-01-31", "2024-02-01"]
+    market_value = {"2024-01-29": 1000.0, "2024-01-30": 1100.0, "2024-01-31": 1650.0, "2024-02-01": 1485.0}
+    # A deposit of 500 on 2024-01-31 must not count as a return
+    cash_flows = {"2024-01-31": 500.0}
+
+    metrics = Dashboard._calculate_twr(dates, market_value, cash_flows)
+
+    assert metrics.cumulative_returns["date"].to_list() == [date(2024, 1, 30), date(2024, 1, 31), date(2024, 2, 1)]
+    assert metrics.cumulative_returns["cumulative_return"].to_list() == pytest.approx([0.10, 0.15, 0.035])
+    assert metrics.total_return == pytest.approx(0.035)
+    assert metrics.total_days == 3
+    assert metrics.total_cashflows == 500.0
+
+
+def test_calculate_twr_skips_periods_without_value():
+    dates = ["2024-01-29", "2024-01-30", "2024-01-31"]
+    market_value = {"2024-01-30": 1000.0, "2024-01-31": 1100.0}
+
+    metrics = Dashboard._calculate_twr(dates, market_value, {})
+
+    assert metrics.cumulative_returns["date"].to_list() == [date(2024, 1, 31)]
+    assert metrics.total_return == pytest.approx(0.10)
+
+
+def test_calculate_twr_needs_two_periods():
+    with pytest.raises(ValueError):
+        Dashboard._calculate_twr(["2024-01-29"], {"2024-01-29": 1000.0}, {})
+
+
+def test_derive_period_returns():
+    cumulative_returns = pl.DataFrame(
+        {
+            "date": [date(2023, 12, 28), date(2023, 12, 29), date(2024, 1, 2), date(2024, 1, 3), date(2024, 2, 1)],
+            "cumulative_return": [0.0, 0.1, 0.21, 0.331, 0.4641],
+        }
+    )
+
+    annual_twr, monthly_twr = Dashboard._derive_period_returns(cumulative_returns)
+
+    assert list(annual_twr.keys()) == ["2024", "2023"]
+    assert annual_twr["2023"] == pytest.approx(0.1)
+    assert annual_twr["2024"] == pytest.approx(1.4641 / 1.21 - 1)
+    assert list(monthly_twr.keys()) == ["2024", "2023"]
+    assert monthly_twr["2024"]["January"] == pytest.approx(0.1)
+    # Single-day months have no return
+    assert monthly_twr["2024"]["February"] == 0.0
+    assert monthly_twr["2023"]["December"] == pytest.approx(0.1)
+    assert len(monthly_twr["2023"]) == 12
+
+
+def test_derive_period_returns_empty():
+    assert Dashboard._derive_period_returns(
+        pl.DataFrame(schema={"date": pl.Date, "cumulative_return": pl.Float64})
+    ) == (
+        {},
+        {},
+    )
+
+
+def test_filter_dashboard_values_carries_previous_value():
+    values = [{"x": "2024-01-01", "y": 1.0}, {"x": "2024-01-05", "y": 2.0}, {"x": "2024-01-08", "y": 3.0}]
+
+    assert Dashboard._filter_dashboard_values(values, "2024-01-03") == [
+        {"x": "2024-01-03", "y": 1.0},
+        {"x": "2024-01-05", "y": 2.0},
+        {"x": "2024-01-08", "y": 3.0},
+    ]
+    assert Dashboard._filter_dashboard_values(values, "2024-01-05") == values[1:]
+    assert Dashboard._filter_dashboard_values(values, "2023-12-01") == values
+    assert Dashboard._filter_dashboard_values(values, "2024-02-01") == []
+    # The input is not modified
+    assert len(values) == 3
+
+
+def test_downsample_keeps_boundaries_and_period_ends():
+    values = [
+        {"x": "2024-01-03", "y": 1.0},
+        {"x": "2024-01-31", "y": 2.0},
+        {"x": "2024-02-01", "y": 3.0},
+        {"x": "2024-02-28", "y": 4.0},
+        {"x": "2024-03-04", "y": 5.0},
+        {"x": "2024-03-05", "y": 6.0},
+    ]
+
+    assert Dashboard._downsample(values, None) == values
+    assert [item["y"] for item in Dashboard._downsample(values, "month")] == [1.0, 2.0, 4.0, 6.0]
+    # 2024-01-31 and 2024-02-01 are in the same ISO week, as are 2024-03-04 and 2024-03-05
+    assert [item["y"] for item in Dashboard._downsample(values, "week")] == [1.0, 3.0, 4.0, 6.0]
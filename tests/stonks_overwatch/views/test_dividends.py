@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+
+from stonks_overwatch.services.models import Dividend, DividendType
+from stonks_overwatch.views.dividends import Dividends
+
+from unittest.mock import patch
+
+
+def _dividend(dividend_type: DividendType, month: int, day: int, amount: float) -> Dividend:
+    return Dividend(
+        dividend_type=dividend_type,
+        payment_date=datetime(2024, month, day, tzinfo=timezone.utc),
+        stock_name="Apple Inc.",
+        stock_symbol="AAPL",
+        currency="EUR",
+        amount=amount,
+        taxes=0.0,
+    )
+
+
+def test_dividends_calendar_uses_monthly_aggregates():
+    view = Dividends.__new__(Dividends)
+    dividends = [
+        _dividend(DividendType.PAID, 1, 10, 10.0),
+        _dividend(DividendType.FORECASTED, 3, 1, 12.0),
+    ]
+    monthly_dividends = [
+        {"year": 2024, "month": 1, "currency": "EUR", "net_amount": 8.5, "gross_amount": 10.0, "payouts": 1},
+        {"year": 2024, "month": 1, "currency": "USD", "net_amount": 1.25, "gross_amount": 1.25, "payouts": 1},
+    ]
+
+    with patch(
+        "stonks_overwatch.views.dividends.timezone.now", return_value=datetime(2024, 3, 15, tzinfo=timezone.utc)
+    ):
+        result = view._get_dividends_calendar(dividends, monthly_dividends)
+
+    calendar = result["calendar"]
+    assert result["years"] == [2024]
+    assert list(calendar.keys()) == ["January 2024", "February 2024", "March 2024"]
+    assert calendar["January 2024"]["total"] == 9.75
+    assert calendar["January 2024"]["payouts"] == 2
+    assert list(calendar["January 2024"]["days"]) == ["10"]
+    # Forecasted dividends are listed, but do not count in the totals
+    assert calendar["March 2024"]["total"] == 0.0
+    assert calendar["March 2024"]["payouts"] == 0
+    assert "AAPL" in calendar["March 2024"]["days"]["01"]
+
+    growth = view._get_dividends_growth(monthly_dividends, result["years"])
+    assert growth == {2024: [9.75, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]}
+
+
+def test_dividends_growth_fills_the_calendar_years_without_dividends():
+    view = Dividends.__new__(Dividends)
+    monthly_dividends = [
+        {"year": 2022, "month": 12, "currency": "EUR", "net_amount": 3.0, "gross_amount": 3.0, "payouts": 1},
+    ]
+
+    growth = view._get_dividends_growth(monthly_dividends, [2024, 2023, 2022])
+
+    assert list(growth) == [2022, 2023, 2024]
+    assert growth[2022][11] == 3.0
+    assert growth[2023] == [0] * 12
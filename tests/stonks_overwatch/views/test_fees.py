@@ -0,0 +1,47 @@
+import json
+
+from stonks_overwatch.services.models import Fee, FeeType, PortfolioId
+from stonks_overwatch.views.fees import Fees
+
+from django.test import RequestFactory
+from unittest.mock import MagicMock, patch
+
+
+def test_fees_json_returns_the_fees_only():
+    fee = Fee(
+        date="2024-01-10",
+        time="10:00:00",
+        type=FeeType.CONNECTION,
+        description="DEGIRO Aansluitingskosten",
+        fee_value=-2.5,
+        currency="EUR",
+    )
+    request = RequestFactory().get("/fees", HTTP_ACCEPT="application/json")
+    view = Fees()
+    view.fees = MagicMock()
+    view.fees.get_fees.return_value = [fee]
+
+    with patch("stonks_overwatch.views.fees.SessionManager.get_selected_portfolio", return_value=PortfolioId.ALL):
+        response = view.get(request)
+
+    data = json.loads(response.content)
+    assert [row["type"] for row in data["fees"]] == ["Connection"]
+    assert data["fees"][0]["fee_formatted"]
+    view.fees.get_fee_totals.assert_not_called()
+
+
+def test_fees_page_renders_the_totals_only():
+    request = RequestFactory().get("/fees")
+    view = Fees()
+    view.fees = MagicMock()
+    view.fees.get_fee_totals.return_value = dict.fromkeys(FeeType, -1.0)
+
+    with (
+        patch("stonks_overwatch.views.fees.SessionManager.get_selected_portfolio", return_value=PortfolioId.ALL),
+        patch("stonks_overwatch.views.fees.render") as render,
+    ):
+        view.get(request)
+
+    context = render.call_args.args[2]
+    assert set(context) == {"transaction_fees", "exchange_fees", "ftt_fees", "adr_fees"}
+    view.fees.get_fees.assert_not_called()
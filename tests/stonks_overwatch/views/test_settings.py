@@ -1,5 +1,6 @@
 import json
 
+from stonks_overwatch.services.aggregators.portfolio_aggregator import PortfolioAggregatorService
 from stonks_overwatch.views.settings import SettingsView
 
 import pytest
@@ -128,3 +129,40 @@ class TestSaveIntegrationSettings:
         assert response.status_code == 400
         data = json.loads(response.content)
         assert "error" in data
+
+
+@pytest.mark.django_db
+class TestSaveSettingsClearsSeriesCache:
+    def setup_method(self):
+        self.factory = RequestFactory()
+        self.view = SettingsView()
+
+    def _post(self, payload):
+        request = self.factory.post(
+            "/settings",
+            data=json.dumps(payload),
+            content_type="application/json",
+            HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+        )
+        return self.view.post(request)
+
+    @patch("stonks_overwatch.views.settings.Config")
+    def test_base_currency_change_clears_the_series(self, mock_config_cls):
+        with patch.object(PortfolioAggregatorService, "series_snapshots") as series_snapshots:
+            response = self._post({"action": "save_general", "base_currency": "USD"})
+
+        assert response.status_code == 200
+        assert mock_config_cls.get_global.return_value.base_currency == "USD"
+        series_snapshots.invalidate.assert_called_once()
+
+    def test_broker_configuration_save_clears_the_series(self):
+        self.view.repository = MagicMock()
+
+        with (
+            patch.object(PortfolioAggregatorService, "series_snapshots") as series_snapshots,
+            patch.object(SettingsView, "_reconfigure_jobs"),
+        ):
+            response = self._post({"broker_name": "degiro", "enabled": False})
+
+        assert response.status_code == 200
+        series_snapshots.invalidate.assert_called_once()
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+
+from stonks_overwatch.services.models import PortfolioId, Transaction
+from stonks_overwatch.services.utilities.pagination import MAX_PAGE_SIZE, Page, PageQuery
+from stonks_overwatch.views.transactions import Transactions
+
+from django.test import RequestFactory
+from unittest.mock import MagicMock, patch
+
+
+def test_transactions_json_returns_a_page():
+    transaction = Transaction(
+        name="Apple Inc.",
+        symbol="AAPL",
+        date="2024-01-10",
+        time="10:00:00",
+        buy_sell="Buy",
+        transaction_type="",
+        price=100.0,
+        currency="USD",
+        quantity=2,
+        total=-200.0,
+        total_currency="USD",
+        total_in_base_currency=-180.0,
+        base_currency="EUR",
+        fees=-1.0,
+        fees_currency="EUR",
+    )
+    request = RequestFactory().get(
+        "/transactions", {"limit": "10", "cursor": "abc", "symbol": "aapl"}, HTTP_ACCEPT="application/json"
+    )
+    view = Transactions()
+    view.transactions = MagicMock()
+    view.transactions.get_transactions_page.return_value = Page(items=[transaction], next_cursor="next")
+
+    with patch(
+        "stonks_overwatch.views.transactions.SessionManager.get_selected_portfolio", return_value=PortfolioId.ALL
+    ):
+        response = view.get(request)
+
+    data = json.loads(response.content)
+    assert data["next_cursor"] == "next"
+    assert [row["symbol"] for row in data["transactions"]] == ["AAPL"]
+    assert data["transactions"][0]["formatted_total"]
+    view.transactions.get_transactions_page.assert_called_once_with(
+        PortfolioId.ALL, PageQuery(limit=10, cursor="abc", symbol="aapl")
+    )
+
+
+def test_transactions_csv_exports_every_page():
+    transactions = [
+        Transaction(
+            name=f"Stock {index}",
+            symbol=f"S{index}",
+            date="2024-01-10",
+            time="10:00:00",
+            buy_sell="Buy",
+            transaction_type="",
+            price=100.0,
+            currency="USD",
+            quantity=1,
+            total=-100.0,
+            total_currency="USD",
+            total_in_base_currency=-90.0,
+            base_currency="EUR",
+            fees=0.0,
+            fees_currency="EUR",
+        )
+        for index in range(3)
+    ]
+    request = RequestFactory().get("/transactions", {"format": "csv", "order": "asc", "symbol": "s"})
+    view = Transactions()
+    view.transactions = MagicMock()
+    view.transactions.get_transactions_page.side_effect = [
+        Page(items=transactions[:2], next_cursor="next"),
+        Page(items=transactions[2:], next_cursor=None),
+    ]
+
+    with patch(
+        "stonks_overwatch.views.transactions.SessionManager.get_selected_portfolio", return_value=PortfolioId.ALL
+    ):
+        response = view.get(request)
+
+    assert response["Content-Type"] == "text/csv"
+    assert 'filename="transactions_export.csv"' in response["Content-Disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.content.decode())))
+    assert [row["symbol"] for row in rows] == ["S0", "S1", "S2"]
+    queries = [call.args[1] for call in view.transactions.get_transactions_page.call_args_list]
+    assert queries == [
+        PageQuery(limit=MAX_PAGE_SIZE, symbol="s", ascending=True),
+        PageQuery(limit=MAX_PAGE_SIZE, cursor="next", symbol="s", ascending=True),
+    ]